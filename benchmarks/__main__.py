@@ -0,0 +1,72 @@
+"""Run the SizeBot benchmark suite against a synthetic data directory.
+
+    python -m benchmarks                        # run everything, and compare against benchmarks/baseline.json
+    python -m benchmarks --filter userdb        # only run benchmarks whose name contains "userdb"
+    python -m benchmarks --save-baseline        # record this run as the new baseline
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks import datagen, runner
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks", description = "Run the SizeBot benchmark suite.")
+    parser.add_argument("--guilds", type = int, default = 10, help = "number of synthetic guilds")
+    parser.add_argument("--users", type = int, default = 100, help = "number of synthetic users per guild")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--repeat", type = int, default = 5, help = "timed samples per benchmark")
+    parser.add_argument("--filter", action = "append", help = "only run benchmarks whose name contains this")
+    parser.add_argument("--output", type = Path, help = "write the results to this JSON file")
+    parser.add_argument("--baseline", type = Path, default = BASELINE, help = "baseline JSON to compare against")
+    parser.add_argument("--threshold", type = float, default = 0.2, help = "allowed slowdown before failing (0.2 = 20%%)")
+    parser.add_argument("--save-baseline", action = "store_true", help = "write the results to the baseline file")
+    args = parser.parse_args()
+
+    # Unit parsing is needed to generate the profiles
+    from sizebot.lib import language, objs, units
+    language.load()
+    units.init()
+    objs.init()
+
+    with tempfile.TemporaryDirectory(prefix = "sizebot-bench-") as tmpdir:
+        root = Path(tmpdir)
+        print(f"Generating {args.guilds} guilds x {args.users} users...")
+        dataset = datagen.generate(root, guilds = args.guilds, users = args.users, seed = args.seed)
+        with datagen.use_datadir(root):
+            # Config and cogs read the data paths on load, so only import them once the paths point at the dataset
+            from sizebot.conf import conf
+            conf.load()
+            from benchmarks import suite  # noqa: F401
+            results = runner.run_all(dataset, only = args.filter, repeat = args.repeat)
+
+    report = runner.to_report(results, dataset)
+    if args.output:
+        runner.save_report(report, args.output)
+    if args.save_baseline:
+        runner.save_report(report, args.baseline)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("No baseline to compare against.")
+        return 0
+    baseline = runner.load_report(args.baseline)
+    if baseline["meta"]["dataset"] != report["meta"]["dataset"]:
+        print("Warning: the baseline was recorded with a different dataset, so results may not be comparable.")
+    regressions = runner.compare(report, baseline, args.threshold)
+    if regressions:
+        print(f"Regressions over {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Generate synthetic SizeBot data directories for benchmarking."""
+from __future__ import annotations
+from collections.abc import Iterator
+
+import contextlib
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import arrow
+
+from sizebot.lib import paths, userdb
+from sizebot.lib.diff import Diff
+from sizebot.lib.units import SV, WV, Decimal
+
+TRIGGER_WORDS = ["grow", "shrink", "tiny", "huge", "boop", "pat", "stomp", "cookie", "potion", "mushroom",
+                 "bigger", "smaller", "cake", "drink", "oops", "sparkle", "zap", "poof", "expand", "crumb"]
+TRIGGER_DIFFS = ["x2", "/2", "+1ft", "-1in", "x1.1", "/1.1", "+10cm", "x10", "/10", "+1m"]
+SCALETALK_DIFFS = ["x1.01", "/1.01", "+1mm", "-1mm"]
+NICKNAMES = ["Digi", "Natalie", "Aria", "Slim", "Nichole", "Kelly", "Alex", "Sam", "Jordan", "Riley"]
+
+CONF_TEMPLATE = """[sizebot]
+prefix = "&"
+name = "SizeBot"
+
+[discord]
+authtoken = "INSERT_BOT_TOKEN_HERE"
+"""
+
+
+@dataclass
+class Dataset:
+    root: Path
+    guilds: int
+    users: int
+    seed: int
+    users_by_guild: dict[int, list[int]] = field(default_factory = dict)
+    changes: int = 0
+    naps: int = 0
+
+    @property
+    def guildids(self) -> list[int]:
+        return list(self.users_by_guild)
+
+    def toJSON(self) -> dict:
+        return {"guilds": self.guilds, "users": self.users, "seed": self.seed, "changes": self.changes, "naps": self.naps}
+
+
+PATH_NAMES = ["datadir", "winkpath", "guilddbpath", "telemetrypath", "thispath", "changespath",
+              "naptimepath", "confpath", "blacklistpath", "metricspath", "languagecachepath", "cogmanifestpath", "tracespath"]
+
+
+@contextlib.contextmanager
+def use_datadir(root: Path) -> Iterator[None]:
+    """Point every SizeBot data path at `root` for the duration of the with-block"""
+    old = {name: getattr(paths, name) for name in PATH_NAMES if hasattr(paths, name)}
+    olddatadir = old["datadir"]
+    try:
+        for name, oldpath in old.items():
+            setattr(paths, name, root / oldpath.relative_to(olddatadir))
+        yield
+    finally:
+        for name, oldpath in old.items():
+            setattr(paths, name, oldpath)
+
+
+def make_user(rng: random.Random, guildid: int, userid: int) -> userdb.User:
+    userdata = userdb.User()
+    userdata.guildid = guildid
+    userdata.id = userid
+    userdata.nickname = f"{rng.choice(NICKNAMES)}{userid % 10000}"
+    userdata.gender = rng.choice(["m", "f", None])
+    userdata.registration_steps_remaining = []
+    userdata.lastactive = arrow.now().shift(hours = -rng.randint(0, 24 * 14))
+    # Heights spread over 12 orders of magnitude, centered on human size
+    userdata.height = SV(Decimal(10) ** Decimal(rng.uniform(-6, 6)) * Decimal("1.754"))
+    userdata.baseheight = SV(Decimal(rng.uniform(1.4, 2.1)))
+    userdata.baseweight = WV(Decimal(rng.uniform(45_000, 110_000)))
+    userdata.unitsystem = rng.choice(["m", "u"])
+    if rng.random() < 0.3:
+        userdata.footlength = SV(userdata.baseheight / 7)
+    if rng.random() < 0.2:
+        userdata.hairlength = SV(Decimal(rng.uniform(0.01, 1)))
+    if rng.random() < 0.1:
+        userdata.taillength = SV(Decimal(rng.uniform(0.2, 2)))
+    if rng.random() < 0.25:
+        for word in rng.sample(TRIGGER_WORDS, rng.randint(1, 4)):
+            userdata.triggers[word] = Diff.parse(rng.choice(TRIGGER_DIFFS))
+    if rng.random() < 0.1:
+        userdata.currentscaletalk = Diff.parse(rng.choice(SCALETALK_DIFFS))
+    return userdata
+
+
+def generate(root: Path, *, guilds: int, users: int, seed: int = 0) -> Dataset:
+    """Build a data directory with `guilds` guilds of `users` registered users each"""
+    rng = random.Random(seed)
+    root.mkdir(parents = True, exist_ok = True)
+    (root / "sizebot.conf").write_text(CONF_TEMPLATE)
+    dataset = Dataset(root, guilds, users, seed)
+
+    with use_datadir(root):
+        changesJSON = []
+        naptimeJSON = []
+        now = time.time()
+        for g in range(guilds):
+            guildid = 100_000_000_000_000_000 + g
+            userids = []
+            for u in range(users):
+                userid = 200_000_000_000_000_000 + g * users + u
+                userdb.save(make_user(rng, guildid, userid))
+                userids.append(userid)
+                # Every 50th user has a slow change running, and every 100th is napping
+                if u % 50 == 0:
+                    changesJSON.append({
+                        "userid": userid,
+                        "guildid": guildid,
+                        "addPerSec": "0",
+                        "mulPerSec": str(Decimal(rng.choice(["1.001", "0.999", "1.0001"]))),
+                        "powPerSec": "1",
+                        "stopSV": None,
+                        "stopTV": None,
+                        "startTime": str(now),
+                        "lastRan": str(now)
+                    })
+                if u % 100 == 1:
+                    naptimeJSON.append({"userid": userid, "guildid": guildid, "endtime": str(now + rng.randint(60, 3600))})
+            dataset.users_by_guild[guildid] = userids
+            if rng.random() < 0.2:
+                (paths.guilddbpath / str(guildid) / "guild.json").write_text(json.dumps({
+                    "id": guildid,
+                    "small_edge": rng.choice(userids),
+                    "large_edge": rng.choice(userids),
+                    "high_limit": None,
+                    "low_limit": "0.001"
+                }))
+        paths.changespath.write_text(json.dumps(changesJSON))
+        paths.naptimepath.write_text(json.dumps(naptimeJSON))
+        dataset.changes = len(changesJSON)
+        dataset.naps = len(naptimeJSON)
+
+    return dataset
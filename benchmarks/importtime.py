@@ -0,0 +1,35 @@
+"""Report SizeBot's slowest imports, and fail if any go over budget.
+
+    python -m benchmarks.importtime                     # sizebot.main and every cog and extension
+    python -m benchmarks.importtime --budget 50         # fail if any one module takes over 50 ms
+    python -m benchmarks.importtime sizebot.lib.eval    # just these modules
+"""
+import argparse
+import asyncio
+import sys
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks.importtime", description = "Time SizeBot's imports.")
+    parser.add_argument("modules", nargs = "*", help = "modules to import (default: sizebot.main and every cog and extension)")
+    parser.add_argument("--budget", type = float, default = 100, help = "allowed import time per module, in ms")
+    parser.add_argument("--limit", type = int, default = 25, help = "number of modules to list")
+    args = parser.parse_args()
+
+    from sizebot import main as sizebotmain
+    from sizebot.lib import importtime
+
+    modules = args.modules or [
+        "sizebot.main",
+        *("sizebot.extensions." + e for e in sizebotmain.initial_extensions),
+        *("sizebot.cogs." + c for c in sizebotmain.initial_cogs)
+    ]
+    timings = asyncio.run(importtime.measure(modules))
+    print(importtime.format_report(timings, args.budget, limit = args.limit))
+    if any(t.self_ms > args.budget for t in timings):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
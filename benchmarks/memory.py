@@ -0,0 +1,124 @@
+"""Measure how much memory SizeBot's in-memory objects take, with tracemalloc.
+
+    python -m benchmarks.memory                   # 1000 synthetic users
+    python -m benchmarks.memory --users 5000      # more users, for steadier numbers
+    python -m benchmarks.memory --output mem.json
+
+Each measurement builds the objects for every user, keeps them all alive, and reports the bytes allocated per user.
+"""
+from __future__ import annotations
+from collections.abc import Callable
+from typing import Any
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from benchmarks import datagen
+
+
+def measure(build: Callable[[], list[Any]]) -> tuple[int, int]:
+    """The bytes still allocated after `build()`, while what it returned is kept alive, and how many things it built"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, len(kept)
+
+
+def format_bytes(size: float) -> str:
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(size) < 1024:
+            return f"{size:,.1f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} GiB"
+
+
+def _object_json() -> list[Any]:
+    import importlib.resources as pkg_resources
+    import sizebot.data.objects
+    return [
+        d
+        for filename in pkg_resources.contents(sizebot.data.objects) if filename.endswith(".json")
+        for d in json.loads(pkg_resources.read_text(sizebot.data.objects, filename))
+    ]
+
+
+def run(dataset: datagen.Dataset) -> dict[str, dict[str, float]]:
+    from sizebot.lib import objs, userdb
+    from sizebot.lib.stats import StatBox, StatBoxCache
+
+    pairs = [(guildid, userid) for guildid, userids in dataset.users_by_guild.items() for userid in userids]
+    profiles = [userdb.load(guildid, userid) for guildid, userid in pairs]
+    statboxes = [StatBox.load(u.stats) for u in profiles]
+    objectjson = _object_json()
+    # Build one of everything first, so one-off allocations (like interned strings) aren't counted
+    StatBox.load(profiles[0].stats).scale(profiles[0].scale)
+
+    def cached_users() -> list[Any]:
+        cache = StatBoxCache(maxsize = len(profiles) * 2)
+        for u in profiles:
+            cache.get(u.stats, u.scale)
+        return [cache]
+
+    measurements: dict[str, Callable[[], list[Any]]] = {
+        "profile": lambda: [userdb.load(guildid, userid) for guildid, userid in pairs],
+        "statbox": lambda: [StatBox.load(u.stats) for u in profiles],
+        "scaled statbox": lambda: [sb.scale(u.scale) for sb, u in zip(statboxes, profiles)],
+        "cached user": cached_users,
+        "object": lambda: [objs.DigiObject.from_json(d) for d in objectjson],
+    }
+    report = {}
+    for name, build in measurements.items():
+        size, count = measure(build)
+        if name == "cached user":
+            count = len(profiles)
+        report[name] = {"bytes": size, "count": count, "bytes_each": size / count}
+    return report
+
+
+def format_report(report: dict[str, dict[str, float]]) -> str:
+    lines = [f"{'':<16}{'each':>14}{'total':>14}"]
+    for name, m in report.items():
+        lines.append(f"{name:<16}{format_bytes(m['bytes_each']):>14}{format_bytes(m['bytes']):>14}  ({m['count']:,})")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks.memory", description = "Measure SizeBot's memory use per user.")
+    parser.add_argument("--guilds", type = int, default = 10, help = "number of synthetic guilds")
+    parser.add_argument("--users", type = int, default = 100, help = "number of synthetic users per guild")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--output", type = Path, help = "write the report to this JSON file")
+    args = parser.parse_args()
+
+    from sizebot.lib import language, objs, units
+    language.load()
+    units.init()
+    objs.init()
+
+    with tempfile.TemporaryDirectory(prefix = "sizebot-memory-") as tmpdir:
+        root = Path(tmpdir)
+        print(f"Generating {args.guilds} guilds x {args.users} users...")
+        dataset = datagen.generate(root, guilds = args.guilds, users = args.users, seed = args.seed)
+        with datagen.use_datadir(root):
+            report = run(dataset)
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent = 4)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
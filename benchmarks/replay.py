@@ -0,0 +1,290 @@
+"""Replay recorded or synthetic message streams through a fully loaded SizeBot, with no Discord connection.
+
+    python -m benchmarks.replay                               # 2000 synthetic messages, as fast as possible
+    python -m benchmarks.replay --rate 50                     # 50 messages a second, handled concurrently like live traffic
+    python -m benchmarks.replay --record stream.ndjson        # also save the synthetic stream
+    python -m benchmarks.replay --stream stream.ndjson        # replay a saved or recorded stream
+
+A stream is newline-delimited JSON, one message per line:
+    {"guildid": 1, "userid": 2, "content": "stats", "command": true}
+Messages with "command" set are sent mentioning the bot, so they reach the commands through on_message and every
+on_message listener sees them, like any other message. The rest are ordinary chat.
+"""
+from __future__ import annotations
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from benchmarks import datagen
+from benchmarks.datagen import TRIGGER_WORDS, Dataset
+from benchmarks.runner import format_seconds
+from benchmarks.standins import StandinGuild, StandinMember, StandinMessage, StandinState
+from sizebot.lib import utils
+
+logger = logging.getLogger("sizebot")
+
+BOT_ID = 554916317258317825
+# Nobody in the dataset, so owner checks fail without asking Discord for the application info
+OWNER_ID = 1
+
+CHATTER = [
+    "hi everyone", "how's it going?", "lol", "that's so big", "i feel tiny today", "brb", "this", "^",
+    "did you see that?", "monika", "what's the weather like up there", "ok", "<:smol:123456> hehe",
+    "I can't believe how tall that building is", "goodnight!"
+]
+COMMANDS = [
+    "stats", "stats", "stats", "height", "weight", "compare", "lookslike", "objectcompare car",
+    "roll 2d6", "roll 4d6k3", "distance 10mi", "food 2000", "water", "scaled car", "ruler 1ft",
+    "stackup", "profile", "change +1ft", "setheight 5ft6in", "help", "help stats", "stat height",
+    "lookat 10cm", "fall 100m", "triggers", "units", "notacommand"
+]
+
+
+@dataclass
+class Event:
+    guildid: int
+    userid: int
+    content: str
+    command: bool = False
+
+
+def synthetic_stream(dataset: Dataset, count: int, *, command_ratio: float = 0.2, seed: int = 0) -> list[Event]:
+    """Chat and commands from random registered users, with a sprinkling of trigger words"""
+    rng = random.Random(seed)
+    guildids = dataset.guildids
+    events = []
+    for _ in range(count):
+        guildid = rng.choice(guildids)
+        userid = rng.choice(dataset.users_by_guild[guildid])
+        if rng.random() < command_ratio:
+            events.append(Event(guildid, userid, rng.choice(COMMANDS), command = True))
+        elif rng.random() < 0.1:
+            events.append(Event(guildid, userid, f"{rng.choice(CHATTER)} {rng.choice(TRIGGER_WORDS)}"))
+        else:
+            events.append(Event(guildid, userid, rng.choice(CHATTER)))
+    return events
+
+
+def load_stream(path: Path) -> list[Event]:
+    with open(path) as f:
+        return [Event(**json.loads(line)) for line in f if line.strip()]
+
+
+def save_stream(events: Iterable[Event], path: Path):
+    with open(path, "w") as f:
+        for event in events:
+            f.write(json.dumps(asdict(event)) + "\n")
+
+
+class Harness:
+    """A `commands.Bot` with every cog and extension loaded, wired to local stand-ins instead of Discord"""
+
+    def __init__(self, dataset: Dataset):
+        self.dataset = dataset
+        self.state = StandinState()
+        self.guilds: dict[int, StandinGuild] = {}
+        for guildid, userids in dataset.users_by_guild.items():
+            self.guilds[guildid] = StandinGuild(guildid, userids, state = self.state)
+        self.listener_seconds: dict[str, float] = {}
+        self.listener_calls: dict[str, int] = {}
+        self.bot = None
+
+    async def start(self):
+        from sizebot import main
+        from sizebot.lib import metrics
+
+        self.bot = main.create_bot()
+        # Every command is logged at CMD level, which would swamp the report
+        logger.setLevel(logging.WARNING)
+        firstguild = next(iter(self.guilds.values()))
+        self.state.user = StandinMember(firstguild, BOT_ID, name = "SizeBot", bot = True)
+        self.bot._connection.user = self.state.user
+        self.bot.owner_id = OWNER_ID
+        self.bot.wait_for = self._wait_for
+        # Normally done by Client.login, which we never call
+        await self.bot._async_setup_hook()
+        await self.bot.setup_hook()
+        # The lag monitor would only measure the harness
+        metrics.lagmonitor.stop()
+        # Time the commands on their own, within main.on_message
+        self._process_commands = self.bot.process_commands
+        self.bot.process_commands = self._timed_process_commands
+
+    async def _timed_process_commands(self, message: StandinMessage):
+        await self._timed("main.on_message > process_commands", self._process_commands, message)
+
+    async def _wait_for(self, event: str, **kwargs) -> Any:
+        # Nobody is around to click on reaction menus, so they time out straight away
+        raise TimeoutError
+
+    async def stop(self):
+        self.bot.process_commands = self._process_commands
+        for extension in list(self.bot.extensions):
+            await self.bot.unload_extension(extension)
+
+    def get_member(self, guildid: int, userid: int) -> StandinMember:
+        guild = self.guilds.get(guildid)
+        if guild is None:
+            guild = self.guilds[guildid] = StandinGuild(guildid, state = self.state)
+        member = guild.get_member(userid)
+        if member is None:
+            member = guild.add_member(userid)
+        return member
+
+    async def _timed(self, name: str, fn: Callable[..., Awaitable[Any]], *args: Any):
+        start = time.perf_counter()
+        try:
+            await fn(*args)
+        except Exception as e:
+            logger.error(f"{name} raised an exception")
+            logger.error(utils.format_traceback(e))
+        self.listener_seconds[name] = self.listener_seconds.get(name, 0) + time.perf_counter() - start
+        self.listener_calls[name] = self.listener_calls.get(name, 0) + 1
+
+    async def handle(self, event: Event):
+        member = self.get_member(event.guildid, event.userid)
+        content = f"<@{BOT_ID}> {event.content}" if event.command else event.content
+        message = StandinMessage(member, content)
+        message.channel.recent.append(message)
+        await self._timed("main.on_message", self.bot.on_message, message)
+        for listener in self.bot.extra_events.get("on_message", []):
+            await self._timed(listener.__qualname__, listener, message)
+
+    async def replay(self, events: list[Event], *, rate: float = 0) -> float:
+        """Replay every event, and return the elapsed time in seconds.
+
+        With a rate of 0, each event is handled to completion before the next. Otherwise events arrive
+        `rate` times a second whether or not earlier ones have finished, like live traffic.
+        """
+        idle = set(asyncio.all_tasks())
+        start = time.perf_counter()
+        if rate <= 0:
+            for event in events:
+                await self.handle(event)
+        else:
+            tasks = []
+            for i, event in enumerate(events):
+                delay = start + i / rate - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(self.handle(event)))
+            await asyncio.gather(*tasks)
+        # Wait for the event listeners that dispatch() started in the background
+        while pending := asyncio.all_tasks() - idle - {asyncio.current_task()}:
+            await asyncio.wait(pending, timeout = 10)
+        return time.perf_counter() - start
+
+
+def _count(name: str) -> int:
+    from sizebot.lib import metrics
+    family = metrics.registry.histograms.get(name, {})
+    return sum(hist.count for hist in family.values())
+
+
+def build_report(harness: Harness, events: list[Event], elapsed: float) -> dict:
+    from sizebot.lib import metrics
+
+    messages = len(events)
+    commands = sum(1 for e in events if e.command)
+    outcomes = {"ok": 0, "error": 0}
+    for key, value in metrics.registry.counters.get("commands_total", {}).items():
+        outcome = dict(key).get("outcome")
+        outcomes[outcome] = outcomes.get(outcome, 0) + value
+    return {
+        "dataset": harness.dataset.toJSON(),
+        "messages": messages,
+        "commands": commands,
+        "commands_ok": outcomes["ok"],
+        "commands_failed": outcomes["error"],
+        "elapsed": elapsed,
+        "messages_per_second": messages / elapsed,
+        "commands_per_second": commands / elapsed,
+        "userdb_loads_per_message": _count("userdb_load_seconds") / messages,
+        "userdb_saves_per_message": _count("userdb_save_seconds") / messages,
+        "http_calls": dict(harness.state.http.calls),
+        "listeners": {
+            name: {"calls": harness.listener_calls[name], "total": seconds, "mean": seconds / harness.listener_calls[name]}
+            for name, seconds in sorted(harness.listener_seconds.items(), key = lambda i: i[1], reverse = True)
+        }
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"{report['messages']} messages ({report['commands']} commands) in {report['elapsed']:.2f}s",
+        f"  {report['messages_per_second']:.1f} messages/s, {report['commands_per_second']:.1f} commands/s",
+        f"  commands: {report['commands_ok']} ok, {report['commands_failed']} failed",
+        f"  userdb per message: {report['userdb_loads_per_message']:.2f} loads, {report['userdb_saves_per_message']:.2f} saves",
+        f"  HTTP calls: {', '.join(f'{k}={v}' for k, v in sorted(report['http_calls'].items())) or 'none'}",
+        "Listeners:"
+    ]
+    for name, stats in report["listeners"].items():
+        lines.append(f"  {name:<40} {stats['calls']:>6} calls  {format_seconds(stats['total']):>12} total  {format_seconds(stats['mean']):>12} mean")
+    return "\n".join(lines)
+
+
+async def run(dataset: Dataset, events: list[Event], *, rate: float = 0) -> dict:
+    from sizebot.lib import metrics
+
+    harness = Harness(dataset)
+    await harness.start()
+    metrics.registry.clear()
+    try:
+        elapsed = await harness.replay(events, rate = rate)
+    finally:
+        await harness.stop()
+    return build_report(harness, events, elapsed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks.replay", description = "Replay message streams through SizeBot offline.")
+    parser.add_argument("--guilds", type = int, default = 10, help = "number of synthetic guilds")
+    parser.add_argument("--users", type = int, default = 100, help = "number of synthetic users per guild")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--messages", type = int, default = 2000, help = "length of the synthetic stream")
+    parser.add_argument("--command-ratio", type = float, default = 0.2, help = "fraction of the synthetic stream that is commands")
+    parser.add_argument("--rate", type = float, default = 0, help = "messages per second (0 = one at a time, as fast as possible)")
+    parser.add_argument("--stream", type = Path, help = "replay this ndjson stream instead of a synthetic one")
+    parser.add_argument("--record", type = Path, help = "save the stream that was replayed")
+    parser.add_argument("--output", type = Path, help = "write the report to this JSON file")
+    args = parser.parse_args()
+
+    from sizebot.lib import language, objs, units
+    language.load()
+    units.init()
+    objs.init()
+
+    with tempfile.TemporaryDirectory(prefix = "sizebot-replay-") as tmpdir:
+        root = Path(tmpdir)
+        print(f"Generating {args.guilds} guilds x {args.users} users...")
+        dataset = datagen.generate(root, guilds = args.guilds, users = args.users, seed = args.seed)
+        if args.stream:
+            events = load_stream(args.stream)
+        else:
+            events = synthetic_stream(dataset, args.messages, command_ratio = args.command_ratio, seed = args.seed)
+        if args.record:
+            save_stream(events, args.record)
+        with datagen.use_datadir(root):
+            from sizebot.conf import conf
+            conf.load()
+            report = asyncio.run(run(dataset, events, rate = args.rate))
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent = 4)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
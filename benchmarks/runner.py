@@ -0,0 +1,137 @@
+"""Time registered benchmarks, and compare the results against a stored baseline."""
+from __future__ import annotations
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from benchmarks.datagen import Dataset
+
+# A benchmark gets the dataset, and returns the operation to time (a plain function or a coroutine function)
+Setup = Callable[[Dataset], Callable[[], Any] | Callable[[], Awaitable[Any]]]
+
+benchmarks: dict[str, Setup] = {}
+
+MIN_SAMPLE_SECONDS = 0.05
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    def wrapper(fn: Setup) -> Setup:
+        benchmarks[name] = fn
+        return fn
+    return wrapper
+
+
+@dataclass
+class Result:
+    name: str
+    loops: int
+    samples: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def best(self) -> float:
+        return min(self.samples)
+
+    def toJSON(self) -> dict:
+        return {"median": self.median, "best": self.best, "loops": self.loops, "repeat": len(self.samples)}
+
+
+def _timer(op: Callable) -> Callable[[int], float]:
+    """Return a function that runs `op` n times and returns the seconds per call"""
+    if inspect.iscoroutinefunction(op):
+        loop = asyncio.new_event_loop()
+
+        async def many(n: int):
+            for _ in range(n):
+                await op()
+
+        def run(n: int) -> float:
+            start = time.perf_counter()
+            loop.run_until_complete(many(n))
+            return (time.perf_counter() - start) / n
+        return run
+
+    def run(n: int) -> float:
+        start = time.perf_counter()
+        for _ in range(n):
+            op()
+        return (time.perf_counter() - start) / n
+    return run
+
+
+def run_benchmark(name: str, dataset: Dataset, *, repeat: int = 5) -> Result:
+    op = benchmarks[name](dataset)
+    timer = _timer(op)
+    # Calibrate like timeit's autorange, so each sample takes at least MIN_SAMPLE_SECONDS
+    loops = 1
+    while True:
+        per_call = timer(loops)
+        if per_call * loops >= MIN_SAMPLE_SECONDS or loops >= 1_000_000:
+            break
+        loops *= 10
+    samples = [timer(loops) for _ in range(repeat)]
+    return Result(name, loops, samples)
+
+
+def run_all(dataset: Dataset, *, only: list[str] | None = None, repeat: int = 5, progress: Callable[[str], None] = print) -> dict[str, Result]:
+    results = {}
+    for name in sorted(benchmarks):
+        if only and not any(f in name for f in only):
+            continue
+        result = run_benchmark(name, dataset, repeat = repeat)
+        results[name] = result
+        progress(f"{name:<40} {format_seconds(result.median):>12}  ({result.loops} loops x {repeat})")
+    return results
+
+
+def to_report(results: dict[str, Result], dataset: Dataset) -> dict:
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "dataset": dataset.toJSON()
+        },
+        "results": {name: r.toJSON() for name, r in results.items()}
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return a line for every benchmark whose median got slower than the baseline by more than `threshold`"""
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        ratio = result["median"] / base["median"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {format_seconds(base['median'])} -> {format_seconds(result['median'])} ({ratio:.2f}x)")
+    return regressions
+
+
+def load_report(path: Path) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_report(report: dict, path: Path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent = 4)
+
+
+def format_seconds(s: float) -> str:
+    if s < 1e-3:
+        return f"{s * 1e6:.1f} µs"
+    if s < 1:
+        return f"{s * 1e3:.2f} ms"
+    return f"{s:.3f} s"
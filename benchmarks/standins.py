@@ -0,0 +1,179 @@
+"""Minimal local stand-ins for the Discord objects the hot paths touch, so benchmarks never need a connection."""
+from __future__ import annotations
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from types import SimpleNamespace
+from typing import Any
+
+import itertools
+
+import discord
+from discord.abc import Messageable
+
+_ids = itertools.count(900_000_000_000_000_000)
+
+
+class StandinHTTP:
+    """A no-op HTTP layer, that counts every route instead of calling it"""
+
+    def __init__(self):
+        self.calls: Counter[str] = Counter()
+
+    async def send_message(self, channel_id: int, *, params: Any) -> dict:
+        self.calls["send_message"] += 1
+        payload = params.payload or {}
+        return {"id": next(_ids), "channel_id": channel_id, "content": payload.get("content") or ""}
+
+    def __getattr__(self, name: str) -> Callable:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def route(*args, **kwargs) -> dict:
+            self.calls[name] += 1
+            return {}
+        return route
+
+
+class StandinState:
+    """Just enough of `discord.state.ConnectionState` for `Messageable.send`"""
+
+    def __init__(self):
+        self.http = StandinHTTP()
+        self.allowed_mentions = None
+        self.user: StandinMember | None = None
+
+    def create_message(self, *, channel: StandinChannel, data: dict) -> StandinMessage:
+        return StandinMessage(self.user, data["content"], channel = channel, messageid = data["id"])
+
+    def store_view(self, view: Any, message_id: int | None = None):
+        pass
+
+
+class StandinMember(discord.Member):
+    """A `discord.Member` that passes isinstance checks without any connection state"""
+
+    def __init__(self, guild: StandinGuild, userid: int, *, name: str | None = None, status: str = "online", bot: bool = False):
+        if name is None:
+            name = f"user{userid}"
+        self._user = SimpleNamespace(id = userid, name = name, global_name = name, discriminator = "0", bot = bot, system = False,
+                                     avatar = None, display_avatar = SimpleNamespace(url = "https://cdn.discordapp.com/embed/avatars/0.png"))
+        self.guild = guild
+        self.nick = None
+        self._avatar = None
+        self._status = status
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @property
+    def display_name(self) -> str:
+        return self.nick or self._user.name
+
+    @property
+    def roles(self) -> list:
+        return []
+
+    def __hash__(self) -> int:
+        return hash(self._user.id)
+
+    def __repr__(self) -> str:
+        return f"<StandinMember id={self.id} guild={self.guild.id}>"
+
+
+class StandinChannel(Messageable):
+    """A text channel whose sends go through the real `Messageable.send`, down to the no-op HTTP layer"""
+
+    def __init__(self, guild: StandinGuild, channelid: int, state: StandinState):
+        self.id = channelid
+        self.name = f"channel{channelid}"
+        self.guild = guild
+        self._state = state
+        self.recent: list[StandinMessage] = []
+
+    async def _get_channel(self) -> StandinChannel:
+        return self
+
+    async def history(self, *, limit: int | None = 100, **kwargs) -> AsyncIterator[StandinMessage]:
+        for m in reversed(self.recent[-limit:] if limit else self.recent):
+            yield m
+
+    @property
+    def mention(self) -> str:
+        return f"<#{self.id}>"
+
+    def permissions_for(self, member: discord.Member) -> discord.Permissions:
+        return discord.Permissions.none()
+
+
+class StandinGuild:
+    def __init__(self, guildid: int, memberids: list[int] = [], *, state: StandinState | None = None):
+        self.id = guildid
+        self.name = f"guild{guildid}"
+        # Nobody owns the guild, and the bot can't manage nicknames, so nickname updates are skipped
+        self.owner_id = 0
+        self.me = SimpleNamespace(guild_permissions = discord.Permissions.none(), top_role = SimpleNamespace(position = 0))
+        self._members: dict[int, StandinMember] = {}
+        self.channel = StandinChannel(self, guildid + 1, state or StandinState())
+        for memberid in memberids:
+            self.add_member(memberid)
+
+    @property
+    def members(self) -> list[StandinMember]:
+        return list(self._members.values())
+
+    @property
+    def member_count(self) -> int:
+        return len(self._members)
+
+    def add_member(self, userid: int, **kwargs) -> StandinMember:
+        member = StandinMember(self, userid, **kwargs)
+        self._members[userid] = member
+        return member
+
+    def get_member(self, userid: int) -> StandinMember | None:
+        return self._members.get(userid)
+
+    def get_channel(self, channelid: int) -> StandinChannel | None:
+        return self.channel if channelid == self.channel.id else None
+
+
+class StandinBot:
+    def __init__(self, guilds: list[StandinGuild] = []):
+        self.guilds = {g.id: g for g in guilds}
+
+    def get_guild(self, guildid: int) -> StandinGuild | None:
+        return self.guilds.get(guildid)
+
+
+class StandinMessage:
+    def __init__(self, author: StandinMember, content: str, *, channel: StandinChannel | None = None, messageid: int | None = None):
+        if channel is None:
+            channel = author.guild.channel
+        self.id = next(_ids) if messageid is None else messageid
+        self.author = author
+        self.channel = channel
+        self.guild = channel.guild
+        self.content = content
+        self._state = channel._state
+        self.mentions = []
+        self.attachments = []
+        self.embeds = []
+        self.webhook_id = None
+        self.reference = None
+        self.created_at = discord.utils.utcnow()
+        self.edited_at = None
+        self.jump_url = f"https://discord.com/channels/{self.guild.id}/{channel.id}/{self.id}"
+
+    async def delete(self, *, delay: float | None = None):
+        self._state.http.calls["delete_message"] += 1
+
+    async def edit(self, **kwargs) -> StandinMessage:
+        self._state.http.calls["edit_message"] += 1
+        return self
+
+    async def add_reaction(self, emoji: Any):
+        self._state.http.calls["add_reaction"] += 1
+
+    async def reply(self, content: str | None = None, **kwargs) -> StandinMessage:
+        return await self.channel.send(content, **kwargs)
@@ -0,0 +1,233 @@
+"""The benchmarks themselves. Each one does its setup against the dataset, then returns the operation to time."""
+from __future__ import annotations
+
+import functools
+import itertools
+import random
+
+from benchmarks.datagen import TRIGGER_WORDS, Dataset, make_user
+from benchmarks.runner import benchmark
+from benchmarks.standins import StandinBot, StandinGuild, StandinMessage
+from sizebot.lib import changes, objs, ranking, userdb
+from sizebot.lib.stats import StatBox
+from sizebot.lib.units import SV, TV, WV, Decimal
+
+
+def _users(dataset: Dataset) -> itertools.cycle[tuple[int, int]]:
+    pairs = [(guildid, userid) for guildid, userids in dataset.users_by_guild.items() for userid in userids]
+    random.Random(dataset.seed).shuffle(pairs)
+    return itertools.cycle(pairs)
+
+
+@benchmark("userdb.load")
+def bench_userdb_load(dataset: Dataset):
+    users = _users(dataset)
+
+    def op():
+        userdb.load(*next(users))
+    return op
+
+
+@benchmark("userdb.save")
+def bench_userdb_save(dataset: Dataset):
+    users = _users(dataset)
+    profiles = [userdb.load(*next(users)) for _ in range(100)]
+    cycle = itertools.cycle(profiles)
+
+    def op():
+        userdb.save(next(cycle))
+    return op
+
+
+@benchmark("statbox.load_scale")
+def bench_statbox(dataset: Dataset):
+    users = _users(dataset)
+    profiles = itertools.cycle([userdb.load(*next(users)) for _ in range(100)])
+
+    def op():
+        userdata = next(profiles)
+        StatBox.load(userdata.stats).scale(userdata.scale)
+    return op
+
+
+@benchmark("statbox.load_scaled_cached")
+def bench_statbox_cached(dataset: Dataset):
+    users = _users(dataset)
+    profiles = itertools.cycle([userdb.load(*next(users)) for _ in range(100)])
+
+    def op():
+        userdata = next(profiles)
+        StatBox.load_scaled(userdata.stats, userdata.scale)
+    return op
+
+
+@benchmark("units.arithmetic")
+def bench_arithmetic(dataset: Dataset):
+    heights = itertools.cycle([SV(Decimal(10) ** e) for e in range(-6, 7)])
+    scale = Decimal("1.5")
+    weight = WV(60000)
+    second = TV(1)
+
+    def op():
+        # The mix of typed operations that scaling a StatBox does
+        height = next(heights)
+        scaled = height * scale
+        area = scaled * scaled
+        area / height
+        weight * (scale * scale * scale)
+        scaled / second
+        scaled + height
+        scaled - height
+        height / scaled
+    return op
+
+
+@benchmark("units.parse_sv")
+def bench_parse_sv(dataset: Dataset):
+    values = itertools.cycle(["5ft10in", "1.754m", "12 miles", "3 lightyears", "2mm", "5'8\"", "100 km"])
+
+    def op():
+        SV.parse(next(values))
+    return op
+
+
+@benchmark("units.format_sv")
+def bench_format_sv(dataset: Dataset):
+    values = itertools.cycle([SV(Decimal(10) ** e) for e in range(-6, 7)])
+
+    def op():
+        format(next(values), ",.3mu")
+    return op
+
+
+@benchmark("objs.close_object")
+def bench_close_object(dataset: Dataset):
+    values = itertools.cycle([SV(Decimal(10) ** e) for e in range(-4, 5)] + [WV(Decimal(10) ** e) for e in range(0, 8)])
+
+    def op():
+        objs.get_close_object_smart(next(values))
+    return op
+
+
+@benchmark("objs.find_by_name")
+def bench_find_by_name(dataset: Dataset):
+    names = itertools.cycle(["penny", "car", "blue whale", "human", "nothing like this", "earth"])
+
+    def op():
+        objs.DigiObject.find_by_name(next(names))
+    return op
+
+
+@benchmark("trigger.on_message")
+def bench_trigger(dataset: Dataset):
+    from sizebot.cogs import trigger
+    trigger.user_triggers.clear()
+    cog = trigger.TriggerCog(None)
+    guilds = [StandinGuild(guildid, userids) for guildid, userids in dataset.users_by_guild.items()]
+    rng = random.Random(dataset.seed)
+    messages = []
+    for guild in guilds:
+        author = rng.choice(guild.members)
+        messages.append(StandinMessage(author, "just chatting, nothing to see here"))
+        messages.append(StandinMessage(author, f"have a {rng.choice(TRIGGER_WORDS)}!"))
+    cycle = itertools.cycle(messages)
+
+    async def op():
+        await cog.on_message(next(cycle))
+    return op
+
+
+@benchmark("limits.on_message")
+def bench_limits(dataset: Dataset):
+    from sizebot.cogs import limits
+    cog = limits.LimitCog(None)
+    rng = random.Random(dataset.seed)
+    messages = []
+    for guildid, userids in dataset.users_by_guild.items():
+        guild = StandinGuild(guildid, userids)
+        messages.append(StandinMessage(rng.choice(guild.members), "just chatting, nothing to see here"))
+    cycle = itertools.cycle(messages)
+
+    async def op():
+        await cog.on_message(next(cycle))
+    return op
+
+
+@benchmark("changes.apply")
+def bench_changes(dataset: Dataset):
+    changes._active_changes.clear()
+    changes.load_from_file()
+    keys = list(changes._active_changes)
+    if not keys:
+        raise ValueError("Dataset has no changes; use more users")
+    bot = StandinBot([StandinGuild(guildid, userids) for guildid, userids in dataset.users_by_guild.items()])
+    cycle = itertools.cycle(keys)
+
+    async def op():
+        await changes.apply(bot, next(cycle))
+    return op
+
+
+@benchmark("edge.get_user_sizes")
+def bench_edge(dataset: Dataset):
+    from sizebot.cogs import edge
+    guilds = itertools.cycle([StandinGuild(guildid, userids) for guildid, userids in dataset.users_by_guild.items()])
+
+    async def op():
+        await edge.getUserSizes(next(guilds))
+    return op
+
+
+# A guild much bigger than the dataset's, for the leaderboard benchmarks
+RANKING_GUILD = 1
+RANKING_USERS = 20_000
+
+
+@functools.cache
+def _big_ranking(seed: int) -> ranking.GuildRanking:
+    rng = random.Random(seed)
+    guildranking = ranking.GuildRanking(RANKING_GUILD)
+    for userid in range(RANKING_USERS):
+        guildranking.set(userid, ranking.values_for(make_user(rng, RANKING_GUILD, userid)))
+    return guildranking
+
+
+@benchmark("ranking.top_20k")
+def bench_ranking_top(dataset: Dataset):
+    guildranking = _big_ranking(dataset.seed)
+    stats = itertools.cycle(ranking.RANKSTATS)
+
+    def op():
+        guildranking.top(next(stats), 10, offset = 100)
+    return op
+
+
+@benchmark("ranking.rank_20k")
+def bench_ranking_rank(dataset: Dataset):
+    guildranking = _big_ranking(dataset.seed)
+    userids = itertools.cycle(random.Random(dataset.seed).sample(range(RANKING_USERS), 1000))
+
+    def op():
+        guildranking.rank(next(userids), "height")
+    return op
+
+
+@benchmark("ranking.update_20k")
+def bench_ranking_update(dataset: Dataset):
+    guildranking = _big_ranking(dataset.seed)
+    rng = random.Random(dataset.seed)
+    updates = itertools.cycle([(userid, ranking.values_for(make_user(rng, RANKING_GUILD, userid))) for userid in rng.sample(range(RANKING_USERS), 1000)])
+
+    def op():
+        guildranking.set(*next(updates))
+    return op
+
+
+@benchmark("ranking.load_20k")
+def bench_ranking_load(dataset: Dataset):
+    ranking.write(_big_ranking(dataset.seed))
+
+    def op():
+        ranking.forget()
+        ranking.load(RANKING_GUILD)
+    return op
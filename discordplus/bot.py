@@ -1,10 +1,10 @@
 from typing import Any
 from collections.abc import Iterable
-
 from copy import copy
 
 import discord
 from discord.ext.commands.bot import BotBase
+from discord.ext.commands.view import StringView
 from discord.ext import commands
 
 old_dispatch = BotBase.dispatch
@@ -23,13 +23,61 @@ def find_one(iterable: Iterable) -> Any:
         return None
 
 
+class LineMessage:
+    """One line of a multi-line message, that shares everything but its content with the original message"""
+    # __slots__ declares to python what attributes to expect.
+    __slots__ = ["_message", "content"]
+
+    def __init__(self, message: discord.Message, content: str):
+        self._message = message
+        self.content = content
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that aren't slots, or slots that were never set (on a half-built copy, say)
+        if name in LineMessage.__slots__:
+            raise AttributeError(name)
+        return getattr(self._message, name)
+
+    def __copy__(self) -> discord.Message:
+        """A real copy of the original message with this line's content, that can be changed freely (like &sudo does)"""
+        message = copy(self._message)
+        message.content = self.content
+        return message
+
+
+def resolve_context(self: BotBase, message: discord.Message, prefix: str | list[str]) -> commands.Context:
+    """Find the prefix and command for a message, like `get_context()`, but with an already known prefix"""
+    view = StringView(message.content)
+    ctx = commands.Context(prefix = None, view = view, bot = self, message = message)
+
+    prefixes = (prefix,) if isinstance(prefix, str) else tuple(prefix)
+    invoked_prefix = discord.utils.find(view.skip_string, prefixes)
+    if invoked_prefix is None:
+        return ctx
+
+    if self.strip_after_prefix:
+        view.skip_ws()
+
+    invoker = view.get_word()
+    ctx.invoked_with = invoker
+    ctx.prefix = invoked_prefix
+    ctx.command = self.all_commands.get(invoker)
+    return ctx
+
+
 async def process_commands(self: BotBase, message: discord.Message):
     if message.author.bot:
         return
 
-    contexts = []
+    # One command
+    if "\n" not in message.content:
+        ctx = await self.get_context(message)
+        await self.invoke(ctx)
+        return
 
-    ctx = await self.get_context(message)
+    # The prefix is the same for every line, so only look it up once
+    prefix = await self.get_prefix(message)
+    ctx = resolve_context(self, message, prefix)
 
     # No command found, invoke will handle it
     if not ctx.command:
@@ -42,13 +90,7 @@ async def process_commands(self: BotBase, message: discord.Message):
         return
 
     # Multiple commands (first command is not multiline)
-    lines = message.content.split("\n")
-    messages = []
-    for line in lines:
-        msg = copy(message)
-        msg.content = line
-        messages.append(msg)
-    contexts = [await self.get_context(msg) for msg in messages]
+    contexts = [resolve_context(self, LineMessage(message, line), prefix) for line in message.content.split("\n")]
 
     # If at least one of the lines does not start with a prefix, then ignore all the lines
     not_command = find_one(ctx for ctx in contexts if ctx.invoked_with is None)
@@ -68,9 +110,16 @@ async def process_commands(self: BotBase, message: discord.Message):
         await multiline_command.command.dispatch_error(multiline_command, commands.errors.BadMultilineCommand(f"{username} tried to run a multi-line command in the middle of a sequence."))
         return
 
-    # If all the lines have a command, then run them in order
-    for ctx in contexts:
-        await self.invoke(ctx)
+    # If all the lines have a command, then run them in order,
+    # converting the arguments for the next line while the current one runs
+    try:
+        for i, ctx in enumerate(contexts):
+            if i + 1 < len(contexts):
+                contexts[i + 1].command.parse_ahead(contexts[i + 1])
+            await self.invoke(ctx)
+    finally:
+        for ctx in contexts:
+            ctx.command.discard_ahead(ctx)
 
 
 def dispatch(self: BotBase, event_name: str, *args, **kwargs):
@@ -1,4 +1,6 @@
-from discord.ext.commands import Command, Cog
+import asyncio
+
+from discord.ext.commands import Command, Cog, Group
 from discord.ext.commands.core import wrap_callback
 from discord.ext import commands
 
@@ -6,14 +8,46 @@ from sizebot.lib.types import BotContext
 
 old_init = Command.__init__
 old_short_doc = Command.short_doc
+old_parse_arguments = Command._parse_arguments
 
 
-def __init__(self: Command, *args, category: str | None = None, multiline: bool = False, **kwargs):
+def __init__(self: Command, *args, category: str | None = None, multiline: bool = False, pure: bool = False, **kwargs):
     self.category = category
     self.multiline = multiline
+    # Argument conversion has no side effects, and doesn't depend on anything earlier commands could change
+    self.pure = pure
     old_init(self, *args, **kwargs)
 
 
+def parse_ahead(self: Command, ctx: BotContext):
+    """Start converting the arguments for `ctx` in the background, if this command allows it"""
+    # Groups read their subcommand from the view after parsing, so they're always parsed in place
+    if not self.pure or isinstance(self, Group):
+        return
+    ctx.parsing_ahead = asyncio.create_task(old_parse_arguments(self, ctx))
+
+
+def discard_ahead(self: Command, ctx: BotContext):
+    """Throw away an argument conversion that was started ahead, but never used (because a check failed, for instance)"""
+    task: asyncio.Task | None = ctx.__dict__.pop("parsing_ahead", None)
+    if task is None:
+        return
+    if task.done():
+        if not task.cancelled():
+            task.exception()
+    else:
+        task.cancel()
+
+
+async def _parse_arguments(self: Command, ctx: BotContext):
+    # If the arguments were already converted ahead, pick up the result (or the error) right where it would have happened
+    task: asyncio.Task | None = ctx.__dict__.pop("parsing_ahead", None)
+    if task is not None:
+        await task
+        return
+    await old_parse_arguments(self, ctx)
+
+
 async def dispatch_error(self: Command, ctx: BotContext, error: commands.CommandError):
     ctx.command_failed = True
     cog = self.cog
@@ -71,6 +105,9 @@ def name_string(self: Command) -> str:
 def patch():
     Command.__init__ = __init__
     Command.dispatch_error = dispatch_error
+    Command.parse_ahead = parse_ahead
+    Command.discard_ahead = discard_ahead
+    Command._parse_arguments = _parse_arguments
     Command.short_doc = short_doc
     Command.alias_string = alias_string
     Command.name_string = name_string
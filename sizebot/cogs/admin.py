@@ -4,8 +4,10 @@ from copy import copy
 import discord
 from discord.ext import commands
 
-from sizebot.lib import userdb
-from sizebot.lib.types import GuildContext
+from sizebot.conf import conf
+from sizebot.lib import admission, importtime, iopool, metrics, render, replycache, userdb, utils
+from sizebot.lib.scheduler import scheduler
+from sizebot.lib.types import BotContext, GuildContext
 
 logger = logging.getLogger("sizebot")
 
@@ -33,7 +35,7 @@ class AdminCog(commands.Cog):
         """Dump a user's data."""
         if user is None:
             user = ctx.author
-        userdata = userdb.load(ctx.guild.id, user.id)
+        userdata = await userdb.aload(ctx.guild.id, user.id)
         await ctx.send(f"```{repr(userdata)}```")
 
     @commands.command(
@@ -50,6 +52,81 @@ class AdminCog(commands.Cog):
         new_message.content = command
         await self.bot.process_commands(new_message)
 
+    @commands.command(
+        hidden = True
+    )
+    @commands.is_owner()
+    async def schedule(self, ctx: BotContext):
+        """Show what the scheduler is waiting on."""
+        # PERMISSION: requires manage_messages
+        await ctx.message.delete(delay=0)
+
+        scheduleDump = scheduler.format_summary()
+
+        if not scheduleDump:
+            scheduleDump = "Nothing scheduled."
+
+        await ctx.author.send("**SCHEDULED TASKS**\n" + scheduleDump)
+
+    @commands.command(
+        hidden = True
+    )
+    @commands.is_owner()
+    async def renderpool(self, ctx: BotContext):
+        """Show the render pool's queue depth."""
+        await ctx.send(f"```\n{render.get_pool().format_summary()}\n```")
+
+    @commands.command(
+        hidden = True
+    )
+    @commands.is_owner()
+    async def ioqueue(self, ctx: BotContext):
+        """Show the I/O pool's busy keys."""
+        await ctx.send(f"```\n{iopool.get_pool().format_summary()}\n```")
+
+    @commands.command(
+        hidden = True
+    )
+    @commands.is_owner()
+    async def buckets(self, ctx: BotContext, limit: int = 10):
+        """Show the command rate limits' busiest users and guilds."""
+        out = admission.get_admission().format_summary(limit = limit)
+        for chunk in utils.chunk_msg(out):
+            await ctx.author.send(chunk)
+
+    @commands.command(
+        hidden = True
+    )
+    @commands.is_owner()
+    async def replycache(self, ctx: BotContext):
+        """Show how often lookup commands are answered from the reply cache."""
+        await ctx.send(f"```\n{replycache.get_cache().format_summary()}\n```")
+
+    @commands.command(
+        hidden = True
+    )
+    @commands.is_owner()
+    async def latency(self, ctx: BotContext):
+        """Show command latency percentiles and event loop lag."""
+        lag = metrics.registry.get("event_loop_lag_seconds")
+        out = metrics.registry.format_summary("command_seconds", "command") or "No commands timed yet."
+        if lag is not None:
+            out += f"\n\nEvent loop lag: p50={lag.percentile(0.5) * 1000:.1f}ms p99={lag.percentile(0.99) * 1000:.1f}ms max={lag.max * 1000:.1f}ms"
+        for chunk in utils.chunk_msg(out):
+            await ctx.author.send(chunk)
+
+    @commands.command(
+        hidden = True
+    )
+    @commands.is_owner()
+    async def importtime(self, ctx: BotContext, limit: int = 15):
+        """Show the slowest imports, against the import budget."""
+        async with ctx.typing():
+            timings = await importtime.measure(["sizebot.main", *sorted(ctx.bot.extensions)])
+        out = importtime.format_report(timings, conf.import_budget_ms, limit = limit)
+        for chunk in utils.chunk_msg(out):
+            await ctx.author.send(chunk)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(AdminCog(bot))
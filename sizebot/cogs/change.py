@@ -2,10 +2,10 @@ import importlib.resources as pkg_resources
 import logging
 import random
 from typing import Self, cast
-from sizebot.lib import errors, utils
+from sizebot.lib import errors
 
 from discord import Member
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 import sizebot.data
 from sizebot.lib import changes, userdb, nickmanager
@@ -21,15 +21,11 @@ logger = logging.getLogger("sizebot")
 class ChangeCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # Changes register themselves with the scheduler, which starts once the bot is properly connected
         changes.load_from_file()
 
-    @commands.Cog.listener()
-    async def on_first_ready(self):
-        # Don't start the change tasks until the bot is properly connected
-        self.changeTask.start()
-
     def cog_unload(self): # type: ignore (Bad typing in discord.py)
-        self.changeTask.cancel()
+        changes.flush()
 
     @commands.command(
         aliases = ["c"],
@@ -54,28 +50,29 @@ class ChangeCog(commands.Cog):
         """
         guildid = ctx.guild.id
         userid = ctx.author.id
-        userdata = userdb.load(guildid, userid)  # Load this data but don't use it as an ad-hoc user test.
-
-        if isinstance(arg, Diff):
-            style = arg.changetype
-            amount = arg.amount
-
-            if style == "add":
-                userdata.height = userdata.height + cast(SV, amount)
-            elif style == "multiply":
-                userdata.height = userdata.height * cast(Decimal, amount)
-            elif style == "power":
-                userdata.scale = userdata.scale ** cast(Decimal, amount)
-            else:
-                raise ChangeMethodInvalidException(style)
-            await nickmanager.nick_update(ctx.author)
-            userdb.save(userdata)
-            await ctx.send(f"{userdata.nickname} is now {userdata.height:m} ({userdata.height:u}) tall.")
-        elif isinstance(arg, Rate) or isinstance(arg, LimitedRate):
-            changes.start(userid, guildid, addPerSec=arg.addPerSec, mulPerSec=arg.mulPerSec, stopSV=arg.stopSV, stopTV=arg.stopTV)
-            await ctx.send(f"{ctx.author.display_name} has begun slow-changing at a rate of `{str(arg)}`.")
-        elif arg == "stop":
-            await ctx.send(**stop_changes(ctx.author))
+        async with userdb.lock(guildid, userid):
+            userdata = await userdb.aload(guildid, userid)  # Load this data but don't use it as an ad-hoc user test.
+
+            if isinstance(arg, Diff):
+                style = arg.changetype
+                amount = arg.amount
+
+                if style == "add":
+                    userdata.height = userdata.height + cast(SV, amount)
+                elif style == "multiply":
+                    userdata.height = userdata.height * cast(Decimal, amount)
+                elif style == "power":
+                    userdata.scale = userdata.scale ** cast(Decimal, amount)
+                else:
+                    raise ChangeMethodInvalidException(style)
+                await nickmanager.nick_update(ctx.author)
+                await userdb.asave(userdata)
+                await ctx.send(f"{userdata.nickname} is now {userdata.height:m} ({userdata.height:u}) tall.")
+            elif isinstance(arg, Rate) or isinstance(arg, LimitedRate):
+                await changes.start(userid, guildid, addPerSec=arg.addPerSec, mulPerSec=arg.mulPerSec, stopSV=arg.stopSV, stopTV=arg.stopTV)
+                await ctx.send(f"{ctx.author.display_name} has begun slow-changing at a rate of `{str(arg)}`.")
+            elif arg == "stop":
+                await ctx.send(**await stop_changes(ctx.author))
 
     @commands.command(
         hidden = True
@@ -99,7 +96,7 @@ class ChangeCog(commands.Cog):
     @commands.guild_only()
     async def stopchange(self, ctx: GuildContext):
         """Stop a currently active slow change."""
-        await ctx.send(**stop_changes(ctx.author))
+        await ctx.send(**await stop_changes(ctx.author))
 
     @commands.command(
         aliases = ["eat"],
@@ -113,11 +110,11 @@ class ChangeCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
+        userdata = await userdb.aload(guildid, userid)
         randmult = Decimal(random.randint(2, 20))
-        change_user_mul(guildid, ctx.author.id, randmult)
+        await change_user_mul(guildid, ctx.author.id, randmult)
         await nickmanager.nick_update(ctx.author)
-        userdata = userdb.load(guildid, userid)
+        userdata = await userdb.aload(guildid, userid)
 
         lines = pkg_resources.read_text(sizebot.data, "eatme.txt").splitlines()
         line = random.choice(lines)
@@ -138,11 +135,11 @@ class ChangeCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
+        userdata = await userdb.aload(guildid, userid)
         randmult = Decimal(random.randint(2, 20))
-        change_user_div(guildid, ctx.author.id, randmult)
+        await change_user_div(guildid, ctx.author.id, randmult)
         await nickmanager.nick_update(ctx.author)
-        userdata = userdb.load(guildid, userid)
+        userdata = await userdb.aload(guildid, userid)
 
         lines = pkg_resources.read_text(sizebot.data, "drinkme.txt").splitlines()
         line = random.choice(lines)
@@ -174,21 +171,22 @@ class ChangeCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
-        if obj is None:
-            objs_larger = [o for o in objects if o.unitlength > userdata.height]
-            if not objs_larger:
-                await ctx.send("You have nothing left to outgrow!")
+        async with userdb.lock(guildid, userid):
+            userdata = await userdb.aload(guildid, userid)
+            if obj is None:
+                objs_larger = [o for o in objects if o.unitlength > userdata.height]
+                if not objs_larger:
+                    await ctx.send("You have nothing left to outgrow!")
+                    return
+                obj = objs_larger[0]
+
+            if obj.unitlength < userdata.height:
+                await ctx.send(f"You're already larger than {obj.article} {obj.name}!")
                 return
-            obj = objs_larger[0]
-
-        if obj.unitlength < userdata.height:
-            await ctx.send(f"You're already larger than {obj.article} {obj.name}!")
-            return
 
-        random_factor = Decimal(random.randint(11, 20) / 10)
-        userdata.height = obj.unitlength * random_factor
-        userdb.save(userdata)
+            random_factor = Decimal(random.randint(11, 20) / 10)
+            userdata.height = obj.unitlength * random_factor
+            await userdb.asave(userdata)
 
         await ctx.send(f"You outgrew {obj.article} **{obj.name}** *({obj.unitlength:,.3mu})* and are now **{userdata.height:,.3mu}** tall!")
 
@@ -201,62 +199,55 @@ class ChangeCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
-        if obj is None:
-            objs_smaller = [o for o in objects if o.unitlength < userdata.height]
-            objs_smaller.reverse()
-            if not objs_smaller:
-                await ctx.send("You have nothing left to outshrink!")
+        async with userdb.lock(guildid, userid):
+            userdata = await userdb.aload(guildid, userid)
+            if obj is None:
+                objs_smaller = [o for o in objects if o.unitlength < userdata.height]
+                objs_smaller.reverse()
+                if not objs_smaller:
+                    await ctx.send("You have nothing left to outshrink!")
+                    return
+                obj = objs_smaller[0]
+
+            if obj.unitlength > userdata.height:
+                await ctx.send(f"You're already smaller than {obj.article} {obj.name}!")
                 return
-            obj = objs_smaller[0]
 
-        if obj.unitlength > userdata.height:
-            await ctx.send(f"You're already smaller than {obj.article} {obj.name}!")
-            return
-
-        random_factor = Decimal(random.randint(11, 20) / 10)
-        userdata.height = obj.unitlength / random_factor
-        userdb.save(userdata)
+            random_factor = Decimal(random.randint(11, 20) / 10)
+            userdata.height = obj.unitlength / random_factor
+            await userdb.asave(userdata)
 
         await ctx.send(f"You outshrunk {obj.article} **{obj.name}** *({obj.unitlength:,.3mu})* and are now **{userdata.height:,.3mu}** tall!")
 
-    # TODO: CamelCase
-    @tasks.loop(seconds=6)
-    async def changeTask(self):
-        """Slow growth task"""
-        try:
-            await changes.apply(self.bot)
-        except Exception as e:
-            logger.error("Ignoring exception in changeTask")
-            logger.error(utils.format_traceback(e))
-
 
-def change_user_mul(guildid: int, userid: int, amount: Decimal):
+async def change_user_mul(guildid: int, userid: int, amount: Decimal):
     if amount == 1:
         raise errors.ValueIsOneException
     if amount == 0:
         raise errors.ValueIsZeroException
-    userdata = userdb.load(guildid, userid)
-    userdata.height = userdata.height * amount
-    userdb.save(userdata)
+    async with userdb.lock(guildid, userid):
+        userdata = await userdb.aload(guildid, userid)
+        userdata.height = userdata.height * amount
+        await userdb.asave(userdata)
 
 
-def change_user_div(guildid: int, userid: int, amount: Decimal):
+async def change_user_div(guildid: int, userid: int, amount: Decimal):
     if amount == 1:
         raise errors.ValueIsOneException
     if amount == 0:
         raise errors.ValueIsZeroException
-    userdata = userdb.load(guildid, userid)
-    userdata.height = userdata.height / amount
-    userdb.save(userdata)
+    async with userdb.lock(guildid, userid):
+        userdata = await userdb.aload(guildid, userid)
+        userdata.height = userdata.height / amount
+        await userdb.asave(userdata)
 
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(ChangeCog(bot))
 
 
-def stop_changes(user: Member) -> StrToSend:
-    deleted = changes.stop(user.id, user.guild.id)
+async def stop_changes(user: Member) -> StrToSend:
+    deleted = await changes.stop(user.id, user.guild.id)
     if deleted is None:
         return {"content": "You can't stop slow-changing, as you don't have a task active!"}
     return {"content": f"{user.display_name} has stopped slow-changing."}
@@ -3,6 +3,7 @@
 # to either 1.1x or 0.9x of the largest or smallest user in the guild, respectively.
 from typing import Any
 
+import asyncio
 import logging
 from sizebot.lib.errors import GuildNotFoundException, UserNotFoundException
 
@@ -18,7 +19,7 @@ logger = logging.getLogger("sizebot")
 
 
 # TODO: CamelCase
-def getUserSizes(g: discord.Guild) -> Any:
+async def getUserSizes(g: discord.Guild) -> Any:
     # Find the largest and smallest current users.
     # TODO: Can this be faster?
     # Like, if you sorted the users by size, would that make this faster?
@@ -28,11 +29,15 @@ def getUserSizes(g: discord.Guild) -> Any:
     largestuser = None
     largestsize = SV(0)
     allusers = {}
+    onlineids = []
     for _, userid in userdb.list_users(guildid=g.id):
         member = g.get_member(userid)
         if not (member and str(member.status) != "offline"):
             continue
-        userdata = userdb.load(g.id, userid)
+        onlineids.append(userid)
+    # Load everyone at once, so the reads run side by side on the I/O pool
+    loaded = await asyncio.gather(*(userdb.aload(g.id, userid) for userid in onlineids))
+    for userid, userdata in zip(onlineids, loaded):
         if userdata.height == 0 or userdata.height == SV("infinity"):
             continue
         if not userdata.is_active:
@@ -63,7 +68,7 @@ class EdgeCog(commands.Cog):
     @commands.guild_only()
     async def edges(self, ctx: GuildContext):
         """See who is set to be the smallest and largest users."""
-        guilddata = guilddb.load_or_create(ctx.guild.id)
+        guilddata = await guilddb.aload_or_create(ctx.guild.id)
         await ctx.send(f"**SERVER-SET SMALLEST AND LARGEST USERS:**\nSmallest: {'*Unset*' if guilddata.small_edge is None else guilddata.small_edge}\nLargest: {'*Unset*' if guilddata.large_edge is None else guilddata.large_edge}")
 
     @commands.command(
@@ -76,9 +81,9 @@ class EdgeCog(commands.Cog):
     @commands.guild_only()
     async def setsmallest(self, ctx: GuildContext, *, member: discord.Member):
         """Set the smallest user."""
-        guilddata = guilddb.load_or_create(ctx.guild.id)
+        guilddata = await guilddb.aload_or_create(ctx.guild.id)
         guilddata.small_edge = member.id
-        guilddb.save(guilddata)
+        await guilddb.asave(guilddata)
         await ctx.send(f"<@{member.id}> is now the smallest user. They will be automatically adjusted to be the smallest user until they are removed from this role.")
         logger.info(f"{member.name} ({member.id}) is now the smallest user in guild {ctx.guild.id}.")
 
@@ -92,9 +97,9 @@ class EdgeCog(commands.Cog):
     @commands.guild_only()
     async def setlargest(self, ctx: GuildContext, *, member: discord.Member):
         """Set the largest user."""
-        guilddata = guilddb.load_or_create(ctx.guild.id)
+        guilddata = await guilddb.aload_or_create(ctx.guild.id)
         guilddata.large_edge = member.id
-        guilddb.save(guilddata)
+        await guilddb.asave(guilddata)
         await ctx.send(f"<@{member.id}> is now the largest user. They will be automatically adjusted to be the largest user until they are removed from this role.")
         logger.info(f"{member.name} ({member.id}) is now the largest user in guild {ctx.guild.id}.")
 
@@ -107,9 +112,9 @@ class EdgeCog(commands.Cog):
     @commands.guild_only()
     async def clearsmallest(self, ctx: GuildContext):
         """Clear the role of 'smallest user.'"""
-        guilddata = guilddb.load_or_create(ctx.guild.id)
+        guilddata = await guilddb.aload_or_create(ctx.guild.id)
         guilddata.small_edge = None
-        guilddb.save(guilddata)
+        await guilddb.asave(guilddata)
         await ctx.send("Smallest user unset.")
         logger.info(f"Smallest user unset in guild {ctx.guild.id}.")
 
@@ -122,9 +127,9 @@ class EdgeCog(commands.Cog):
     @commands.guild_only()
     async def clearlargest(self, ctx: GuildContext):
         """Clear the role of 'largest user.'"""
-        guilddata = guilddb.load_or_create(ctx.guild.id)
+        guilddata = await guilddb.aload_or_create(ctx.guild.id)
         guilddata.large_edge = None
-        guilddb.save(guilddata)
+        await guilddb.asave(guilddata)
         await ctx.send("Largest user unset.")
         logger.info(f"Largest user unset in guild {ctx.guild.id}.")
 
@@ -135,9 +140,9 @@ class EdgeCog(commands.Cog):
     @is_mod()
     @commands.guild_only()
     async def edgedebug(self, ctx: GuildContext):
-        userdata = userdb.load(ctx.guild.id, ctx.author.id)
-        usersizes = getUserSizes(ctx.guild)
-        guilddata = guilddb.load(ctx.guild.id)
+        userdata = await userdb.aload(ctx.guild.id, ctx.author.id)
+        usersizes = await getUserSizes(ctx.guild)
+        guilddata = await guilddb.aload(ctx.guild.id)
         sm = guilddata.small_edge
         lg = guilddata.large_edge
 
@@ -159,7 +164,7 @@ class EdgeCog(commands.Cog):
             return
 
         try:
-            guilddata = guilddb.load(m.guild.id)
+            guilddata = await guilddb.aload(m.guild.id)
         except GuildNotFoundException:
             return  # Guild does not have edges set
 
@@ -168,34 +173,35 @@ class EdgeCog(commands.Cog):
         if not (m.author.id == sm or m.author.id == lg):
             return  # The user is not set to be the smallest or the largest user.
 
-        try:
-            userdata = userdb.load(m.guild.id, m.author.id)
-        except UserNotFoundException:
-            return
-
-        usersizes = getUserSizes(m.guild)
+        usersizes = await getUserSizes(m.guild)
         smallestuser = usersizes["smallest"]["id"]
         smallestsize = usersizes["smallest"]["size"]
         largestuser = usersizes["largest"]["id"]
         largestsize = usersizes["largest"]["size"]
 
-        if sm == m.author.id:
-            if m.author.id == smallestuser:
+        async with userdb.lock(m.guild.id, m.author.id):
+            try:
+                userdata = await userdb.aload(m.guild.id, m.author.id)
+            except UserNotFoundException:
                 return
-            elif userdata.height == SV(0):
-                return
-            else:
-                userdata.height = smallestsize * Decimal(0.9)
-                userdb.save(userdata)
 
-        if lg == m.author.id:
-            if m.author.id == largestuser:
-                return
-            elif userdata.height == SV("infinity"):
-                return
-            else:
-                userdata.height = largestsize * Decimal(1.1)
-                userdb.save(userdata)
+            if sm == m.author.id:
+                if m.author.id == smallestuser:
+                    return
+                elif userdata.height == SV(0):
+                    return
+                else:
+                    userdata.height = smallestsize * Decimal(0.9)
+                    await userdb.asave(userdata)
+
+            if lg == m.author.id:
+                if m.author.id == largestuser:
+                    return
+                elif userdata.height == SV("infinity"):
+                    return
+                else:
+                    userdata.height = largestsize * Decimal(1.1)
+                    await userdb.asave(userdata)
 
         if userdata.display:
             await nickmanager.nick_update(m.author)
@@ -39,9 +39,10 @@ class FunCog(commands.Cog):
     @commands.guild_only()
     async def report(self, ctx: GuildContext, *, user: discord.User):
         """Report a user to the Tiny Rights Alliance."""
-        ud = userdb.load(ctx.guild.id, user.id)
-        ud.tra_reports += 1
-        userdb.save(ud)
+        async with userdb.lock(ctx.guild.id, user.id):
+            ud = await userdb.aload(ctx.guild.id, user.id)
+            ud.tra_reports += 1
+            await userdb.asave(ud)
         await ctx.send(f"{ud.nickname} has been reported to the Tiny Rights Alliance. This is report **#{ud.tra_reports}**.")
 
     @commands.command(
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import aiohttp
+import asyncio
+import functools
 import logging
 import math
 
@@ -13,7 +15,7 @@ from discord.ext import commands
 
 from sizebot import __version__
 from sizebot.conf import conf
-from sizebot.lib import checks, userdb, utils
+from sizebot.lib import checks, objs, render, userdb, utils
 from sizebot.lib.constants import colors, emojis
 from sizebot.lib.menu import Menu
 from sizebot.lib.stats import statmap
@@ -73,30 +75,191 @@ def get_cat_cmds(commands: list[commands.Command]) -> dict[str, list[commands.Co
     return commands_by_cat
 
 
+def render_units() -> Embed:
+    heightobjectunits = [su.unit for su in SV._systems["o"]._systemunits]
+    weightobjectunits = [su.unit for su in WV._systems["o"]._systemunits]
+
+    heightunits = [str(u) for u in sorted(SV._units) if u not in heightobjectunits]
+    weightunits = [str(u) for u in sorted(WV._units) if u not in weightobjectunits]
+
+    embed = Embed(title=f"Units [SizeBot {__version__}]")
+
+    for n, units in enumerate(utils.chunk_list(heightunits, math.ceil(len(heightunits) / 3))):
+        embed.add_field(name="Height" if n == 0 else "\u200b", value="\n".join(units))
+
+    for n, units in enumerate(utils.chunk_list(weightunits, math.ceil(len(weightunits) / 3))):
+        embed.add_field(name="Weight" if n == 0 else "\u200b", value="\n".join(units))
+
+    return embed
+
+
+@functools.lru_cache(maxsize = 1)
+def _render_units_once(catalog_version: int) -> Embed:
+    return render_units()
+
+
+def get_units_embed() -> Embed:
+    """The units list, which doesn't depend on which cogs are loaded, so it's only rendered again when the objects are reloaded"""
+    return _render_units_once(objs.catalog_version)
+
+
+def render_summary(commands_by_cat: dict[str, list[commands.Command]]) -> Embed:
+    embed = Embed(title=f"Help [SizeBot {__version__}]")
+    embed.set_footer(text = "Select an emoji to see details about a category.")
+
+    # Add each category to a field
+    for cat in categories:
+        cat_cmds = commands_by_cat.get(cat.cid, [])
+        if not cat_cmds:
+            continue
+        field_text = f"\n\n**{cat.emoji} {cat.name}**\n" + (", ".join(f"`{c.name}`" for c in cat_cmds))
+        embed.add_field(value=field_text, inline=False)
+    return embed
+
+
+def render_category_help(category: HelpCategory, cmds: list[commands.Command]) -> Embed:
+    embed = Embed(title=f"{category.name} Help [SizeBot {__version__}]")
+
+    command_texts = [f"`{c.name}` {c.alias_string}\n{c.short_doc}" for c in cmds]
+    embed.add_field(value=f"**{category.emoji}{category.name}**", inline=False)
+    field_texts = [""]
+    for t in command_texts:
+        if len(field_texts[-1] + "\n" + t) > 1024:
+            field_texts.append("")
+        field_texts[-1] = field_texts[-1] + "\n" + t
+    for text in field_texts:
+        embed.add_field(value=text)
+    return embed
+
+
+def render_command_help(cmd: commands.Command, prefix: str) -> Embed:
+    """Help for a command.
+
+    Help
+
+    {prefix}{cmd.name} {cmd.usage (or autogenerated signature)}
+
+    {cmd.description (optional)}
+
+    {cmd.help (docstring, optional)}
+
+    Aliases:
+    alias1, alias2
+    """
+    signature = f"{prefix}{cmd.name} {cmd.signature}"
+
+    descriptionParts = []
+    if cmd.description:
+        descriptionParts.append(cmd.description)
+    if cmd.help:
+        descriptionParts.append(cmd.help)
+    description = ""
+    if "is_owner" in repr(cmd.checks):
+        description += ":rotating_light: **THIS COMMAND IS FOR BOT OWNERS ONLY** :rotating_light:\n"
+    if "is_mod" in repr(cmd.checks):
+        description += ":rotating_light: **THIS COMMAND IS FOR SERVER MODS ONLY** :rotating_light:\n"
+    if "guild_only" in repr(cmd.checks):
+        description += "*This command can only be run in a server, and not in DMs.*\n"
+    description += "\n\n".join(descriptionParts).replace("&", prefix).replace("#STATS#", stats_string).replace("#ALPHA#", alpha_warning).replace("#ACC#", accuracy_warning)
+
+    embed = Embed(
+        title=signature,
+        description=description
+    ).set_author(name=f"Help [SizeBot {__version__}]").set_footer(text=f"See `{conf.prefix}help <command>` for more details about a command and how to use it.")
+
+    if cmd.aliases:
+        embed.add_field(name="**Aliases:**", value=", ".join(cmd.aliases), inline=False)
+
+    return embed
+
+
+class HelpCatalog:
+    """Every help embed, rendered once for the cogs that were loaded at the time.
+
+    The summary and category embeds have no author, since that depends on who asked, so send a copy of them.
+    """
+
+    def __init__(self, key: tuple[int, ...]):
+        self.key = key
+        self.summary: Embed = None
+        self.category_options: dict[str, HelpCategory] = {}
+        self.categories: dict[str, Embed] = {}
+        self.commands: dict[str, Embed] = {}
+        self.units: Embed = None
+
+    @staticmethod
+    def key_for(bot: commands.Bot) -> tuple[int, ...]:
+        return tuple(id(cog) for cog in bot.cogs.values())
+
+    def is_current(self, bot: commands.Bot) -> bool:
+        """Whether no cog has been added, removed or reloaded since this was built"""
+        return self.key == self.key_for(bot)
+
+    @classmethod
+    async def build(cls, bot: commands.Bot) -> HelpCatalog:
+        """Render every help embed, letting other tasks run between commands"""
+        catalog = cls(cls.key_for(bot))
+        commands_by_cat = get_cat_cmds(bot.commands)
+        catalog.summary = render_summary(commands_by_cat)
+        catalog.category_options = {cat.emoji: cat for cat in categories if commands_by_cat.get(cat.cid, [])}
+        for cat in categories:
+            await asyncio.sleep(0)
+            catalog.categories[cat.cid] = render_category_help(cat, commands_by_cat.get(cat.cid, []))
+        for cmd in list(bot.walk_commands()):
+            await asyncio.sleep(0)
+            catalog.commands[cmd.qualified_name] = render_command_help(cmd, conf.prefix)
+        # Rendering the units takes a while, but only the first time, so that's done on the render pool
+        catalog.units = await render.run(get_units_embed)
+        return catalog
+
+
 class HelpCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.catalog: HelpCatalog | None = None
+        self._rebuild: asyncio.Task | None = None
+
+    def cog_unload(self):  # type: ignore (Bad typing in discord.py)
+        if self._rebuild is not None:
+            self._rebuild.cancel()
+
+    async def _build_catalog(self):
+        try:
+            # Build again if the cogs changed while this build was under way
+            while self.catalog is None or not self.catalog.is_current(self.bot):
+                self.catalog = await HelpCatalog.build(self.bot)
+        except Exception as e:
+            logger.error("Failed to build the help catalog")
+            logger.error(utils.format_traceback(e))
+
+    def refresh_catalog(self):
+        """Rebuild the catalog in the background, unless that's already under way"""
+        if self._rebuild is None or self._rebuild.done():
+            self._rebuild = asyncio.create_task(self._build_catalog())
+
+    async def get_catalog(self) -> HelpCatalog:
+        """The catalog, or the last one built while a new one is on its way"""
+        if self.catalog is None or not self.catalog.is_current(self.bot):
+            self.refresh_catalog()
+        if self.catalog is None:
+            await asyncio.shield(self._rebuild)
+        return self.catalog
+
+    @commands.Cog.listener()
+    async def on_cogs_loaded(self):
+        self.refresh_catalog()
+
+    @commands.Cog.listener()
+    async def on_extension_loaded(self, extension: str):
+        self.refresh_catalog()
 
     @commands.command(
         category = "help"
     )
     async def units(self, ctx: BotContext):
         """Get a list of the various units SizeBot accepts."""
-        heightobjectunits = [su.unit for su in SV._systems["o"]._systemunits]
-        weightobjectunits = [su.unit for su in WV._systems["o"]._systemunits]
-
-        heightunits = [str(u) for u in sorted(SV._units) if u not in heightobjectunits]
-        weightunits = [str(u) for u in sorted(WV._units) if u not in weightobjectunits]
-
-        embed = Embed(title=f"Units [SizeBot {__version__}]")
-
-        for n, units in enumerate(utils.chunk_list(heightunits, math.ceil(len(heightunits) / 3))):
-            embed.add_field(name="Height" if n == 0 else "\u200b", value="\n".join(units))
-
-        for n, units in enumerate(utils.chunk_list(weightunits, math.ceil(len(weightunits) / 3))):
-            embed.add_field(name="Weight" if n == 0 else "\u200b", value="\n".join(units))
-
-        await ctx.send(embed=embed)
+        catalog = await self.get_catalog()
+        await ctx.send(embed=catalog.units)
 
     async def send_summary_help(self, ctx: BotContext):
         """Sends help summary.
@@ -109,29 +272,14 @@ class HelpCog(commands.Cog):
         {cmd.name} - {cmd.brief (or first line of cmd.help)}
         ...
         """
-
-        # Get commands grouped by category
-        commands_by_cat = get_cat_cmds(ctx.bot.commands)
-
-        embed = Embed(title=f"Help [SizeBot {__version__}]")
-        embed.set_footer(text = "Select an emoji to see details about a category.")
+        catalog = await self.get_catalog()
+        embed = catalog.summary.copy()
         embed.set_author(name = f"requested by {ctx.author.name}", icon_url = ctx.author.avatar)
 
-        # Add each category to a field
-        for cat in categories:
-            cat_cmds = commands_by_cat.get(cat.cid, [])
-            if not cat_cmds:
-                # logger.warn(f"Command category {cat.cid!r} is empty.")
-                continue
-            field_text = f"\n\n**{cat.emoji} {cat.name}**\n" + (", ".join(f"`{c.name}`" for c in cat_cmds))
-            embed.add_field(value=field_text, inline=False)
-
         # Display the embed with a reaction menu
-        categoryoptions = {cat.emoji: cat for cat in categories if commands_by_cat.get(cat.cid, [])}
-
         reactionmenu, answer = await Menu.display(
             ctx,
-            categoryoptions.keys(),
+            catalog.category_options.keys(),
             cancel_emoji = emojis.cancel,
             initial_embed = embed,
             delete_after = False
@@ -143,25 +291,14 @@ class HelpCog(commands.Cog):
 
         # User clicked a category emoji
         await reactionmenu.message.delete()
-        selectedcategory = categoryoptions[answer]
-        cat_cmds = commands_by_cat.get(selectedcategory.cid, [])
-        await self.send_category_help(ctx, selectedcategory, cat_cmds)
+        selectedcategory = catalog.category_options[answer]
+        await self.send_category_help(ctx, selectedcategory)
 
-    async def send_category_help(self, ctx: BotContext, category: HelpCategory, cmds: list[commands.Command]):
-        # Prepare the embed for the category
-        embed = Embed(title=f"{category.name} Help [SizeBot {__version__}]")
+    async def send_category_help(self, ctx: BotContext, category: HelpCategory):
+        catalog = await self.get_catalog()
+        embed = catalog.categories[category.cid].copy()
         embed.set_author(name = ctx.author.name, icon_url = ctx.author.avatar)
 
-        command_texts = [f"`{c.name}` {c.alias_string}\n{c.short_doc}" for c in cmds]
-        embed.add_field(value=f"**{category.emoji}{category.name}**", inline=False)
-        field_texts = [""]
-        for t in command_texts:
-            if len(field_texts[-1] + "\n" + t) > 1024:
-                field_texts.append("")
-            field_texts[-1] = field_texts[-1] + "\n" + t
-        for text in field_texts:
-            embed.add_field(value=text)
-
         # Display the embed with a reaction menu
         reactionmenu, answer = await Menu.display(
             ctx,
@@ -180,43 +317,12 @@ class HelpCog(commands.Cog):
         await self.send_summary_help(ctx)
 
     async def send_command_help(self, ctx: BotContext, cmd: commands.Command):
-        """Sends help for a command.
-
-        Help
-
-        {prefix}{cmd.name} {cmd.usage (or autogenerated signature)}
-
-        {cmd.description (optional)}
-
-        {cmd.help (docstring, optional)}
-
-        Aliases:
-        alias1, alias2
-        """
-        signature = f"{ctx.prefix}{cmd.name} {cmd.signature}"
-
-        descriptionParts = []
-        if cmd.description:
-            descriptionParts.append(cmd.description)
-        if cmd.help:
-            descriptionParts.append(cmd.help)
-        description = ""
-        if "is_owner" in repr(cmd.checks):
-            description += ":rotating_light: **THIS COMMAND IS FOR BOT OWNERS ONLY** :rotating_light:\n"
-        if "is_mod" in repr(cmd.checks):
-            description += ":rotating_light: **THIS COMMAND IS FOR SERVER MODS ONLY** :rotating_light:\n"
-        if "guild_only" in repr(cmd.checks):
-            description += "*This command can only be run in a server, and not in DMs.*\n"
-        description += "\n\n".join(descriptionParts).replace("&", ctx.prefix).replace("#STATS#", stats_string).replace("#ALPHA#", alpha_warning).replace("#ACC#", accuracy_warning)
-
-        embed = Embed(
-            title=signature,
-            description=description
-        ).set_author(name=f"Help [SizeBot {__version__}]").set_footer(text=f"See `{conf.prefix}help <command>` for more details about a command and how to use it.")
-
-        if cmd.aliases:
-            embed.add_field(name="**Aliases:**", value=", ".join(cmd.aliases), inline=False)
-
+        embed = None
+        if ctx.prefix == conf.prefix:
+            catalog = await self.get_catalog()
+            embed = catalog.commands.get(cmd.qualified_name)
+        if embed is None:
+            embed = render_command_help(cmd, ctx.prefix)
         await ctx.send(embed=embed)
 
     @commands.command(
@@ -1,14 +1,15 @@
 import importlib.resources as pkg_resources
 import logging
+import time
 
 import arrow
 
 import discord
-from discord.ext import commands, tasks
-from discord.utils import sleep_until
+from discord.ext import commands
 
 import sizebot.data
 from sizebot.conf import conf
+from sizebot.lib.scheduler import scheduler
 from sizebot.lib.types import BotContext
 from sizebot.lib.utils import int_to_roman, format_traceback
 
@@ -25,20 +26,17 @@ class HolidayCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.holidayTask.start()
+        scheduler.schedule("holiday", time.time(), self.holiday_check)
 
     def cog_unload(self): # type: ignore (Bad typing in discord.py)
-        self.holidayTask.cancel()
+        scheduler.cancel("holiday")
 
-    # TODO: CamelCase
-    @tasks.loop(seconds=60)
-    async def holidayTask(self):
+    async def holiday_check(self, bot: commands.Bot):
         """Holiday checker"""
+        now = arrow.now()
         try:
             # logger.info("Checking for holidays")
 
-            now = arrow.now()
-
             # Holiday checks.
             newactivityname = conf.activity
 
@@ -84,14 +82,11 @@ class HolidayCog(commands.Cog):
                 newactivity = discord.Game(name = newactivityname)
                 await self.bot.change_presence(activity = newactivity)
 
-            next_midnight = arrow.get(now).replace(hour=0, minute=0, second=0).shift(days=1)
-            await sleep_until(next_midnight.datetime)
         except Exception as err:
             logger.error(format_traceback(err))
-
-    @holidayTask.before_loop
-    async def before_holidayTask(self):
-        await self.bot.wait_until_ready()
+        finally:
+            next_midnight = arrow.get(now).replace(hour=0, minute=0, second=0, microsecond=0).shift(days=1)
+            scheduler.schedule("holiday", next_midnight.timestamp(), self.holiday_check)
 
     @commands.command(
         hidden = True
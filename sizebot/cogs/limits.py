@@ -24,7 +24,7 @@ class LimitCog(commands.Cog):
     @commands.guild_only()
     async def limits(self, ctx: GuildContext):
         """See the guild's current caps."""
-        guilddata = guilddb.load_or_create(ctx.guild.id)
+        guilddata = await guilddb.aload_or_create(ctx.guild.id)
         print_low = '*Unset*' if guilddata.low_limit is None else format(guilddata.low_limit, ",.3mu")
         print_high = '*Unset*' if guilddata.high_limit is None else format(guilddata.high_limit, ",.3mu")
         await ctx.send(f"**SERVER-SET LOW CAPS AND HIGH CAPS:**\nLow Limit: {print_low}\nHigh Limit: {print_high}")
@@ -39,9 +39,9 @@ class LimitCog(commands.Cog):
     @commands.guild_only()
     async def setlowlimit(self, ctx: GuildContext, *, size: SV):
         """Set the low size limit (floor)."""
-        guilddata = guilddb.load_or_create(ctx.guild.id)
+        guilddata = await guilddb.aload_or_create(ctx.guild.id)
         guilddata.low_limit = size
-        guilddb.save(guilddata)
+        await guilddb.asave(guilddata)
         await ctx.send(f"{size:,.3mu} is now the lowest allowed size in this guild.")
         logger.info(f"{size:,.3mu} is now the low size cap in guild {ctx.guild.id}.")
 
@@ -55,9 +55,9 @@ class LimitCog(commands.Cog):
     @commands.guild_only()
     async def sethighlimit(self, ctx: GuildContext, *, size: SV):
         """Set the high size limit (ceiling)."""
-        guilddata = guilddb.load_or_create(ctx.guild.id)
+        guilddata = await guilddb.aload_or_create(ctx.guild.id)
         guilddata.high_limit = size
-        guilddb.save(guilddata)
+        await guilddb.asave(guilddata)
         await ctx.send(f"{size:,.3mu} is now the highest allowed size in this guild.")
         logger.info(f"{size:,.3mu} is now the high size cap in guild {ctx.guild.id}.")
 
@@ -71,9 +71,9 @@ class LimitCog(commands.Cog):
     @commands.guild_only()
     async def clearlowlimit(self, ctx: GuildContext):
         """Set the low size limit (floor)."""
-        guilddata = guilddb.load_or_create(ctx.guild.id)
+        guilddata = await guilddb.aload_or_create(ctx.guild.id)
         guilddata.low_limit = None
-        guilddb.save(guilddata)
+        await guilddb.asave(guilddata)
         await ctx.send("There is now no lowest allowed size in this guild.")
         logger.info(f"Cleared low size cap in guild {ctx.guild.id}.")
 
@@ -87,9 +87,9 @@ class LimitCog(commands.Cog):
     @commands.guild_only()
     async def clearhighlimit(self, ctx: GuildContext):
         """Set the high size limit (ceiling)."""
-        guilddata = guilddb.load_or_create(ctx.guild.id)
+        guilddata = await guilddb.aload_or_create(ctx.guild.id)
         guilddata.high_limit = None
-        guilddb.save(guilddata)
+        await guilddb.asave(guilddata)
         await ctx.send("There is now no highest allowed size in this guild.")
         logger.info(f"Cleared high size cap in guild {ctx.guild.id}.")
 
@@ -99,26 +99,28 @@ class LimitCog(commands.Cog):
         if not isinstance(m.author, discord.Member):
             return
 
+        # Check the guild first, since most guilds have no settings and that's answered from the cache
         try:
-            userdata = userdb.load(m.guild.id, m.author.id)
-        except UserNotFoundException:
-            return
-        try:
-            guilddata = guilddb.load(m.guild.id)
+            guilddata = await guilddb.aload(m.guild.id)
         except GuildNotFoundException:
             return
-
-        if guilddata.low_limit:
-            if userdata.height < guilddata.low_limit:
-                userdata.height = guilddata.low_limit
-                userdb.save(userdata)
-                await m.channel.send(f"{userdata.nickname} hit the lower limit of this guild and has been set to {guilddata.low_limit:,.3mu}.")
-
-        if guilddata.high_limit:
-            if userdata.height > guilddata.high_limit:
-                userdata.height = guilddata.high_limit
-                userdb.save(userdata)
-                await m.channel.send(f"{userdata.nickname} hit the upper limit of this guild and has been set to {guilddata.high_limit:,.3mu}.")
+        async with userdb.lock(m.guild.id, m.author.id):
+            try:
+                userdata = await userdb.aload(m.guild.id, m.author.id)
+            except UserNotFoundException:
+                return
+
+            if guilddata.low_limit:
+                if userdata.height < guilddata.low_limit:
+                    userdata.height = guilddata.low_limit
+                    await userdb.asave(userdata)
+                    await m.channel.send(f"{userdata.nickname} hit the lower limit of this guild and has been set to {guilddata.low_limit:,.3mu}.")
+
+            if guilddata.high_limit:
+                if userdata.height > guilddata.high_limit:
+                    userdata.height = guilddata.high_limit
+                    await userdb.asave(userdata)
+                    await m.channel.send(f"{userdata.nickname} hit the upper limit of this guild and has been set to {guilddata.high_limit:,.3mu}.")
 
         if userdata.display:
             await nickmanager.nick_update(m.author)
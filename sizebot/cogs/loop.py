@@ -9,8 +9,9 @@ from discord.ext import commands
 
 from sizebot.lib.stats import StatBox
 from sizebot.lib.units import RV, SV, TV
-from sizebot.lib import userdb
+from sizebot.lib import errors, userdb
 from sizebot.lib.constants import emojis
+from sizebot.lib.scheduler import scheduler
 from sizebot.lib.types import GuildContext
 from sizebot.lib.utils import pretty_time_delta
 from sizebot.lib.userdb import MoveTypeStr
@@ -30,7 +31,7 @@ def calc_move_dist(userdata: userdb.User) -> tuple[TV, SV]:
     if stoptime is not None and elapsed_seconds >= stoptime:
         elapsed_seconds = stoptime
 
-    stats = StatBox.load(userdata.stats).scale(userdata.scale)
+    stats = StatBox.load_scaled(userdata.stats, userdata.scale)
     try:
         speed: SV = stats[f"{movetype}perhour"].value
     except KeyError:
@@ -42,6 +43,38 @@ def calc_move_dist(userdata: userdb.User) -> tuple[TV, SV]:
     return elapsed_seconds, distance
 
 
+def schedule_auto_stop(userdata: userdb.User, channel: discord.abc.Messageable):
+    """Finish a timed movement as soon as its time limit runs out"""
+    guildid = userdata.guildid
+    userid = userdata.id
+    movestarted = userdata.movestarted
+    stoptime = movestarted.shift(seconds=float(userdata.movestop))
+
+    async def callback(bot: commands.Bot):
+        async with userdb.lock(guildid, userid):
+            try:
+                userdata = await userdb.aload(guildid, userid)
+            except errors.UserNotFoundException:
+                return
+            # This movement was already stopped, or replaced by a newer one
+            if userdata.currentmovetype is None or userdata.movestarted != movestarted:
+                return
+            t, distance = calc_move_dist(userdata)
+            nicetime = pretty_time_delta(t)
+            movetype = userdata.currentmovetype
+            userdata.currentmovetype = None
+            userdata.movestarted = None
+            userdata.movestop = None
+            await userdb.asave(userdata)
+        await channel.send(f"{userdata.nickname} finished {lang.ing[movetype]}. They {lang.ed[movetype]} **{distance:,.3mu}** in **{nicetime}**!")
+
+    scheduler.schedule(("move", guildid, userid), stoptime.timestamp(), callback)
+
+
+def cancel_auto_stop(userdata: userdb.User):
+    scheduler.cancel(("move", userdata.guildid, userdata.id))
+
+
 class LoopCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -66,21 +99,24 @@ class LoopCog(commands.Cog):
         # Fix typing now that we've checked it
         action = cast(userdb.MoveTypeStr, action)
 
-        userdata = userdb.load(ctx.guild.id, ctx.author.id)
-
-        if userdata.currentmovetype:
-            t, distance = calc_move_dist(userdata)
-            nicetime = pretty_time_delta(t)
-            await ctx.send(
-                f"{emojis.warning} You're already {lang.ing[userdata.currentmovetype]}.\n"
-                f"You've gone **{distance:,.3mu}** so far in **{nicetime}**!"
-            )
-            return
-
-        userdata.currentmovetype = action
-        userdata.movestarted = arrow.now()
-        userdata.movestop = stop
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id)
+
+            if userdata.currentmovetype:
+                t, distance = calc_move_dist(userdata)
+                nicetime = pretty_time_delta(t)
+                await ctx.send(
+                    f"{emojis.warning} You're already {lang.ing[userdata.currentmovetype]}.\n"
+                    f"You've gone **{distance:,.3mu}** so far in **{nicetime}**!"
+                )
+                return
+
+            userdata.currentmovetype = action
+            userdata.movestarted = arrow.now()
+            userdata.movestop = stop
+            await userdb.asave(userdata)
+        if stop is not None:
+            schedule_auto_stop(userdata, ctx.channel)
         await ctx.send(f"{userdata.nickname} is now {lang.ing[userdata.currentmovetype]}.")
 
     @commands.command(
@@ -89,19 +125,21 @@ class LoopCog(commands.Cog):
     @commands.guild_only()
     async def stop(self, ctx: GuildContext):
         """Stop a current movement."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id)
-        if userdata.currentmovetype is None:
-            await ctx.send("You aren't currently moving!")
-            return
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id)
+            if userdata.currentmovetype is None:
+                await ctx.send("You aren't currently moving!")
+                return
 
-        t, distance = calc_move_dist(userdata)
-        nicetime = pretty_time_delta(t)
-        await ctx.send(f"You stopped {lang.ing[userdata.currentmovetype]}. You {lang.ed[userdata.currentmovetype]} **{distance:,.3mu}** in **{nicetime}**!")
+            t, distance = calc_move_dist(userdata)
+            nicetime = pretty_time_delta(t)
+            await ctx.send(f"You stopped {lang.ing[userdata.currentmovetype]}. You {lang.ed[userdata.currentmovetype]} **{distance:,.3mu}** in **{nicetime}**!")
 
-        userdata.currentmovetype = None
-        userdata.movestarted = None
-        userdata.movestop = None
-        userdb.save(userdata)
+            userdata.currentmovetype = None
+            userdata.movestarted = None
+            userdata.movestop = None
+            await userdb.asave(userdata)
+        cancel_auto_stop(userdata)
 
     @commands.command(
         category = "loop"
@@ -115,7 +153,7 @@ class LoopCog(commands.Cog):
         if who is None:
             who = ctx.author
         whoid = who.id
-        userdata = userdb.load(ctx.guild.id, whoid)
+        userdata = await userdb.aload(ctx.guild.id, whoid)
 
         if userdata.currentmovetype is None:
             if who == ctx.author:
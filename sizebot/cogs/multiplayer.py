@@ -30,18 +30,19 @@ class MPCog(commands.Cog):
 
         If a user has a button set (with `&setbutton`,) changes that user by their set amount.
         """
-        userdata = userdb.load(ctx.guild.id, user.id)
-        if userdata.button is None:
-            await ctx.send(f"{userdata.nickname} has no button to push!")
-            return
-        diff = userdata.button
-        if diff.changetype == "multiply":
-            userdata.height *= diff.amount
-        elif diff.changetype == "add":
-            userdata.height += diff.amount
-        elif diff.changetype == "power":
-            userdata = userdata ** diff.amount
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, user.id):
+            userdata = await userdb.aload(ctx.guild.id, user.id)
+            if userdata.button is None:
+                await ctx.send(f"{userdata.nickname} has no button to push!")
+                return
+            diff = userdata.button
+            if diff.changetype == "multiply":
+                userdata.height *= diff.amount
+            elif diff.changetype == "add":
+                userdata.height += diff.amount
+            elif diff.changetype == "power":
+                userdata = userdata ** diff.amount
+            await userdb.asave(userdata)
         await nickmanager.nick_update(user)
         await ctx.send(f"You pushed {userdata.nickname}'s button! They are now **{userdata.height:,.3mu}** tall.")
 
@@ -55,9 +56,10 @@ class MPCog(commands.Cog):
 
         Set a change amount, and when others run `&pushbutton` on you, you'll change by that amount.
         """
-        userdata = userdb.load(ctx.guild.id, ctx.author.id)
-        userdata.button = diff
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id)
+            userdata.button = diff
+            await userdb.asave(userdata)
         await ctx.send(f"Set button to {diff}.")
 
     @commands.command(
@@ -67,9 +69,10 @@ class MPCog(commands.Cog):
     @commands.guild_only()
     async def clearbutton(self, ctx: GuildContext):
         """Remove your push button."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id)
-        userdata.button = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id)
+            userdata.button = None
+            await userdb.asave(userdata)
         await ctx.send("Your button is now disabled.")
 
     @commands.command(
@@ -92,8 +95,8 @@ class MPCog(commands.Cog):
         if thief is None:
             thief = ctx.message.author
 
-        thiefdata = userdb.load(ctx.guild.id, thief.id)
-        victimdata = userdb.load(ctx.guild.id, victim.id)
+        thiefdata = await userdb.aload(ctx.guild.id, thief.id)
+        victimdata = await userdb.aload(ctx.guild.id, victim.id)
 
         if isinstance(amount, SV):
             original_victim_height = copy(victimdata.height)
@@ -152,26 +155,27 @@ class MPCog(commands.Cog):
     @commands.guild_only()
     async def changeother(self, ctx: GuildContext, other: discord.Member, *, string: Diff):
         """Change someone else's height. The other user must have this functionality enabled."""
-        userdata = userdb.load(other.guild.id, other.id)
-
-        if not userdata.allowchangefromothers:
-            await ctx.send(f"{userdata.nickname} does not allow others to change their size.")
-            return
-
-        style = string.changetype
-        amount = string.amount
-
-        if style == "add":
-            userdata.height += amount
-        elif style == "multiply":
-            userdata.height *= amount
-        elif style == "power":
-            userdata = userdata ** amount
-        else:
-            raise ChangeMethodInvalidException
-        await nickmanager.nick_update(other)
+        async with userdb.lock(other.guild.id, other.id):
+            userdata = await userdb.aload(other.guild.id, other.id)
+
+            if not userdata.allowchangefromothers:
+                await ctx.send(f"{userdata.nickname} does not allow others to change their size.")
+                return
 
-        userdb.save(userdata)
+            style = string.changetype
+            amount = string.amount
+
+            if style == "add":
+                userdata.height += amount
+            elif style == "multiply":
+                userdata.height *= amount
+            elif style == "power":
+                userdata = userdata ** amount
+            else:
+                raise ChangeMethodInvalidException
+            await nickmanager.nick_update(other)
+
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname} is now {userdata.height:mu} tall.")
 
@@ -183,14 +187,15 @@ class MPCog(commands.Cog):
     @commands.guild_only()
     async def setother(self, ctx: GuildContext, other: discord.Member, *, newheight: SV):
         """Set someone else's height. The other user must have this functionality enabled."""
-        userdata = userdb.load(other.guild.id, other.id)
+        async with userdb.lock(other.guild.id, other.id):
+            userdata = await userdb.aload(other.guild.id, other.id)
 
-        if not userdata.allowchangefromothers:
-            await ctx.send(f"{userdata.nickname} does not allow others to change their size.")
-            return
+            if not userdata.allowchangefromothers:
+                await ctx.send(f"{userdata.nickname} does not allow others to change their size.")
+                return
 
-        userdata.height = newheight
-        userdb.save(userdata)
+            userdata.height = newheight
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname} is now {userdata.height:mu} tall.")
 
@@ -209,9 +214,10 @@ class MPCog(commands.Cog):
 
         #ALPHA#
         """
-        userdata = userdb.load(ctx.guild.id, ctx.author.id)
-        userdata.allowchangefromothers = not userdata.allowchangefromothers
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id)
+            userdata.allowchangefromothers = not userdata.allowchangefromothers
+            await userdb.asave(userdata)
 
         s = f"Set allowing others to change your size to {userdata.allowchangefromothers}."
 
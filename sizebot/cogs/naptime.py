@@ -1,8 +1,8 @@
 import logging
 
-from discord.ext import commands, tasks
+from discord.ext import commands
 
-from sizebot.lib import naps, utils
+from sizebot.lib import naps
 from sizebot.lib.types import BotContext, GuildContext
 from sizebot.lib.units import TV
 
@@ -14,10 +14,7 @@ class NaptimeCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.nannyTask.start()
-
-    def cog_unload(self): # type: ignore (Bad typing in discord.py)
-        self.nannyTask.cancel()
+        naps.load_from_file()
 
     @commands.command(
         aliases = ["chloroform"],
@@ -37,7 +34,7 @@ class NaptimeCog(commands.Cog):
 
         logger.info(f"{ctx.author.display_name} wants to go to sleep in {duration:m}.")
 
-        naps.start(ctx.author.id, ctx.guild.id, duration)
+        await naps.start(ctx.author.id, ctx.guild.id, duration)
 
         await ctx.send(f"See you in {duration:m}!")
 
@@ -51,7 +48,7 @@ class NaptimeCog(commands.Cog):
         """
         logger.info(f"{ctx.author.display_name} wants to cancel bedtime.")
 
-        nanny = naps.stop(ctx.author.id)
+        nanny = await naps.stop(ctx.author.id)
         if nanny is not None:
             await ctx.send("Naptime has been cancelled.")
 
@@ -74,16 +71,6 @@ class NaptimeCog(commands.Cog):
         await ctx.author.send("**WAITING NANNIES**\n" + nannyDump)
         logger.info(f"User {ctx.author.id} ({ctx.author.display_name}) dumped the waiting nannies.")
 
-    # TODO: CamelCase
-    @tasks.loop(seconds=60)
-    async def nannyTask(self):
-        """Nanny task"""
-        try:
-            await naps.check(self.bot)
-        except Exception as e:
-            logger.error("Ignoring exception in nannyTask")
-            logger.error(utils.format_traceback(e))
-
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(NaptimeCog(bot))
@@ -9,7 +9,7 @@ from discord.ext import commands
 from discord.ext.commands.converter import MemberConverter
 
 from sizebot import __version__
-from sizebot.lib import objs, proportions, userdb, utils
+from sizebot.lib import objs, proportions, render, replycache, userdb, utils
 from sizebot.lib.constants import emojis
 from sizebot.lib.errors import InvalidSizeValue
 from sizebot.lib.loglevels import EGG
@@ -17,7 +17,7 @@ from sizebot.lib.objs import DigiLand, DigiObject, objects, relativestatsembed,
 from sizebot.lib.stats import StatBox, taglist, AVERAGE_HEIGHT
 from sizebot.lib.types import BotContext, GuildContext
 from sizebot.lib.units import SV, WV, AV, Decimal
-from sizebot.lib.userdb import load_or_fake, MemberOrFake, MemberOrFakeOrSize
+from sizebot.lib.userdb import aload_or_fake, MemberOrFake, MemberOrFakeOrSize
 from sizebot.lib.fakeplayer import FakePlayer
 from sizebot.lib.utils import parse_many, pretty_time_delta, sentence_join
 
@@ -32,8 +32,10 @@ class ObjectsCog(commands.Cog):
     @commands.command(
         aliases = ["objects", "objlist", "objectlist"],
         category = "objects",
-        usage = "[tag]"
+        usage = "[tag]",
+        pure = True
     )
+    @replycache.cached("tag")
     async def objs(self, ctx: BotContext, tag: str = None):
         """Get a list of the various objects SizeBot accepts."""
         objectunits = []
@@ -57,7 +59,8 @@ class ObjectsCog(commands.Cog):
 
     @commands.command(
         aliases = ["natstats"],
-        category = "objects"
+        category = "objects",
+        pure = True
     )
     @commands.guild_only()
     async def lookslike(self, ctx: GuildContext, *, memberOrHeight: MemberOrFakeOrSize = None):
@@ -65,7 +68,7 @@ class ObjectsCog(commands.Cog):
         if memberOrHeight is None:
             memberOrHeight = ctx.author
 
-        userdata = load_or_fake(memberOrHeight)
+        userdata = await aload_or_fake(memberOrHeight)
 
         if userdata.height == 0:
             await ctx.send(f"{userdata.tag} is really {userdata.height:,.3mu}, or about... huh. I can't find them.")
@@ -79,7 +82,8 @@ class ObjectsCog(commands.Cog):
     @commands.command(
         aliases = ["objcompare", "objcomp"],
         usage = "<object/user> [as user/height]",
-        category = "objects"
+        category = "objects",
+        pure = True
     )
     @commands.guild_only()
     async def objectcompare(self, ctx: GuildContext, *, args: str):
@@ -110,18 +114,18 @@ class ObjectsCog(commands.Cog):
             what = await parse_many(ctx, args, [DigiObject, mc, SV])
             who = ctx.author
 
-        userdata = load_or_fake(who)
-        userstats = StatBox.load(userdata.stats).scale(userdata.scale)
+        userdata = await aload_or_fake(who)
+        userstats = StatBox.load_scaled(userdata.stats, userdata.scale)
 
         if isinstance(what, DigiObject):
             oc = relativestatsembed(what, userdata)
             await ctx.send(embed = oc)
             return
         elif isinstance(what, discord.Member) or isinstance(what, SV):  # TODO: Make this not literally just a compare. (make one sided)
-            compdata = load_or_fake(what)
+            compdata = await aload_or_fake(what)
         elif isinstance(what, str) and what in ["person", "man", "average", "average person", "average man", "average human", "human"]:
             compheight = userstats['averagescale'].value
-            compdata = load_or_fake(compheight)
+            compdata = await aload_or_fake(compheight)
         else:
             await ctx.send(
             f"Sorry, I don't know what `{orig}` is.\n"
@@ -130,13 +134,14 @@ class ObjectsCog(commands.Cog):
             f"(see `{ctx.prefix}help suggestobject` for instructions on doing that.)"
         )
             return
-        tosend = proportions.get_compare(userdata, compdata, ctx.author.id)
+        tosend = await render.run(proportions.get_compare, userdata, compdata, ctx.author.id)
         await ctx.send(**tosend)
 
     @commands.command(
         aliases = ["look", "examine"],
         usage = "<object>",
-        category = "objects"
+        category = "objects",
+        pure = True
     )
     @commands.guild_only()
     async def lookat(self, ctx: GuildContext, *, what: DigiObject | MemberOrFake | SV | str):
@@ -148,7 +153,7 @@ class ObjectsCog(commands.Cog):
         `&look book`
         `&examine building`"""
 
-        userdata = load_or_fake(ctx.author)
+        userdata = await aload_or_fake(ctx.author)
 
         if isinstance(what, str):
             what = what.lower()
@@ -175,7 +180,7 @@ class ObjectsCog(commands.Cog):
 
         # Member comparisons are just height comparisons
         if isinstance(what, get_args(MemberOrFake)):
-            compdata = load_or_fake(what)
+            compdata = await aload_or_fake(what)
             what = compdata.height
 
         # Height comparisons
@@ -210,7 +215,7 @@ class ObjectsCog(commands.Cog):
             footlength=SV.parse("2.75in"),
             taillength=SV.parse("12cm")
         ))
-        userdata = userdb.load(ctx.guild.id, ctx.author.id)
+        userdata = await userdb.aload(ctx.guild.id, ctx.author.id)
 
         # Comparison command
         comp_keys = {
@@ -230,7 +235,7 @@ class ObjectsCog(commands.Cog):
         }
         if what in comp_keys:
             compdata = comp_keys[what]
-            tosend = proportions.get_compare_simple(userdata, compdata, ctx.message.author.id)
+            tosend = await render.run(proportions.get_compare_simple, userdata, compdata, ctx.message.author.id)
             await ctx.send(**tosend)
             return
 
@@ -245,8 +250,10 @@ class ObjectsCog(commands.Cog):
     @commands.command(
         aliases = ["objectstats"],
         usage = "<object>",
-        category = "objects"
+        category = "objects",
+        pure = True
     )
+    @replycache.cached("what")
     async def objstats(self, ctx: BotContext, *, what: DigiObject | str):
         """Get stats about an object.
 
@@ -261,7 +268,8 @@ class ObjectsCog(commands.Cog):
 
     @commands.command(
         category = "objects",
-        usage = "[@User]"
+        usage = "[@User]",
+        pure = True
     )
     # TODO: Bad name.
     @commands.guild_only()
@@ -277,7 +285,7 @@ class ObjectsCog(commands.Cog):
             who = ctx.author
         if amount is None:
             amount = 3
-        userdata = userdb.load_or_fake(who)
+        userdata = await userdb.aload_or_fake(who)
         height = userdata.height
         objs_smaller = [o for o in objects if o.unitlength <= height][-amount:]
         objs_larger = [o for o in objects if o.unitlength > height][:amount]
@@ -295,7 +303,8 @@ class ObjectsCog(commands.Cog):
         await ctx.send(embed = embed)
 
     @commands.command(
-        category = "objects"
+        category = "objects",
+        pure = True
     )
     @commands.guild_only()
     async def food(self, ctx: GuildContext, food: DigiObject | str, *, who: MemberOrFakeOrSize = None):
@@ -325,7 +334,7 @@ class ObjectsCog(commands.Cog):
         if who is None:
             who = ctx.author
 
-        userdata = userdb.load_or_fake(who)
+        userdata = await userdb.aload_or_fake(who)
         scale = userdata.scale
         scale3 = scale ** 3
         cals_needed = CAL_PER_DAY * scale3
@@ -358,14 +367,15 @@ class ObjectsCog(commands.Cog):
         await ctx.send(embed = embed)
 
     @commands.command(
-        category = "objects"
+        category = "objects",
+        pure = True
     )
     @commands.guild_only()
     async def water(self, ctx: GuildContext, *, who: MemberOrFakeOrSize = None):
         if who is None:
             who = ctx.author
 
-        userdata = userdb.load_or_fake(who)
+        userdata = await userdb.aload_or_fake(who)
         scale = userdata.scale
 
         BASE_WATER = WV(3200)
@@ -381,7 +391,8 @@ class ObjectsCog(commands.Cog):
         await ctx.send(embed = embed)
 
     @commands.command(
-        category = "objects"
+        category = "objects",
+        pure = True
     )
     @commands.guild_only()
     async def land(self, ctx: GuildContext, land: DigiObject | str, *, who: MemberOrFakeOrSize = None):
@@ -402,8 +413,8 @@ class ObjectsCog(commands.Cog):
         if who is None:
             who = ctx.author
 
-        userdata = userdb.load_or_fake(who)
-        stats = StatBox.load(userdata.stats).scale(userdata.scale)
+        userdata = await userdb.aload_or_fake(who)
+        stats = StatBox.load_scaled(userdata.stats, userdata.scale)
         scale = userdata.scale
 
         if land == "random":
@@ -443,6 +454,7 @@ class ObjectsCog(commands.Cog):
     @commands.command(
         category = "objects"
     )
+    @replycache.cached()
     async def tags(self, ctx: BotContext):
         """Get the list of object and stat tags."""
 
@@ -464,11 +476,12 @@ class ObjectsCog(commands.Cog):
 
     @commands.command(
         usage = "[object]",
-        category = "objects"
+        category = "objects",
+        pure = True
     )
     @commands.guild_only()
     async def scaled(self, ctx: GuildContext, *, obj: DigiObject):
-        userdata = load_or_fake(ctx.author)
+        userdata = await aload_or_fake(ctx.author)
         await ctx.send(f"{obj.article.capitalize()} {obj.name} scaled for {userdata.nickname} is {get_stats_sentence(obj, userdata.scale, userdata.unitsystem)}")
 
 
@@ -3,8 +3,8 @@ import random
 
 from discord.ext import commands
 
-from sizebot.lib import userdb
-from sizebot.lib.pokemon import pokemon
+from sizebot.lib import replycache, userdb
+from sizebot.lib.pokemon import get_pokemon
 from sizebot.lib.types import BotContext, GuildContext
 from sizebot.lib.userdb import MemberOrFakeOrSize
 
@@ -19,8 +19,10 @@ class PokemonCog(commands.Cog):
         aliases = ["dex"],
         category = "objects"
     )
+    @replycache.cached("pkmn")
     async def pokedex(self, ctx: BotContext, pkmn: int | str = None):
         """Pokemaaaaaaaaans"""
+        pokemon = get_pokemon()
         if isinstance(pkmn, str):
             p = next((m for m in pokemon if m.name.lower() == pkmn.lower()), None)
         elif isinstance(pkmn, int):
@@ -30,6 +32,7 @@ class PokemonCog(commands.Cog):
 
         if p is None:
             p = random.choice(pokemon)
+            replycache.dont_cache()
 
         e = p.stats_embed()
         await ctx.send(embed = e)
@@ -39,16 +42,19 @@ class PokemonCog(commands.Cog):
         category = "objects"
     )
     @commands.guild_only()
+    @replycache.cached("pkmn", "who")
     async def lookatpokemon(self, ctx: GuildContext, pkmn: int | str = None, *, who: MemberOrFakeOrSize = None):
         """Pokemaaaaaaaaans"""
         if who is None:
             who = ctx.author
+            replycache.dont_cache()
 
-        userdata = userdb.load_or_fake(who)
+        userdata = await userdb.aload_or_fake(who)
 
         if pkmn == "lad":
             pkmn = "kricketot"
 
+        pokemon = get_pokemon()
         if isinstance(pkmn, str):
             p = next((m for m in pokemon if m.name.lower() == pkmn.lower()), None)
         elif isinstance(pkmn, int):
@@ -58,6 +64,7 @@ class PokemonCog(commands.Cog):
 
         if p is None:
             p = random.choice(pokemon)
+            replycache.dont_cache()
 
         e = p.comp_embed(user = userdata)
         await ctx.send(embed = e)
@@ -29,9 +29,10 @@ class ProfileCog(commands.Cog):
     @commands.guild_only()
     async def setpicture(self, ctx: GuildContext, *, url: Annotated[str, parse_url]):
         """ Set your profile's image. Must be a valid image URL."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.picture_url = url
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.picture_url = url
+            await userdb.asave(userdata)
         await ctx.send("Profile image set.")
 
     @commands.command(
@@ -45,9 +46,10 @@ class ProfileCog(commands.Cog):
         """Set your profile description.
 
         Accepts slightly more markdown than usual, see https://leovoel.github.io/embed-visualizer/"""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.description = desc
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.description = desc
+            await userdb.asave(userdata)
         await ctx.send("Profile description set.")
 
     @commands.command(
@@ -57,9 +59,10 @@ class ProfileCog(commands.Cog):
     @commands.guild_only()
     async def resetpicture(self, ctx: GuildContext):
         """Reset your profile's image."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.picture_url = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.picture_url = None
+            await userdb.asave(userdata)
         await ctx.send("Profile image reset.")
 
     @commands.command(
@@ -69,9 +72,10 @@ class ProfileCog(commands.Cog):
     @commands.guild_only()
     async def resetdescription(self, ctx: GuildContext):
         """Remove your profile description."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.description = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.description = None
+            await userdb.asave(userdata)
         await ctx.send("Profile description reset.")
 
     @commands.command(
@@ -88,7 +92,7 @@ class ProfileCog(commands.Cog):
         if member is None:
             member = ctx.author
         same_user = ctx.author.id == member.id
-        userdata = userdb.load(ctx.guild.id, member.id, member = member, allow_unreg=same_user)
+        userdata = await userdb.aload(ctx.guild.id, member.id, member = member, allow_unreg=same_user)
         profileembed = Embed(title = userdata.nickname, description = userdata.description)
         profileembed.set_image(url = userdata.auto_picture_url)
         profileembed.add_field(name = "Height", value = f"{userdata.height:,.3mu}", inline = True)
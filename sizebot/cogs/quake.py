@@ -10,7 +10,7 @@ from sizebot.lib.quake import breath_joules, heartbeat_joules, joules_to_mag, ju
 from sizebot.lib.stats import StatBox
 from sizebot.lib.types import GuildContext
 from sizebot.lib.units import SV, Decimal
-from sizebot.lib.userdb import load_or_fake, MemberOrFakeOrSize
+from sizebot.lib.userdb import aload_or_fake, MemberOrFakeOrSize
 from sizebot.lib.errors import UserMessedUpException
 
 EARTH_RAD = Decimal(10_018_570)
@@ -110,7 +110,7 @@ class QuakeCog(commands.Cog):
         """See what quakes would be caused by your steps.\n#ACC#"""
         if user is None:
             user = ctx.author
-        userdata = load_or_fake(user)
+        userdata = await aload_or_fake(user)
         e = quake_embed(userdata, quake_type)
         await ctx.send(embed = e)
 
@@ -123,7 +123,7 @@ class QuakeCog(commands.Cog):
         """See what quakes would be caused by your steps.\n#ACC#"""
         if user is None:
             user = ctx.author
-        userdata = load_or_fake(user)
+        userdata = await aload_or_fake(user)
         e = quake_stats_embed(userdata)
         await ctx.send(embed = e)
 
@@ -134,8 +134,8 @@ class QuakeCog(commands.Cog):
     @commands.guild_only()
     async def quakecompare(self, ctx: GuildContext, user: MemberOrFakeOrSize, quake_type: QuakeType | None = "step"):
         """See what quakes would be caused by someone else's steps.\n#ACC#"""
-        self_user = load_or_fake(ctx.author)
-        userdata = load_or_fake(user)
+        self_user = await aload_or_fake(ctx.author)
+        userdata = await aload_or_fake(user)
         userdata.scale *= self_user.viewscale
         e = quake_embed(userdata, quake_type, scale_rad = userdata.viewscale)
         e.title = e.title + f" as seen by {self_user.nickname}"
@@ -151,8 +151,8 @@ class QuakeCog(commands.Cog):
         """Walk a distance and cause some quakes.\n#ACC#"""
         if user is None:
             user = ctx.author
-        userdata = load_or_fake(user)
-        stats = StatBox.load(userdata.stats).scale(userdata.scale)
+        userdata = await aload_or_fake(user)
+        stats = StatBox.load_scaled(userdata.stats, userdata.scale)
         steps: int = int(dist / stats['walksteplength'].value)
 
         if steps < 1:
@@ -185,7 +185,7 @@ class QuakeCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
+        userdata = await userdb.aload(guildid, userid)
 
         steps: int = len(s)
 
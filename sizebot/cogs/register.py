@@ -75,7 +75,7 @@ class RegisterCog(commands.Cog):
 
         userdata = None
         try:
-            userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
         except errors.UserNotFoundException:
             userdata = None
 
@@ -134,7 +134,8 @@ class RegisterCog(commands.Cog):
         # TODO: If the bot has MANAGE_NICKNAMES permission but can't change this user's permission, let the user know
         # TODO: If the bot has MANAGE_NICKNAMES permission but can't change this user's permission, and the user is an admin, let them know they may need to fix permissions
 
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            await userdb.asave(userdata)
 
         await add_user_role(ctx.author)
 
@@ -167,7 +168,7 @@ class RegisterCog(commands.Cog):
         guild = ctx.guild
         user = ctx.author
         # User is not registered
-        if not userdb.exists(guild.id, user.id, allow_unreg=True):
+        if not await userdb.aexists(guild.id, user.id, allow_unreg=True):
             logger.warn(f"User {user.id} not registered with SizeBot, but tried to unregister anyway.")
             await ctx.send("Sorry! You aren't registered with SizeBot.\n"
                            "To register, use the `&register` command.")
@@ -205,7 +206,8 @@ class RegisterCog(commands.Cog):
         if ctx.me.guild_permissions.manage_nicknames:
             await nickmanager.nick_reset(user)
         # delete the user file
-        userdb.delete(guild.id, user.id)
+        async with userdb.lock(guild.id, user.id):
+            await userdb.adelete(guild.id, user.id)
         # remove the user role
         await remove_user_role(user)
 
@@ -250,7 +252,7 @@ class RegisterCog(commands.Cog):
         outmsg = await ctx.send(emojis.loading)
         outstring = ""
 
-        if userdb.exists(ctx.guild.id, ctx.author.id):
+        if await userdb.aexists(ctx.guild.id, ctx.author.id):
             outstring += "**:rotating_light:WARNING::rotating_light:**\n**You are already registered with SizeBot on this guild. Copying a profile to this guild will overwrite any size data you have here. Proceed with caution.**\n\n"
 
         outstring += "Copy profile from what guild?\n"
@@ -292,9 +294,10 @@ class RegisterCog(commands.Cog):
 
         chosen = inputdict[reaction.emoji] - 1
         chosenguildid = guilds_ids[chosen]
-        userdata = userdb.load(chosenguildid, ctx.author.id)
-        userdata.guildid = ctx.guild.id
-        userdb.save(userdata)
+        async with userdb.lock(chosenguildid, ctx.author.id):
+            userdata = await userdb.aload(chosenguildid, ctx.author.id)
+            userdata.guildid = ctx.guild.id
+            await userdb.asave(userdata)
 
         await outmsg.delete()
         await ctx.send(f"Successfully copied profile from *{self.bot.get_guild(int(chosenguildid)).name}* to here!")
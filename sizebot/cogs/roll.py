@@ -2,6 +2,7 @@ import logging
 
 from discord.ext import commands
 
+from sizebot.conf import conf
 from sizebot.lib import roller
 from sizebot.lib.types import BotContext
 
@@ -30,7 +31,7 @@ class RollCog(commands.Cog):
         `&roll 4d6d1` will roll 4 six-sided dice, and  ignore the result of the lowest die.
         `&roll 5d4k2` will roll 5 4-sided dice, and keep the results of the 2 highest dice.
         """
-        result = roller.roll(dString)
+        result = roller.roll(dString, max_dice = conf.roll_max_dice, max_sides = conf.roll_max_sides)
 
         header = (f"{ctx.author.display_name} rolled `{dString}`!\n"
                   f"__**TOTAL: {result.total}**__\n")
@@ -38,10 +39,10 @@ class RollCog(commands.Cog):
         for i, r in enumerate(result.rolls):
             rollheader = f"Roll {i + 1}: **{r.total}** | "
             dicestrings = []
-            if r.used:
-                dicestrings.append(f"{', '.join([str(u) for u in sorted(r.used)])}")
-            if r.dropped:
-                dicestrings.append(f"~~{', '.join([str(d) for d in sorted(r.dropped)])}~~")
+            if len(r.used):
+                dicestrings.append(r.format_used(conf.roll_list_limit))
+            if len(r.dropped):
+                dicestrings.append(f"~~{r.format_dropped(conf.roll_list_limit)}~~")
             rollstrings.append(rollheader + ", ".join(dicestrings))
 
         sendstring = header + "\n".join(rollstrings)
@@ -61,7 +62,7 @@ class RollCog(commands.Cog):
         For example:
         `&r 4d6d1` will roll 4 six-sided dice, and  ignore the result of the lowest die.
         `&r 5d4k2` will roll 5 4-sided dice, and keep the results of the 2 highest dice."""
-        result = roller.roll(dString)
+        result = roller.roll(dString, max_dice = conf.roll_max_dice, max_sides = conf.roll_max_sides)
         await ctx.send(f"{ctx.author.display_name} rolled `{dString}` = **{result.total}**")
 
 
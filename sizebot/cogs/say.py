@@ -274,7 +274,7 @@ class SayCog(commands.Cog):
         await ctx.message.delete(delay=0)
 
         try:
-            user = userdb.load(ctx.guild.id, ctx.author.id)
+            user = await userdb.aload(ctx.guild.id, ctx.author.id)
             height = user.height
             nick = user.nickname
         except UserNotFoundException:
@@ -303,11 +303,11 @@ class SayCog(commands.Cog):
             otherheight = memberOrHeight
             othernick = memberOrHeight.display_name
         else:
-            other = userdb.load(ctx.guild.id, memberOrHeight.id)
+            other = await userdb.aload(ctx.guild.id, memberOrHeight.id)
             otherheight = other.height
             othernick = other.nickname
         try:
-            user = userdb.load(ctx.guild.id, ctx.author.id)
+            user = await userdb.aload(ctx.guild.id, ctx.author.id)
             height = user.height
             nick = user.nickname
         except UserNotFoundException:
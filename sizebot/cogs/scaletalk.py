@@ -45,38 +45,39 @@ class ScaleTypeCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
-
-        chars = None  # fix unbound error
-        if match := re.fullmatch(re_char, change):
-            diff = Diff.parse(match.group(1))
-            if match.group(2):
-                chars = try_int(match.group(2))
-                if chars == "":
-                    chars = 1
-        else:
-            raise UserMessedUpException(f"`{change}` is not a valid character count.")
-        if not isinstance(chars, int):
-            raise UserMessedUpException(f"`{change}` is not a valid character count.")
-        elif chars == 0:
-            raise ValueIsZeroException
-
-        if diff.changetype == "add":
-            finaldiff = copy(diff)
-            finaldiff.amount = SV(finaldiff.amount / chars)
-        elif diff.changetype == "multiply":
-            finaldiff = copy(diff)
-            finaldiff.amount = finaldiff.amount ** Decimal(1 / chars)
-        else:
-            raise ChangeMethodInvalidException("This change type is not yet supported for scale-talking.")
-
-        if finaldiff.amount == 0:
-            raise ValueIsZeroException
-
-        userdata.currentscaletalk = finaldiff
-        userdata.scaletalklock = True
-
-        userdb.save(userdata)
+        async with userdb.lock(guildid, userid):
+            userdata = await userdb.aload(guildid, userid)
+
+            chars = None  # fix unbound error
+            if match := re.fullmatch(re_char, change):
+                diff = Diff.parse(match.group(1))
+                if match.group(2):
+                    chars = try_int(match.group(2))
+                    if chars == "":
+                        chars = 1
+            else:
+                raise UserMessedUpException(f"`{change}` is not a valid character count.")
+            if not isinstance(chars, int):
+                raise UserMessedUpException(f"`{change}` is not a valid character count.")
+            elif chars == 0:
+                raise ValueIsZeroException
+
+            if diff.changetype == "add":
+                finaldiff = copy(diff)
+                finaldiff.amount = SV(finaldiff.amount / chars)
+            elif diff.changetype == "multiply":
+                finaldiff = copy(diff)
+                finaldiff.amount = finaldiff.amount ** Decimal(1 / chars)
+            else:
+                raise ChangeMethodInvalidException("This change type is not yet supported for scale-talking.")
+
+            if finaldiff.amount == 0:
+                raise ValueIsZeroException
+
+            userdata.currentscaletalk = finaldiff
+            userdata.scaletalklock = True
+
+            await userdb.asave(userdata)
         if finaldiff.changetype == "multiply":
             await ctx.send(f"{userdata.nickname}'s scale per character is now set to **~{finaldiff.amount:,.10}x**.")
         else:
@@ -94,9 +95,10 @@ class ScaleTypeCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
-        userdata.currentscaletalk = None
-        userdb.save(userdata)
+        async with userdb.lock(guildid, userid):
+            userdata = await userdb.aload(guildid, userid)
+            userdata.currentscaletalk = None
+            await userdb.asave(userdata)
         await ctx.send(f"{userdata.nickname}'s scale per character is now cleared.")
 
     @commands.Cog.listener()
@@ -109,25 +111,26 @@ class ScaleTypeCog(commands.Cog):
         content = re.sub(r"<:(.*):\d+>", r"\1", content)  # Make emojis just their name.
         length = len(content)
 
-        try:
-            userdata = userdb.load(guildid, userid)
-        except UserNotFoundException:
-            return
+        async with userdb.lock(guildid, userid):
+            try:
+                userdata = await userdb.aload(guildid, userid)
+            except UserNotFoundException:
+                return
 
-        if userdata.scaletalklock is True:
-            userdata.scaletalklock = False
-            userdb.save(userdata)
-            return
+            if userdata.scaletalklock is True:
+                userdata.scaletalklock = False
+                await userdb.asave(userdata)
+                return
 
-        if userdata.currentscaletalk is None:
-            return
+            if userdata.currentscaletalk is None:
+                return
 
-        if userdata.currentscaletalk.changetype == "add":
-            userdata.height += (cast(SV, userdata.currentscaletalk.amount) * length)
-        elif userdata.currentscaletalk.changetype == "multiply":
-            userdata.height *= (cast(Decimal, userdata.currentscaletalk.amount) ** length)
+            if userdata.currentscaletalk.changetype == "add":
+                userdata.height += (cast(SV, userdata.currentscaletalk.amount) * length)
+            elif userdata.currentscaletalk.changetype == "multiply":
+                userdata.height *= (cast(Decimal, userdata.currentscaletalk.amount) ** length)
 
-        userdb.save(userdata)
+            await userdb.asave(userdata)
 
 
 async def setup(bot: commands.Bot):
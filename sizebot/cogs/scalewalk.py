@@ -108,42 +108,43 @@ class ScaleWalkCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
-        stats = StatBox.load(userdata.stats).scale(userdata.scale)
-
-        stepcount, final_inc, final_ratio = get_steps(stats['walksteplength'].value, change, dist)
-
-        finalheight = SV(userdata.height / final_ratio)
-
-        symbol = ""
-        if change.changetype == "add":
-            symbol = "+"
-        if change.changetype == "multiply":
-            symbol = "x"
-
-        amountstring = ""
-        if change.changetype == "add":
-            amountstring = f"{symbol}{change.amount:,.3mu}"
-        if change.changetype == "multiply":
-            amountstring = f"{symbol}{change.amount:,.3}"
-
-        if flag is None:
-            e = discord.Embed(
-                title = f"If {userdata.nickname} walked {dist:,.3mu}, scaling {amountstring} each step...",
-                description = f"They would now be **{finalheight:,.3mu}** tall after **{stepcount}** steps."
-            )
-            await ctx.send(embed = e)
-        elif flag == "apply":
-            userdata.height = finalheight
-            userdb.save(userdata)
-
-            e = discord.Embed(
-                title = f"{userdata.nickname} walked {dist:,.3mu}, scaling {amountstring} each step...",
-                description = f"They are now **{finalheight:,.3mu}** tall after **{stepcount}** steps."
-            )
-            await ctx.send(embed = e)
-        else:
-            raise DigiContextException(f"Invalid flag {flag}.")
+        async with userdb.lock(guildid, userid):
+            userdata = await userdb.aload(guildid, userid)
+            stats = StatBox.load_scaled(userdata.stats, userdata.scale)
+
+            stepcount, final_inc, final_ratio = get_steps(stats['walksteplength'].value, change, dist)
+
+            finalheight = SV(userdata.height / final_ratio)
+
+            symbol = ""
+            if change.changetype == "add":
+                symbol = "+"
+            if change.changetype == "multiply":
+                symbol = "x"
+
+            amountstring = ""
+            if change.changetype == "add":
+                amountstring = f"{symbol}{change.amount:,.3mu}"
+            if change.changetype == "multiply":
+                amountstring = f"{symbol}{change.amount:,.3}"
+
+            if flag is None:
+                e = discord.Embed(
+                    title = f"If {userdata.nickname} walked {dist:,.3mu}, scaling {amountstring} each step...",
+                    description = f"They would now be **{finalheight:,.3mu}** tall after **{stepcount}** steps."
+                )
+                await ctx.send(embed = e)
+            elif flag == "apply":
+                userdata.height = finalheight
+                await userdb.asave(userdata)
+
+                e = discord.Embed(
+                    title = f"{userdata.nickname} walked {dist:,.3mu}, scaling {amountstring} each step...",
+                    description = f"They are now **{finalheight:,.3mu}** tall after **{stepcount}** steps."
+                )
+                await ctx.send(embed = e)
+            else:
+                raise DigiContextException(f"Invalid flag {flag}.")
 
     @commands.command(
         category = "scalestep",
@@ -161,42 +162,43 @@ class ScaleWalkCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
-        stats = StatBox.load(userdata.stats).scale(userdata.scale)
-
-        stepcount, final_inc, final_ratio = get_steps(stats['runsteplength'].value, change, dist)
-
-        finalheight = SV(userdata.height / final_ratio)
-
-        symbol = ""
-        if change.changetype == "add":
-            symbol = "+"
-        if change.changetype == "multiply":
-            symbol = "x"
-
-        amountstring = ""
-        if change.changetype == "add":
-            amountstring = f"{symbol}{change.amount:,.3mu}"
-        if change.changetype == "multiply":
-            amountstring = f"{symbol}{change.amount:,.3}"
-
-        if flag is None:
-            e = discord.Embed(
-                title = f"If {userdata.nickname} ran {dist:,.3mu}, scaling {amountstring} each step...",
-                description = f"They would now be **{finalheight:,.3mu}** tall after **{stepcount}** steps."
-            )
-            await ctx.send(embed = e)
-        elif flag == "apply":
-            userdata.height = finalheight
-            userdb.save(userdata)
-
-            e = discord.Embed(
-                title = f"{userdata.nickname} ran {dist:,.3mu}, scaling {amountstring} each step...",
-                description = f"They are now **{finalheight:,.3mu}** tall after **{stepcount}** steps."
-            )
-            await ctx.send(embed = e)
-        else:
-            raise DigiContextException(f"Invalid flag {flag}.")
+        async with userdb.lock(guildid, userid):
+            userdata = await userdb.aload(guildid, userid)
+            stats = StatBox.load_scaled(userdata.stats, userdata.scale)
+
+            stepcount, final_inc, final_ratio = get_steps(stats['runsteplength'].value, change, dist)
+
+            finalheight = SV(userdata.height / final_ratio)
+
+            symbol = ""
+            if change.changetype == "add":
+                symbol = "+"
+            if change.changetype == "multiply":
+                symbol = "x"
+
+            amountstring = ""
+            if change.changetype == "add":
+                amountstring = f"{symbol}{change.amount:,.3mu}"
+            if change.changetype == "multiply":
+                amountstring = f"{symbol}{change.amount:,.3}"
+
+            if flag is None:
+                e = discord.Embed(
+                    title = f"If {userdata.nickname} ran {dist:,.3mu}, scaling {amountstring} each step...",
+                    description = f"They would now be **{finalheight:,.3mu}** tall after **{stepcount}** steps."
+                )
+                await ctx.send(embed = e)
+            elif flag == "apply":
+                userdata.height = finalheight
+                await userdb.asave(userdata)
+
+                e = discord.Embed(
+                    title = f"{userdata.nickname} ran {dist:,.3mu}, scaling {amountstring} each step...",
+                    description = f"They are now **{finalheight:,.3mu}** tall after **{stepcount}** steps."
+                )
+                await ctx.send(embed = e)
+            else:
+                raise DigiContextException(f"Invalid flag {flag}.")
 
     @commands.command(
         aliases = ["setscalestep", "setscalewalk", "setwalkscale"],
@@ -218,11 +220,12 @@ class ScaleWalkCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
-        userdata.currentscalestep = change
-        if change.amount == 0:
-            raise ValueIsZeroException
-        userdb.save(userdata)
+        async with userdb.lock(guildid, userid):
+            userdata = await userdb.aload(guildid, userid)
+            userdata.currentscalestep = change
+            if change.amount == 0:
+                raise ValueIsZeroException
+            await userdb.asave(userdata)
         await ctx.send(f"{userdata.nickname}'s scale per step is now set to {change}.")
 
     @commands.command(
@@ -238,9 +241,10 @@ class ScaleWalkCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
-        userdata.currentscalestep = None
-        userdb.save(userdata)
+        async with userdb.lock(guildid, userid):
+            userdata = await userdb.aload(guildid, userid)
+            userdata.currentscalestep = None
+            await userdb.asave(userdata)
         await ctx.send(f"{userdata.nickname}'s scale per step is now cleared.")
 
     @commands.command(
@@ -258,41 +262,42 @@ class ScaleWalkCog(commands.Cog):
         guildid = ctx.guild.id
         userid = ctx.author.id
 
-        userdata = userdb.load(guildid, userid)
+        async with userdb.lock(guildid, userid):
+            userdata = await userdb.aload(guildid, userid)
 
-        if steps is None:
-            steps = 1
+            if steps is None:
+                steps = 1
 
-        steps = try_int(steps)
-        if steps == "car":
-            await ctx.send("Cronch.")
-            logger.log(EGG, f"{ctx.author.display_name} stepped on a car.")
-            return
+            steps = try_int(steps)
+            if steps == "car":
+                await ctx.send("Cronch.")
+                logger.log(EGG, f"{ctx.author.display_name} stepped on a car.")
+                return
 
-        if not isinstance(steps, int):
-            await ctx.send(f"`{steps}` is not a number.")
-            return
+            if not isinstance(steps, int):
+                await ctx.send(f"`{steps}` is not a number.")
+                return
 
-        if steps <= 0:
-            await ctx.send("You... stand... still.")
-            return
+            if steps <= 0:
+                await ctx.send("You... stand... still.")
+                return
 
-        if userdata.currentscalestep is None:
-            await ctx.send(f"You do not have a stepscale set. Please use `{conf.prefix}setstepscale <amount>` to do so.")
-            return
+            if userdata.currentscalestep is None:
+                await ctx.send(f"You do not have a stepscale set. Please use `{conf.prefix}setstepscale <amount>` to do so.")
+                return
 
-        if userdata.currentscalestep.changetype == "add":
-            userdata.height += (userdata.currentscalestep.amount * steps)
-        elif userdata.currentscalestep.changetype == "multiply":
-            userdata.height *= (userdata.currentscalestep.amount ** steps)
-        else:
-            raise ChangeMethodInvalidException("This change type is not yet supported for scale-walking.")
+            if userdata.currentscalestep.changetype == "add":
+                userdata.height += (userdata.currentscalestep.amount * steps)
+            elif userdata.currentscalestep.changetype == "multiply":
+                userdata.height *= (userdata.currentscalestep.amount ** steps)
+            else:
+                raise ChangeMethodInvalidException("This change type is not yet supported for scale-walking.")
 
-        stats = StatBox.load(userdata.stats).scale(userdata.scale)
-        dist_travelled = get_dist(stats['walksteplength'].value, userdata.currentscalestep, (steps + 1))
-        await ctx.send(f"You walked {dist_travelled:,.3mu} in {steps} {'step' if steps == 1 else 'steps'}.")
+            stats = StatBox.load_scaled(userdata.stats, userdata.scale)
+            dist_travelled = get_dist(stats['walksteplength'].value, userdata.currentscalestep, (steps + 1))
+            await ctx.send(f"You walked {dist_travelled:,.3mu} in {steps} {'step' if steps == 1 else 'steps'}.")
 
-        userdb.save(userdata)
+            await userdb.asave(userdata)
 
 
 async def setup(bot: commands.Bot):
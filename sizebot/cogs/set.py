@@ -34,9 +34,10 @@ class SetCog(commands.Cog):
         # TODO: Disable and hide this command on servers where bot does not have MANAGE_NICKNAMES permission
         # TODO: If the bot has MANAGE_NICKNAMES permission but can't change this user's permission, let the user know
         # TODO: If the bot has MANAGE_NICKNAMES permission but can't change this user's permission, and the user is an admin, let them know they may need to fix permissions
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.nickname = newnick
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.nickname = newnick
+            await userdb.asave(userdata)
 
         await ctx.send(f"<@{ctx.author.id}>'s nick is now {userdata.nickname}.")
 
@@ -50,9 +51,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setspecies(self, ctx: GuildContext, *, newspecies: str):
         """Change species."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.species = newspecies
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.species = newspecies
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s species is now a {userdata.species}.")
 
@@ -66,9 +68,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def resetspecies(self, ctx: GuildContext):
         """Remove species."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.species = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.species = None
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s species is now cleared.")
 
@@ -89,9 +92,10 @@ class SetCog(commands.Cog):
             await ctx.send(f"Please enter `{ctx.prefix}{ctx.invoked_with} [Y/N/true/false/yes/no/enable/disable...]`.")
             return
 
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.display = newdisp
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.display = newdisp
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s display is now set to {userdata.display}.")
 
@@ -105,10 +109,11 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setsystem(self, ctx: GuildContext, newsys: Annotated[UnitSystem, parse_unitsystem]):
         """Set measurement system. (M or U.)"""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.unitsystem = newsys
-        completed_registration = userdata.complete_step("setsystem")
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.unitsystem = newsys
+            completed_registration = userdata.complete_step("setsystem")
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s system is now set to {newsys}.")
 
@@ -123,10 +128,11 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setheight(self, ctx: GuildContext, *, newheight: SV):
         """Change height."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.height = newheight
-        completed_registration = userdata.complete_step("setheight")
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.height = newheight
+            completed_registration = userdata.complete_step("setheight")
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname} is now {userdata.height:mu} tall.")
 
@@ -146,9 +152,10 @@ class SetCog(commands.Cog):
             logger.log(EGG, "Bananas used for scale.")
             return
 
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.height = userdata.baseheight * newscale
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.height = userdata.baseheight * newscale
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname} is now {userdata.height:mu} tall.")
 
@@ -163,11 +170,12 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setso(self, ctx: GuildContext, sv1: discord.Member | SV, sv2: SV):
         """Change height by scale."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        if isinstance(sv1, discord.Member):
-            sv1 = userdb.load(sv1.guild.id, ctx.author.id).height  # This feels like a hack. Is this awful?
-        userdata.scale = sv1 / sv2
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            if isinstance(sv1, discord.Member):
+                sv1 = (await userdb.aload(sv1.guild.id, ctx.author.id)).height  # This feels like a hack. Is this awful?
+            userdata.scale = sv1 / sv2
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname} is now {userdata.height:mu} tall.")
 
@@ -187,11 +195,12 @@ class SetCog(commands.Cog):
         `&copyheight @User`
         `&copyheight @User 10`
         """
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        from_userdata = userdb.load(ctx.guild.id, from_user.id)
-        userdata.height = from_userdata.height * newscale
-        completed_registration = userdata.complete_step("setheight")
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            from_userdata = await userdb.aload(ctx.guild.id, from_user.id)
+            userdata.height = from_userdata.height * newscale
+            completed_registration = userdata.complete_step("setheight")
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname} is now {userdata.height:mu} tall.")
 
@@ -205,9 +214,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def resetheight(self, ctx: GuildContext):
         """Reset height/size."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.height = userdata.baseheight
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.height = userdata.baseheight
+            await userdb.asave(userdata)
 
         await ctx.send(f"{ctx.author.display_name} reset their size.")
 
@@ -233,10 +243,11 @@ class SetCog(commands.Cog):
 
         newheightSV = randrange_log(minheight, maxheight)
 
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.height = newheightSV
-        completed_registration = userdata.complete_step("setheight")
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.height = newheightSV
+            completed_registration = userdata.complete_step("setheight")
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname} is now {userdata.height:mu} tall.")
 
@@ -257,10 +268,11 @@ class SetCog(commands.Cog):
 
         newscale = Decimal(randrange_log(float(minscale), float(maxscale)))
 
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.scale = newscale
-        completed_registration = userdata.complete_step("setheight")
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.scale = newscale
+            completed_registration = userdata.complete_step("setheight")
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname} is now {userdata.height:mu} tall.")
 
@@ -274,10 +286,11 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setinf(self, ctx: GuildContext):
         """Change height to infinity."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.height = SV("infinity")
-        completed_registration = userdata.complete_step("setheight")
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.height = SV("infinity")
+            completed_registration = userdata.complete_step("setheight")
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname} is now infinitely tall.")
 
@@ -291,10 +304,11 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def set0(self, ctx: GuildContext):
         """Change height to a zero."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.height = 0
-        completed_registration = userdata.complete_step("setheight")
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.height = 0
+            completed_registration = userdata.complete_step("setheight")
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname} is now nothing.")
 
@@ -308,12 +322,13 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setweight(self, ctx: GuildContext, *, newweight: WV):
         """Set your current weight."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        currweight = newweight
-        baseweight = currweight / (userdata.scale ** 3)
-        userdata.baseweight = baseweight
-        completed_registration = userdata.complete_step("setweight")
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            currweight = newweight
+            baseweight = currweight / (userdata.scale ** 3)
+            userdata.baseweight = baseweight
+            completed_registration = userdata.complete_step("setweight")
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s weight is now {currweight:mu}")
 
@@ -327,11 +342,12 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setfoot(self, ctx: GuildContext, *, newfoot: Annotated[SV, pos_SV]):
         """Set your current foot length."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        currfoot = newfoot
-        basefoot = SV(currfoot / userdata.scale)
-        userdata.footlength = basefoot
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            currfoot = newfoot
+            basefoot = SV(currfoot / userdata.scale)
+            userdata.footlength = basefoot
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s base foot length is now {basefoot:mu} long ({to_shoe_size(basefoot, 'm')}), "
                        f"or {currfoot:mu} currently. {to_shoe_size(currfoot, 'm')}")
@@ -355,11 +371,12 @@ class SetCog(commands.Cog):
         `&setshoe 10W`
         `&setshoe 12C`
         """
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        currfoot = from_shoe_size(newshoe)
-        basefoot = SV(currfoot / userdata.scale)
-        userdata.footlength = basefoot
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            currfoot = from_shoe_size(newshoe)
+            basefoot = SV(currfoot / userdata.scale)
+            userdata.footlength = basefoot
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s base foot length is now {basefoot:mu} long ({to_shoe_size(basefoot, 'm')}), "
                        f"or {currfoot:mu} currently. {to_shoe_size(SV(currfoot), 'm')}")
@@ -372,9 +389,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def resetfoot(self, ctx: GuildContext):
         """Remove custom foot length."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.footlength = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.footlength = None
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s foot length is now default.")
         await show_next_step(ctx, userdata)
@@ -386,9 +404,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def togglepaw(self, ctx: GuildContext):
         """Switch between the word "foot" and "paw" for your stats."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.pawtoggle = not userdata.pawtoggle
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.pawtoggle = not userdata.pawtoggle
+            await userdb.asave(userdata)
 
         await ctx.send(f"The end of {userdata.nickname}'s legs are now called a {userdata.footname.lower()}.")
         await show_next_step(ctx, userdata)
@@ -400,9 +419,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def togglefur(self, ctx: GuildContext):
         """Switch between the word "hair" and "fur" for your stats."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.furtoggle = not userdata.furtoggle
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.furtoggle = not userdata.furtoggle
+            await userdb.asave(userdata)
 
         await ctx.send(f"The hair of {userdata.nickname} is now called {userdata.hairname.lower()}.")
         await show_next_step(ctx, userdata)
@@ -414,9 +434,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def sethair(self, ctx: GuildContext, *, newhair: Annotated[SV, pos_SV]):
         """Set your current hair length."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.hairlength = SV(newhair / userdata.scale)
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.hairlength = SV(newhair / userdata.scale)
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s base hair length is now {userdata.hairlength:mu} long, "
                        f"or {SV(userdata.hairlength):mu} currently.")
@@ -429,9 +450,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def settail(self, ctx: GuildContext, *, newtail: Annotated[SV, pos_SV]):
         """Set your current tail length."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.taillength = SV(newtail / userdata.scale)
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.taillength = SV(newtail / userdata.scale)
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s base tail length is now {userdata.taillength:mu} long, "
                        f"or {SV(userdata.taillength):mu} currently.")
@@ -444,9 +466,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def resettail(self, ctx: GuildContext):
         """Remove custom tail length."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.taillength = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.taillength = None
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s tail length is now cleared.")
         await show_next_step(ctx, userdata)
@@ -458,11 +481,12 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setear(self, ctx: GuildContext, *, newear: Annotated[SV, pos_SV]):
         """Set your current ear heightear."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        currear = newear
-        baseear = SV(currear / userdata.scale)
-        userdata.earheight = baseear
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            currear = newear
+            baseear = SV(currear / userdata.scale)
+            userdata.earheight = baseear
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s base ear height is now {baseear:mu} long, "
                        f"or {currear:mu} currently.")
@@ -475,9 +499,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def resetear(self, ctx: GuildContext):
         """Remove custom ear height."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.earheight = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.earheight = None
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s ear height is now cleared.")
         await show_next_step(ctx, userdata)
@@ -490,11 +515,12 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setstrength(self, ctx: GuildContext, *, newstrength: Annotated[WV, pos_WV]):
         """Set your current lift/carry strength."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        currstrength = newstrength
-        basestrength = WV(currstrength / (userdata.scale ** 3))
-        userdata.liftstrength = basestrength
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            currstrength = newstrength
+            basestrength = WV(currstrength / (userdata.scale ** 3))
+            userdata.liftstrength = basestrength
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s base lift strength is now {basestrength:mu}, "
                        f"or {currstrength:mu} currently.")
@@ -507,9 +533,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def resetstrength(self, ctx: GuildContext):
         """Remove custom lift/carry strength."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.liftstrength = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.liftstrength = None
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s lift/carry strength is now cleared.")
         await show_next_step(ctx, userdata)
@@ -521,11 +548,12 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setwalk(self, ctx: GuildContext, *, newspeed: LinearRate):
         """Set your current walk speed."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        currspeed = SV(newspeed.addPerSec * HOUR)
-        basespeed = SV(currspeed / userdata.scale)
-        userdata.walkperhour = basespeed
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            currspeed = SV(newspeed.addPerSec * HOUR)
+            basespeed = SV(currspeed / userdata.scale)
+            userdata.walkperhour = basespeed
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s base walk speed is now {basespeed:mu} per hour. (Current speed is {currspeed:mu} per hour)")
         await show_next_step(ctx, userdata)
@@ -537,9 +565,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def resetwalk(self, ctx: GuildContext):
         """Remove custom walk speed."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.walkperhour = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.walkperhour = None
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s walk speed is now cleared.")
         await show_next_step(ctx, userdata)
@@ -551,11 +580,12 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setrun(self, ctx: GuildContext, *, newspeed: LinearRate):
         """Set your current run speed."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        currspeed = SV(newspeed.addPerSec * HOUR)
-        basespeed = SV(currspeed / userdata.scale)
-        userdata.runperhour = basespeed
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            currspeed = SV(newspeed.addPerSec * HOUR)
+            basespeed = SV(currspeed / userdata.scale)
+            userdata.runperhour = basespeed
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s base run speed is now {basespeed:mu} per hour. (Current speed is {currspeed:mu} per hour)")
         await show_next_step(ctx, userdata)
@@ -567,9 +597,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def resetrun(self, ctx: GuildContext):
         """Remove custom run speed."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.runperhour = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.runperhour = None
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s run speed is now cleared.")
         await show_next_step(ctx, userdata)
@@ -581,11 +612,12 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def setswim(self, ctx: GuildContext, *, newspeed: LinearRate):
         """Set your current swim speed."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        currspeed = SV(newspeed.addPerSec * HOUR)
-        basespeed = SV(currspeed / userdata.scale)
-        userdata.swimperhour = basespeed
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            currspeed = SV(newspeed.addPerSec * HOUR)
+            basespeed = SV(currspeed / userdata.scale)
+            userdata.swimperhour = basespeed
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s base swim speed is now {basespeed:mu} per hour. (Current speed is {currspeed:mu} per hour)")
         await show_next_step(ctx, userdata)
@@ -597,9 +629,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def resetswim(self, ctx: GuildContext):
         """Remove custom swim speed."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.swimperhour = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.swimperhour = None
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s swim speed is now cleared.")
         await show_next_step(ctx, userdata)
@@ -610,9 +643,10 @@ class SetCog(commands.Cog):
     )
     @commands.guild_only()
     async def setgender(self, ctx: GuildContext, gender: Annotated[Gender, parse_gender]):
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.gender = gender
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.gender = gender
+            await userdb.asave(userdata)
 
         await nickmanager.nick_update(ctx.author)
 
@@ -626,9 +660,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     async def resetgender(self, ctx: GuildContext):
         """Reset gender."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id, allow_unreg=True)
-        userdata.gender = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, ctx.author.id):
+            userdata = await userdb.aload(ctx.guild.id, ctx.author.id, allow_unreg=True)
+            userdata.gender = None
+            await userdb.asave(userdata)
 
         await nickmanager.nick_update(ctx.author)
 
@@ -643,9 +678,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     @commands.is_owner()
     async def setmodel(self, ctx: GuildContext, user: discord.Member, *, model: str):
-        userdata = userdb.load(ctx.guild.id, user.id)
-        userdata.macrovision_model = model
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, user.id):
+            userdata = await userdb.aload(ctx.guild.id, user.id)
+            userdata.macrovision_model = model
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s model is now {model}.")
 
@@ -657,9 +693,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     @commands.is_owner()
     async def clearmodel(self, ctx: GuildContext, *, user: discord.Member):
-        userdata = userdb.load(ctx.guild.id, user.id)
-        userdata.macrovision_model = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, user.id):
+            userdata = await userdb.aload(ctx.guild.id, user.id)
+            userdata.macrovision_model = None
+            await userdb.asave(userdata)
 
         await ctx.send(f"Cleared {userdata.nickname}'s model.")
 
@@ -670,9 +707,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     @commands.is_owner()
     async def setview(self, ctx: GuildContext, user: discord.Member, *, view: str):
-        userdata = userdb.load(ctx.guild.id, user.id)
-        userdata.macrovision_view = view
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, user.id):
+            userdata = await userdb.aload(ctx.guild.id, user.id)
+            userdata.macrovision_view = view
+            await userdb.asave(userdata)
 
         await ctx.send(f"{userdata.nickname}'s view is now {view}.")
 
@@ -684,9 +722,10 @@ class SetCog(commands.Cog):
     @commands.guild_only()
     @commands.is_owner()
     async def clearview(self, ctx: GuildContext, *, user: discord.Member):
-        userdata = userdb.load(ctx.guild.id, user.id)
-        userdata.macrovision_view = None
-        userdb.save(userdata)
+        async with userdb.lock(ctx.guild.id, user.id):
+            userdata = await userdb.aload(ctx.guild.id, user.id)
+            userdata.macrovision_view = None
+            await userdb.asave(userdata)
 
         await ctx.send(f"Cleared {userdata.nickname}'s view.")
 
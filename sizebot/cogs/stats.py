@@ -1,3 +1,6 @@
+from typing import Literal
+
+import asyncio
 import logging
 from random import choice
 
@@ -5,22 +8,26 @@ import discord
 from discord.ext import commands
 
 from sizebot.cogs.register import show_next_step
-from sizebot.lib import errors, proportions, userdb, macrovision
+from sizebot.lib import errors, proportions, render, userdb, macrovision
 from sizebot.lib.constants import colors, emojis
 from sizebot.lib.facts import get_facts_from_user
 from sizebot.lib.freefall import freefall
-from sizebot.lib.language import engine
+from sizebot.lib.language import aget_plural_word
 from sizebot.lib.metal import metal_value, nugget_value
 from sizebot.lib.neuron import get_neuron_embed
 from sizebot.lib.objs import format_close_object_smart
+from sizebot.lib.ranking import RANKSTATS, RankStat
+from sizebot.lib.stats import format_scale
 from sizebot.lib.statproxy import StatProxy
 from sizebot.lib.types import BotContext, GuildContext
 from sizebot.lib.units import SV, TV, WV, Decimal
-from sizebot.lib.userdb import load_or_fake, MemberOrFakeOrSize, load_or_fake_height, load_or_fake_weight
+from sizebot.lib.userdb import aload_or_fake, MemberOrFakeOrSize, aload_or_fake_height, aload_or_fake_weight
 from sizebot.lib.utils import pretty_time_delta, sentence_join, round_fraction
 
 logger = logging.getLogger("sizebot")
 
+RANKING_PAGE_SIZE = 10
+
 
 class StatsCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -28,7 +35,8 @@ class StatsCog(commands.Cog):
 
     @commands.command(
         usage = "[user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def stats(self, ctx: GuildContext, memberOrHeight: MemberOrFakeOrSize | None = None):
@@ -45,16 +53,17 @@ class StatsCog(commands.Cog):
             memberOrHeight = ctx.author
 
         same_user = isinstance(memberOrHeight, discord.Member) and memberOrHeight.id == ctx.author.id
-        userdata = load_or_fake(memberOrHeight, allow_unreg=same_user)
+        userdata = await aload_or_fake(memberOrHeight, allow_unreg=same_user)
 
-        tosend = proportions.get_stats(userdata, ctx.author.id)
+        tosend = await render.run(proportions.get_stats, userdata, ctx.author.id)
         await ctx.send(**tosend)
 
         await show_next_step(ctx, userdata)
 
     @commands.command(
         usage = "<from> <to> [user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def statsso(self, ctx: GuildContext, sv1: MemberOrFakeOrSize, sv2: SV, *, memberOrHeight: MemberOrFakeOrSize = None):
@@ -63,21 +72,22 @@ class StatsCog(commands.Cog):
         if memberOrHeight is None:
             memberOrHeight = ctx.author
 
-        sv1 = load_or_fake_height(sv1)  # This feels like a hack. Is this awful?
+        sv1 = await aload_or_fake_height(sv1)  # This feels like a hack. Is this awful?
         scale_factor = sv1 / sv2
 
         same_user = isinstance(memberOrHeight, discord.Member) and memberOrHeight.id == ctx.author.id
-        userdata = load_or_fake(memberOrHeight, allow_unreg=same_user)
+        userdata = await aload_or_fake(memberOrHeight, allow_unreg=same_user)
         userdata.scale = scale_factor
 
-        tosend = proportions.get_stats(userdata, ctx.author.id)
+        tosend = await render.run(proportions.get_stats, userdata, ctx.author.id)
         await ctx.send(**tosend)
 
         await show_next_step(ctx, userdata)
 
     @commands.command(
         usage = "[user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def basestats(self, ctx: GuildContext, *, member: discord.Member = None):
@@ -92,7 +102,7 @@ class StatsCog(commands.Cog):
         if member is None:
             member = ctx.author
 
-        userdata = userdb.load(ctx.guild.id, member.id)
+        userdata = await userdb.aload(ctx.guild.id, member.id)
 
         tosend = proportions.get_basestats(userdata, requesterID=ctx.author.id)
 
@@ -102,7 +112,8 @@ class StatsCog(commands.Cog):
 
     @commands.command(
         usage = "[user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def settings(self, ctx: GuildContext, *, member: discord.Member = None):
@@ -117,7 +128,7 @@ class StatsCog(commands.Cog):
         if member is None:
             member = ctx.author
 
-        userdata = userdb.load(ctx.guild.id, member.id)
+        userdata = await userdb.aload(ctx.guild.id, member.id)
 
         tosend = proportions.get_settings(userdata, requesterID=ctx.author.id)
 
@@ -127,7 +138,8 @@ class StatsCog(commands.Cog):
 
     @commands.command(
         usage = "[user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def statsas(self, ctx: GuildContext, memberOrHeight: MemberOrFakeOrSize = None,
@@ -146,18 +158,19 @@ class StatsCog(commands.Cog):
         if memberOrHeight2 is None:
             memberOrHeight2 = ctx.author
 
-        userdata = load_or_fake(memberOrHeight)
-        userdata2 = load_or_fake(memberOrHeight2)
+        userdata = await aload_or_fake(memberOrHeight)
+        userdata2 = await aload_or_fake(memberOrHeight2)
         userdata2.nickname = userdata2.nickname + " as " + userdata.nickname
         userdata2.height = userdata.height
 
-        tosend = proportions.get_stats(userdata2, ctx.author.id)
+        tosend = await render.run(proportions.get_stats, userdata2, ctx.author.id)
         await ctx.send(**tosend)
 
     @commands.command(
         aliases = ["get"],
         usage = "<stat> [user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def stat(self, ctx: GuildContext, stat: StatProxy, *, memberOrHeight: MemberOrFakeOrSize = None):
@@ -177,10 +190,10 @@ class StatsCog(commands.Cog):
             memberOrHeight = ctx.author
 
         same_user = isinstance(memberOrHeight, discord.Member) and memberOrHeight.id == ctx.author.id
-        userdata = load_or_fake(memberOrHeight, allow_unreg=same_user)
+        userdata = await aload_or_fake(memberOrHeight, allow_unreg=same_user)
 
         if stat.tag:
-            tosend = proportions.get_stats_bytag(userdata, stat.name, ctx.author.id)
+            tosend = await render.run(proportions.get_stats_bytag, userdata, stat.name, ctx.author.id)
             await ctx.send(**tosend)
         else:
             tosend = proportions.get_stat(userdata, stat.name)
@@ -193,7 +206,8 @@ class StatsCog(commands.Cog):
 
     @commands.command(
         usage = "<from> <to> <stat> [user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def statso(self, ctx: GuildContext, sv1: MemberOrFakeOrSize, sv2: SV, stat: StatProxy, *, memberOrHeight: MemberOrFakeOrSize = None):
@@ -206,13 +220,13 @@ class StatsCog(commands.Cog):
             memberOrHeight = ctx.author
 
         same_user = isinstance(memberOrHeight, discord.Member) and memberOrHeight.id == ctx.author.id
-        userdata = load_or_fake(memberOrHeight, allow_unreg=same_user)
-        sv1 = load_or_fake_height(sv1)  # This feels like a hack. Is this awful?
+        userdata = await aload_or_fake(memberOrHeight, allow_unreg=same_user)
+        sv1 = await aload_or_fake_height(sv1)  # This feels like a hack. Is this awful?
         scale_factor = sv1 / sv2
         userdata.scale = scale_factor
 
         if stat.tag:
-            tosend = proportions.get_stats_bytag(userdata, stat.name, ctx.author.id)
+            tosend = await render.run(proportions.get_stats_bytag, userdata, stat.name, ctx.author.id)
             await ctx.send(**tosend)
         else:
             tosend = proportions.get_stat(userdata, stat.name)
@@ -226,7 +240,8 @@ class StatsCog(commands.Cog):
     @commands.command(
         aliases = ["getas"],
         usage = "<stat> [user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def statas(self, ctx: GuildContext, stat: StatProxy, memberOrHeight: MemberOrFakeOrSize = None,
@@ -248,13 +263,13 @@ class StatsCog(commands.Cog):
         if memberOrHeight2 is None:
             memberOrHeight2 = ctx.author
 
-        userdata = load_or_fake(memberOrHeight)
-        userdata2 = load_or_fake(memberOrHeight2)
+        userdata = await aload_or_fake(memberOrHeight)
+        userdata2 = await aload_or_fake(memberOrHeight2)
         userdata2.nickname = userdata2.nickname + " as " + userdata.nickname
         userdata2.height = userdata.height
 
         if stat.tag:
-            tosend = proportions.get_stats_bytag(userdata2, stat.name, ctx.author.id)
+            tosend = await render.run(proportions.get_stats_bytag, userdata2, stat.name, ctx.author.id)
             await ctx.send(**tosend)
         else:
             tosend = proportions.get_stat(userdata2, stat.name)
@@ -266,7 +281,8 @@ class StatsCog(commands.Cog):
     @commands.command(
         aliases = ["comp", "comparison"],
         usage = "<user/height> [user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def compare(self, ctx: GuildContext, memberOrHeight: MemberOrFakeOrSize = None,
@@ -281,39 +297,41 @@ class StatsCog(commands.Cog):
             await ctx.send("Please use either two parameters to compare two people or sizes, or one to compare with yourself.")
             return
 
-        userdata1 = load_or_fake(memberOrHeight)
-        userdata2 = load_or_fake(memberOrHeight2)
+        userdata1 = await aload_or_fake(memberOrHeight)
+        userdata2 = await aload_or_fake(memberOrHeight2)
 
         msg = await ctx.send(emojis.loading + " *Loading comparison...*")
 
-        tosend = proportions.get_compare(userdata1, userdata2, ctx.author.id)
+        tosend = await render.run(proportions.get_compare, userdata1, userdata2, ctx.author.id)
         await msg.edit(content = "", **tosend)
 
     @commands.command(
         aliases = ["compas"],
         usage = "[user/height] [user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def compareas(self, ctx: GuildContext, asHeight: MemberOrFakeOrSize = None,
                         memberOrHeight: MemberOrFakeOrSize = None):
         """Compare yourself as a different height and another user."""
 
-        userdata = load_or_fake(ctx.message.author)
-        asdata = load_or_fake(asHeight)
+        userdata = await aload_or_fake(ctx.message.author)
+        asdata = await aload_or_fake(asHeight)
         userdata.height = asdata.height
         userdata.nickname += " as " + asdata.nickname
-        comparedata = load_or_fake(memberOrHeight)
+        comparedata = await aload_or_fake(memberOrHeight)
 
         msg = await ctx.send(emojis.loading + " *Loading comparison...*")
 
-        tosend = proportions.get_compare(userdata, comparedata, ctx.author.id)
+        tosend = await render.run(proportions.get_compare, userdata, comparedata, ctx.author.id)
         await msg.edit(content = "", **tosend)
 
     @commands.command(
         aliases = ["compstat"],
         usage = "<stat> [user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def comparestat(self, ctx: GuildContext, stat: StatProxy, *, memberOrHeight: MemberOrFakeOrSize, memberOrHeight2: MemberOrFakeOrSize = None):
@@ -324,12 +342,12 @@ class StatsCog(commands.Cog):
             await ctx.send("Please use either two parameters to compare two people or sizes, or one to compare with yourself.")
             return
 
-        userdata1 = load_or_fake(memberOrHeight)
-        userdata2 = load_or_fake(memberOrHeight2)
+        userdata1 = await aload_or_fake(memberOrHeight)
+        userdata2 = await aload_or_fake(memberOrHeight2)
 
         if stat.tag:
             # TODO: Properly merge this
-            tosend = proportions.get_compare_bytag(userdata1, userdata2, stat.name, requesterID=ctx.author.id)
+            tosend = await render.run(proportions.get_compare_bytag, userdata1, userdata2, stat.name, requesterID=ctx.author.id)
             await ctx.send(**tosend)
         else:
             tosend = proportions.get_compare_stat(userdata1, userdata2, stat.name)
@@ -341,7 +359,8 @@ class StatsCog(commands.Cog):
     @commands.command(
         aliases = ["dist", "walk", "run", "climb", "swim", "crawl", "drive"],
         usage = "<length> [user]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def distance(self, ctx: GuildContext, goal: MemberOrFakeOrSize | TV,
@@ -356,22 +375,23 @@ class StatsCog(commands.Cog):
         if member is None:
             member = ctx.author
 
-        userdata = load_or_fake(member)
+        userdata = await aload_or_fake(member)
 
         if not isinstance(goal, (SV, TV)):
-            goal = load_or_fake_height(goal)
+            goal = await aload_or_fake_height(goal)
 
         if isinstance(goal, SV):
-            tosend = proportions.get_speeddistance(userdata, goal)
+            tosend = await render.run(proportions.get_speeddistance, userdata, goal)
         elif isinstance(goal, TV):
-            tosend = proportions.get_speedtime(userdata, goal)
+            tosend = await render.run(proportions.get_speedtime, userdata, goal)
 
         await ctx.send(**tosend)
 
     @commands.command(
         aliases = ["diststats"],
         usage = "<user/height> [user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def distancestats(self, ctx: GuildContext, memberOrHeight: MemberOrFakeOrSize = None,
@@ -384,17 +404,18 @@ class StatsCog(commands.Cog):
             await ctx.send("Please use either two parameters to compare two people or sizes, or one to compare with yourself.")
             return
 
-        userdata1 = load_or_fake(memberOrHeight)
-        userdata2 = load_or_fake(memberOrHeight2)
+        userdata1 = await aload_or_fake(memberOrHeight)
+        userdata2 = await aload_or_fake(memberOrHeight2)
 
-        tosend = proportions.get_speedcompare(userdata2, userdata1, ctx.author.id)
+        tosend = await render.run(proportions.get_speedcompare, userdata2, userdata1, ctx.author.id)
 
         await ctx.send(**tosend)
 
     @commands.command(
         aliases = ["diststat"],
         usage = "<stat> <user/height> [user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def distancestat(self, ctx: GuildContext, stat: str, memberOrHeight: MemberOrFakeOrSize = None,
@@ -409,10 +430,10 @@ class StatsCog(commands.Cog):
             await ctx.send("Please use either two parameters to compare two people or sizes, or one to compare with yourself.")
             return
 
-        userdata1 = load_or_fake(memberOrHeight)
-        userdata2 = load_or_fake(memberOrHeight2)
+        userdata1 = await aload_or_fake(memberOrHeight)
+        userdata2 = await aload_or_fake(memberOrHeight2)
 
-        tosend = proportions.get_speedcompare_stat(userdata2, userdata1, stat)
+        tosend = await render.run(proportions.get_speedcompare_stat, userdata2, userdata1, stat)
 
         if tosend is None:
             await ctx.send(f"{userdata1.nickname} doesn't have the `{stat}` stat.")
@@ -423,7 +444,8 @@ class StatsCog(commands.Cog):
     @commands.command(
         aliases = ["reversedistance", "reversedist", "revdist"],
         usage = "<length> [user]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def ruler(self, ctx: GuildContext, length: SV, *, who: MemberOrFakeOrSize = None):
@@ -436,7 +458,7 @@ class StatsCog(commands.Cog):
         if who is None:
             who = ctx.message.author
 
-        userdata = load_or_fake(who)
+        userdata = await aload_or_fake(who)
 
         if userdata.height == 0:
             await ctx.send(f"{userdata.tag} doesn't exist...")
@@ -455,7 +477,8 @@ class StatsCog(commands.Cog):
 
     @commands.command(
         usage = "<user or length>",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def sound(self, ctx: GuildContext, *, who: MemberOrFakeOrSize = None):
@@ -469,7 +492,7 @@ class StatsCog(commands.Cog):
         if isinstance(who, SV):
             is_SV = True
 
-        userdata = load_or_fake(who)
+        userdata = await aload_or_fake(who)
 
         traveldist = userdata.height
 
@@ -479,7 +502,8 @@ class StatsCog(commands.Cog):
         if is_SV:
             desc = f"To travel {traveldist:,.3mu}, it would take sound **{printtime}**."
         else:
-            desc = f"To travel from **{userdata.nickname}**'s head to their {engine.plural(userdata.footname).lower()}, it would take sound **{printtime}**."
+            footnames = await aget_plural_word(userdata.footname)
+            desc = f"To travel from **{userdata.nickname}**'s head to their {footnames.lower()}, it would take sound **{printtime}**."
 
         embed = discord.Embed(title = f"Sound Travel Time in {traveldist:,.3mu}",
                               description = desc)
@@ -488,7 +512,8 @@ class StatsCog(commands.Cog):
 
     @commands.command(
         usage = "<user or length>",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def light(self, ctx: GuildContext, *, who: MemberOrFakeOrSize = None):
@@ -502,7 +527,7 @@ class StatsCog(commands.Cog):
         if isinstance(who, SV):
             is_SV = True
 
-        userdata = load_or_fake(who)
+        userdata = await aload_or_fake(who)
 
         traveldist = userdata.height
 
@@ -512,7 +537,8 @@ class StatsCog(commands.Cog):
         if is_SV:
             desc = f"To travel {traveldist:,.3mu}, it would take light **{printtime}**."
         else:
-            desc = f"To travel from **{userdata.nickname}**'s head to their {engine.plural(userdata.footname).lower()}, it would take light **{printtime}**."
+            footnames = await aget_plural_word(userdata.footname)
+            desc = f"To travel from **{userdata.nickname}**'s head to their {footnames.lower()}, it would take light **{printtime}**."
 
         embed = discord.Embed(title = f"Light Travel Time in {traveldist:,.3mu}",
                                       description = desc)
@@ -520,7 +546,8 @@ class StatsCog(commands.Cog):
         await ctx.send(embed = embed)
 
     @commands.command(
-        usage = "<distance>"
+        usage = "<distance>",
+        pure = True
     )
     @commands.guild_only()
     async def fall(self, ctx: GuildContext, distance: MemberOrFakeOrSize):
@@ -529,9 +556,9 @@ class StatsCog(commands.Cog):
         #ACC#
         """
         if isinstance(distance, discord.Member):
-            ud = userdb.load(ctx.guild.id, distance.id)
+            ud = await userdb.aload(ctx.guild.id, distance.id)
             distance = ud.height
-        userdata = userdb.load(ctx.guild.id, ctx.author.id)
+        userdata = await userdb.aload(ctx.guild.id, ctx.author.id)
         basemass = userdata.baseweight
         scale = userdata.scale
         time, vm = freefall(basemass, distance, scale)
@@ -541,16 +568,17 @@ class StatsCog(commands.Cog):
                        f"Your max speed: {vm:.3m}/s")
 
     @commands.command(
-        usage = "<distance>"
+        usage = "<distance>",
+        pure = True
     )
     @commands.guild_only()
     async def mcfall(self, ctx: GuildContext, distance: discord.Member | SV):
         if ctx.guild is None:
             raise commands.errors.NoPrivateMessage()
         if isinstance(distance, discord.Member):
-            ud = userdb.load(ctx.guild.id, distance.id)
+            ud = await userdb.aload(ctx.guild.id, distance.id)
             distance = ud.height
-        userdata = userdb.load(ctx.guild.id, ctx.author.id)
+        userdata = await userdb.aload(ctx.guild.id, ctx.author.id)
         new_dist = SV(distance * userdata.viewscale)
         hearts = round_fraction(max(SV(0), new_dist - SV(3)) / SV(2), 2)
 
@@ -574,7 +602,7 @@ class StatsCog(commands.Cog):
         userdatas = []
         for member in ctx.message.mentions:
             try:
-                userdatas.append(userdb.load(member.guild.id, member.id, member=member))
+                userdatas.append(await userdb.aload(member.guild.id, member.id, member=member))
             except errors.UserNotFoundException:
                 failedusers.append(member)
 
@@ -596,14 +624,15 @@ class StatsCog(commands.Cog):
             title="Click here for lineup image!",
             description=f"Lineup of {nicks}",
             color=colors.cyan,
-            url = macrovision.get_url_from_users(userdatas)
+            url = await render.run(macrovision.get_url_from_users, userdatas)
         )
         await msg.edit(content = "", embed = e)
 
     @commands.command(
         aliases = ["simplecomp", "simplecomparison"],
         usage = "<user/height> [user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def simplecompare(self, ctx: GuildContext, memberOrHeight: MemberOrFakeOrSize = None,
@@ -618,18 +647,19 @@ class StatsCog(commands.Cog):
             await ctx.send("Please use either two parameters to compare two people or sizes, or one to compare with yourself.")
             return
 
-        userdata1 = load_or_fake(memberOrHeight)
-        userdata2 = load_or_fake(memberOrHeight2)
+        userdata1 = await aload_or_fake(memberOrHeight)
+        userdata2 = await aload_or_fake(memberOrHeight2)
 
         msg = await ctx.send(emojis.loading + " *Loading comparison...*")
 
-        tosend = proportions.get_compare_simple(userdata1, userdata2, ctx.author.id)
+        tosend = await render.run(proportions.get_compare_simple, userdata1, userdata2, ctx.author.id)
         await msg.edit(content = "", **tosend)
 
     @commands.command(
         aliases = ["minecraft", "scopic"],
         usage = "[user]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def pehkui(self, ctx: GuildContext, *, who: MemberOrFakeOrSize = None):
@@ -640,7 +670,7 @@ class StatsCog(commands.Cog):
         if who is None:
             who = ctx.message.author
 
-        userdata = load_or_fake(who)
+        userdata = await aload_or_fake(who)
 
         if userdata.height == 0:
             await ctx.send(f"{userdata.nickname} doesn't exist...")
@@ -654,7 +684,8 @@ class StatsCog(commands.Cog):
     @commands.command(
         aliases = ["g", "gravity"],
         usage = "<user> [user]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def gravitycompare(self, ctx: GuildContext, memberOrHeight: MemberOrFakeOrSize = None,
@@ -670,8 +701,8 @@ class StatsCog(commands.Cog):
             await ctx.send("Please use either two parameters to compare two people or sizes, or one to compare with yourself.")
             return
 
-        userdata1 = load_or_fake(memberOrHeight)
-        userdata2 = load_or_fake(memberOrHeight2)
+        userdata1 = await aload_or_fake(memberOrHeight)
+        userdata2 = await aload_or_fake(memberOrHeight2)
         larger_person, smaller_person = (userdata1, userdata2) if userdata1.height > userdata2.height else (userdata2, userdata1)
 
         # RP rules
@@ -688,7 +719,8 @@ class StatsCog(commands.Cog):
     @commands.command(
         aliases = ["gold", "silver", "palladium", "platinum", "nugget", "nuggets"],
         usage = "[user]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def metal(self, ctx: GuildContext, *, who: MemberOrFakeOrSize | WV = None):
@@ -700,12 +732,16 @@ class StatsCog(commands.Cog):
         if isinstance(who, WV):
             weight = who
         else:
-            weight = load_or_fake_weight(who)
+            weight = await aload_or_fake_weight(who)
 
-        gold_dollars = metal_value("gold", weight)
-        silver_dollars = metal_value("silver", weight)
-        platinum_dollars = metal_value("platinum", weight)
-        palladium_dollars = metal_value("palladium", weight)
+        msg = await ctx.send(emojis.loading + " *Asking the Swiss Bank...*")
+
+        gold_dollars, silver_dollars, platinum_dollars, palladium_dollars = await asyncio.gather(
+            metal_value("gold", weight),
+            metal_value("silver", weight),
+            metal_value("platinum", weight),
+            metal_value("palladium", weight)
+        )
 
         nugget_dollars, nugget_count = nugget_value(weight)
 
@@ -716,12 +752,12 @@ class StatsCog(commands.Cog):
         e.add_field(name = "Palladium", value = f"${palladium_dollars:,.2}")
         e.add_field(name = "Chicken Nuggets", value = f"${nugget_dollars:,.2}\n*(≈{nugget_count} nuggets)*")
 
-        msg = await ctx.send(emojis.loading + " *Asking the Swiss Bank...*")
         await msg.edit(content = "", embed = e)
 
     @commands.command(
         usage = "[value]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def convert(self, ctx: GuildContext, *, whoOrWhat: MemberOrFakeOrSize | WV = None):
@@ -736,14 +772,15 @@ class StatsCog(commands.Cog):
         if isinstance(whoOrWhat, (SV, WV)):
             value = whoOrWhat
         else:
-            value = load_or_fake_height(whoOrWhat)
+            value = await aload_or_fake_height(whoOrWhat)
 
         await ctx.send(f"{value:,.3mu}")
 
     @commands.command(
         aliases = ["keypoint", "measurements", "measure"],
         usage = "[user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def keypoints(self, ctx: GuildContext, who: MemberOrFakeOrSize = None):
@@ -751,16 +788,17 @@ class StatsCog(commands.Cog):
         if who is None:
             who = ctx.message.author
 
-        userdata1 = load_or_fake(who)
+        userdata1 = await aload_or_fake(who)
 
-        tosend = proportions.get_keypoints_embed(userdata1, ctx.author.id)
+        tosend = await render.run(proportions.get_keypoints_embed, userdata1, ctx.author.id)
 
         await ctx.send(**tosend)
 
     @commands.command(
         aliases = ["reaction", "reactiontime", "react"],
         usage = "[user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def neuron(self, ctx: GuildContext, who: MemberOrFakeOrSize = None):
@@ -768,7 +806,7 @@ class StatsCog(commands.Cog):
         if who is None:
             who = ctx.message.author
 
-        userdata = load_or_fake(who)
+        userdata = await aload_or_fake(who)
 
         tosend = get_neuron_embed(userdata)
 
@@ -777,7 +815,8 @@ class StatsCog(commands.Cog):
     @commands.command(
         aliases = ["fact"],
         usage = "[user/height]",
-        category = "stats"
+        category = "stats",
+        pure = True
     )
     @commands.guild_only()
     async def facts(self, ctx: GuildContext, who: MemberOrFakeOrSize = None):
@@ -788,7 +827,7 @@ class StatsCog(commands.Cog):
         else:
             prefix = None
 
-        userdata = load_or_fake(who)
+        userdata = await aload_or_fake(who)
         if prefix is None:
             prefix = userdata.nickname + " is"
         facts = get_facts_from_user(userdata, prefix)
@@ -796,6 +835,71 @@ class StatsCog(commands.Cog):
 
         await ctx.send(s)
 
+    @commands.command(
+        aliases = ["leaderboards", "sizeboard"],
+        usage = "[height/scale/weight] [largest/smallest] [page]",
+        category = "stats",
+        pure = True
+    )
+    @commands.guild_only()
+    async def ranking(self, ctx: GuildContext, stat: RankStat = "height", order: Literal["largest", "smallest"] = "largest", page: int = 1):
+        """See who's the biggest (or smallest) in this server.
+
+        Examples:
+        `&ranking`
+        `&ranking weight`
+        `&ranking scale smallest`
+        `&ranking height largest 2`
+        """
+        guildranking = await userdb.aload_ranking(ctx.guild.id)
+        smallest = order == "smallest"
+        page = max(1, page)
+        offset = (page - 1) * RANKING_PAGE_SIZE
+        entries = guildranking.top(stat, RANKING_PAGE_SIZE, offset = offset, smallest = smallest)
+        if not entries:
+            await ctx.send(f"There's nobody on page {page} of this leaderboard.")
+            return
+
+        lines = [f"**{offset + i}.** <@{userid}>: {format_rankvalue(stat, value)}" for i, (userid, value) in enumerate(entries, 1)]
+        pages = (len(guildranking) - 1) // RANKING_PAGE_SIZE + 1
+        embed = discord.Embed(
+            title = f"{order.capitalize()} {stat} in {ctx.guild.name}",
+            description = "\n".join(lines),
+            color = colors.cyan
+        )
+        embed.set_footer(text = f"Page {page} of {pages}, {len(guildranking)} users")
+        await ctx.send(embed = embed)
+
+    @commands.command(
+        usage = "[height/scale/weight] [user]",
+        category = "stats",
+        pure = True
+    )
+    @commands.guild_only()
+    async def rank(self, ctx: GuildContext, stat: RankStat = "height", *, member: discord.Member = None):
+        """See where you (or someone else) are on this server's leaderboard.
+
+        Examples:
+        `&rank`
+        `&rank weight`
+        `&rank scale @User`
+        """
+        if member is None:
+            member = ctx.author
+        guildranking = await userdb.aload_ranking(ctx.guild.id)
+        place = guildranking.rank(member.id, stat)
+        if place is None:
+            await ctx.send(f"{member.display_name} isn't on this server's leaderboard.")
+            return
+        value = guildranking.users[member.id][RANKSTATS.index(stat)]
+        await ctx.send(f"{member.display_name} is **#{place}** of {len(guildranking)} by {stat}, at {format_rankvalue(stat, value)}.")
+
+
+def format_rankvalue(stat: RankStat, value: Decimal) -> str:
+    if stat == "scale":
+        return format_scale(value)
+    return f"{value:,.3mu}"
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(StatsCog(bot))
@@ -11,13 +11,30 @@ from discord import Embed
 from discord.ext import commands
 
 from sizebot import __version__
-from sizebot.lib import paths
+from sizebot.lib import filelock, iopool, paths
 from sizebot.lib.loglevels import EGG
 from sizebot.lib.types import BotContext, GuildContext
 
 logger = logging.getLogger("sizebot")
 
 
+def _write(jsondata: Any):
+    filelock.write_atomic(paths.thispath, json.dumps(jsondata, indent = 4))
+
+
+def _add_point(id: int):
+    # Every worker adds to the same leaderboard, so read and write it in one go, under the lock
+    with filelock.locked(paths.thispath):
+        tracker = ThisTracker.load()
+        tracker.increment_points(id)
+        tracker.save()
+
+
+async def add_point(id: int):
+    """Give a user one agreement point, on the I/O pool"""
+    await iopool.run("this", _add_point, id)
+
+
 class ThisTracker():
     def __init__(self, points: dict[str, int] | None = None):
         if points is None:
@@ -31,10 +48,11 @@ class ThisTracker():
         self.points[id] = count + 1
 
     def save(self):
-        paths.thispath.parent.mkdir(exist_ok = True)
-        jsondata = self.toJSON()
-        with open(paths.thispath, "w") as f:
-            json.dump(jsondata, f, indent = 4)
+        _write(self.toJSON())
+
+    async def asave(self):
+        """`save()`, with the file written on the I/O pool"""
+        await iopool.run("this", _write, self.toJSON())
 
     def toJSON(self) -> Any:
         """Return a python dictionary for json exporting"""
@@ -42,6 +60,10 @@ class ThisTracker():
             "points": self.points,
         }
 
+    @classmethod
+    async def aload(cls) -> ThisTracker:
+        return await iopool.run("this", ThisTracker.load)
+
     @classmethod
     def load(cls) -> ThisTracker:
         try:
@@ -95,7 +117,7 @@ class ThisCog(commands.Cog):
         """See who's the most agreeable!"""
         logger.log(EGG, f"{ctx.message.author.display_name} found the leaderboard!")
         now = datetime.now(tzlocal())
-        tracker = ThisTracker.load()
+        tracker = await ThisTracker.aload()
         trackerlist = sorted(tracker.points.items(), key=lambda i: i[1], reverse= True)
         embed = Embed(title="The Most Agreeable Users", color=0x31eff9)
         embed.set_author(name=f"SizeBot {__version__}")
@@ -116,9 +138,7 @@ class ThisCog(commands.Cog):
             messages = [m async for m in channel.history(limit=100)]
             if find_latest_non_this(messages).author.id == m.author.id:
                 return
-            tracker = ThisTracker.load()
-            tracker.increment_points(find_latest_non_this(messages).author.id)
-            tracker.save()
+            await add_point(find_latest_non_this(messages).author.id)
 
     @commands.Cog.listener()
     async def on_reaction_add(self, reaction: discord.Reaction, reacter: discord.Member | discord.User):
@@ -127,9 +147,7 @@ class ThisCog(commands.Cog):
         if reaction.message.author.id == reacter.id:
             return
         if is_agreement_emoji(reaction.emoji):
-            tracker = ThisTracker.load()
-            tracker.increment_points(reaction.message.author.id)
-            tracker.save()
+            await add_point(reaction.message.author.id)
 
 
 async def setup(bot: commands.Bot):
@@ -10,7 +10,7 @@ from discord.ext import commands
 from sizebot.lib.errors import UserNotFoundException
 from sizebot.lib.units import SV
 from sizebot.conf import conf
-from sizebot.lib import userdb, nickmanager
+from sizebot.lib import iopool, userdb, nickmanager, shards, watcher
 from sizebot.lib.diff import Diff
 from sizebot.lib.types import BotContext, GuildContext
 
@@ -41,20 +41,42 @@ def unset_cached_trigger(guildid: int, authorid: int, trigger: str):
         del user_triggers[trigger]
 
 
-def set_trigger(guildid: int, authorid: int, trigger: str, diff: Diff):
-    userdata = userdb.load(guildid, authorid)
-    # Only set the cache _after_ we've check if the user is registered
-    set_cached_trigger(guildid, authorid, trigger, diff)
-    userdata.triggers[trigger] = diff
-    userdb.save(userdata)
+async def set_trigger(guildid: int, authorid: int, trigger: str, diff: Diff):
+    async with userdb.lock(guildid, authorid):
+        userdata = await userdb.aload(guildid, authorid)
+        # Only set the cache _after_ we've check if the user is registered
+        set_cached_trigger(guildid, authorid, trigger, diff)
+        userdata.triggers[trigger] = diff
+        await userdb.asave(userdata)
 
 
-def unset_trigger(guildid: int, authorid: int, trigger: str):
+async def unset_trigger(guildid: int, authorid: int, trigger: str):
     unset_cached_trigger(guildid, authorid, trigger)
-    userdata = userdb.load(guildid, authorid)
-    if trigger in userdata.triggers:
-        del userdata.triggers[trigger]
-        userdb.save(userdata)
+    async with userdb.lock(guildid, authorid):
+        userdata = await userdb.aload(guildid, authorid)
+        if trigger in userdata.triggers:
+            del userdata.triggers[trigger]
+            await userdb.asave(userdata)
+
+
+def read_all_triggers() -> defaultdict[str, dict[tuple[int, int], Diff]]:
+    """Every trigger word of every user in the guilds this process owns"""
+    triggers = defaultdict(dict)
+    for guildid, userid in userdb.list_users():
+        if not shards.owns(guildid):
+            continue
+        try:
+            userdata = userdb.load(guildid, userid)
+        except UserNotFoundException:
+            continue
+        for trigger, diff in userdata.triggers.items():
+            triggers[trigger][guildid, userid] = diff
+    return triggers
+
+
+def load_all_triggers():
+    global user_triggers
+    user_triggers = read_all_triggers()
 
 
 class TriggerCog(commands.Cog):
@@ -62,13 +84,29 @@ class TriggerCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        for guildid, userid in userdb.list_users():
-            try:
-                userdata = userdb.load(guildid, userid)
-            except UserNotFoundException:
-                continue
-            for trigger, diff in userdata.triggers.items():
-                user_triggers[trigger][guildid, userid] = diff
+        load_all_triggers()
+        watcher.subscribe(self.on_file_change)
+
+    def cog_unload(self): # type: ignore (Bad typing in discord.py)
+        watcher.unsubscribe(self.on_file_change)
+
+    async def on_file_change(self, event: watcher.FileEvent):
+        """Pick up triggers from profiles that were changed outside this process"""
+        global user_triggers
+        if event.kind == "all":
+            # Read them into a new dict and swap it in, so on_message keeps using the old one until then
+            user_triggers = await iopool.run("triggers", read_all_triggers)
+            return
+        if event.kind != "user" or not shards.owns(event.guildid):
+            return
+        for trigger in list(user_triggers):
+            unset_cached_trigger(event.guildid, event.userid, trigger)
+        try:
+            userdata = await userdb.aload(event.guildid, event.userid)
+        except UserNotFoundException:
+            return
+        for trigger, diff in userdata.triggers.items():
+            set_cached_trigger(event.guildid, event.userid, trigger, diff)
 
     @commands.Cog.listener()
     async def on_message(self, m: discord.Message):
@@ -93,15 +131,16 @@ class TriggerCog(commands.Cog):
 
         # Update triggered users
         for (guildid, userid), diffs in users_to_update.items():
-            userdata = userdb.load(guildid, userid)
-            for diff in diffs:
-                if diff.changetype == "multiply":
-                    userdata.height *= diff.amount
-                elif diff.changetype == "add":
-                    userdata.height += diff.amount
-                elif diff.changetype == "power":
-                    userdata = userdata ** diff.amount
-            userdb.save(userdata)
+            async with userdb.lock(guildid, userid):
+                userdata = await userdb.aload(guildid, userid)
+                for diff in diffs:
+                    if diff.changetype == "multiply":
+                        userdata.height *= diff.amount
+                    elif diff.changetype == "add":
+                        userdata.height += diff.amount
+                    elif diff.changetype == "power":
+                        userdata = userdata ** diff.amount
+                await userdb.asave(userdata)
             if userdata.display:
                 await nickmanager.nick_update(m.guild.get_member(userid))
 
@@ -112,7 +151,7 @@ class TriggerCog(commands.Cog):
     async def triggers(self, ctx: GuildContext):
         """List your trigger words."""
         userid = ctx.author.id
-        userdata = userdb.load(ctx.guild.id, userid)
+        userdata = await userdb.aload(ctx.guild.id, userid)
         triggers = [f"`{trigger}`: {diff}" for trigger, diff in userdata.triggers.items()]
         out = "**Triggers**:\n" + "\n".join(triggers)
         await ctx.send(out)
@@ -124,7 +163,7 @@ class TriggerCog(commands.Cog):
     async def exporttriggers(self, ctx: GuildContext):
         """Export your trigger words."""
         userid = ctx.author.id
-        userdata = userdb.load(ctx.guild.id, userid)
+        userdata = await userdb.aload(ctx.guild.id, userid)
         triggers = [f"&settrigger {trigger} {diff}" for trigger, diff in userdata.triggers.items()]
         out = "```\n" + "\n".join(triggers) + "\n```"
         await ctx.send(out)
@@ -139,7 +178,7 @@ class TriggerCog(commands.Cog):
 
         #ALPHA#
         """
-        set_trigger(ctx.guild.id, ctx.author.id, trigger, diff)
+        await set_trigger(ctx.guild.id, ctx.author.id, trigger, diff)
         await ctx.send(f"Set trigger word {trigger!r} to scale {diff}.")
 
     @commands.command(
@@ -150,7 +189,7 @@ class TriggerCog(commands.Cog):
     @commands.guild_only()
     async def cleartrigger(self, ctx: GuildContext, *, trigger: str):
         """Remove a trigger word."""
-        unset_trigger(ctx.guild.id, ctx.author.id, trigger)
+        await unset_trigger(ctx.guild.id, ctx.author.id, trigger)
         await ctx.send(f"Removed trigger word {trigger!r}.")
 
     @commands.command(
@@ -161,9 +200,9 @@ class TriggerCog(commands.Cog):
     @commands.guild_only()
     async def clearalltriggers(self, ctx: GuildContext):
         """Remove all your trigger words."""
-        userdata = userdb.load(ctx.guild.id, ctx.author.id)
+        userdata = await userdb.aload(ctx.guild.id, ctx.author.id)
         for trigger in userdata.triggers.keys():
-            unset_trigger(ctx.guild.id, ctx.author.id, trigger)
+            await unset_trigger(ctx.guild.id, ctx.author.id, trigger)
         await ctx.send("Removed all trigger words.")
 
 
@@ -1,15 +1,16 @@
 import io
-import json
 import re
-from aiohttp_requests import requests
 from json.decoder import JSONDecodeError
 from urllib.parse import quote
 
+import aiohttp
+
 import discord
 from discord import Embed
 from discord.ext import commands
 
 from sizebot import __version__
+from sizebot.lib import webclient
 from sizebot.lib.constants import emojis
 from sizebot.lib.types import BotContext
 
@@ -19,6 +20,8 @@ re_digits = re.compile(r"\d+")
 re_percent = re.compile(r"\d+%?")
 re_dividers = re.compile(r"[\s,]+")
 coloricon = "https://cdn.discordapp.com/attachments/650460192009617433/676205298674958366/spinning-beachball-of-death-mac.png"
+# A color's info never changes, so we can hang on to lookups for a long time
+COLOR_TTL = 24 * 60 * 60
 
 
 class WeirdCog(commands.Cog):
@@ -97,14 +100,9 @@ class WeirdCog(commands.Cog):
             await outmessage.edit(content = f"`{colortype}` is not an accepted color type.\nAccepted types are hex, rgb, hsv, hsl, or cymk.")
             return
 
-        r = await requests.get(url + "/id?" + colortype + "=" + colorvalueout)
         try:
-            colorjson = json.loads(await r.text())
-        except JSONDecodeError:
-            await outmessage.edit(content = emojis.warning + "The Color API is not working as expected. Please try again later.")
-            return
-
-        if r.status != 200:
+            colorjson = await webclient.client.get_json(url + "/id?" + colortype + "=" + colorvalueout, ttl = COLOR_TTL)
+        except (JSONDecodeError, webclient.APIException, aiohttp.ClientError, TimeoutError):
             await outmessage.edit(content = emojis.warning + "The Color API is not working as expected. Please try again later.")
             return
 
@@ -145,11 +143,10 @@ class WeirdCog(commands.Cog):
 
         m = await ctx.send(emojis.loading + " *Loading math...*")
 
-        r = await requests.get(full_url)
+        r = await webclient.client.get(full_url)
         await m.delete()
-        read_data = await r.read()
-        if 200 <= r.status <= 299:
-            arr = io.BytesIO(read_data)
+        if r.ok:
+            arr = io.BytesIO(r.body)
             arr.seek(0)
             f = discord.File(arr, f"{ctx.message.id}.png")
             await ctx.send(content = "", file=f)
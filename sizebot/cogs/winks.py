@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 import discord
 from discord.ext import commands
 
-from sizebot.lib import utils, paths
+from sizebot.lib import filelock, iopool, utils, paths
 from sizebot.lib.constants import ids
 from sizebot.lib.types import BotContext
 
@@ -26,13 +26,22 @@ def get_winks() -> int:
 
 
 def add_winks(count: int = 1) -> int:
-    winkcount = get_winks()
-    winkcount += count
-    with open(paths.winkpath, "w") as winkfile:
-        winkfile.write(str(winkcount))
+    with filelock.locked(paths.winkpath):
+        winkcount = get_winks()
+        winkcount += count
+        filelock.write_atomic(paths.winkpath, str(winkcount))
     return winkcount
 
 
+async def aadd_winks(count: int = 1) -> int:
+    """`add_winks()`, with the file read and written on the I/O pool"""
+    return await iopool.run("winks", add_winks, count)
+
+
+async def aget_winks() -> int:
+    return await iopool.run("winks", get_winks)
+
+
 def count_winks(s: str) -> int:
     return len(winkPattern.findall(s))
 
@@ -72,7 +81,7 @@ class WinksCog(commands.Cog):
         category = "misc"
     )
     async def winkcount(self, ctx: BotContext):
-        winkcount = get_winks()
+        winkcount = await aget_winks()
         await ctx.send(f"Yukio has winked {winkcount} times since 15 September, 2019! :wink:")
         logger.info(f"Wink count requested by {ctx.author.nickname}! Current count: {winkcount} times!")
 
@@ -85,7 +94,7 @@ class WinksCog(commands.Cog):
         if winksSeen == 0:
             return
 
-        winkcount = add_winks(winksSeen)
+        winkcount = await aadd_winks(winksSeen)
         if winkcount % 100 == 0:
             logger.info(f"Yukio has winked {winkcount} times!")
         if winkcount in milestones:
@@ -83,6 +83,37 @@ conf = Config([
     ConfigField("activity", "sizebot.activity", default="Ratchet and Clank: Size Matters"),
     ConfigField("authtoken", "discord.authtoken", initdefault="INSERT_BOT_TOKEN_HERE"),
     ConfigField("logchannelid", "discord.logchannelid", type=int, default=None),
+    ConfigField("log_flush_interval", "discord.log_flush_interval", type=float, default=2),
+    ConfigField("log_queue_size", "discord.log_queue_size", type=int, default=1000),
     ConfigField("bugwebhookurl", "discord.bugwebhookurl", default=None),
-    ConfigField("cuttly_key", "api.cuttly", default=None)
+    ConfigField("cuttly_key", "api.cuttly", default=None),
+    ConfigField("render_workers", "sizebot.render_workers", type=int, default=2),
+    ConfigField("render_timeout", "sizebot.render_timeout", type=float, default=30),
+    ConfigField("io_workers", "sizebot.io_workers", type=int, default=4),
+    ConfigField("lazy_startup", "sizebot.lazy_startup", type=bool, default=False),
+    ConfigField("deferred_cogs", "sizebot.deferred_cogs", type=list, default=["eval", "keypad", "pokemon", "quake", "roll", "test", "weird"]),
+    ConfigField("import_budget_ms", "sizebot.import_budget_ms", type=float, default=100),
+    ConfigField("shard_workers", "shards.workers", type=int, default=1),
+    ConfigField("shard_count", "shards.count", type=int, default=0),
+    ConfigField("admission_enabled", "admission.enabled", type=bool, default=True),
+    ConfigField("admission_user_burst", "admission.user_burst", type=float, default=10),
+    ConfigField("admission_user_rate", "admission.user_rate", type=float, default=0.5),
+    ConfigField("admission_guild_burst", "admission.guild_burst", type=float, default=60),
+    ConfigField("admission_guild_rate", "admission.guild_rate", type=float, default=5),
+    ConfigField("admission_heavy_limit", "admission.heavy_limit", type=int, default=4),
+    ConfigField("admission_max_wait", "admission.max_wait", type=float, default=2),
+    ConfigField("reply_cache_size", "replycache.size", type=int, default=512),
+    ConfigField("reply_cache_ttl", "replycache.ttl", type=float, default=3600),
+    ConfigField("roll_max_dice", "roll.max_dice", type=int, default=1_000_000),
+    ConfigField("roll_max_sides", "roll.max_sides", type=int, default=1_000_000_000),
+    ConfigField("roll_list_limit", "roll.list_limit", type=int, default=100),
+    ConfigField("guilddb_check_mtime", "guilddb.check_mtime", type=bool, default=False),
+    ConfigField("watch_files", "watcher.enabled", type=bool, default=False),
+    ConfigField("watch_backend", "watcher.backend", default="auto"),
+    ConfigField("watch_interval", "watcher.poll_interval", type=float, default=5),
+    ConfigField("trace_enabled", "tracing.enabled", type=bool, default=False),
+    ConfigField("trace_sample_rate", "tracing.sample_rate", type=float, default=0.01),
+    ConfigField("trace_slow_ms", "tracing.slow_ms", type=float, default=None),
+    ConfigField("trace_max_bytes", "tracing.max_bytes", type=int, default=10_000_000),
+    ConfigField("trace_backups", "tracing.backups", type=int, default=3)
 ])
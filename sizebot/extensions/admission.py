@@ -0,0 +1,49 @@
+from discord.ext import commands
+
+from sizebot.conf import conf
+from sizebot.lib import admission
+from sizebot.lib.types import BotContext
+
+_permits: dict[BotContext, admission.Permit] = {}
+
+
+# Checks run right before argument conversion, so a turned-away command costs next to nothing
+async def admit_command(ctx: BotContext) -> bool:
+    if ctx.command is None:
+        return True
+    guildid = ctx.guild.id if ctx.guild is not None else None
+    try:
+        _permits[ctx] = await admission.get_admission().admit(ctx.author.id, guildid, ctx.command.qualified_name)
+    except admission.AdmissionDenied as e:
+        if e.scope == "busy":
+            raise commands.MaxConcurrencyReached(conf.admission_heavy_limit, commands.BucketType.default) from None
+        if e.scope == "guild":
+            cooldown = commands.Cooldown(conf.admission_guild_burst, conf.admission_guild_burst / conf.admission_guild_rate)
+            raise commands.CommandOnCooldown(cooldown, e.retry_after, commands.BucketType.guild) from None
+        cooldown = commands.Cooldown(conf.admission_user_burst, conf.admission_user_burst / conf.admission_user_rate)
+        raise commands.CommandOnCooldown(cooldown, e.retry_after, commands.BucketType.user) from None
+    return True
+
+
+def _release(ctx: BotContext):
+    permit = _permits.pop(ctx, None)
+    if permit is not None:
+        admission.get_admission().release(permit)
+
+
+async def setup(bot: commands.Bot):
+    if not conf.admission_enabled:
+        return
+    bot.add_check(admit_command, call_once = True)
+
+    @bot.listen()
+    async def on_command_completion(ctx: BotContext):
+        _release(ctx)
+
+    @bot.listen()
+    async def on_command_error(ctx: BotContext, error: commands.CommandError):
+        _release(ctx)
+
+
+async def teardown(bot: commands.Bot):
+    bot.remove_check(admit_command, call_once = True)
@@ -65,6 +65,8 @@ async def setup(bot: commands.Bot):
             await ctx.send(f"{emojis.error} You do not have permission to run this command.")
         elif isinstance(err, commands.CommandOnCooldown):
             await ctx.send(f"{emojis.info} You're using that command too fast! Try again in {pretty_time_delta(err.retry_after)}.")
+        elif isinstance(err, commands.MaxConcurrencyReached):
+            await ctx.send(f"{emojis.info} SizeBot is busy with a lot of big commands right now! Try again in a moment.")
         elif isinstance(err, InvalidOperation):
             await ctx.send(f"{emojis.warning} That's... not math I can do.")
         elif isinstance(err, OverflowError):
@@ -0,0 +1,59 @@
+import logging
+import time
+
+from discord.ext import commands
+
+from sizebot.lib import metrics, utils
+from sizebot.lib.scheduler import scheduler
+from sizebot.lib.types import BotContext
+
+logger = logging.getLogger("sizebot")
+
+# How often the metrics file is rewritten, in seconds
+WRITE_INTERVAL = 60
+
+_command_starts: dict[BotContext, float] = {}
+
+
+# Checks run synchronously right before argument conversion, unlike the on_command event
+def start_command_timer(ctx: BotContext) -> bool:
+    _command_starts[ctx] = time.perf_counter()
+    return True
+
+
+def _finish_command(ctx: BotContext, outcome: str):
+    start = _command_starts.pop(ctx, None)
+    if start is None or ctx.command is None:
+        return
+    metrics.observe("command_seconds", time.perf_counter() - start, command = ctx.command.qualified_name)
+    metrics.inc("commands_total", command = ctx.command.qualified_name, outcome = outcome)
+
+
+async def write_metrics(bot: commands.Bot):
+    try:
+        metrics.write_file()
+    except Exception as e:
+        logger.error("Failed to write the metrics file")
+        logger.error(utils.format_traceback(e))
+    scheduler.schedule("metrics", time.time() + WRITE_INTERVAL, write_metrics)
+
+
+async def setup(bot: commands.Bot):
+    bot.add_check(start_command_timer, call_once = True)
+
+    @bot.listen()
+    async def on_command_completion(ctx: BotContext):
+        _finish_command(ctx, "ok")
+
+    @bot.listen()
+    async def on_command_error(ctx: BotContext, error: commands.CommandError):
+        _finish_command(ctx, "error")
+
+    metrics.lagmonitor.start()
+    scheduler.schedule("metrics", time.time() + WRITE_INTERVAL, write_metrics)
+
+
+async def teardown(bot: commands.Bot):
+    bot.remove_check(start_command_timer, call_once = True)
+    metrics.lagmonitor.stop()
+    scheduler.cancel("metrics")
@@ -0,0 +1,65 @@
+import functools
+import logging
+from typing import Any
+
+import discord
+from discord.ext import commands
+from discord.ext.commands import core
+
+from sizebot.conf import conf
+from sizebot.lib import paths, shards, tracing
+from sizebot.lib.types import BotContext
+
+logger = logging.getLogger("sizebot")
+
+_original_run_converters = core.run_converters
+_original_send = commands.Context.send
+
+
+@functools.wraps(_original_run_converters)
+async def run_converters(ctx: BotContext, converter: Any, argument: str, param: commands.Parameter) -> Any:
+    with tracing.span("convert", param = param.name, converter = getattr(converter, "__name__", converter)):
+        return await _original_run_converters(ctx, converter, argument, param)
+
+
+@functools.wraps(_original_send)
+async def send(self: BotContext, *args, **kwargs) -> discord.Message:
+    with tracing.span("send"):
+        return await _original_send(self, *args, **kwargs)
+
+
+async def setup(bot: commands.Bot):
+    if not conf.trace_enabled:
+        return
+    slow_seconds = conf.trace_slow_ms / 1000 if conf.trace_slow_ms is not None else None
+    exporter = tracing.FileExporter(shards.current.per_worker(paths.tracespath), max_bytes = conf.trace_max_bytes, backups = conf.trace_backups)
+    tracing.configure(tracing.Tracer(exporter, sample_rate = conf.trace_sample_rate, slow_seconds = slow_seconds))
+
+    process_commands = bot.process_commands
+    invoke = bot.invoke
+
+    async def traced_process_commands(message: discord.Message):
+        with tracing.trace("message", message = message.id, guild = message.guild.id if message.guild else None):
+            await process_commands(message)
+
+    async def traced_invoke(ctx: BotContext):
+        name = ctx.command.qualified_name if ctx.command is not None else None
+        with tracing.span("command", command = name):
+            await invoke(ctx)
+
+    bot.process_commands = traced_process_commands
+    bot.invoke = traced_invoke
+    core.run_converters = run_converters
+    commands.Context.send = send
+    logger.info(f"Tracing {conf.trace_sample_rate:.0%} of commands to {exporter.path}.")
+
+
+async def teardown(bot: commands.Bot):
+    if not tracing.enabled():
+        return
+    await tracing.flush()
+    tracing.configure(None)
+    del bot.process_commands
+    del bot.invoke
+    core.run_converters = _original_run_converters
+    commands.Context.send = _original_send
@@ -0,0 +1,12 @@
+from discord.ext import commands
+
+from sizebot.lib import webclient
+
+
+async def setup(bot: commands.Bot):
+    pass
+
+
+async def teardown(bot: commands.Bot):
+    # Extensions are unloaded when the bot closes, so this closes the shared connection pool on shutdown
+    await webclient.client.close()
@@ -0,0 +1,194 @@
+"""Keep one user (or one busy guild) from slowing SizeBot down for everyone.
+
+Every command costs some tokens, and heavier commands cost more. Each user and each guild has a bucket of tokens
+that slowly refills. A command that's a little over budget waits for its tokens; one that would have to wait too
+long is turned away. On top of that, only a few CPU-heavy commands run at once across the whole bot, and the rest
+queue for a free slot.
+"""
+from __future__ import annotations
+from collections.abc import Callable
+from typing import Literal
+
+import asyncio
+import functools
+import time
+from dataclasses import dataclass
+
+from sizebot.conf import conf
+from sizebot.lib import metrics
+
+# How many tokens each command costs. Anything not listed costs 1.
+COSTS = {
+    "stats": 3,
+    "statsas": 3,
+    "compare": 3,
+    "compareas": 3,
+    "comparestat": 2,
+    "lineup": 5,
+    "roll": 3,
+    "r": 3,
+    "stackup": 3,
+    "lookslike": 2,
+    "earthquake": 2,
+    "quakewalk": 2,
+}
+# Commands that take enough CPU that only a few should run at once
+HEAVY = {"stats", "statsas", "compare", "compareas", "lineup", "roll", "r", "stackup"}
+# How often (in admitted commands) full buckets are dropped, so idle users aren't kept forever
+PRUNE_EVERY = 1000
+
+Scope = Literal["user", "guild", "busy"]
+
+
+class AdmissionDenied(Exception):
+    def __init__(self, scope: Scope, retry_after: float):
+        self.scope = scope
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    # __slots__ declares to python what attributes to expect.
+    __slots__ = ["capacity", "rate", "tokens", "updated"]
+
+    def __init__(self, capacity: float, rate: float, now: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, cost: float, now: float) -> float:
+        """How long until `cost` tokens are available. Costs bigger than the bucket are charged as a full bucket."""
+        self.refill(now)
+        missing = min(cost, self.capacity) - self.tokens
+        return max(0, missing / self.rate)
+
+    def take(self, cost: float):
+        self.tokens -= min(cost, self.capacity)
+
+    def give(self, cost: float):
+        self.tokens = min(self.capacity, self.tokens + min(cost, self.capacity))
+
+    def is_full(self, now: float) -> bool:
+        self.refill(now)
+        return self.tokens >= self.capacity
+
+
+@dataclass
+class Permit:
+    command: str
+    heavy: bool
+
+
+class Admission:
+    def __init__(self, *,
+                 user_burst: float = 10, user_rate: float = 0.5,
+                 guild_burst: float = 60, guild_rate: float = 5,
+                 heavy_limit: int = 4, max_wait: float = 2,
+                 clock: Callable[[], float] = time.monotonic):
+        self.user_burst = user_burst
+        self.user_rate = user_rate
+        self.guild_burst = guild_burst
+        self.guild_rate = guild_rate
+        self.heavy_limit = heavy_limit
+        self.max_wait = max_wait
+        self.clock = clock
+        self.users: dict[int, TokenBucket] = {}
+        self.guilds: dict[int, TokenBucket] = {}
+        self._heavy = asyncio.Semaphore(heavy_limit)
+        self.running_heavy = 0
+        self.waiting_heavy = 0
+        self.admitted = 0
+        self.denied = 0
+
+    def cost(self, command: str) -> int:
+        return COSTS.get(command, 1)
+
+    def _bucket(self, buckets: dict[int, TokenBucket], key: int, capacity: float, rate: float, now: float) -> TokenBucket:
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = TokenBucket(capacity, rate, now)
+        return bucket
+
+    def _deny(self, command: str, scope: Scope, retry_after: float):
+        self.denied += 1
+        metrics.inc("admission_total", command = command, outcome = f"denied_{scope}")
+        raise AdmissionDenied(scope, retry_after)
+
+    async def _take_tokens(self, userid: int, guildid: int | None, command: str, cost: int) -> list[TokenBucket]:
+        while True:
+            now = self.clock()
+            buckets = [(self._bucket(self.users, userid, self.user_burst, self.user_rate, now), "user")]
+            if guildid is not None:
+                buckets.append((self._bucket(self.guilds, guildid, self.guild_burst, self.guild_rate, now), "guild"))
+            wait, scope = max((b.wait_time(cost, now), s) for b, s in buckets)
+            if wait == 0:
+                for b, _ in buckets:
+                    b.take(cost)
+                return [b for b, _ in buckets]
+            if wait > self.max_wait:
+                self._deny(command, scope, wait)
+            metrics.inc("admission_queued_total", reason = scope)
+            await asyncio.sleep(wait)
+
+    async def admit(self, userid: int, guildid: int | None, command: str) -> Permit:
+        """Wait until `command` can run, or raise AdmissionDenied if it would take too long"""
+        cost = self.cost(command)
+        buckets = await self._take_tokens(userid, guildid, command, cost)
+        heavy = command in HEAVY
+        if heavy:
+            if self._heavy.locked() and self.waiting_heavy >= self.heavy_limit:
+                self._refund(buckets, cost)
+                self._deny(command, "busy", self.max_wait)
+            self.waiting_heavy += 1
+            try:
+                await asyncio.wait_for(self._heavy.acquire(), self.max_wait)
+            except TimeoutError:
+                self._refund(buckets, cost)
+                self._deny(command, "busy", self.max_wait)
+            finally:
+                self.waiting_heavy -= 1
+            self.running_heavy += 1
+        self.admitted += 1
+        metrics.inc("admission_total", command = command, outcome = "admitted")
+        if self.admitted % PRUNE_EVERY == 0:
+            self.prune()
+        return Permit(command, heavy)
+
+    def _refund(self, buckets: list[TokenBucket], cost: int):
+        for b in buckets:
+            b.give(cost)
+
+    def release(self, permit: Permit):
+        if permit.heavy:
+            self.running_heavy -= 1
+            self._heavy.release()
+
+    def prune(self):
+        """Drop every full bucket. A new bucket starts full, so this changes nothing but memory."""
+        now = self.clock()
+        for buckets in [self.users, self.guilds]:
+            for key in [k for k, b in buckets.items() if b.is_full(now)]:
+                del buckets[key]
+
+    def format_summary(self, limit: int = 10) -> str:
+        now = self.clock()
+        lines = [f"Admitted: {self.admitted:,}, denied: {self.denied:,}",
+                 f"Heavy commands: {self.running_heavy}/{self.heavy_limit} running, {self.waiting_heavy} waiting"]
+        for name, buckets in [("users", self.users), ("guilds", self.guilds)]:
+            for b in buckets.values():
+                b.refill(now)
+            emptiest = sorted(buckets.items(), key = lambda kv: kv[1].tokens)[:limit]
+            lines.append(f"\nEmptiest {name} ({len(buckets):,} tracked):")
+            lines.extend(f"  {key}: {b.tokens:.1f}/{b.capacity:g}" for key, b in emptiest)
+        return "\n".join(lines)
+
+
+@functools.cache
+def get_admission() -> Admission:
+    return Admission(user_burst = conf.admission_user_burst, user_rate = conf.admission_user_rate,
+                     guild_burst = conf.admission_guild_burst, guild_rate = conf.admission_guild_rate,
+                     heavy_limit = conf.admission_heavy_limit, max_wait = conf.admission_max_wait)
@@ -0,0 +1,249 @@
+"""Export the whole data store (every profile, guild, change and nap) into one archive, and import it back.
+
+An archive is gzipped ndjson: a header line, then one line per guild and per profile, then the changes and naps,
+then a footer with how many of each there were. Every record carries the sha256 of its data, and the footer
+catches archives that were cut short.
+
+Guilds are read (and, on import, written) by a pool of worker processes, so decoding and compressing all those
+small files is spread over every core. Each worker compresses its own guilds, and gzip allows its output to be
+simply concatenated.
+
+    sizebot export backup.ndjson.gz
+    sizebot import backup.ndjson.gz --guild 1234 --dry-run
+
+Import while the bot is stopped: a running bot keeps its changes and naps in memory, and would save over them.
+The whole archive is checked (every checksum, and the footer) before anything is written, so a damaged archive
+leaves the data store as it was. Leaderboards of the imported guilds are thrown away, to be built again.
+"""
+from __future__ import annotations
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+import collections
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sizebot import __version__
+from sizebot.lib import changes, filelock, guilddb, naps, paths, ranking, userdb
+
+FORMAT = "sizebot-archive"
+VERSION = 1
+KINDS = ["guild", "user", "change", "nap"]
+# How many lines go to an import worker at once
+IMPORT_BATCH = 500
+
+
+class ArchiveError(Exception):
+    pass
+
+
+@dataclass
+class Summary:
+    # How many records of each kind were in the archive, and how many were exported or imported
+    seen: collections.Counter[str] = field(default_factory = collections.Counter)
+    written: collections.Counter[str] = field(default_factory = collections.Counter)
+    guilds: set[int] = field(default_factory = set)
+
+    def add(self, other: Summary):
+        self.seen.update(other.seen)
+        self.written.update(other.written)
+        self.guilds.update(other.guilds)
+
+    def format(self) -> str:
+        return ", ".join(f"{self.written[k]:,}/{self.seen[k]:,} {k}s" for k in KINDS)
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, separators = (",", ":"))
+
+
+def _record(kind: str, data: Any, **ids: int) -> str:
+    """One archive line. `data` goes last, so the line can be built around it without encoding it again."""
+    text = _dumps(data)
+    checksum = hashlib.sha256(text.encode()).hexdigest()
+    idtext = "".join(f"\"{k}\":{v}," for k, v in ids.items())
+    return f"{{\"kind\":\"{kind}\",{idtext}\"sha256\":\"{checksum}\",\"data\":{text}}}\n"
+
+
+def _check(record: dict[str, Any]) -> Any:
+    data = record["data"]
+    if hashlib.sha256(_dumps(data).encode()).hexdigest() != record.get("sha256"):
+        ids = ", ".join(f"{k} {record[k]}" for k in ["guildid", "userid"] if k in record)
+        raise ArchiveError(f"Checksum mismatch in {record['kind']} record ({ids}).")
+    return data
+
+
+def _init_worker(guilddbpath: Path):
+    paths.guilddbpath = guilddbpath
+
+
+def process_map[T, R](fn: Callable[[T], R], items: Iterable[T], workers: int) -> Iterator[R]:
+    """`map()`, spread over `workers` processes, with at most a few jobs waiting at once"""
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+    with ProcessPoolExecutor(workers, initializer = _init_worker, initargs = (paths.guilddbpath,)) as executor:
+        pending: collections.deque[Future[R]] = collections.deque()
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def list_guilds() -> list[int]:
+    try:
+        return sorted(int(p.name) for p in paths.guilddbpath.iterdir() if p.name.isdigit() and p.is_dir())
+    except FileNotFoundError:
+        return []
+
+
+def _export_guild(guildid: int) -> tuple[bytes, Summary]:
+    """Every record for one guild, gzipped"""
+    summary = Summary()
+    lines = []
+    guildpath = guilddb.get_guild_data_path(guildid)
+    if guildpath.exists():
+        with open(guildpath) as f:
+            lines.append(_record("guild", json.load(f), guildid = guildid))
+        summary.written["guild"] += 1
+    userspath = userdb.get_guild_users_path(guildid)
+    try:
+        userids = sorted(int(name[:-5]) for name in os.listdir(userspath) if name.endswith(".json") and name[:-5].isdigit())
+    except FileNotFoundError:
+        userids = []
+    for userid in userids:
+        with open(userspath / f"{userid}.json") as f:
+            lines.append(_record("user", json.load(f), guildid = guildid, userid = userid))
+        summary.written["user"] += 1
+    summary.seen.update(summary.written)
+    return gzip.compress("".join(lines).encode(), compresslevel = 6), summary
+
+
+def export(path: Path, *, guilds: Iterable[int] | None = None, workers: int | None = None) -> Summary:
+    """Write every guild (or just `guilds`) to an archive at `path`"""
+    workers = workers or os.cpu_count() or 1
+    guildids = list_guilds() if guilds is None else sorted(guilds)
+    wanted = set(guildids)
+    summary = Summary()
+    temppath = path.with_name(path.name + ".tmp")
+    with open(temppath, "wb") as f:
+        header = {"kind": "header", "format": FORMAT, "version": VERSION,
+                  "created": datetime.now(timezone.utc).isoformat(), "sizebot": __version__}
+        f.write(gzip.compress((_dumps(header) + "\n").encode()))
+        for chunk, guildsummary in process_map(_export_guild, guildids, workers):
+            f.write(chunk)
+            summary.add(guildsummary)
+        lines = []
+        for kind, entries in [("change", changes._read()), ("nap", naps._read())]:
+            for entry in entries:
+                if int(entry["guildid"]) in wanted:
+                    lines.append(_record(kind, entry, guildid = int(entry["guildid"])))
+                    summary.seen[kind] += 1
+                    summary.written[kind] += 1
+        lines.append(_dumps({"kind": "footer", "counts": {k: summary.seen[k] for k in KINDS}}) + "\n")
+        f.write(gzip.compress("".join(lines).encode()))
+    temppath.replace(path)
+    return summary
+
+
+def _import_lines(job: tuple[list[str], frozenset[int] | None, bool]) -> Summary:
+    lines, guilds, dry_run = job
+    summary = Summary()
+    for line in lines:
+        record = json.loads(line)
+        kind = record["kind"]
+        summary.seen[kind] += 1
+        data = _check(record)
+        if guilds is not None and record["guildid"] not in guilds:
+            continue
+        if not dry_run:
+            if kind == "guild":
+                guilddb._write(guilddb.get_guild_data_path(record["guildid"]), data)
+            else:
+                userdb._write(userdb.get_user_path(record["guildid"], record["userid"]), data)
+        summary.written[kind] += 1
+        summary.guilds.add(record["guildid"])
+    return summary
+
+
+def _merge(path: Path, entries: list[Any], guilds: set[int]):
+    """Replace the entries in a changes or naps file that belong to `guilds`"""
+    with filelock.locked(path):
+        try:
+            with open(path) as f:
+                existing = json.load(f)
+        except FileNotFoundError:
+            existing = []
+        kept = [e for e in existing if int(e["guildid"]) not in guilds]
+        filelock.write_atomic(path, json.dumps(kept + entries))
+
+
+def _read_archive(path: Path, wanted: frozenset[int] | None, workers: int, *, dry_run: bool) -> tuple[Summary, dict[str, list[Any]]]:
+    """Read every record in an archive, checking it, and write the guilds and profiles unless it's a `dry_run`"""
+    summary = Summary()
+    extra: dict[str, list[Any]] = {"change": [], "nap": []}
+    footer = None
+
+    def jobs(f: Iterable[str]) -> Iterator[tuple[list[str], frozenset[int] | None, bool]]:
+        nonlocal footer
+        header = json.loads(next(iter(f), "{}"))
+        if header.get("format") != FORMAT:
+            raise ArchiveError(f"{path} isn't a SizeBot archive.")
+        if header.get("version") != VERSION:
+            raise ArchiveError(f"{path} is archive version {header.get('version')}, but only version {VERSION} can be imported.")
+        batch = []
+        for line in f:
+            # Guilds and profiles go to the workers, everything else is small enough to handle here
+            if line.startswith(("{\"kind\":\"guild\"", "{\"kind\":\"user\"")):
+                batch.append(line)
+                if len(batch) >= IMPORT_BATCH:
+                    yield batch, wanted, dry_run
+                    batch = []
+                continue
+            record = json.loads(line)
+            if record["kind"] == "footer":
+                footer = record
+            elif record["kind"] in extra:
+                summary.seen[record["kind"]] += 1
+                data = _check(record)
+                if wanted is None or record["guildid"] in wanted:
+                    extra[record["kind"]].append(data)
+                    summary.written[record["kind"]] += 1
+                    summary.guilds.add(record["guildid"])
+        if batch:
+            yield batch, wanted, dry_run
+
+    with gzip.open(path, "rt") as f:
+        for batchsummary in process_map(_import_lines, jobs(f), workers):
+            summary.add(batchsummary)
+
+    if footer is None:
+        raise ArchiveError(f"{path} is incomplete: it has no footer.")
+    for kind in KINDS:
+        if footer["counts"].get(kind, 0) != summary.seen[kind]:
+            raise ArchiveError(f"{path} is incomplete: expected {footer['counts'].get(kind, 0)} {kind}s, found {summary.seen[kind]}.")
+    return summary, extra
+
+
+def import_(path: Path, *, guilds: Iterable[int] | None = None, workers: int | None = None, dry_run: bool = False) -> Summary:
+    """Restore an archive into the data store, or just the guilds in `guilds`, once the whole archive checks out"""
+    workers = workers or os.cpu_count() or 1
+    wanted = frozenset(guilds) if guilds is not None else None
+    summary, extra = _read_archive(path, wanted, workers, dry_run = True)
+    if not dry_run:
+        summary, extra = _read_archive(path, wanted, workers, dry_run = False)
+        # Changes and naps for the imported guilds are replaced, even where the archive has none
+        guildids = set(wanted) if wanted is not None else summary.guilds
+        _merge(paths.changespath, extra["change"], guildids)
+        _merge(paths.naptimepath, extra["nap"], guildids)
+        for guildid in guildids:
+            ranking.discard(guildid)
+    return summary
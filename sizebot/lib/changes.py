@@ -1,33 +1,30 @@
 from __future__ import annotations
-from queue import Empty, Queue
-from typing import Iterator, TypedDict, cast
+from typing import TypedDict, cast
 
+import asyncio
 import json
 import logging
 import time
 
 from discord.ext import commands
 
-from sizebot.lib import userdb, paths, nickmanager
+from sizebot.lib import filelock, iopool, userdb, paths, nickmanager, shards
 from sizebot.lib import utils
+from sizebot.lib.scheduler import scheduler
 from sizebot.lib.units import SV, TV, Decimal
 from sizebot.lib.utils import pretty_time_delta
 
 logger = logging.getLogger("sizebot")
 
-
-def iter_queue[T](q: Queue[T]) -> Iterator[T]:
-    while True:
-        try:
-            yield q.get(False)
-        except Empty:
-            break
-
+# How often a running change updates the user's height
+TICK_SECONDS = 6
+# Ticks only move lastRan along, so the file is rewritten for them at most this often.
+# After a crash, at most this much growth is applied again on startup.
+SAVE_INTERVAL = 60
 
 ChangeKey = tuple[int, int]
 _active_changes: dict[ChangeKey, Change] = {}
-_changes_to_stop: Queue[ChangeKey] = Queue()
-_changes_to_start: Queue[Change] = Queue()
+_save_task: asyncio.Task | None = None
 
 
 class ChangeJSON(TypedDict):
@@ -43,6 +40,9 @@ class ChangeJSON(TypedDict):
 
 
 class Change:
+    # __slots__ declares to python what attributes to expect.
+    __slots__ = ["userid", "guildid", "addPerSec", "mulPerSec", "powPerSec", "stopSV", "stopTV", "startTime", "lastRan"]
+
     def __init__(self,
                  userid: int,
                  guildid: int,
@@ -75,38 +75,39 @@ class Change:
         addPerTick = cast(SV, self.addPerSec * seconds)
         mulPerTick = cast(Decimal, self.mulPerSec ** seconds)
         powPerTick = cast(Decimal, self.powPerSec ** seconds)
-        userdata = userdb.load(self.guildid, self.userid)
-        newheight = cast(SV, ((userdata.height ** powPerTick) * mulPerTick) + addPerTick)
-
-        if newheight < userdata.height:
-            direction = "down"
-        elif newheight > userdata.height:
-            direction = "up"
-        else:
-            direction = "none"
-
-        if (
-            self.stopSV is not None
-            and (
-                (direction == "down" and newheight <= self.stopSV)
-                or (direction == "up" and newheight >= self.stopSV)
-            )
-        ):
-            newheight = self.stopSV
-            running = False
-
-        # if we've moved past 0 or SV("infinity"), cancel the change
-        if newheight < SV(0):
-            newheight = SV(0)
-        if newheight == SV(0) or newheight == SV("infinity"):
-            running = False
-
-        # if we're not changing height anymore, cancel the change
-        if direction == "none":
-            running = False
-
-        userdata.height = newheight
-        userdb.save(userdata)
+        async with userdb.lock(self.guildid, self.userid):
+            userdata = await userdb.aload(self.guildid, self.userid)
+            newheight = cast(SV, ((userdata.height ** powPerTick) * mulPerTick) + addPerTick)
+
+            if newheight < userdata.height:
+                direction = "down"
+            elif newheight > userdata.height:
+                direction = "up"
+            else:
+                direction = "none"
+
+            if (
+                self.stopSV is not None
+                and (
+                    (direction == "down" and newheight <= self.stopSV)
+                    or (direction == "up" and newheight >= self.stopSV)
+                )
+            ):
+                newheight = self.stopSV
+                running = False
+
+            # if we've moved past 0 or SV("infinity"), cancel the change
+            if newheight < SV(0):
+                newheight = SV(0)
+            if newheight == SV(0) or newheight == SV("infinity"):
+                running = False
+
+            # if we're not changing height anymore, cancel the change
+            if direction == "none":
+                running = False
+
+            userdata.height = newheight
+            await userdb.asave(userdata)
         guild = bot.get_guild(self.guildid)
         if guild is None:
             logger.info(f"Unrecognized guild found in Change: guildid={self.guildid} userid={self.userid}")
@@ -124,6 +125,17 @@ class Change:
             return None
         return cast(Decimal, self.startTime + self.stopTV)
 
+    @property
+    def key(self) -> ChangeKey:
+        return (self.userid, self.guildid)
+
+    def next_tick(self) -> float:
+        """When this change should next be applied, never later than its end time"""
+        nexttick = float(self.lastRan) + TICK_SECONDS
+        if self.endtime is not None:
+            nexttick = min(nexttick, float(self.endtime))
+        return nexttick
+
     def __str__(self) -> str:
         out = f"G: {self.guildid}| U: {self.userid}\n    "
         out += f"ADD/S: {self.addPerSec:.10}, MUL/S:{self.mulPerSec}"
@@ -161,57 +173,121 @@ class Change:
         }
 
 
-def start(userid: int, guildid: int, *, addPerSec: SV = SV(0), mulPerSec: Decimal = Decimal(1), stopSV: SV | None = None, stopTV: TV | None = None):
+async def start(userid: int, guildid: int, *, addPerSec: SV = SV(0), mulPerSec: Decimal = Decimal(1), stopSV: SV | None = None, stopTV: TV | None = None):
     """Start a new change task"""
     startTime = lastRan = Decimal(time.time())
     change = Change(userid, guildid, addPerSec=addPerSec, mulPerSec=mulPerSec, stopSV=stopSV, stopTV=stopTV, startTime=startTime, lastRan=lastRan)
-    _changes_to_start.put(change)
+    _activate(change)
+    await asave_to_file()
 
 
-def stop(userid: int, guildid: int) -> Change | None:
+async def stop(userid: int, guildid: int) -> Change | None:
     """Stop a running change task"""
-    key = (userid, guildid)
-    _changes_to_stop.put(key)
-    return _active_changes.get(key, None)
-
-
-async def apply(bot: commands.Bot):
-    """Apply slow growth changes"""
-    global _active_changes
-    runningChanges = {}
-    for key in iter_queue(_changes_to_stop):
-        _active_changes.pop(key, None)
-    for change in iter_queue(_changes_to_start):
-        _active_changes[change.userid, change.guildid] = change
-    for key, change in _active_changes.items():
-        try:
-            running = await change.apply(bot)
-            if running:
-                runningChanges[key] = change
-        except Exception as e:
-            logger.error("Ignoring exception in changes.apply")
-            logger.error(utils.format_traceback(e))
-    _active_changes = runningChanges
-    save_to_file()
+    change = _deactivate((userid, guildid))
+    if change is not None:
+        await asave_to_file()
+    return change
 
 
-def load_from_file():
-    """Load all change tasks from a file"""
+async def apply(bot: commands.Bot, key: ChangeKey):
+    """Apply a single slow growth change, and schedule its next tick if it's still running"""
+    change = _active_changes.get(key)
+    if change is None:
+        return
+    try:
+        running = await change.apply(bot)
+    except Exception as e:
+        logger.error("Ignoring exception in changes.apply")
+        logger.error(utils.format_traceback(e))
+        running = False
+    # The change may have been stopped or replaced while we were waiting on Discord
+    if _active_changes.get(key) is change:
+        if running:
+            _schedule(change)
+            _save_soon()
+            return
+        _deactivate(key)
+    await asave_to_file()
+
+
+def _schedule(change: Change, when: float | None = None):
+    if when is None:
+        when = change.next_tick()
+    key = change.key
+
+    async def callback(bot: commands.Bot):
+        await apply(bot, key)
+
+    scheduler.schedule(("change", key), when, callback)
+
+
+def _activate(change: Change, when: float | None = None):
+    """Activate a change, replacing any other change for the same user"""
+    _active_changes[change.key] = change
+    _schedule(change, when)
+
+
+def _deactivate(key: ChangeKey) -> Change | None:
+    """Deactivate a change"""
+    scheduler.cancel(("change", key))
+    return _active_changes.pop(key, None)
+
+
+def _read() -> list[ChangeJSON]:
     try:
         with open(paths.changespath, "r") as f:
-            changesJSON: list[ChangeJSON] = json.load(f)
+            return json.load(f)
     except FileNotFoundError:
-        changesJSON = []
-    for changeJSON in changesJSON:
+        return []
+
+
+def load_from_file():
+    """Load all change tasks from a file, for the guilds this process owns"""
+    for changeJSON in _read():
+        if not shards.owns(int(changeJSON["guildid"])):
+            continue
         change = Change.fromJSON(changeJSON)
-        _changes_to_start.put(change)
+        # Catch up on any growth missed while we were offline
+        _activate(change, time.time())
+
+
+def _write(changesJson: list[ChangeJSON]):
+    with filelock.locked(paths.changespath):
+        # Other workers' changes are in the same file, so keep them
+        if shards.current.sharded:
+            changesJson = [c for c in _read() if not shards.owns(int(c["guildid"]))] + changesJson
+        filelock.write_atomic(paths.changespath, json.dumps(changesJson))
 
 
 def save_to_file():
     """Save all change tasks to a file"""
-    changesJson = [c.toJSON() for c in _active_changes.values()]
-    with open(paths.changespath, "w") as f:
-        json.dump(changesJson, f)
+    _write([c.toJSON() for c in _active_changes.values()])
+
+
+async def asave_to_file():
+    """`save_to_file()`, with the file written on the I/O pool"""
+    await iopool.run("changes", _write, [c.toJSON() for c in _active_changes.values()])
+
+
+async def _save_later():
+    await asyncio.sleep(SAVE_INTERVAL)
+    await asave_to_file()
+
+
+def _save_soon():
+    """Save the changes file within SAVE_INTERVAL seconds, once for any number of ticks"""
+    global _save_task
+    if _save_task is None or _save_task.done():
+        _save_task = asyncio.create_task(_save_later())
+
+
+def flush():
+    """Save any ticks that haven't been written yet, when shutting down"""
+    global _save_task
+    if _save_task is not None:
+        _save_task.cancel()
+        _save_task = None
+    save_to_file()
 
 
 def format_summary() -> str:
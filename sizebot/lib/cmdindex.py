@@ -0,0 +1,150 @@
+from __future__ import annotations
+from collections.abc import Iterable
+
+import bisect
+import time
+from collections import Counter
+
+from discord.ext import commands
+
+# Autocomplete runs on every keystroke, so fuzzy scoring stops once this many seconds have passed
+SEARCH_BUDGET = 0.0005
+# Only this many of the best trigram candidates get an edit distance
+MAX_FUZZY_CANDIDATES = 40
+
+
+def _trigrams(s: str) -> set[str]:
+    padded = f"  {s} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _distances(a: str, b: str) -> list[int]:
+    """The edit distance from `a` to every prefix of `b`, counting a swap of two neighbouring letters as one edit"""
+    prev2: list[int] = []
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cost = 0 if ca == cb else 1
+            d = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                d = min(d, prev2[j - 2] + 1)
+            cur.append(d)
+        prev2, prev = prev, cur
+    return prev
+
+
+def edit_distance(a: str, b: str) -> int:
+    return _distances(a, b)[-1]
+
+
+class CommandIndex:
+    """A precomputed index over command names and aliases, for ranked autocomplete and prefix lookups.
+
+    Results are ranked exact match first, then prefix matches, then substring matches, then typos,
+    with more popular commands first within each group.
+    """
+
+    def __init__(self):
+        self.names: list[str] = []
+        self.canonical: dict[str, str] = {}
+        self.popularity: Counter[str] = Counter()
+        self._lowered: list[str] = []
+        self._sorted: list[tuple[str, int]] = []
+        self._trigrams: dict[str, list[int]] = {}
+        self._name_set: set[str] = set()
+        self._lengths: list[int] = []
+
+    def build(self, cmds: Iterable[commands.Command], popularity: Counter[str] | None = None):
+        """Index every visible command, and its aliases"""
+        names = []
+        canonical = {}
+        for cmd in cmds:
+            if cmd.hidden:
+                continue
+            for name in [cmd.name, *cmd.aliases]:
+                names.append(name)
+                canonical[name] = cmd.name
+        self.names = names
+        self.canonical = canonical
+        self.popularity = Counter(popularity or {})
+        self._lowered = [n.lower() for n in names]
+        self._sorted = sorted((n, i) for i, n in enumerate(self._lowered))
+        self._trigrams = {}
+        for i, n in enumerate(self._lowered):
+            for t in _trigrams(n):
+                self._trigrams.setdefault(t, []).append(i)
+        self._name_set = set(names)
+        self._lengths = sorted({len(n) for n in names}, reverse = True)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._name_set
+
+    def record(self, name: str):
+        """Count a use of a command, so it ranks higher from now on"""
+        name = self.canonical.get(name)
+        if name is not None:
+            self.popularity[name] += 1
+
+    def match_prefix(self, content: str) -> str | None:
+        """The longest command name that `content` starts with, if any"""
+        for length in self._lengths:
+            if content[:length] in self._name_set:
+                return content[:length]
+        return None
+
+    def _rank(self, i: int) -> int:
+        return -self.popularity[self.canonical[self.names[i]]]
+
+    def search(self, query: str, limit: int = 20, *, budget: float = SEARCH_BUDGET) -> list[str]:
+        deadline = time.perf_counter() + budget
+        q = query.lower().strip()
+        if not q:
+            return []
+
+        # Prefix matches are a contiguous run of the sorted names
+        start = bisect.bisect_left(self._sorted, (q, -1))
+        prefixed = []
+        for name, i in self._sorted[start:]:
+            if not name.startswith(q):
+                break
+            prefixed.append(i)
+        exact = [i for i in prefixed if self._lowered[i] == q]
+        prefixed = sorted((i for i in prefixed if self._lowered[i] != q), key = lambda i: (self._rank(i), len(self._lowered[i])))
+        results = exact + prefixed
+        if len(results) >= limit:
+            return [self.names[i] for i in results[:limit]]
+
+        # Substring and typo matches come from the trigram index
+        seen = set(results)
+        overlap: Counter[int] = Counter()
+        for t in _trigrams(q):
+            for i in self._trigrams.get(t, ()):
+                if i not in seen:
+                    overlap[i] += 1
+        if len(q) < 3:
+            # Too short to share a whole trigram with the middle of a name
+            substrings = [i for i, name in enumerate(self._lowered) if i not in seen and q in name]
+        else:
+            substrings = [i for i in overlap if q in self._lowered[i]]
+        substrings.sort(key = lambda i: (self._rank(i), len(self._lowered[i])))
+        results += substrings
+        if len(results) >= limit:
+            return [self.names[i] for i in results[:limit]]
+
+        seen.update(substrings)
+        maxdistance = max(1, len(q) // 3)
+        fuzzy = []
+        for i, _ in overlap.most_common(MAX_FUZZY_CANDIDATES):
+            if i in seen:
+                continue
+            if time.perf_counter() > deadline:
+                break
+            # Compare against the start of the name, so partly typed names still match
+            distances = _distances(q, self._lowered[i][:len(q) + 1])
+            distance = min(distances[max(0, len(q) - 1):] or distances[-1:])
+            if distance <= maxdistance:
+                fuzzy.append((distance, self._rank(i), i))
+        fuzzy.sort()
+        results += [i for _, _, i in fuzzy]
+        return [self.names[i] for i in results[:limit]]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from abc import abstractmethod
+from collections.abc import Callable
 from typing import Self, overload
 
 import numbers
@@ -32,6 +33,9 @@ decimal.setcontext(context)
 
 @total_ordering
 class BaseDecimal():
+    # __slots__ declares to python what attributes to expect.
+    __slots__ = ["_rawvalue"]
+
     infinity = RawDecimal("infinity")
     _infinity = RawDecimal("1e1000")
 
@@ -150,110 +154,51 @@ class BaseDecimal():
 
     @abstractmethod
     def __add__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        return BaseDecimal(rawvalue + rawother)
+        return BaseDecimal(raw_add(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __radd__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        return BaseDecimal(rawother + rawvalue)
+        return BaseDecimal(raw_radd(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __sub__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        try:
-            return BaseDecimal(rawvalue - rawother)
-        except decimal.InvalidOperation as e:
-            return BaseDecimal(0)
+        return BaseDecimal(raw_sub(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __rsub__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        return BaseDecimal(rawother - rawvalue)
+        return BaseDecimal(raw_rsub(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __mul__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        return BaseDecimal(rawvalue * rawother)
+        return BaseDecimal(raw_mul(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __rmul__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        return BaseDecimal(rawother * rawvalue)
+        return BaseDecimal(raw_rmul(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __truediv__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        if is_infinite(rawvalue) and is_infinite(rawother):
-            raise decimal.InvalidOperation
-        elif is_infinite(rawvalue):
-            return BaseDecimal(rawvalue)
-        elif is_infinite(rawother):
-            return BaseDecimal(0)
-        return BaseDecimal(rawvalue / rawother)
+        return BaseDecimal(raw_truediv(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __rtruediv__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        if is_infinite(rawvalue) and is_infinite(rawother):
-            raise decimal.InvalidOperation
-        elif is_infinite(rawvalue):
-            return BaseDecimal(0)
-        elif is_infinite(rawother):
-            return BaseDecimal(rawother)
-        return BaseDecimal(rawother / rawvalue)
+        return BaseDecimal(raw_rtruediv(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __floordiv__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        if is_infinite(rawvalue) and is_infinite(rawother):
-            raise decimal.InvalidOperation
-        elif is_infinite(rawvalue):
-            return BaseDecimal(rawvalue)
-        elif is_infinite(rawother):
-            return BaseDecimal(0)
-        return BaseDecimal(rawvalue // rawother)
+        return BaseDecimal(raw_floordiv(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __rfloordiv__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        if is_infinite(rawvalue) and is_infinite(rawother):
-            raise decimal.InvalidOperation
-        elif is_infinite(rawvalue):
-            return BaseDecimal(0)
-        elif is_infinite(rawother):
-            return BaseDecimal(rawother)
-        return BaseDecimal(rawother // rawvalue)
+        return BaseDecimal(raw_rfloordiv(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __mod__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        if is_infinite(rawvalue):
-            return BaseDecimal(0)
-        elif is_infinite(rawother):
-            return BaseDecimal(rawother)
-        return BaseDecimal(rawvalue % rawother)
+        return BaseDecimal(raw_mod(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __rmod__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        if is_infinite(rawvalue):
-            return BaseDecimal(rawother)
-        elif is_infinite(rawother):
-            return BaseDecimal(0)
-        return BaseDecimal(rawother % rawvalue)
+        return BaseDecimal(raw_rmod(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __divmod__(self, other: BaseDecimal | int) -> tuple[BaseDecimal, BaseDecimal]:
@@ -269,15 +214,11 @@ class BaseDecimal():
 
     @abstractmethod
     def __pow__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        return BaseDecimal(rawvalue ** rawother)
+        return BaseDecimal(raw_pow(unwrap_decimal(self), unwrap_decimal(other)))
 
     @abstractmethod
     def __rpow__(self, other: BaseDecimal | int) -> BaseDecimal:
-        rawvalue = unwrap_decimal(self)
-        rawother = unwrap_decimal(other)
-        return BaseDecimal(rawother ** rawvalue)
+        return BaseDecimal(raw_rpow(unwrap_decimal(self), unwrap_decimal(other)))
 
     def __neg__(self) -> Self:
         rawvalue = unwrap_decimal(self)
@@ -504,3 +445,159 @@ def is_infinite(value: RawDecimal | int):
         return False
     return value.is_infinite()
 
+
+
+# The arithmetic itself, on raw values. `value` is always the left-hand side of the method that was called,
+# so the reflected versions (raw_radd and so on) have their operands the other way around.
+RawOperand = RawDecimal | int
+
+
+def raw_add(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    return value + other
+
+
+def raw_radd(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    return other + value
+
+
+def raw_sub(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    try:
+        return value - other
+    except decimal.InvalidOperation:
+        return RawDecimal(0)
+
+
+def raw_rsub(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    return other - value
+
+
+def raw_mul(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    return value * other
+
+
+def raw_rmul(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    return other * value
+
+
+def raw_truediv(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    if is_infinite(value) and is_infinite(other):
+        raise decimal.InvalidOperation
+    elif is_infinite(value):
+        return value
+    elif is_infinite(other):
+        return RawDecimal(0)
+    return value / other
+
+
+def raw_rtruediv(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    if is_infinite(value) and is_infinite(other):
+        raise decimal.InvalidOperation
+    elif is_infinite(value):
+        return RawDecimal(0)
+    elif is_infinite(other):
+        return other
+    return other / value
+
+
+def raw_floordiv(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    if is_infinite(value) and is_infinite(other):
+        raise decimal.InvalidOperation
+    elif is_infinite(value):
+        return value
+    elif is_infinite(other):
+        return RawDecimal(0)
+    return value // other
+
+
+def raw_rfloordiv(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    if is_infinite(value) and is_infinite(other):
+        raise decimal.InvalidOperation
+    elif is_infinite(value):
+        return RawDecimal(0)
+    elif is_infinite(other):
+        return other
+    return other // value
+
+
+def raw_mod(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    if is_infinite(value):
+        return RawDecimal(0)
+    elif is_infinite(other):
+        return other
+    return value % other
+
+
+def raw_rmod(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    if is_infinite(value):
+        return other
+    elif is_infinite(other):
+        return RawDecimal(0)
+    return other % value
+
+
+def raw_pow(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    return value ** other
+
+
+def raw_rpow(value: RawDecimal, other: RawOperand) -> RawDecimal:
+    return other ** value
+
+
+INFINITY = RawDecimal("infinity")
+NEGATIVE_INFINITY = RawDecimal("-infinity")
+
+# What a pair of types resolved to: the result type, the values it clamps to infinity at, and whether the right side needs unwrapping
+Resolved = tuple[type[BaseDecimal], RawDecimal, RawDecimal, bool]
+
+
+class Operator:
+    """One arithmetic operator between typed decimals, like `*` between SVs and Decimals.
+
+    Each left-hand type declares which right-hand types it accepts, in order, and what type the result is,
+    the same as a chain of isinstance checks would. The first time a pair of types is seen, the declarations are
+    looked up along the left type's MRO, and the answer is kept in a table keyed by the exact pair of types.
+    After that, applying the operator is one dict lookup, one operation on the raw values, and one new object.
+    """
+
+    def __init__(self, raw: Callable[[RawDecimal, RawOperand], RawDecimal]):
+        self.raw = raw
+        self._rules: dict[type, list[tuple[type | tuple[type, ...], type[BaseDecimal]]]] = {}
+        self._table: dict[tuple[type, type], Resolved | None] = {}
+
+    def define(self, left: type[BaseDecimal], rules: list[tuple[type | tuple[type, ...], type[BaseDecimal]]]):
+        """Declare the (right-hand type, result type) pairs a left-hand type accepts"""
+        self._rules[left] = rules
+        self._table.clear()
+
+    def _resolve(self, lefttype: type, righttype: type) -> Resolved | None:
+        resolved = None
+        for cls in lefttype.__mro__:
+            rules = self._rules.get(cls)
+            if rules is None:
+                continue
+            for right, result in rules:
+                if issubclass(righttype, right):
+                    # BaseDecimal clamps first, then the result type clamps again, so the lower limit wins
+                    limit = min(BaseDecimal._infinity, result._infinity)
+                    resolved = (result, -limit, limit, issubclass(righttype, BaseDecimal))
+                    break
+            break
+        self._table[lefttype, righttype] = resolved
+        return resolved
+
+    def apply(self, left: BaseDecimal, right: BaseDecimal | int) -> BaseDecimal:
+        try:
+            resolved = self._table[type(left), type(right)]
+        except KeyError:
+            resolved = self._resolve(type(left), type(right))
+        if resolved is None:
+            raise NotImplementedError
+        result, low, high, unwrap = resolved
+        rawvalue = self.raw(left._rawvalue, right._rawvalue if unwrap else right)
+        if rawvalue >= high:
+            rawvalue = INFINITY
+        elif rawvalue <= low:
+            rawvalue = NEGATIVE_INFINITY
+        value = object.__new__(result)
+        value._rawvalue = rawvalue
+        return value
@@ -1,39 +1,154 @@
+"""Send SizeBot's log to a Discord channel.
+
+Records are collected for a few seconds and sent together, so an error storm turns into a handful of messages
+instead of one per record. Records repeated within a batch are sent once, with a count. If the queue fills up
+(because Discord is slow, or the bot is logging faster than it can send), new records are dropped and the next
+batch says how many were lost. When Discord rate limits the channel, sending waits as long as Discord asks.
+"""
+from __future__ import annotations
+from collections.abc import Iterable
+from typing import Protocol
+
 import asyncio
 import logging
+import threading
 
 import discord
 
+from sizebot.lib import metrics
 from sizebot.lib.utils import chunk_msg
 
+MESSAGE_LENGTH = 2000
+# How many times one message is retried when it's rate limited, before it's given up on
+MAX_RETRIES = 5
+
+
+class Channel(Protocol):
+    async def send(self, content: str) -> object:
+        ...
+
 
 class AsyncHandler(logging.Handler):
-    def __init__(self, *args, **kwargs):
-        self.__queue: asyncio.Queue[logging.LogRecord] = asyncio.Queue()
-        asyncio.create_task(self.__loop())
+    """A logging handler that hands records to an asyncio task, in batches collected over `flush_interval` seconds"""
+
+    def __init__(self, *args, flush_interval: float = 2, queue_size: int = 1000, **kwargs):
         super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.__queue: asyncio.Queue[logging.LogRecord] = asyncio.Queue(queue_size)
+        self.__eventloop = asyncio.get_running_loop()
+        self.__thread = threading.get_ident()
+        self.__task = asyncio.create_task(self.__loop())
 
     def emit(self, record: logging.LogRecord):
-        self.__queue.put_nowait(record)
+        # Records can be logged from the I/O pool's threads, and asyncio queues aren't thread-safe
+        if threading.get_ident() == self.__thread:
+            self.__put(record)
+        else:
+            self.__eventloop.call_soon_threadsafe(self.__put, record)
+
+    def __put(self, record: logging.LogRecord):
+        try:
+            self.__queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            metrics.inc("log_records_dropped_total")
 
-    def asyncemit(self, record: logging.LogRecord):
+    async def asyncemit(self, records: list[logging.LogRecord]):
         raise NotImplementedError
 
+    def __drain(self) -> list[logging.LogRecord]:
+        records = []
+        while not self.__queue.empty():
+            records.append(self.__queue.get_nowait())
+        return records
+
     async def __loop(self):
         while True:
-            record = await self.__queue.get()
+            records = [await self.__queue.get()]
+            await asyncio.sleep(self.flush_interval)
+            records += self.__drain()
             try:
-                await self.asyncemit(record)
+                await self.asyncemit(records)
             except Exception:
-                pass
+                metrics.inc("log_send_errors_total")
+            finally:
+                for _ in records:
+                    self.__queue.task_done()
+
+    async def join(self):
+        """Wait until every record queued so far has been sent"""
+        await self.__queue.join()
+
+    def close(self):
+        self.__task.cancel()
+        super().close()
+
+
+def _retry_after(err: Exception) -> float | None:
+    """How long Discord asked us to wait, if this error is a rate limit"""
+    if isinstance(err, discord.RateLimited):
+        return err.retry_after
+    if isinstance(err, discord.HTTPException) and err.status == 429:
+        headers = getattr(err.response, "headers", {})
+        for header in ["Retry-After", "X-RateLimit-Reset-After"]:
+            if header in headers:
+                return float(headers[header])
+        return 1
+    return None
+
+
+def _dedupe(records: Iterable[logging.LogRecord]) -> dict[tuple[int, str], int]:
+    """Count each distinct message, in the order they first appeared"""
+    counts: dict[tuple[int, str], int] = {}
+    for record in records:
+        key = (record.levelno, record.getMessage())
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def _pack(blocks: Iterable[str]) -> list[str]:
+    """Join blocks into as few messages as they fit in"""
+    messages: list[str] = []
+    for block in blocks:
+        if messages and len(messages[-1]) + 1 + len(block) <= MESSAGE_LENGTH:
+            messages[-1] += "\n" + block
+        else:
+            messages.append(block)
+    return messages
 
 
 class DiscordHandler(AsyncHandler):
-    def __init__(self, channel: discord.TextChannel):
-        super().__init__()
+    def __init__(self, channel: Channel, *, flush_interval: float = 2, queue_size: int = 1000):
+        super().__init__(flush_interval = flush_interval, queue_size = queue_size)
         self.__channel = channel
 
-    async def asyncemit(self, record: logging.LogRecord):
-        message = record.getMessage().replace("```", r"\`\`\`")
+    def format_batch(self, records: list[logging.LogRecord]) -> list[str]:
+        blocks = []
+        if self.dropped:
+            blocks.append(f"*Dropped {self.dropped} log message(s), the log queue was full.*")
+            self.dropped = 0
+        for (_, message), count in _dedupe(records).items():
+            message = message.replace("```", r"\`\`\`")
+            blocks.extend(chunk_msg(message))
+            if count > 1:
+                blocks.append(f"*(repeated {count} times)*")
+        return _pack(blocks)
 
-        for m in chunk_msg(message):
-            await self.__channel.send(m)
+    async def asyncemit(self, records: list[logging.LogRecord]):
+        for m in self.format_batch(records):
+            await self.__send(m)
+
+    async def __send(self, message: str):
+        for _ in range(MAX_RETRIES):
+            try:
+                await self.__channel.send(message)
+                metrics.inc("log_messages_sent_total")
+                return
+            except Exception as e:
+                delay = _retry_after(e)
+                if delay is None:
+                    raise
+                metrics.inc("log_rate_limited_total")
+                await asyncio.sleep(delay)
+        metrics.inc("log_send_errors_total")
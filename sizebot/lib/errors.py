@@ -1,15 +1,12 @@
 from typing import Any
 from collections.abc import Iterable
 
-import importlib.resources as pkg_resources
 import logging
-import json
 
-import sizebot.data
 from sizebot.conf import conf
+from sizebot.lib.models import get_models
 from sizebot.lib.types import BotContext
 
-modelJSON = json.loads(pkg_resources.read_text(sizebot.data, "models.json"))
 logger = logging.getLogger("sizebot")
 
 
@@ -187,7 +184,7 @@ class InvalidMacrovisionViewException(DigiException):
         self.model = model
         self.view = view
 
-        if self.model not in modelJSON.keys():
+        if self.model not in get_models():
             raise InvalidMacrovisionModelException(self.model)
 
     # TODO: CamelCase
@@ -208,6 +205,16 @@ class InvalidRollException(DigiException):
         return f"Invalid roll string `{self.dString}`."
 
 
+class RollTooLargeException(DigiException):
+    def __init__(self, dString: str, limit: str):
+        self.dString = dString
+        self.limit = limit
+
+    # TODO: CamelCase
+    def formatUserMessage(self) -> str:
+        return f"Roll string `{self.dString}` is too large! You can roll at most {self.limit}."
+
+
 class AdminPermissionException(DigiContextException):
     # TODO: CamelCase
     async def formatMessage(self, ctx: BotContext) -> str:
@@ -288,6 +295,16 @@ class UnfoundStatException(DigiException):
         return f"Could not calculate the {self.s} stat(s)."
 
 
+class RenderTimeoutException(DigiException):
+    # TODO: CamelCase
+    def formatMessage(self) -> str:
+        return "A render took too long and was abandoned."
+
+    # TODO: CamelCase
+    def formatUserMessage(self) -> str:
+        return "That took too long to calculate! Please try again later."
+
+
 def sentence_join(items: Iterable[str], *, joiner: str | None = None, oxford: bool = False) -> str:
     """Join a list of strings like a sentence.
 
@@ -50,6 +50,6 @@ def get_facts(size: SV, prefix: str = "You are", wiggle: float = 10) -> list[str
 
 
 def get_facts_from_user(userdata: User, prefix: str = "You are", wiggle: float = 10) -> list[str]:
-    statbox = StatBox.load(userdata.stats).scale(userdata.scale)
+    statbox = StatBox.load_scaled(userdata.stats, userdata.scale)
     height = statbox.stats_by_key['height'].value
     return get_facts(height, prefix, wiggle)
@@ -0,0 +1,61 @@
+"""Cross-process locks on shared data files, for when several sharded workers write to the same file.
+
+The lock is held on a separate `<name>.lock` file next to the data file, so the data file itself can be replaced
+while the lock is held.
+"""
+from __future__ import annotations
+from collections.abc import Iterator
+from typing import IO
+
+import contextlib
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+def _lock(f: IO):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        # LK_LOCK only retries for 10 seconds, so keep retrying
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+
+def _unlock(f: IO):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextlib.contextmanager
+def locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on `path` against every other process using this same function. This blocks, so run it off the event loop."""
+    path.parent.mkdir(exist_ok = True, parents = True)
+    with open(path.with_name(path.name + ".lock"), "a+") as f:
+        _lock(f)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+def write_atomic(path: Path, text: str):
+    """Replace a file's contents in one step, so another process never reads it half-written"""
+    path.parent.mkdir(exist_ok = True, parents = True)
+    temppath = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temppath, "w") as f:
+        f.write(text)
+    temppath.replace(path)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 from typing import Any
 
+import functools
 import json
+from copy import copy
+from pathlib import Path
 
-from sizebot.lib import errors, paths
+from sizebot.conf import conf
+from sizebot.lib import errors, iopool, paths, tracing, watcher
 from sizebot.lib.units import SV
 
 
@@ -75,26 +79,117 @@ def get_guild_data_path(guildid: int) -> str:
     return get_guild_path(guildid) / "guild.json"
 
 
+class GuildCache:
+    """Loaded guilds, and the IDs of guilds that are known to have no settings saved at all.
+
+    Most guilds never set limits or edges, so they're looked up on every message but never found.
+    Remembering that they're missing saves a failed open() each time.
+    If `check_mtime` is set, every lookup also checks the file on disk, to pick up edits made outside the bot.
+    """
+
+    def __init__(self, *, check_mtime: bool = False):
+        self.check_mtime = check_mtime
+        self._guilds: dict[int, tuple[Guild, float | None]] = {}
+        self._missing: set[int] = set()
+
+    def _mtime(self, guildid: int) -> float | None:
+        try:
+            return get_guild_data_path(guildid).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def get(self, guildid: int) -> Guild | None:
+        """A copy of the cached guild, or None if the guild isn't saved. Raises KeyError if it isn't cached either way."""
+        if guildid in self._missing:
+            if self.check_mtime and self._mtime(guildid) is not None:
+                self._missing.discard(guildid)
+                raise KeyError(guildid)
+            return None
+        guild, mtime = self._guilds[guildid]
+        if self.check_mtime and self._mtime(guildid) != mtime:
+            del self._guilds[guildid]
+            raise KeyError(guildid)
+        return copy(guild)
+
+    def put(self, guild: Guild):
+        self._missing.discard(guild.id)
+        self._guilds[guild.id] = (copy(guild), self._mtime(guild.id) if self.check_mtime else None)
+
+    def put_missing(self, guildid: int):
+        self._guilds.pop(guildid, None)
+        self._missing.add(guildid)
+
+    def invalidate(self, guildid: int):
+        self._guilds.pop(guildid, None)
+        self._missing.discard(guildid)
+
+    def clear(self):
+        self._guilds.clear()
+        self._missing.clear()
+
+
+@functools.cache
+def get_cache() -> GuildCache:
+    return GuildCache(check_mtime = conf.guilddb_check_mtime)
+
+
+def _on_file_change(event: watcher.FileEvent):
+    if event.kind == "all":
+        get_cache().clear()
+    elif event.kind == "guild":
+        get_cache().invalidate(event.guildid)
+
+
+watcher.subscribe(_on_file_change)
+
+
+def _write(path: Path, jsondata: Any):
+    path.parent.mkdir(exist_ok = True, parents = True)
+    with open(path, "w") as f:
+        json.dump(jsondata, f, indent = 4)
+    watcher.wrote(path)
+
+
+@tracing.traced()
 def save(guilddata: Guild):
     guildid = guilddata.id
     if guildid is None:
         raise errors.CannotSaveWithoutIDException
-    path = get_guild_data_path(guildid)
-    path.parent.mkdir(exist_ok = True, parents = True)
-    jsondata = guilddata.toJSON()
-    with open(path, "w") as f:
-        json.dump(jsondata, f, indent = 4)
+    _write(get_guild_data_path(guildid), guilddata.toJSON())
+    get_cache().put(guilddata)
 
 
+async def asave(guilddata: Guild):
+    """`save()`, with the file written on the I/O pool"""
+    guildid = guilddata.id
+    if guildid is None:
+        raise errors.CannotSaveWithoutIDException
+    await iopool.run(("guild", guildid), _write, get_guild_data_path(guildid), guilddata.toJSON())
+    get_cache().put(guilddata)
+
+
+@tracing.traced()
 def load(guildid: int) -> Guild:
+    cache = get_cache()
+    try:
+        guild = cache.get(guildid)
+    except KeyError:
+        pass
+    else:
+        if guild is None:
+            raise errors.GuildNotFoundException(guildid)
+        return guild
+
     path = get_guild_data_path(guildid)
     try:
         with open(path, "r") as f:
             jsondata = json.load(f)
     except FileNotFoundError:
+        cache.put_missing(guildid)
         raise errors.GuildNotFoundException(guildid)
 
     guild = Guild.fromJSON(jsondata)
+    cache.put(guild)
 
     return guild
 
@@ -107,15 +202,39 @@ def load_or_create(guildid: int) -> Guild:
     return guilddata
 
 
+async def aload(guildid: int) -> Guild:
+    """`load()`, with the file read on the I/O pool. Cached guilds are answered straight away."""
+    cache = get_cache()
+    if not cache.check_mtime:
+        try:
+            guild = cache.get(guildid)
+        except KeyError:
+            pass
+        else:
+            if guild is None:
+                raise errors.GuildNotFoundException(guildid)
+            return guild
+    return await iopool.run(("guild", guildid), load, guildid)
+
+
+async def aload_or_create(guildid: int) -> Guild:
+    try:
+        guilddata = await aload(guildid)
+    except errors.GuildNotFoundException:
+        guilddata = Guild(guildid)
+    return guilddata
+
+
 def delete(guildid: int):
-    path = get_guild_path(guildid)
+    path = get_guild_data_path(guildid)
     path.unlink(missing_ok = True)
+    watcher.wrote(path)
+    get_cache().invalidate(guildid)
 
 
 def exists(guildid: int) -> bool:
-    exists = True
     try:
-        load(guildid)
-    except errors.GuildNotFoundException:
-        exists = False
-    return exists
+        return get_cache().get(guildid) is not None
+    except KeyError:
+        pass
+    return get_guild_data_path(guildid).exists()
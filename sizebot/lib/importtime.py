@@ -0,0 +1,64 @@
+"""Measure how long SizeBot's modules take to import, like `python -X importtime`, and check them against a budget.
+
+The imports run in a fresh interpreter, since everything is already imported in this one.
+"""
+from __future__ import annotations
+
+import asyncio
+import re
+import sys
+from dataclasses import dataclass
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportTiming:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def cumulative_ms(self) -> float:
+        return self.cumulative_us / 1000
+
+    @property
+    def self_ms(self) -> float:
+        return self.self_us / 1000
+
+
+def parse(output: str) -> list[ImportTiming]:
+    """Read the report that `python -X importtime` writes to stderr"""
+    timings = []
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        # The top level is indented by one space, and each level below by two more
+        timings.append(ImportTiming(name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return timings
+
+
+def _command(modules: list[str]) -> list[str]:
+    return [sys.executable, "-X", "importtime", "-c", "; ".join(f"import {m}" for m in modules)]
+
+
+async def measure(modules: list[str]) -> list[ImportTiming]:
+    """Import `modules` in a fresh interpreter, and time every import along the way"""
+    proc = await asyncio.create_subprocess_exec(*_command(modules), stdout = asyncio.subprocess.DEVNULL, stderr = asyncio.subprocess.PIPE)
+    _, stderr = await proc.communicate()
+    return parse(stderr.decode(errors = "replace"))
+
+
+def format_report(timings: list[ImportTiming], budget_ms: float, *, limit: int = 15) -> str:
+    """The slowest imports by their own time, with everything over budget marked"""
+    total_ms = sum(t.self_ms for t in timings)
+    slowest = sorted(timings, key = lambda t: t.self_us, reverse = True)[:limit]
+    over = [t for t in timings if t.self_ms > budget_ms]
+    lines = [f"Total: {total_ms:,.1f} ms across {len(timings)} modules. Budget: {budget_ms:,.1f} ms per module, {len(over)} over."]
+    for t in slowest:
+        flag = "!" if t.self_ms > budget_ms else " "
+        lines.append(f"{flag} {t.self_ms:>9,.1f} ms  {t.cumulative_ms:>9,.1f} ms cumulative  {t.name}")
+    return "\n".join(lines)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sizebot.conf import conf
+from sizebot.lib import render
+
+
+class IOPool:
+    """A small thread pool for file I/O, so a slow disk never stalls the event loop.
+
+    Every job has a key (like a user or guild). Jobs with the same key run one at a time, in the order they were submitted,
+    so two saves of the same file can never land out of order. Jobs with different keys run in parallel.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        # File loading parses Decimals too, so the workers need the same context as the render pool
+        self._executor = ThreadPoolExecutor(max_workers = workers, thread_name_prefix = "sizebot-io", initializer = render._init_worker)
+        self._tails: dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+
+    def __len__(self) -> int:
+        """How many keys have jobs queued or running"""
+        return len(self._tails)
+
+    async def run[T](self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run `fn(*args, **kwargs)` on the pool, after every job already submitted with the same key"""
+        loop = asyncio.get_running_loop()
+        previous = self._tails.get(key)
+        done = loop.create_future()
+        self._tails[key] = done
+
+        async def job() -> T:
+            if previous is not None:
+                await previous
+            # Carry the caller's context over, so trace spans in `fn` know their parent
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(self._executor, functools.partial(context.run, fn, *args, **kwargs))
+
+        def finish(task: asyncio.Task):
+            with self._lock:
+                if task.cancelled() or task.exception() is not None:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+            done.set_result(None)
+            if self._tails.get(key) is done:
+                del self._tails[key]
+
+        task = asyncio.ensure_future(job())
+        task.add_done_callback(finish)
+        # If the caller stops waiting, the job still runs, so later jobs for the same key stay in order
+        return await asyncio.shield(task)
+
+    def format_summary(self) -> str:
+        return (f"Workers: {self.workers}, busy keys: {len(self)}\n"
+                f"Completed: {self.completed}, failed: {self.failed}")
+
+    def shutdown(self):
+        self._executor.shutdown(wait = True)
+
+
+@functools.cache
+def get_pool() -> IOPool:
+    return IOPool(conf.io_workers)
+
+
+async def run[T](key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking I/O function on the shared I/O pool, in order with everything else for `key`"""
+    return await get_pool().run(key, fn, *args, **kwargs)
@@ -1,11 +1,30 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Literal
+
+import functools
+import hashlib
 import importlib.resources as pkg_resources
+import json
+import threading
+from importlib import metadata
 
-import inflect
 import toml
 
 import sizebot.data
+from sizebot.lib import filelock, paths, render
+
+if TYPE_CHECKING:
+    import inflect
+
+# inflect takes over a second to import, so it's only imported the first time a word isn't in the cache
+_engine: inflect.engine | None = None
+_engine_lock = threading.Lock()
+_plurals: dict[str, str] = {}
 
-engine: inflect.engine = None
+# Only words from the object catalog are cached here, since this cache is saved to disk
+WordKind = Literal["plural_noun", "a"]
+_cache: dict[WordKind, dict[str, str]] = {"plural_noun": {}, "a": {}}
+_cache_dirty = False
 
 ing = {
     "walk": "walking",
@@ -24,20 +43,85 @@ ed = {
 }
 
 
+def _cache_stamp() -> str:
+    """Cached words are only good for the same inflect, with the same custom plurals"""
+    plurals = json.dumps(_plurals, sort_keys = True).encode()
+    return f"{metadata.version('inflect')}:{hashlib.sha1(plurals).hexdigest()}"
+
+
 def load():
-    global engine
-    engine = inflect.engine()
+    global _plurals
     plurals: dict[str, dict[str, str]] = toml.loads(pkg_resources.read_text(sizebot.data, "plurals.ini"))
-    for s, p in plurals["plurals"].items():
-        engine.defnoun(s, p)
+    _plurals = plurals["plurals"]
+    _load_cache()
+
+
+def _load_cache():
+    try:
+        with open(paths.languagecachepath, "r") as f:
+            jsondata = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return
+    if jsondata.get("stamp") != _cache_stamp():
+        return
+    for kind, words in _cache.items():
+        words.update(jsondata.get(kind, {}))
+
+
+def save_cache():
+    """Write out any words worked out since the cache was loaded"""
+    global _cache_dirty
+    if not _cache_dirty:
+        return
+    filelock.write_atomic(paths.languagecachepath, json.dumps({"stamp": _cache_stamp(), **_cache}))
+    _cache_dirty = False
+
+
+def get_engine() -> inflect.engine:
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            import inflect
+            engine = inflect.engine()
+            for s, p in _plurals.items():
+                engine.defnoun(s, p)
+            _engine = engine
+    return _engine
+
+
+async def warm():
+    """Import inflect on the render pool, so no command has to wait for it on the event loop"""
+    await render.run(get_engine)
+
+
+def _lookup(kind: WordKind, word: str) -> str:
+    global _cache_dirty
+    words = _cache[kind]
+    result = words.get(word)
+    if result is None:
+        result = getattr(get_engine(), kind)(word)
+        words[word] = result
+        _cache_dirty = True
+    return result
 
 
 def get_plural(noun: str) -> str:
     overrides = {}
     if noun in overrides:
         return overrides[noun]
-    return engine.plural_noun(noun)
+    return _lookup("plural_noun", noun)
+
+
+@functools.lru_cache(maxsize = 1024)
+def get_plural_word(word: str) -> str:
+    """The plural of any word, not just a noun"""
+    return get_engine().plural(word)
+
+
+async def aget_plural_word(word: str) -> str:
+    """`get_plural_word` for user-chosen words, worked out on the render pool"""
+    return await render.run(get_plural_word, word)
 
 
 def get_indefinite_article(noun: str) -> str:
-    return engine.a(noun)
+    return _lookup("a", noun)
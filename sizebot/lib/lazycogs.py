@@ -0,0 +1,175 @@
+"""Cogs that aren't imported until one of their commands is first used.
+
+A deferred cog is stood in for by proxy commands, with the same names, aliases and help as the real ones,
+so they still show up in help and autocomplete. The first time one of them is run, the real cog is loaded in place
+of the proxies, and the command is handed over to it.
+
+The proxies are built from a manifest of each cog's commands, written whenever the cog is loaded.
+A cog that isn't in the manifest yet, or whose source has changed since, is just loaded straight away.
+"""
+from __future__ import annotations
+from collections.abc import Collection
+from typing import TypedDict
+
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+
+from discord.ext import commands
+
+from sizebot import __version__
+from sizebot.lib import filelock, paths
+from sizebot.lib.types import BotContext
+
+logger = logging.getLogger("sizebot")
+
+MANIFEST_VERSION = 1
+
+
+class CommandInfo(TypedDict):
+    name: str
+    aliases: list[str]
+    help: str | None
+    brief: str | None
+    usage: str
+    hidden: bool
+    category: str | None
+    multiline: bool
+
+
+class CogInfo(TypedDict):
+    stamp: str
+    commands: list[CommandInfo]
+
+
+def get_stamp(extension: str) -> str | None:
+    """Something that changes whenever the extension's source does, found without importing it"""
+    spec = importlib.util.find_spec(extension)
+    if spec is None or spec.origin is None:
+        return None
+    stat = os.stat(spec.origin)
+    return f"{__version__}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def load_manifest() -> dict[str, CogInfo]:
+    try:
+        with open(paths.cogmanifestpath, "r") as f:
+            jsondata = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if jsondata.get("version") != MANIFEST_VERSION:
+        return {}
+    return jsondata["cogs"]
+
+
+def save_manifest(manifest: dict[str, CogInfo]):
+    filelock.write_atomic(paths.cogmanifestpath, json.dumps({"version": MANIFEST_VERSION, "cogs": manifest}, indent = 4))
+
+
+def describe(command: commands.Command) -> CommandInfo:
+    return {
+        "name": command.name,
+        "aliases": list(command.aliases),
+        "help": command.help,
+        "brief": command.brief,
+        "usage": command.signature,
+        "hidden": command.hidden,
+        "category": command.category,
+        "multiline": command.multiline
+    }
+
+
+def describe_extension(bot: commands.Bot, extension: str) -> CogInfo | None:
+    """The manifest entry for a loaded extension"""
+    stamp = get_stamp(extension)
+    if stamp is None:
+        return None
+    cmds = sorted((c for c in bot.commands if c.module == extension), key = lambda c: c.name)
+    return {"stamp": stamp, "commands": [describe(c) for c in cmds]}
+
+
+class DeferredCog(commands.Cog):
+    """Stands in for an extension that hasn't been loaded yet. It's never added to the bot, only its proxy commands are."""
+
+    def __init__(self, bot: commands.Bot, extension: str, info: CogInfo):
+        self.bot = bot
+        self.extension = extension
+        self.proxies: list[commands.Command] = []
+        self._lock = asyncio.Lock()
+        for cmdinfo in info["commands"]:
+            proxy = commands.Command(
+                DeferredCog.run_proxy,
+                name = cmdinfo["name"],
+                aliases = cmdinfo["aliases"],
+                help = cmdinfo["help"],
+                brief = cmdinfo["brief"],
+                usage = cmdinfo["usage"],
+                hidden = cmdinfo["hidden"],
+                category = cmdinfo["category"],
+                multiline = cmdinfo["multiline"],
+                ignore_extra = True
+            )
+            proxy.cog = self
+            self.proxies.append(proxy)
+
+    async def run_proxy(self, ctx: BotContext):
+        await self.load()
+        command = ctx.bot.get_command(ctx.command.qualified_name)
+        if command is None or isinstance(command.cog, DeferredCog):
+            raise commands.CommandNotFound(f'Command "{ctx.invoked_with}" is not found')
+        # Hand over the same context, so the real command parses its arguments from right where the proxy stopped
+        await command.invoke(ctx)
+
+    @property
+    def loaded(self) -> bool:
+        return self.extension in self.bot.extensions
+
+    def add_proxies(self):
+        for proxy in self.proxies:
+            self.bot.add_command(proxy)
+
+    def remove_proxies(self):
+        for proxy in self.proxies:
+            if self.bot.all_commands.get(proxy.name) is proxy:
+                self.bot.remove_command(proxy.name)
+
+    async def load(self):
+        """Load the real extension in place of the proxies, once"""
+        async with self._lock:
+            if self.loaded:
+                return
+            logger.info(f"Loading deferred extension {self.extension}.")
+            self.remove_proxies()
+            try:
+                await self.bot.load_extension(self.extension)
+            except Exception:
+                self.add_proxies()
+                raise
+            self.bot.dispatch("extension_loaded", self.extension)
+
+
+async def load_extensions(bot: commands.Bot, extensions: list[str], *, deferred: Collection[str] = ()) -> dict[str, DeferredCog]:
+    """Load extensions in order, deferring the ones in `deferred` wherever the manifest allows it"""
+    manifest = load_manifest()
+    changed = False
+    deferredcogs: dict[str, DeferredCog] = {}
+    for extension in extensions:
+        if extension in deferred:
+            info = manifest.get(extension)
+            if info is not None and info["stamp"] == get_stamp(extension):
+                cog = DeferredCog(bot, extension, info)
+                cog.add_proxies()
+                deferredcogs[extension] = cog
+                continue
+        await bot.load_extension(extension)
+        if extension in deferred:
+            manifest[extension] = describe_extension(bot, extension)
+            changed = True
+    if changed:
+        save_manifest(manifest)
+    if deferredcogs:
+        logger.info(f"Deferred {len(deferredcogs)} extension(s) until first use: {', '.join(deferredcogs)}")
+    return deferredcogs
+
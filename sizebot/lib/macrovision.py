@@ -3,21 +3,17 @@ from typing import Any
 import base64
 from dataclasses import dataclass
 import json
-import importlib.resources as pkg_resources
 import logging
 
-import sizebot.data
+from sizebot.lib.models import get_models
 from sizebot.lib.stats import StatBox
 from sizebot.lib.units import SV, Decimal
 from sizebot.lib.userdb import User
 
 logger = logging.getLogger("sizebot")
 
-model_heights = json.loads(pkg_resources.read_text(sizebot.data, "models.json"))
-
-
 def get_model_scale(model: str, view: str, height_in_meters: SV) -> Decimal:
-    normal_height = SV(model_heights[model][view])
+    normal_height = SV(get_models()[model][view])
     return height_in_meters / normal_height
 
 
@@ -1,14 +1,17 @@
-from typing import Any, Literal
+from typing import Literal
 
-import json
 from math import ceil, floor
-import requests
 
+from sizebot.lib import webclient
 from sizebot.lib.errors import ThisShouldNeverHappenException
 from sizebot.lib.units import WV, Decimal
 
 G_PER_OZ = Decimal("28.3495")
 
+# Metal prices move slowly, so a minute-old quote is good enough, and an hour-old one will do while we fetch a new one
+PRICE_TTL = 60
+PRICE_STALE = 60 * 60
+
 GOLD_URL = R"https://forex-data-feed.swissquote.com/public-quotes/bboquotes/instrument/XAU/USD"
 SILVER_URL = R"https://forex-data-feed.swissquote.com/public-quotes/bboquotes/instrument/XAG/USD"
 PLATINUM_URL = R"https://forex-data-feed.swissquote.com/public-quotes/bboquotes/instrument/XPT/USD"
@@ -18,18 +21,7 @@ Dollars = float
 Metal = Literal["gold", "silver", "platinum", "palladium"]
 
 
-def get_json_response(url: str) -> Any:
-    r = requests.get(url)
-    try:
-        j = json.loads(r.text)
-    except json.JSONDecodeError as e:
-        raise e
-    if r.status_code != 200:
-        raise Exception(f"The API returned a code {r.status}.")
-    return j
-
-
-def metal_value(metal: Metal, weight: WV) -> Dollars:
+async def metal_value(metal: Metal, weight: WV) -> Dollars:
     if metal == "gold":
         url = GOLD_URL
     elif metal == "palladium":
@@ -41,7 +33,7 @@ def metal_value(metal: Metal, weight: WV) -> Dollars:
     else:
         raise ThisShouldNeverHappenException(f"Metal type {metal} unrecognized.")
 
-    j = get_json_response(url)
+    j = await webclient.client.get_json(url, ttl = PRICE_TTL, stale = PRICE_STALE)
 
     PRICE_PER_OZ = Decimal(j[0]["spreadProfilePrices"][0]["ask"])
     PRICE_PER_G = PRICE_PER_OZ / G_PER_OZ
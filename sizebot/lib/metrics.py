@@ -0,0 +1,214 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import asyncio
+import contextlib
+import functools
+import logging
+import threading
+import time
+
+from sizebot.lib import paths, shards
+
+logger = logging.getLogger("sizebot")
+
+PREFIX = "sizebot_"
+QUANTILES = [0.5, 0.9, 0.99]
+
+# Each doubling of a value is split into this many buckets, for roughly 6% resolution
+SUB_BUCKETS = 16
+SUB_BUCKET_BITS = 4
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - SUB_BUCKET_BITS - 1
+    return SUB_BUCKETS + shift * SUB_BUCKETS + ((micros >> shift) - SUB_BUCKETS)
+
+
+def _bucket_value(index: int) -> int:
+    """The midpoint of a bucket, in microseconds"""
+    if index < SUB_BUCKETS:
+        return index
+    shift, m = divmod(index - SUB_BUCKETS, SUB_BUCKETS)
+    low = (m + SUB_BUCKETS) << shift
+    return low + ((1 << shift) >> 1)
+
+
+class Histogram:
+    """An HDR-style log-linear histogram of durations, with microsecond resolution"""
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, seconds: float):
+        micros = max(0, int(seconds * 1_000_000))
+        index = _bucket_index(micros)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        target = max(1, round(q * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                value = _bucket_value(index) / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms: dict[str, dict[LabelKey, Histogram]] = {}
+        self.counters: dict[str, dict[LabelKey, int]] = {}
+
+    def observe(self, name: str, seconds: float, **labels: str):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            family = self.histograms.setdefault(name, {})
+            hist = family.get(key)
+            if hist is None:
+                hist = family[key] = Histogram()
+            hist.observe(seconds)
+
+    def inc(self, name: str, amount: int = 1, **labels: str):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            family = self.counters.setdefault(name, {})
+            family[key] = family.get(key, 0) + amount
+
+    def get(self, name: str, **labels: str) -> Histogram | None:
+        return self.histograms.get(name, {}).get(tuple(sorted(labels.items())))
+
+    def to_prometheus(self) -> str:
+        lines = []
+        with self._lock:
+            for name, family in sorted(self.histograms.items()):
+                fullname = PREFIX + name
+                lines.append(f"# TYPE {fullname} summary")
+                for key, hist in sorted(family.items()):
+                    for q in QUANTILES:
+                        lines.append(f"{fullname}{_format_labels(key + (('quantile', str(q)),))} {hist.percentile(q):.6f}")
+                    lines.append(f"{fullname}_sum{_format_labels(key)} {hist.sum:.6f}")
+                    lines.append(f"{fullname}_count{_format_labels(key)} {hist.count}")
+            for name, family in sorted(self.counters.items()):
+                fullname = PREFIX + name
+                lines.append(f"# TYPE {fullname} counter")
+                for key, value in sorted(family.items()):
+                    lines.append(f"{fullname}{_format_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def format_summary(self, name: str, label: str) -> str:
+        """A p50/p99 table of one histogram family, slowest p99 first"""
+        family = self.histograms.get(name, {})
+        rows = []
+        for key, hist in family.items():
+            labelvalue = dict(key).get(label, "")
+            rows.append((hist.percentile(0.99), labelvalue, hist))
+        rows.sort(key = lambda r: r[0], reverse = True)
+        return "\n".join(
+            f"{labelvalue:<20} n={hist.count:<6} p50={hist.percentile(0.5) * 1000:8.1f}ms p99={p99 * 1000:8.1f}ms"
+            for p99, labelvalue, hist in rows
+        )
+
+    def clear(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f"{k}=\"{_escape(str(v))}\"" for k, v in key) + "}"
+
+
+registry = Registry()
+
+
+def observe(name: str, seconds: float, **labels: str):
+    registry.observe(name, seconds, **labels)
+
+
+def inc(name: str, amount: int = 1, **labels: str):
+    registry.inc(name, amount, **labels)
+
+
+@contextlib.contextmanager
+def timed(name: str, **labels: str) -> Iterator[None]:
+    """Record how long the with-block takes"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe(name, time.perf_counter() - start, **labels)
+
+
+def timethis(name: str, **labels: str) -> Callable:
+    """Record how long every call to the decorated function takes"""
+    def wrapper(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapped(*args, **kwargs) -> Any:
+            with timed(name, **labels):
+                return fn(*args, **kwargs)
+        return wrapped
+    return wrapper
+
+
+def write_file():
+    """Write all metrics to the metrics file, in the Prometheus text format"""
+    # Sharded workers each keep their own metrics, so each writes its own file
+    path = shards.current.per_worker(paths.metricspath)
+    tmppath = path.with_suffix(".tmp")
+    tmppath.parent.mkdir(parents = True, exist_ok = True)
+    tmppath.write_text(registry.to_prometheus())
+    tmppath.replace(path)
+
+
+class LagMonitor:
+    """Measure how late the event loop wakes up from a sleep"""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - start - self.interval
+            registry.observe("event_loop_lag_seconds", max(0, lag))
+
+    def start(self):
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self.run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+lagmonitor = LagMonitor()
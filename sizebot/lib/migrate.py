@@ -0,0 +1,109 @@
+"""Upgrade every saved profile to the current schema version and the compact encoding, in one offline pass.
+
+Profiles are still upgraded as they're loaded, so running this is never required, but once it has run,
+loading a profile skips migration entirely, and every file is a bit smaller.
+
+    sizebot migrate --dry-run
+    sizebot migrate --workers 8
+
+Stop the bot first, so it can't save a profile while it's being rewritten.
+"""
+from __future__ import annotations
+
+import collections
+import json
+import os
+from dataclasses import dataclass, field
+
+from sizebot.lib import archive, filelock, userdb
+
+# How many unreadable profiles are listed by name in the report
+MAX_LISTED_ERRORS = 20
+
+
+@dataclass
+class Report:
+    profiles: int = 0
+    upgraded: int = 0
+    compacted: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    # How many profiles were missing each field, or had an older version
+    fields: collections.Counter[str] = field(default_factory = collections.Counter)
+    versions: collections.Counter[str] = field(default_factory = collections.Counter)
+    errors: list[str] = field(default_factory = list)
+    error_count: int = 0
+
+    def add(self, other: Report):
+        self.profiles += other.profiles
+        self.upgraded += other.upgraded
+        self.compacted += other.compacted
+        self.bytes_before += other.bytes_before
+        self.bytes_after += other.bytes_after
+        self.fields.update(other.fields)
+        self.versions.update(other.versions)
+        self.error_count += other.error_count
+        self.errors.extend(other.errors[:MAX_LISTED_ERRORS - len(self.errors)])
+
+    def format(self) -> str:
+        lines = [f"{self.profiles:,} profiles: {self.upgraded:,} upgraded to version {userdb.SCHEMA_VERSION}, "
+                 f"{self.compacted:,} only re-encoded, {self.profiles - self.upgraded - self.compacted:,} already current."]
+        if self.bytes_before:
+            lines.append(f"Size: {self.bytes_before:,} bytes -> {self.bytes_after:,} bytes ({self.bytes_after / self.bytes_before:.0%}).")
+        if self.versions:
+            lines.append("From versions: " + ", ".join(f"{v} ({n:,})" for v, n in sorted(self.versions.items())))
+        if self.fields:
+            lines.append("Fields added: " + ", ".join(f"{k} ({n:,})" for k, n in self.fields.most_common()))
+        if self.error_count:
+            lines.append(f"{self.error_count:,} profiles couldn't be read:")
+            lines.extend(f"  {e}" for e in self.errors)
+        return "\n".join(lines)
+
+
+def _migrate_guild(job: tuple[int, bool]) -> Report:
+    guildid, dry_run = job
+    report = Report()
+    userspath = userdb.get_guild_users_path(guildid)
+    try:
+        names = [name for name in os.listdir(userspath) if name.endswith(".json") and name[:-5].isdigit()]
+    except FileNotFoundError:
+        return report
+    for name in names:
+        path = userspath / name
+        data = path.read_bytes()
+        report.profiles += 1
+        report.bytes_before += len(data)
+        report.bytes_after += len(data)
+        try:
+            jsondata = json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            report.error_count += 1
+            if len(report.errors) < MAX_LISTED_ERRORS:
+                report.errors.append(f"{path}: {e}")
+            continue
+        upgrade = jsondata.get("version") != userdb.SCHEMA_VERSION
+        if upgrade:
+            report.versions[str(jsondata.get("version", "none"))] += 1
+            before = set(jsondata)
+            jsondata = userdb.migrate_json(jsondata)
+            report.fields.update(k for k in jsondata if k not in before and k != "version")
+        newtext = userdb.encode(jsondata)
+        if not upgrade and newtext.encode() == data:
+            continue
+        if upgrade:
+            report.upgraded += 1
+        else:
+            report.compacted += 1
+        report.bytes_after += len(newtext.encode()) - len(data)
+        if not dry_run:
+            filelock.write_atomic(path, newtext)
+    return report
+
+
+def migrate(*, dry_run: bool = False, workers: int | None = None) -> Report:
+    """Upgrade every profile in the store. With `dry_run`, just report what would change."""
+    workers = workers or os.cpu_count() or 1
+    report = Report()
+    for guildreport in archive.process_map(_migrate_guild, ((g, dry_run) for g in archive.list_guilds()), workers):
+        report.add(guildreport)
+    return report
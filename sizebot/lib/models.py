@@ -0,0 +1,12 @@
+"""The MacroVision models, and the height of each of their views"""
+import functools
+import importlib.resources as pkg_resources
+import json
+
+import sizebot.data
+
+
+@functools.cache
+def get_models() -> dict[str, dict[str, str]]:
+    """Read the models the first time they're needed. Profiles, errors and macrovision all share this one copy."""
+    return json.loads(pkg_resources.read_text(sizebot.data, "models.json"))
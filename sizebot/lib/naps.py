@@ -7,7 +7,8 @@ import time
 
 from discord.ext import commands
 
-from sizebot.lib import paths, utils
+from sizebot.lib import filelock, iopool, paths, shards, utils
+from sizebot.lib.scheduler import scheduler
 from sizebot.lib.units import TV, Decimal
 
 logger = logging.getLogger("sizebot")
@@ -34,6 +35,9 @@ class Nanny:
         await member.move_to(None, reason="Naptime!")
         return False
 
+    def __str__(self) -> str:
+        return f"G: {self.guildid}| U: {self.userid}\n    ends in {utils.pretty_time_delta(max(Decimal(0), self.endtime - Decimal(time.time())))}"
+
     def toJSON(self) -> Any:
         return {
             "userid": self.userid,
@@ -42,65 +46,96 @@ class Nanny:
         }
 
 
-def start(userid: int, guildid: int, durationTV: TV):
+async def start(userid: int, guildid: int, durationTV: TV):
     """Start a new naptime nanny"""
     endtime = Decimal(time.time()) + durationTV
     nanny = Nanny(userid, guildid, endtime)
     _activate(nanny)
+    await asave_to_file()
 
 
-def stop(userid: int) -> Nanny:
+async def stop(userid: int) -> Nanny:
     """Stop a waiting naptime nanny"""
     nanny = _deactivate(userid)
+    if nanny is not None:
+        await asave_to_file()
     return nanny
 
 
-async def check(bot: commands.Bot):
-    """Have the nannies check their watches"""
-    global _active_nannies
-    runningNannies = {}
-    for userid, nanny in _active_nannies.items():
-        try:
-            running = await nanny.check(bot)
-            if running:
-                runningNannies[userid] = nanny
-        except Exception as e:
-            logger.error("Ignoring exception in naps.check")
-            logger.error(utils.format_traceback(e))
-    _active_nannies = runningNannies
-    save_to_file()
+async def check(bot: commands.Bot, userid: int):
+    """Have a nanny check their watch"""
+    nanny = _active_nannies.get(userid)
+    if nanny is None:
+        return
+    try:
+        running = await nanny.check(bot)
+    except Exception as e:
+        logger.error("Ignoring exception in naps.check")
+        logger.error(utils.format_traceback(e))
+        running = False
+    if running:
+        # Woken up early (e.g. the clock moved), so go back to sleep
+        _schedule(nanny)
+        return
+    if _active_nannies.get(userid) is nanny:
+        _deactivate(userid)
+        await asave_to_file()
+
+
+def _schedule(nanny: Nanny):
+    userid = nanny.userid
+
+    async def callback(bot: commands.Bot):
+        await check(bot, userid)
+
+    scheduler.schedule(("nap", userid), float(nanny.endtime), callback)
 
 
 def _activate(nanny: Nanny):
     """Activate a new naptime nanny"""
     _active_nannies[nanny.userid] = nanny
-    save_to_file()
+    _schedule(nanny)
 
 
 def _deactivate(userid: int) -> Nanny:
     """Deactivate a waiting naptime nanny"""
-    nanny = _active_nannies.pop(userid, None)
-    save_to_file()
-    return nanny
+    scheduler.cancel(("nap", userid))
+    return _active_nannies.pop(userid, None)
 
 
-def load_from_file():
-    """Load all naptime nannies from file"""
+def _read() -> list[Any]:
     try:
         with open(paths.naptimepath, "r") as f:
-            nanniesJSON = json.load(f)
+            return json.load(f)
     except FileNotFoundError:
-        nanniesJSON = []
-    for nannyJSON in nanniesJSON:
+        return []
+
+
+def load_from_file():
+    """Load all naptime nannies from file, for the guilds this process owns"""
+    for nannyJSON in _read():
+        if not shards.owns(int(nannyJSON["guildid"])):
+            continue
         nanny = Nanny(**nannyJSON)
         _activate(nanny)
 
 
+def _write(nanniesJSON: list[Any]):
+    with filelock.locked(paths.naptimepath):
+        # Other workers' nannies are in the same file, so keep them
+        if shards.current.sharded:
+            nanniesJSON = [n for n in _read() if not shards.owns(int(n["guildid"]))] + nanniesJSON
+        filelock.write_atomic(paths.naptimepath, json.dumps(nanniesJSON))
+
+
 def save_to_file():
     """Save all naptime nannies to a file"""
-    nanniesJSON = [n.toJSON() for n in _active_nannies.values()]
-    with open(paths.naptimepath, "w") as f:
-        json.dump(nanniesJSON, f)
+    _write([n.toJSON() for n in _active_nannies.values()])
+
+
+async def asave_to_file():
+    """`save_to_file()`, with the file written on the I/O pool"""
+    await iopool.run("naps", _write, [n.toJSON() for n in _active_nannies.values()])
 
 
 def format_summary() -> str:
@@ -29,7 +29,7 @@ def get_speed_to_part(statbox: StatBox, part: Part) -> Decimal:
 
 
 def get_neuron_embed(userdata: User) -> EmbedToSend:
-    statbox = StatBox.load(userdata.stats).scale(userdata.scale)
+    statbox = StatBox.load_scaled(userdata.stats, userdata.scale)
     embed = Embed(title = f"Neuron Travel Distance for {statbox.stats_by_key['nickname'].value}",
                   description = f"{statbox.stats_by_key['nickname'].value} is {statbox.stats_by_key['height'].value:.1mu} tall.")
     for part in PARTS:
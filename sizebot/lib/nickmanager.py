@@ -63,7 +63,7 @@ async def nick_update(user: User | Member):
         return
 
     try:
-        userdata = userdb.load(user.guild.id, user.id)
+        userdata = await userdb.aload(user.guild.id, user.id)
     except errors.UserNotFoundException:
         return
 
@@ -88,7 +88,7 @@ async def nick_reset(user: User | Member):
     if not _can_edit_nick(user):
         return
 
-    userdata = userdb.load(user.guild.id, user.id, allow_unreg=True)
+    userdata = await userdb.aload(user.guild.id, user.id, allow_unreg=True)
 
     # User's display setting is N. No sizetag.
     if not userdata.display:
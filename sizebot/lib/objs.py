@@ -21,6 +21,8 @@ objects: list[DigiObject] = []
 food: list[DigiObject] = []
 land: list[DigiObject] = []
 tags: dict[str, int] = {}
+# Goes up whenever objects are loaded, so anything built from the old list knows it's out of date
+catalog_version = 0
 
 Dimension = Literal["h", "l", "d", "w", "t", "p"]
 
@@ -56,6 +58,12 @@ class LandJson(TypedDict):
 
 @total_ordering
 class DigiObject:
+    # __slots__ declares to python what attributes to expect.
+    __slots__ = [
+        "name", "dimension", "name_plural", "singular_names", "aliases", "_tags", "tags", "article", "symbol", "note",
+        "height", "length", "width", "diameter", "depth", "thickness", "calories", "price", "weight"
+    ]
+
     def __init__(
         self,
         name: str,
@@ -341,8 +349,10 @@ def load_obj_file(filename: str):
 
 
 def load_obj_json(data: list[ObjectJson]):
+    global catalog_version
     for d in data:
         objects.append(DigiObject.from_json(d))
+    catalog_version += 1
 
 
 def init():
@@ -15,8 +15,13 @@ datadir = get_data_dir()
 winkpath = datadir / "winkcount.txt"
 guilddbpath = datadir / "guilds"
 telemetrypath = datadir / "telemetry"
+commandcountspath = telemetrypath / "command_counts.json"
 thispath = datadir / "thistracker.json"
 changespath = datadir / "changes.json"
 naptimepath = datadir / "naptime.json"
 confpath = datadir / "sizebot.conf"
 blacklistpath = datadir / "blacklist.txt"
+metricspath = datadir / "metrics.prom"
+tracespath = datadir / "traces.ndjson"
+languagecachepath = datadir / "language.json"
+cogmanifestpath = datadir / "cogs.json"
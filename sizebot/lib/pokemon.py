@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Any
 
+import functools
 import importlib.resources as pkg_resources
 import json
 
@@ -11,10 +12,10 @@ from sizebot.lib.units import SV, WV, Decimal
 from sizebot.lib.userdb import User
 from sizebot.lib.utils import int_to_roman
 
-pokemon: list[Pokemon] = []
-
-
 class Pokemon:
+    # __slots__ declares to python what attributes to expect.
+    __slots__ = ["name", "natdex", "generation", "roman_generation", "region", "height", "weight", "types", "color", "flavor_text", "sprite"]
+
     def __init__(self, name: str, natdex: int = None, generation: int = None, region: str = None,
                  height: SV = None, weight: WV = None, types: list[str] = [], color: int = None,
                  flavor_text: str = None, sprite: str = None) -> None:
@@ -82,9 +83,14 @@ class Pokemon:
         return str(self)
 
 
-def init():
-    global pokemon
+# Goes up whenever the Pokémon are (re)loaded
+catalog_version = 0
+
 
+@functools.cache
+def get_pokemon() -> list[Pokemon]:
+    """Every Pokémon, read the first time they're asked for"""
+    global catalog_version
+    catalog_version += 1
     pokefile = pkg_resources.read_text(sizebot.data, "pokemon.json")
-    p = json.loads(pokefile)
-    pokemon = [Pokemon.fromJSON(j) for j in p]
+    return [Pokemon.fromJSON(j) for j in json.loads(pokefile)]
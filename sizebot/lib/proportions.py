@@ -3,14 +3,14 @@ import logging
 from discord import Embed
 
 from sizebot import __version__
-from sizebot.lib import macrovision
+from sizebot.lib import macrovision, tracing
 from sizebot.lib.constants import colors, emojis
 from sizebot.lib.objs import format_close_object_smart
 from sizebot.lib.speed import speedcalc
 from sizebot.lib.types import EmbedField, EmbedToSend, StrToSend
 from sizebot.lib.units import SV, TV, WV, Decimal
 from sizebot.lib.userdb import User
-from sizebot.lib.stats import Stat, calc_view_angle, statmap, StatBox
+from sizebot.lib.stats import AVERAGE_PLAYERSTATS, Stat, calc_view_angle, statmap, StatBox
 
 logger = logging.getLogger("sizebot")
 
@@ -18,6 +18,7 @@ compareicon = "https://media.discordapp.net/attachments/650460192009617433/66502
 
 
 # stats ???
+@tracing.traced()
 def get_speedcompare(userdata1: User, userdata2: User, requesterID: int) -> EmbedToSend:
     small, big, _, _, multiplier = _get_compare_statboxes(userdata1, userdata2)
 
@@ -37,6 +38,7 @@ def get_speedcompare(userdata1: User, userdata2: User, requesterID: int) -> Embe
 
 
 # stat with stat.key=key
+@tracing.traced()
 def get_speedcompare_stat(userdata1: User, userdata2: User, key: str) -> EmbedToSend | None:
     small, big, _, _, _ = _get_compare_statboxes(userdata1, userdata2)
     mapped_key = _get_mapped_stat(key)
@@ -54,8 +56,9 @@ def get_speedcompare_stat(userdata1: User, userdata2: User, key: str) -> EmbedTo
 
 
 # bunch-o-stats
+@tracing.traced()
 def get_speeddistance(userdata: User, distance: SV) -> EmbedToSend | StrToSend:
-    stats = StatBox.load(userdata.stats).scale(userdata.scale)
+    stats = StatBox.load_scaled(userdata.stats, userdata.scale)
 
     distance_viewed = SV(distance * stats['viewscale'].value)
     if stats['height'].value > distance:
@@ -72,8 +75,9 @@ def get_speeddistance(userdata: User, distance: SV) -> EmbedToSend | StrToSend:
 
 
 # stats with stat.key=walkperhour
+@tracing.traced()
 def get_speedtime(userdata: User, time: TV) -> EmbedToSend | StrToSend:
-    stats = StatBox.load(userdata.stats).scale(userdata.scale)
+    stats = StatBox.load_scaled(userdata.stats, userdata.scale)
 
     walkpersecond = SV(stats['walkperhour'].value / 3600)
     distance = SV(walkpersecond * time)
@@ -81,6 +85,7 @@ def get_speedtime(userdata: User, time: TV) -> EmbedToSend | StrToSend:
 
 
 # stats ???
+@tracing.traced()
 def get_compare(userdata1: User, userdata2: User, requesterID: int) -> EmbedToSend:
     small, big, small_viewby_big, big_viewby_small, _ = _get_compare_statboxes(userdata1, userdata2)
 
@@ -100,6 +105,7 @@ def get_compare(userdata1: User, userdata2: User, requesterID: int) -> EmbedToSe
 
 
 # stats with stat.key=height or weight
+@tracing.traced()
 def get_compare_simple(userdata1: User, userdata2: User, requesterID: int) -> EmbedToSend:
     small, big, small_viewby_big, big_viewby_small, multiplier = _get_compare_statboxes(userdata1, userdata2)
     lookangle, lookdirection = _calc_view(small['height'].value, big['height'].value)
@@ -132,6 +138,7 @@ def get_compare_simple(userdata1: User, userdata2: User, requesterID: int) -> Em
 
 
 # stats with stat.tag=tag
+@tracing.traced()
 def get_compare_bytag(userdata1: User, userdata2: User, tag: str, requesterID: int) -> EmbedToSend:
     small, big, small_viewby_big, big_viewby_small, multiplier = _get_compare_statboxes(userdata1, userdata2)
     lookangle, lookdirection = _calc_view(small['height'].value, big['height'].value)
@@ -158,6 +165,7 @@ def get_compare_bytag(userdata1: User, userdata2: User, tag: str, requesterID: i
 
 
 # stat with stat.key=key
+@tracing.traced()
 def get_compare_stat(userdata1: User, userdata2: User, key: str) -> StrToSend | None:
     small, big, small_viewby_big, big_viewby_small, _ = _get_compare_statboxes(userdata1, userdata2)
     mapped_key = _get_mapped_stat(key)
@@ -177,10 +185,11 @@ def get_compare_stat(userdata1: User, userdata2: User, key: str) -> StrToSend |
 
 
 # stats with stat.is_shown
+@tracing.traced()
 def get_stats(userdata: User, requesterID: int) -> EmbedToSend:
-    viewer = StatBox.load(userdata.stats).scale(userdata.scale)
+    viewer = StatBox.load_scaled(userdata.stats, userdata.scale)
     avg = StatBox.load_average()
-    avg_viewedby_viewer = avg.scale(viewer['viewscale'].value)
+    avg_viewedby_viewer = StatBox.load_scaled(AVERAGE_PLAYERSTATS, viewer['viewscale'].value)
     lookangle, lookdirection = _calc_view(viewer['height'].value, avg['height'].value)
 
     embed = _create_embed(f"Stats for {viewer['nickname'].value}", requesterID)
@@ -195,8 +204,9 @@ def get_stats(userdata: User, requesterID: int) -> EmbedToSend:
 
 
 # stats with stat.tag=tag
+@tracing.traced()
 def get_stats_bytag(userdata: User, tag: str, requesterID: int) -> EmbedToSend:
-    stats = StatBox.load(userdata.stats).scale(userdata.scale)
+    stats = StatBox.load_scaled(userdata.stats, userdata.scale)
 
     embed = _create_embed(f"Stats for {stats['nickname'].value} tagged `{tag}`", requesterID)
 
@@ -208,11 +218,12 @@ def get_stats_bytag(userdata: User, tag: str, requesterID: int) -> EmbedToSend:
 
 
 # stat with stat.key=key
+@tracing.traced()
 def get_stat(userdata: User, key: str) -> StrToSend | None:
     mapped_key = _get_mapped_stat(key)
     if mapped_key is None:
         return None
-    stats = StatBox.load(userdata.stats).scale(userdata.scale)
+    stats = StatBox.load_scaled(userdata.stats, userdata.scale)
     stat = stats[mapped_key]
 
     msg = f"{stat.string}"
@@ -222,8 +233,9 @@ def get_stat(userdata: User, key: str) -> StrToSend | None:
 
 
 # stats with stat.is_shown
+@tracing.traced()
 def get_basestats(userdata: User, requesterID: int) -> EmbedToSend:
-    basestats = StatBox.load(userdata.stats)
+    basestats = StatBox.load_scaled(userdata.stats)
 
     embed = _create_embed(f"Base Stats for {basestats['nickname'].value}", requesterID)
 
@@ -236,8 +248,9 @@ def get_basestats(userdata: User, requesterID: int) -> EmbedToSend:
 
 
 # stats with stat.definition.userkey
+@tracing.traced()
 def get_settings(userdata: User, requesterID: int) -> EmbedToSend:
-    basestats = StatBox.load(userdata.stats)
+    basestats = StatBox.load_scaled(userdata.stats)
 
     embed = _create_embed(f"Settings for {basestats['nickname'].value}", requesterID)
 
@@ -256,8 +269,9 @@ def get_settings(userdata: User, requesterID: int) -> EmbedToSend:
 
 
 # stats with stat.tag="keypoint"
+@tracing.traced()
 def get_keypoints_embed(userdata: User, requesterID: int) -> EmbedToSend:
-    stats = StatBox.load(userdata.stats).scale(userdata.scale)
+    stats = StatBox.load_scaled(userdata.stats, userdata.scale)
 
     embed = _create_embed(f"Keypoints for {stats['nickname'].value}", requesterID)
 
@@ -333,17 +347,17 @@ def _get_mapped_stat(key: str) -> str | None:
 
 
 def _get_compare_statboxes(userdata1: User, userdata2: User) -> tuple[StatBox, StatBox, StatBox, StatBox, Decimal]:
-    stats1 = StatBox.load(userdata1.stats).scale(userdata1.scale)
-    stats2 = StatBox.load(userdata2.stats).scale(userdata2.scale)
-    small, big = sorted([stats1, stats2], key=lambda s: s['height'].value)
+    stats1 = StatBox.load_scaled(userdata1.stats, userdata1.scale)
+    stats2 = StatBox.load_scaled(userdata2.stats, userdata2.scale)
+    (small_userdata, small), (big_userdata, big) = sorted([(userdata1, stats1), (userdata2, stats2)], key=lambda u: u[1]['height'].value)
     if small['height'].value == 0 and big['height'].value == 0:
         # TODO: This feels awkward
-        small_viewby_big = small.scale(1)
-        big_viewby_small = big.scale(1)
+        small_viewby_big = StatBox.load_scaled(small_userdata.stats, small_userdata.scale, 1)
+        big_viewby_small = StatBox.load_scaled(big_userdata.stats, big_userdata.scale, 1)
         multiplier = Decimal(1)
     else:
-        small_viewby_big = small.scale(big['viewscale'].value)
-        big_viewby_small = big.scale(small['viewscale'].value)
+        small_viewby_big = StatBox.load_scaled(small_userdata.stats, small_userdata.scale, big['viewscale'].value)
+        big_viewby_small = StatBox.load_scaled(big_userdata.stats, big_userdata.scale, small['viewscale'].value)
         multiplier = big['height'].value / small['height'].value
     return small, big, small_viewby_big, big_viewby_small, multiplier
 
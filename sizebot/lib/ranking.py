@@ -0,0 +1,500 @@
+"""Per-guild leaderboards over height, scale and weight, kept up to date on every save.
+
+Each guild has an order-statistics tree per stat, so the top of a leaderboard and the rank of any one user
+are O(log n) instead of a scan of every profile in the guild.
+
+On disk, each guild's index is a snapshot (ranking.json) plus a journal of every change since (ranking.log),
+so a save only appends one line, and a restart only reads two files.
+The journal is folded back into the snapshot once it grows bigger than the snapshot itself.
+
+The indexes in memory are only touched on the event loop. `arecord()` does the file writes on the I/O pool, in order
+with everything else for the guild's index.
+"""
+from __future__ import annotations
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal, Protocol, get_args
+
+import json
+import logging
+import random
+from pathlib import Path
+
+from sizebot.lib import iopool, paths
+from sizebot.lib.digidecimal import RawDecimal
+from sizebot.lib.units import SV, WV, Decimal
+
+logger = logging.getLogger("sizebot")
+
+RankStat = Literal["height", "scale", "weight"]
+RANKSTATS: tuple[RankStat, ...] = get_args(RankStat)
+
+SNAPSHOT_VERSION = 1
+# Never bother compacting a journal smaller than this, in bytes
+MIN_COMPACT = 16 * 1024
+
+# Keys use plain decimals, which compare much faster than the wrapped ones
+Key = tuple[RawDecimal, int]
+Values = tuple[SV, Decimal, WV]
+
+
+class Rankable(Protocol):
+    guildid: int
+    id: int
+    height: SV
+    baseheight: SV
+    weight: WV
+    registered: bool
+
+
+class _Node:
+    __slots__ = ["key", "priority", "left", "right", "size"]
+
+    def __init__(self, key: Key):
+        self.key = key
+        self.priority = random.random()
+        self.left: _Node | None = None
+        self.right: _Node | None = None
+        self.size = 1
+
+    def update(self):
+        self.size = 1 + _size(self.left) + _size(self.right)
+
+
+def _size(node: _Node | None) -> int:
+    return 0 if node is None else node.size
+
+
+def _split(node: _Node | None, key: Key, inclusive: bool) -> tuple[_Node | None, _Node | None]:
+    """Split a tree into the keys below `key` (or up to and including it, if `inclusive`), and the rest"""
+    if node is None:
+        return None, None
+    if node.key < key or (inclusive and node.key == key):
+        node.right, right = _split(node.right, key, inclusive)
+        node.update()
+        return node, right
+    left, node.left = _split(node.left, key, inclusive)
+    node.update()
+    return left, node
+
+
+def _merge(left: _Node | None, right: _Node | None) -> _Node | None:
+    """Join two trees, where every key in `left` is below every key in `right`"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.update()
+        return left
+    right.left = _merge(left, right.left)
+    right.update()
+    return right
+
+
+def _build(keys: list[Key]) -> _Node | None:
+    """Build a balanced tree from sorted keys in O(n), instead of adding them one at a time"""
+    if not keys:
+        return None
+    # Hand out random priorities highest first, level by level, so they're in heap order like a tree built by adding
+    priorities = sorted((random.random() for _ in keys), reverse = True)
+    nodes = [_Node(key) for key in keys]
+    root = None
+    queue: deque[tuple[int, int, _Node | None, bool]] = deque([(0, len(keys), None, False)])
+    p = 0
+    while queue:
+        start, stop, parent, isright = queue.popleft()
+        if start >= stop:
+            continue
+        middle = (start + stop) // 2
+        node = nodes[middle]
+        node.priority = priorities[p]
+        node.size = stop - start
+        p += 1
+        if parent is None:
+            root = node
+        elif isright:
+            parent.right = node
+        else:
+            parent.left = node
+        queue.append((start, middle, node, False))
+        queue.append((middle + 1, stop, node, True))
+    return root
+
+
+class OrderStatisticTree:
+    """A sorted set of keys that can also find the nth key, and the position of a key, in O(log n).
+
+    It's a treap: a binary search tree, balanced by giving every node a random priority,
+    where each node also knows the size of its subtree.
+    """
+
+    def __init__(self, keys: Iterable[Key] = ()):
+        self._root = _build(sorted(set(keys)))
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __contains__(self, key: Key) -> bool:
+        node = self._root
+        while node is not None:
+            if key == node.key:
+                return True
+            node = node.left if key < node.key else node.right
+        return False
+
+    def __iter__(self) -> Iterator[Key]:
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def add(self, key: Key):
+        left, right = _split(self._root, key, False)
+        middle, right = _split(right, key, True)
+        if middle is None:
+            middle = _Node(key)
+        self._root = _merge(_merge(left, middle), right)
+
+    def discard(self, key: Key):
+        left, right = _split(self._root, key, False)
+        _, right = _split(right, key, True)
+        self._root = _merge(left, right)
+
+    def rank(self, key: Key) -> int:
+        """How many keys are below `key`"""
+        count = 0
+        node = self._root
+        while node is not None:
+            if node.key < key:
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def select(self, index: int) -> Key:
+        """The key at position `index`, counting from the lowest"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        node = self._root
+        while True:
+            leftsize = _size(node.left)
+            if index < leftsize:
+                node = node.left
+            elif index == leftsize:
+                return node.key
+            else:
+                index -= leftsize + 1
+                node = node.right
+
+
+def _parse_values(values: list[str]) -> Values:
+    height, scale, weight = (RawDecimal(v) for v in values)
+    return (SV(height), Decimal(scale), WV(weight))
+
+
+def values_for(userdata: Rankable) -> Values | None:
+    """The ranked stats for a user, or None if they don't belong on the leaderboard"""
+    if not userdata.registered:
+        return None
+    height = userdata.height
+    if height == 0 or height == SV("infinity") or userdata.baseheight == 0:
+        return None
+    return (height, height / userdata.baseheight, userdata.weight)
+
+
+class GuildRanking:
+    """The leaderboards for one guild"""
+
+    def __init__(self, guildid: int):
+        self.guildid = guildid
+        self.users: dict[int, Values] = {}
+        self.trees: dict[RankStat, OrderStatisticTree] = {stat: OrderStatisticTree() for stat in RANKSTATS}
+        self.journaled = 0
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def __contains__(self, userid: int) -> bool:
+        return userid in self.users
+
+    def set(self, userid: int, values: Values | None):
+        self.remove(userid)
+        if values is None:
+            return
+        self.users[userid] = values
+        for stat, value in zip(RANKSTATS, values):
+            self.trees[stat].add((value.to_pydecimal(), userid))
+
+    def remove(self, userid: int):
+        old = self.users.pop(userid, None)
+        if old is None:
+            return
+        for stat, value in zip(RANKSTATS, old):
+            self.trees[stat].discard((value.to_pydecimal(), userid))
+
+    def top(self, stat: RankStat, count: int, *, offset: int = 0, smallest: bool = False) -> list[tuple[int, Decimal]]:
+        """The (userid, value) pairs at the top (or bottom) of the leaderboard, skipping the first `offset`"""
+        tree = self.trees[stat]
+        end = min(len(tree), offset + count)
+        statindex = RANKSTATS.index(stat)
+        results = []
+        for i in range(offset, end):
+            _, userid = tree.select(i if smallest else -1 - i)
+            results.append((userid, self.users[userid][statindex]))
+        return results
+
+    def rank(self, userid: int, stat: RankStat, *, smallest: bool = False) -> int | None:
+        """A user's place on the leaderboard, starting at 1, or None if they aren't on it"""
+        values = self.users.get(userid)
+        if values is None:
+            return None
+        key = (values[RANKSTATS.index(stat)].to_pydecimal(), userid)
+        tree = self.trees[stat]
+        below = tree.rank(key)
+        if smallest:
+            return below + 1
+        return len(tree) - below
+
+    def toJSON(self) -> Any:
+        return {
+            "version": SNAPSHOT_VERSION,
+            "guildid": str(self.guildid),
+            "users": {str(userid): [str(v) for v in values] for userid, values in self.users.items()}
+        }
+
+    @classmethod
+    def from_users(cls, guildid: int, users: dict[int, Values]) -> GuildRanking:
+        """Build the leaderboards for a whole guild at once"""
+        ranking = GuildRanking(guildid)
+        ranking.users = users
+        ranking.trees = {
+            stat: OrderStatisticTree((values[i].to_pydecimal(), userid) for userid, values in users.items())
+            for i, stat in enumerate(RANKSTATS)
+        }
+        return ranking
+
+    @classmethod
+    def fromJSON(cls, jsondata: Any) -> GuildRanking:
+        users = {int(userid): _parse_values(values) for userid, values in jsondata["users"].items()}
+        return GuildRanking.from_users(int(jsondata["guildid"]), users)
+
+
+def get_snapshot_path(guildid: int) -> Path:
+    return paths.guilddbpath / f"{guildid}" / "ranking.json"
+
+
+def get_journal_path(guildid: int) -> Path:
+    return paths.guilddbpath / f"{guildid}" / "ranking.log"
+
+
+def _journal_entry(userid: int, values: Values | None) -> str:
+    return json.dumps({"id": str(userid), "values": None if values is None else [str(v) for v in values]})
+
+
+def _read_journal(path: Path) -> Iterator[tuple[str, list[str] | None]]:
+    try:
+        with open(path, "r") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            # A write that was cut off by a crash
+            logger.warning(f"Skipping a broken line in {path}.")
+            continue
+        yield entry["id"], entry["values"]
+
+
+def _replay(ranking: GuildRanking, path: Path):
+    for userid, values in _read_journal(path):
+        ranking.set(int(userid), None if values is None else _parse_values(values))
+        ranking.journaled += 1
+
+
+def _read(guildid: int) -> GuildRanking | None:
+    try:
+        with open(get_snapshot_path(guildid), "r") as f:
+            jsondata = json.load(f)
+    except FileNotFoundError:
+        return None
+    if jsondata.get("version") != SNAPSHOT_VERSION:
+        return None
+    ranking = GuildRanking.fromJSON(jsondata)
+    _replay(ranking, get_journal_path(guildid))
+    return ranking
+
+
+def _write_snapshot(guildid: int, jsondata: Any):
+    path = get_snapshot_path(guildid)
+    path.parent.mkdir(exist_ok = True, parents = True)
+    temppath = path.with_suffix(".tmp")
+    with open(temppath, "w") as f:
+        json.dump(jsondata, f)
+    temppath.replace(path)
+    get_journal_path(guildid).unlink(missing_ok = True)
+
+
+def write(ranking: GuildRanking):
+    """Write a fresh snapshot of a guild's index, and start a new journal"""
+    _write_snapshot(ranking.guildid, ranking.toJSON())
+    ranking.journaled = 0
+
+
+def _compact(guildid: int):
+    """Fold a guild's journal into its snapshot, straight from disk, whether or not the index is in memory"""
+    with open(get_snapshot_path(guildid), "r") as f:
+        jsondata = json.load(f)
+    users = jsondata["users"]
+    for userid, values in _read_journal(get_journal_path(guildid)):
+        if values is None:
+            users.pop(userid, None)
+        else:
+            users[userid] = values
+    _write_snapshot(guildid, jsondata)
+
+
+def _journal(guildid: int, lines: list[str], built: bool) -> bool:
+    """Append to a guild's journal, compacting it once it's bigger than the snapshot.
+
+    Unless the guild is already known to be `built`, this first checks that it has a snapshot at all, and writes
+    nothing if it doesn't. Returns whether it has one.
+    """
+    snapshotpath = get_snapshot_path(guildid)
+    if not built and not snapshotpath.exists():
+        return False
+    with open(get_journal_path(guildid), "a") as f:
+        f.write("".join(lines))
+        size = f.tell()
+    if size > MIN_COMPACT and size > snapshotpath.stat().st_size:
+        _compact(guildid)
+    return True
+
+
+_rankings: dict[int, GuildRanking] = {}
+# Whether each guild has a snapshot on disk, once that's known, so saves don't have to check every time
+_built: dict[int, bool] = {}
+# Saves to guilds whose index is being read or built on the I/O pool, applied once it's ready
+_pending: dict[int, dict[int, Values | None]] = {}
+
+
+def _apply(guildid: int, changes: dict[int, Values | None]) -> list[str]:
+    """Apply changes to the index in memory, returning the journal lines still to write"""
+    if guildid in _pending:
+        _pending[guildid].update(changes)
+        return []
+    ranking = _rankings.get(guildid)
+    if ranking is not None:
+        for userid, values in changes.items():
+            ranking.set(userid, values)
+    # Guilds whose index hasn't been built yet are skipped, since building it reads every user anyway
+    if _built.get(guildid) is False:
+        return []
+    return [_journal_entry(userid, values) + "\n" for userid, values in changes.items()]
+
+
+def record(guildid: int, userid: int, values: Values | None):
+    """Record a user's new values (or None, if they're no longer ranked)"""
+    lines = _apply(guildid, {userid: values})
+    if lines:
+        _built[guildid] = _journal(guildid, lines, _built.get(guildid, False))
+
+
+async def arecord(guildid: int, userid: int, values: Values | None):
+    """`record()`, with the journal written on the I/O pool"""
+    lines = _apply(guildid, {userid: values})
+    if lines:
+        built = await iopool.run(("ranking", guildid), _journal, guildid, lines, _built.get(guildid, False))
+        # Unless the index was built or discarded in the meantime
+        _built.setdefault(guildid, built)
+
+
+def update(userdata: Rankable):
+    """Record a saved user"""
+    record(userdata.guildid, userdata.id, values_for(userdata))
+
+
+def remove(guildid: int, userid: int):
+    """Record a deleted user"""
+    record(guildid, userid, None)
+
+
+def build(guildid: int, users: Iterable[Rankable]) -> GuildRanking:
+    """Build a guild's index from scratch, and save it"""
+    values = {userdata.id: values_for(userdata) for userdata in users}
+    ranking = GuildRanking.from_users(guildid, {userid: v for userid, v in values.items() if v is not None})
+    write(ranking)
+    _rankings[guildid] = ranking
+    _built[guildid] = True
+    return ranking
+
+
+def load(guildid: int) -> GuildRanking | None:
+    """A guild's index, if it has been built"""
+    ranking = _rankings.get(guildid)
+    if ranking is None:
+        ranking = _read(guildid)
+        if ranking is not None:
+            _rankings[guildid] = ranking
+            _built[guildid] = True
+    return ranking
+
+
+def loaded(guildid: int) -> GuildRanking | None:
+    """A guild's index, if it's already in memory"""
+    return _rankings.get(guildid)
+
+
+def start_loading(guildid: int):
+    """Hold on to saves for this guild while its index is read or built on another thread"""
+    _pending.setdefault(guildid, {})
+
+
+async def finish_loading(guildid: int):
+    """Apply the saves that came in while this guild's index was being read or built"""
+    pending = _pending.pop(guildid, {})
+    lines = _apply(guildid, pending)
+    if lines:
+        built = await iopool.run(("ranking", guildid), _journal, guildid, lines, _built.get(guildid, False))
+        _built.setdefault(guildid, built)
+
+
+def list_built() -> list[int]:
+    """Every guild with an index saved on disk"""
+    return [int(p.parent.name) for p in paths.guilddbpath.glob("*/ranking.json") if p.parent.name.isdigit()]
+
+
+def _unlink(guildid: int):
+    get_snapshot_path(guildid).unlink(missing_ok = True)
+    get_journal_path(guildid).unlink(missing_ok = True)
+
+
+def discard(guildid: int):
+    """Throw away a guild's index, so it's built again from every profile the next time it's needed"""
+    _rankings.pop(guildid, None)
+    _built[guildid] = False
+    _unlink(guildid)
+
+
+async def adiscard(guildid: int):
+    """`discard()`, with the files removed on the I/O pool"""
+    _rankings.pop(guildid, None)
+    _built[guildid] = False
+    await iopool.run(("ranking", guildid), _unlink, guildid)
+
+
+def forget():
+    """Drop every index from memory, so they're read from disk again"""
+    _rankings.clear()
+    _built.clear()
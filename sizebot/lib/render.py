@@ -0,0 +1,86 @@
+from __future__ import annotations
+from collections.abc import Callable
+from typing import Any
+
+import asyncio
+import decimal
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sizebot.conf import conf
+from sizebot.lib import digidecimal, errors
+
+logger = logging.getLogger("sizebot")
+
+
+def _init_worker():
+    # Decimal contexts are per-thread, and digidecimal only configures the main thread's
+    decimal.setcontext(digidecimal.context.copy())
+
+
+class RenderPool:
+    """A thread pool for the Decimal-heavy StatBox math and embed building, so the event loop only does I/O"""
+
+    def __init__(self, workers: int, timeout: float):
+        self.workers = workers
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers = workers, thread_name_prefix = "sizebot-render", initializer = _init_worker)
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.timedout = 0
+
+    def _wrap[T](self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Callable[[], T]:
+        def job() -> T:
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+        return job
+
+    async def run[T](self, fn: Callable[..., T], *args: Any, timeout: float | None = None, **kwargs: Any) -> T:
+        """Run `fn(*args, **kwargs)` on the pool, and wait at most `timeout` seconds for the result"""
+        if timeout is None:
+            timeout = self.timeout
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.queued += 1
+        fut = loop.run_in_executor(self._executor, self._wrap(fn, *args, **kwargs))
+        try:
+            result = await asyncio.wait_for(fut, timeout)
+        except TimeoutError:
+            # The worker thread can't be interrupted, but we can stop waiting on it
+            self.timedout += 1
+            logger.warning(f"Render of {getattr(fn, '__name__', fn)!r} timed out after {timeout} seconds")
+            raise errors.RenderTimeoutException
+        except Exception:
+            self.failed += 1
+            raise
+        self.completed += 1
+        return result
+
+    def format_summary(self) -> str:
+        return (f"Workers: {self.workers}, timeout: {self.timeout}s\n"
+                f"Queued: {self.queued}, running: {self.running}\n"
+                f"Completed: {self.completed}, failed: {self.failed}, timed out: {self.timedout}")
+
+    def shutdown(self):
+        self._executor.shutdown(wait = False, cancel_futures = True)
+
+
+@functools.cache
+def get_pool() -> RenderPool:
+    return RenderPool(conf.render_workers, conf.render_timeout)
+
+
+async def run[T](fn: Callable[..., T], *args: Any, timeout: float | None = None, **kwargs: Any) -> T:
+    """Run a rendering function on the shared render pool"""
+    return await get_pool().run(fn, *args, timeout = timeout, **kwargs)
@@ -0,0 +1,177 @@
+"""Remember the replies of commands that always answer the same question the same way.
+
+Some commands (object stats, the pokédex, the object and tag lists) only look things up in the object and Pokémon
+catalogs, so the same arguments always get the same reply. Decorate their callbacks to send a remembered reply
+instead of building it again:
+
+    @commands.command()
+    @replycache.cached("what")
+    async def objstats(self, ctx: BotContext, *, what: DigiObject | str):
+        ...
+
+Only the arguments named in `cached()` (and the prefix the command was called with) tell replies apart, so a cached
+command must not read anything else: not the author, not a profile, not a random pick. A call whose arguments
+include a member or a fake player is never cached, and a callback that does end up depending on something else
+(say, picking at random because nothing matched) calls `replycache.dont_cache()`.
+
+A reply is only kept if it was a single message of just content and an embed. Replies are also forgotten after a
+while, and whenever the catalogs are reloaded.
+"""
+from __future__ import annotations
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import contextvars
+import functools
+import inspect
+import time
+from collections import OrderedDict
+
+import discord
+
+from sizebot.conf import conf
+from sizebot.lib import metrics, objs, pokemon
+from sizebot.lib.digidecimal import BaseDecimal
+from sizebot.lib.types import BotContext
+
+# The only parts of a message that are kept, and only when they're all there is to it
+PAYLOAD_KEYS = {"content", "embed"}
+
+_cacheable: contextvars.ContextVar[bool] = contextvars.ContextVar("cacheable", default = True)
+
+
+class Uncacheable(Exception):
+    pass
+
+
+def catalog_version() -> tuple[int, int]:
+    return objs.catalog_version, pokemon.catalog_version
+
+
+def normalize(value: Any) -> Hashable:
+    """A key part for one argument, or Uncacheable if the argument could stand for something that changes"""
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, BaseDecimal):
+        return repr(value)
+    if isinstance(value, objs.DigiObject):
+        return ("DigiObject", value.name)
+    raise Uncacheable
+
+
+def dont_cache():
+    """Don't keep the reply the current command is about to send"""
+    _cacheable.set(False)
+
+
+class _Recorder:
+    """Stands in for a command's context, noting what it sends"""
+
+    def __init__(self, ctx: BotContext):
+        self._ctx = ctx
+        self.sent: list[dict[str, Any]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ctx, name)
+
+    async def send(self, content: str | None = None, **kwargs: Any) -> discord.Message:
+        self.sent.append({"content": content, **kwargs} if content is not None else kwargs)
+        return await self._ctx.send(content, **kwargs)
+
+
+class _Entry:
+    # __slots__ declares to python what attributes to expect.
+    __slots__ = ["payload", "stored"]
+
+    def __init__(self, payload: dict[str, Any], stored: float):
+        self.payload = payload
+        self.stored = stored
+
+
+class ReplyCache:
+    """An LRU cache of sent replies, each kept for at most `ttl` seconds"""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self.clock() - entry.stored >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.payload
+
+    def put(self, key: Hashable, payload: dict[str, Any]):
+        self._entries[key] = _Entry(payload, self.clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last = False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def format_summary(self) -> str:
+        lookups = self.hits + self.misses
+        rate = f"{self.hits / lookups:.1%}" if lookups else "n/a"
+        return (f"Entries: {len(self._entries):,}/{self.maxsize:,}, TTL: {self.ttl:g}s\n"
+                f"Hits: {self.hits:,}, misses: {self.misses:,} (hit rate {rate}), not cacheable: {self.bypassed:,}")
+
+
+@functools.cache
+def get_cache() -> ReplyCache:
+    return ReplyCache(conf.reply_cache_size, conf.reply_cache_ttl)
+
+
+def cached(*argnames: str) -> Callable:
+    """Send a remembered reply when the decorated command callback is called with the same `argnames` again"""
+    def wrapper(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapped(self: Any, ctx: BotContext, *args, **kwargs):
+            cache = get_cache()
+            arguments = signature.bind(self, ctx, *args, **kwargs)
+            arguments.apply_defaults()
+            try:
+                key = (name, ctx.prefix, catalog_version(), tuple(normalize(arguments.arguments[a]) for a in argnames))
+            except Uncacheable:
+                cache.bypassed += 1
+                metrics.inc("reply_cache_total", command = name, outcome = "bypass")
+                return await fn(self, ctx, *args, **kwargs)
+
+            payload = cache.get(key)
+            if payload is not None:
+                cache.hits += 1
+                metrics.inc("reply_cache_total", command = name, outcome = "hit")
+                await ctx.send(**payload)
+                return
+
+            recorder = _Recorder(ctx)
+            token = _cacheable.set(True)
+            try:
+                await fn(self, recorder, *args, **kwargs)
+                cacheable = _cacheable.get()
+            finally:
+                _cacheable.reset(token)
+            if cacheable and len(recorder.sent) == 1 and recorder.sent[0].keys() <= PAYLOAD_KEYS:
+                cache.misses += 1
+                metrics.inc("reply_cache_total", command = name, outcome = "miss")
+                cache.put(key, recorder.sent[0])
+            else:
+                cache.bypassed += 1
+                metrics.inc("reply_cache_total", command = name, outcome = "bypass")
+        return wrapped
+    return wrapper
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
-import random
 import re
 
 import numexpr
+import numpy as np
 
 from sizebot.lib import errors
 
+# Defaults for the caps on a single roll string, overridden by the roll section of the config
+MAX_DICE = 1_000_000
+MAX_SIDES = 1_000_000_000
+# Rolls with more dice than this are summarized as a histogram instead of listing every die
+LIST_LIMIT = 100
+
+_rng = np.random.default_rng()
+
+
+def seed(s: int | None):
+    """Make all following rolls deterministic (or random again, with None)"""
+    global _rng
+    _rng = np.random.default_rng(s)
+
 
 def evalmath(expression: str) -> int:
     return int(numexpr.evaluate(expression, local_dict={}, global_dict={}))
@@ -22,21 +36,18 @@ class RollArg:
         self.sides = sides
         self.drop = drop
 
-    def roll(self) -> RollResult:
-        # roll the dice
-        rolls = [random.randint(1, self.sides) for _ in range(self.rolls)]
-        # get list of lowest dice to drop
-        lowest = sorted(rolls)[:self.drop]
-        # make lists of used and dropped rolls, in the order they were rolled
-        used: list[int] = []
-        dropped: list[int] = []
-        for r in rolls:
-            if r in lowest:
-                lowest.remove(r)
-                dropped.append(r)
-            else:
-                used.append(r)
-        return RollResult(used, dropped)
+    def roll(self, rng: np.random.Generator | None = None) -> RollResult:
+        if rng is None:
+            rng = _rng
+        # roll all the dice at once
+        dice = rng.integers(1, self.sides, size = self.rolls, endpoint = True)
+        if self.drop == 0:
+            return RollResult(dice, dice[:0])
+        # find the lowest dice without sorting the rest
+        keep = np.ones(self.rolls, dtype = bool)
+        keep[np.argpartition(dice, self.drop - 1)[:self.drop]] = False
+        # used and dropped rolls stay in the order they were rolled
+        return RollResult(dice[keep], dice[~keep])
 
     @classmethod
     def parse(cls, s: str) -> RollArg:
@@ -55,19 +66,39 @@ class RollArg:
         return cls(rolls, sides, dropcount)
 
 
+def _format_dice(dice: np.ndarray, limit: int) -> str:
+    if len(dice) <= limit:
+        return ", ".join(str(d) for d in np.sort(dice))
+    faces, counts = np.unique(dice, return_counts = True)
+    if len(faces) <= limit:
+        return ", ".join(f"{f}×{c}" for f, c in zip(faces, counts))
+    return f"{len(dice)} dice from {faces[0]} to {faces[-1]}, averaging {dice.mean():.2f}"
+
+
 class RollResult:
     __slots__ = ["total", "used", "dropped"]
 
-    def __init__(self, used: list[int], dropped: list[int]):
-        self.total = sum(used)
+    def __init__(self, used: np.ndarray, dropped: np.ndarray):
+        self.total = int(used.sum())
         self.used = used
         self.dropped = dropped
 
+    def histogram(self) -> dict[int, int]:
+        """How many of the used dice landed on each face that came up"""
+        faces, counts = np.unique(self.used, return_counts = True)
+        return {int(f): int(c) for f, c in zip(faces, counts)}
+
+    def format_used(self, limit: int = LIST_LIMIT) -> str:
+        return _format_dice(self.used, limit)
+
+    def format_dropped(self, limit: int = LIST_LIMIT) -> str:
+        return _format_dice(self.dropped, limit)
+
     def __str__(self) -> str:
         output = (f"    Total: {self.total}\n"
-                  f"    Used: {self.used}\n")
+                  f"    Used: {self.format_used()}\n")
         if len(self.dropped) > 0:
-            output += f"    Dropped: {self.dropped}\n"
+            output += f"    Dropped: {self.format_dropped()}\n"
         return output
 
 
@@ -85,15 +116,25 @@ class Result:
         return output
 
 
-def roll(argstring: str) -> Result:
+def roll(argstring: str, *, max_dice: int = MAX_DICE, max_sides: int = MAX_SIDES, rng: np.random.Generator | None = None) -> Result:
     # Split up and categorize parameters
     argstrings: list[str] = RollArg.re_pattern_all.split(argstring)
+    rollargs = [(s, RollArg.parse(s)) for s in argstrings]
+
+    # Check the caps before rolling anything
+    dicecount = sum(rollarg.rolls for _, rollarg in rollargs if rollarg is not None)
+    if dicecount > max_dice:
+        raise errors.RollTooLargeException(argstring, f"{max_dice:,} dice")
+    if any(rollarg.sides > max_sides for _, rollarg in rollargs if rollarg is not None):
+        raise errors.RollTooLargeException(argstring, f"{max_sides:,} sides")
+    if any(rollarg.sides < 1 for _, rollarg in rollargs if rollarg is not None):
+        raise errors.InvalidRollException(argstring)
+
     rolls: list[RollResult] = []
     rollexpr = ""
-    for s in argstrings:
-        rollarg = RollArg.parse(s)
+    for s, rollarg in rollargs:
         if rollarg is not None:
-            result = rollarg.roll()
+            result = rollarg.roll(rng)
             rolls.append(result)
             s = result.total
         rollexpr += str(s)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+from discord.ext import commands
+
+from sizebot.lib import utils
+
+logger = logging.getLogger("sizebot")
+
+Callback = Callable[[commands.Bot], Awaitable[Any]]
+
+
+class _Entry:
+    __slots__ = ["when", "seq", "key", "callback", "cancelled"]
+
+    def __init__(self, when: float, seq: int, key: Hashable, callback: Callback):
+        self.when = when
+        self.seq = seq
+        self.key = key
+        self.callback = callback
+        self.cancelled = False
+
+    def __lt__(self, other: _Entry) -> bool:
+        return (self.when, self.seq) < (other.when, other.seq)
+
+
+class Scheduler:
+    """A min-heap of deadlines that wakes up exactly when the next item is due.
+
+    Every item has a key. Scheduling a key that is already queued replaces the old deadline.
+    Cancelled entries are left in the heap as tombstones and dropped when they reach the top.
+    """
+
+    def __init__(self):
+        self._heap: list[_Entry] = []
+        self._entries: dict[Hashable, _Entry] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def schedule(self, key: Hashable, when: float, callback: Callback):
+        """Run `callback(bot)` at the unix timestamp `when`"""
+        self.cancel(key)
+        entry = _Entry(float(when), next(self._counter), key, callback)
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        # Only interrupt the sleeping runner if this is the new earliest deadline
+        if self._heap[0] is entry:
+            self._wakeup.set()
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel a scheduled item, returning whether there was anything to cancel"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry.cancelled = True
+        return True
+
+    def is_scheduled(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def deadline(self, key: Hashable) -> float | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return entry.when
+
+    def next_deadline(self) -> float | None:
+        self._drop_cancelled()
+        if not self._heap:
+            return None
+        return self._heap[0].when
+
+    def pop_due(self, now: float) -> list[_Entry]:
+        """Remove and return every live entry due at or before `now`, in deadline order"""
+        due = []
+        while self._heap and self._heap[0].when <= now:
+            entry = heapq.heappop(self._heap)
+            if entry.cancelled:
+                continue
+            del self._entries[entry.key]
+            due.append(entry)
+        return due
+
+    def _drop_cancelled(self):
+        while self._heap and self._heap[0].cancelled:
+            heapq.heappop(self._heap)
+
+    async def run(self, bot: commands.Bot):
+        """Sleep until the next deadline (or until an earlier one is scheduled), then run everything that is due"""
+        while True:
+            self._wakeup.clear()
+            deadline = self.next_deadline()
+            timeout = None if deadline is None else max(0, deadline - time.time())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except TimeoutError:
+                pass
+            for entry in self.pop_due(time.time()):
+                try:
+                    await entry.callback(bot)
+                except Exception as e:
+                    logger.error(f"Ignoring exception in scheduled task {entry.key!r}")
+                    logger.error(utils.format_traceback(e))
+
+    def start(self, bot: commands.Bot):
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self.run(bot))
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def format_summary(self) -> str:
+        now = time.time()
+        lines = []
+        for entry in sorted(self._entries.values()):
+            lines.append(f"{entry.key!r} in {utils.pretty_time_delta(max(0, entry.when - now))}")
+        return "\n".join(lines)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+scheduler = Scheduler()
@@ -0,0 +1,72 @@
+"""Which guilds this process is responsible for, when SizeBot runs as several sharded worker processes.
+
+Discord sends each guild's events to exactly one shard, (guild ID >> 22) % shard count, and each worker process runs
+a fixed set of shards. So every guild belongs to exactly one process, and that process owns the guild's data:
+its profiles, guild settings and leaderboards are only ever written by it, without any locking.
+
+Data that isn't per guild (slow changes, naps, the agreement leaderboard, the wink count) lives in one shared file,
+so those files are only ever changed under a cross-process lock (see `filelock`),
+and each worker only loads and saves the entries for the guilds it owns.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+def shard_for(guildid: int, shard_count: int) -> int:
+    """The shard Discord sends a guild's events to"""
+    return (guildid >> 22) % shard_count
+
+
+def split(shard_count: int, workers: int) -> list[tuple[int, ...]]:
+    """Deal the shards out between the workers, round-robin"""
+    return [tuple(range(worker, shard_count, workers)) for worker in range(workers)]
+
+
+@dataclass(frozen = True)
+class ShardInfo:
+    # None when SizeBot isn't sharded, and this one process owns everything
+    shard_count: int | None = None
+    shard_ids: tuple[int, ...] = ()
+    worker: int = 0
+
+    @property
+    def sharded(self) -> bool:
+        return self.shard_count is not None
+
+    @property
+    def is_primary(self) -> bool:
+        """Whether this process should do the once-per-bot work, like syncing slash commands"""
+        return self.worker == 0
+
+    def owns(self, guildid: int | None) -> bool:
+        if not self.sharded:
+            return True
+        # DMs always arrive on shard 0
+        shard = 0 if guildid is None else shard_for(guildid, self.shard_count)
+        return shard in self.shard_ids
+
+    def per_worker(self, path: Path) -> Path:
+        """A path of this worker's own, for files that every worker writes separately"""
+        if not self.sharded:
+            return path
+        return path.with_stem(f"{path.stem}-{self.worker}")
+
+    def __str__(self) -> str:
+        if not self.sharded:
+            return "Not sharded"
+        return f"Worker {self.worker}, shards {', '.join(str(s) for s in self.shard_ids)} of {self.shard_count}"
+
+
+current = ShardInfo()
+
+
+def configure(info: ShardInfo):
+    global current
+    current = info
+
+
+def owns(guildid: int | None) -> bool:
+    """Whether this process is responsible for a guild"""
+    return current.owns(guildid)
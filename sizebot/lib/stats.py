@@ -2,10 +2,11 @@ from __future__ import annotations
 from typing import Any, TypeVar, TypedDict, cast
 from collections.abc import Callable
 
-from functools import cached_property
+from collections import OrderedDict
 import math
+import threading
 
-from sizebot.lib import errors
+from sizebot.lib import errors, metrics, tracing
 from sizebot.lib.constants import emojis
 from sizebot.lib.gender import Gender
 from sizebot.lib.units import Decimal, SV, WV, TV, AV
@@ -40,6 +41,9 @@ HOUR = Decimal("3600")
 IS_LARGE = 1.0
 IS_VERY_LARGE = 10.0
 
+# How many built StatBoxes to keep, dropping the least recently used first
+STATBOX_CACHE_SIZE = 256
+
 
 class PlayerStats(TypedDict):
     height: str
@@ -116,6 +120,9 @@ def wrap_type(f: Callable[[Any], T] | None) -> Callable[[Any], T | None]:
     def wrapped(v: Any) -> T | None:
         if v is None:
             return None
+        # Typed values are never changed in place, so one that's already the right type can be used as it is
+        if type(v) is f:
+            return v
         return f(v)
     return wrapped
 
@@ -221,12 +228,21 @@ class StatDef:
 
 
 class Stat:
+    # __slots__ declares to python what attributes to expect.
+    # The underscored ones are filled in the first time they're used.
+    __slots__ = ["sb", "definition", "value", "is_setbyuser", "is_set", "_is_shown", "_title", "_body", "_string", "_embed"]
+
     def __init__(self, sb: StatBox, definition: StatDef, value: Any, is_setbyuser: bool):
         self.sb = sb
         self.definition = definition
         self.value = value
         self.is_setbyuser = is_setbyuser
         self.is_set = value is not None or not definition.settable
+        self._is_shown: bool | None = None
+        self._title: str | None = None
+        self._body: str | None = None
+        self._string: str | None = None
+        self._embed: dict[str, str | bool] | None = None
 
     @property
     def key(self) -> str:
@@ -240,31 +256,42 @@ class Stat:
     def tags(self) -> list[str]:
         return self.definition.tags
 
-    @cached_property
+    @property
     def is_shown(self) -> bool:
-        return self.definition.get_is_shown(self.sb)
+        if self._is_shown is None:
+            self._is_shown = self.definition.get_is_shown(self.sb)
+        return self._is_shown
 
-    @cached_property
+    @property
     def title(self) -> str:
-        return self.definition.get_title(self.sb)
+        if self._title is None:
+            self._title = self.definition.get_title(self.sb)
+        return self._title
 
-    @cached_property
+    @property
     def body(self) -> str:
-        return self.definition.get_body(self.sb)
+        if self._body is None:
+            self._body = self.definition.get_body(self.sb)
+        return self._body
 
-    @cached_property
+    @property
     def string(self) -> str:
-        if self.value is None:
-            return f"The {self.title} stat is unavailable for this user."
-        return self.definition.get_string(self.sb)
+        if self._string is None:
+            if self.value is None:
+                self._string = f"The {self.title} stat is unavailable for this user."
+            else:
+                self._string = self.definition.get_string(self.sb)
+        return self._string
 
-    @cached_property
+    @property
     def embed(self) -> dict[str, str | bool]:
-        return {
-            "name": self.title,
-            "value": self.body,
-            "inline": self.definition.inline
-        }
+        if self._embed is None:
+            self._embed = {
+                "name": self.title,
+                "value": self.body,
+                "inline": self.definition.inline
+            }
+        return self._embed
 
     def __str__(self) -> str:
         return f"{self.title}: {self.value}"
@@ -298,6 +325,9 @@ def process_queue(source: list[IN], _process: Callable[[IN], None | OUT]) -> lis
 
 
 class StatBox:
+    # __slots__ declares to python what attributes to expect.
+    __slots__ = ["stats", "stats_by_key", "values"]
+
     def __init__(self):
         self.stats: list[Stat] = []
         self.stats_by_key: dict[str, Stat] = {}
@@ -309,6 +339,8 @@ class StatBox:
         self.values = {sv.key: sv.value for sv in stats}
 
     @classmethod
+    @metrics.timethis("statbox_build_seconds", op = "load")
+    @tracing.traced()
     def load(cls, userstats: PlayerStats) -> StatBox:
         values: dict[str, Any] = {}
         sb = StatBox()
@@ -324,27 +356,19 @@ class StatBox:
 
     @classmethod
     def load_average(cls) -> StatBox:
-        average_userdata: PlayerStats = {
-            "height": str(AVERAGE_HEIGHT),
-            "weight": str(AVERAGE_WEIGHT),
-            "pawtoggle": False,
-            "furtoggle": False,
-            "nickname": "Average",
-            "id": "0",
-            "gender": None,
-            "hairlength": None,
-            "taillength": None,
-            "earheight": None,
-            "macrovision_model": None,
-            "macrovision_view": None,
-            "footlength": None,
-            "liftstrength": None,
-            "walkperhour": None,
-            "swimperhour": None,
-            "runperhour": None
-        }
-        return cls.load(average_userdata)
+        # It never changes, so it's only ever built once
+        global _average_statbox
+        if _average_statbox is None:
+            _average_statbox = cls.load(AVERAGE_PLAYERSTATS)
+        return _average_statbox
+
+    @classmethod
+    def load_scaled(cls, userstats: PlayerStats, *scales: Decimal) -> StatBox:
+        """`StatBox.load(userstats)`, scaled by each of `scales` in turn, reusing an earlier result if there is one"""
+        return statbox_cache.get(userstats, *scales)
 
+    @metrics.timethis("statbox_build_seconds", op = "scale")
+    @tracing.traced()
     def scale(self, scale_value: Decimal) -> StatBox:
         values: dict[str, Any] = {}
         sb = StatBox()
@@ -366,6 +390,108 @@ class StatBox:
         return self.stats_by_key[k]
 
 
+AVERAGE_PLAYERSTATS: PlayerStats = {
+    "height": str(AVERAGE_HEIGHT),
+    "weight": str(AVERAGE_WEIGHT),
+    "pawtoggle": False,
+    "furtoggle": False,
+    "nickname": "Average",
+    "id": "0",
+    "gender": None,
+    "hairlength": None,
+    "taillength": None,
+    "earheight": None,
+    "macrovision_model": None,
+    "macrovision_view": None,
+    "footlength": None,
+    "liftstrength": None,
+    "walkperhour": None,
+    "swimperhour": None,
+    "runperhour": None
+}
+
+_average_statbox: StatBox | None = None
+
+StatBoxKey = tuple[tuple[tuple[str, Any], ...], tuple[str, ...]]
+
+
+class StatBoxCache:
+    """An LRU cache of built StatBoxes, keyed by the user stats they were built from and the scales applied to them.
+
+    StatBoxes are never changed after they're built, so a cached one can be handed out to anyone (on any thread).
+    Entries for a user are dropped when their profile is saved, so they don't hold on to stale profiles.
+    """
+
+    def __init__(self, maxsize: int = STATBOX_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._boxes: OrderedDict[StatBoxKey, StatBox] = OrderedDict()
+        self._keys_by_user: dict[str, set[StatBoxKey]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def _lookup(self, key: StatBoxKey) -> StatBox | None:
+        with self._lock:
+            statbox = self._boxes.get(key)
+            if statbox is not None:
+                self._boxes.move_to_end(key)
+            return statbox
+
+    def _store(self, key: StatBoxKey, userid: str, statbox: StatBox):
+        with self._lock:
+            self._boxes[key] = statbox
+            self._boxes.move_to_end(key)
+            self._keys_by_user.setdefault(userid, set()).add(key)
+            while len(self._boxes) > self.maxsize:
+                oldkey, _ = self._boxes.popitem(last = False)
+                self._forget_key(oldkey)
+
+    def _forget_key(self, key: StatBoxKey):
+        userid = dict(key[0]).get("id")
+        keys = self._keys_by_user.get(userid)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_user[userid]
+
+    def get(self, userstats: PlayerStats, *scales: Decimal) -> StatBox:
+        statskey = tuple(sorted(userstats.items()))
+        scalekeys = tuple(str(scale) for scale in scales)
+        # Each step is cached too, so the unscaled box is shared by every scale of the same user
+        for n in range(len(scales), -1, -1):
+            statbox = self._lookup((statskey, scalekeys[:n]))
+            if statbox is not None:
+                break
+        if n == len(scales) and statbox is not None:
+            metrics.inc("statbox_cache_total", outcome = "hit")
+            return statbox
+        metrics.inc("statbox_cache_total", outcome = "miss")
+        userid = str(userstats.get("id"))
+        if statbox is None:
+            statbox = StatBox.load(userstats)
+            self._store((statskey, ()), userid, statbox)
+        for i in range(n, len(scales)):
+            statbox = statbox.scale(scales[i])
+            self._store((statskey, scalekeys[:i + 1]), userid, statbox)
+        return statbox
+
+    def invalidate(self, userid: int | str):
+        """Drop every StatBox built from a user's stats"""
+        with self._lock:
+            for key in self._keys_by_user.pop(str(userid), ()):
+                self._boxes.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._boxes.clear()
+            self._keys_by_user.clear()
+
+
+statbox_cache = StatBoxCache()
+
+
 def bool_to_icon(value: bool) -> str:
     CHK_Y = "✅"
     CHK_N = "❎"
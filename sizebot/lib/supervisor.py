@@ -0,0 +1,126 @@
+"""Run SizeBot as several worker processes, each with its own share of the shards, and restart any that crash.
+
+A worker that exits cleanly (someone ran `&halt`, say) stops the whole bot, so every other worker is stopped too.
+A worker that crashes is restarted, waiting longer after each crash in a row, up to a minute.
+"""
+from __future__ import annotations
+from collections.abc import Callable
+
+import logging
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+from sizebot.lib import shards
+
+logger = logging.getLogger("sizebot")
+
+RESTART_DELAY_MIN = 1
+RESTART_DELAY_MAX = 60
+# A worker that stays up this long is healthy again, and its restart delay starts over
+HEALTHY_SECONDS = 60
+# How long workers get to shut down before they're killed
+STOP_TIMEOUT = 30
+POLL_INTERVAL = 1
+
+Popen = Callable[[list[str]], subprocess.Popen]
+
+
+@dataclass
+class Worker:
+    info: shards.ShardInfo
+    process: subprocess.Popen | None = None
+    started: float = 0
+    crashes: int = 0
+    restart_at: float | None = None
+
+    @property
+    def command(self) -> list[str]:
+        return [sys.executable, "-m", "sizebot",
+                "--worker", str(self.info.worker),
+                "--shard-count", str(self.info.shard_count),
+                "--shards", ",".join(str(s) for s in self.info.shard_ids)]
+
+    def restart_delay(self) -> float:
+        return min(RESTART_DELAY_MAX, RESTART_DELAY_MIN * 2 ** (self.crashes - 1))
+
+
+class Supervisor:
+    def __init__(self, workers: int, shard_count: int, *, popen: Popen = subprocess.Popen):
+        self.workers = [
+            Worker(shards.ShardInfo(shard_count, shard_ids, worker))
+            for worker, shard_ids in enumerate(shards.split(shard_count, workers))
+        ]
+        self.popen = popen
+        self.stopping = False
+
+    def start(self, worker: Worker, now: float):
+        logger.info(f"Starting {worker.info}.")
+        worker.process = self.popen(worker.command)
+        worker.started = now
+        worker.restart_at = None
+
+    def start_all(self):
+        now = time.monotonic()
+        for worker in self.workers:
+            self.start(worker, now)
+
+    def poll(self, now: float) -> bool:
+        """Check on every worker, restarting crashed ones once their delay is up. Returns False once everything has stopped."""
+        for worker in self.workers:
+            if worker.process is None:
+                if worker.restart_at is not None and now >= worker.restart_at and not self.stopping:
+                    self.start(worker, now)
+                continue
+            code = worker.process.poll()
+            if code is None:
+                continue
+            worker.process = None
+            if code == 0 or self.stopping:
+                logger.info(f"Worker {worker.info.worker} stopped.")
+                self.stop()
+                continue
+            if now - worker.started >= HEALTHY_SECONDS:
+                worker.crashes = 0
+            worker.crashes += 1
+            delay = worker.restart_delay()
+            worker.restart_at = now + delay
+            logger.error(f"Worker {worker.info.worker} exited with code {code}, restarting in {delay}s.")
+        return any(w.process is not None for w in self.workers) or (not self.stopping)
+
+    def stop(self):
+        """Ask every worker to shut down"""
+        self.stopping = True
+        for worker in self.workers:
+            worker.restart_at = None
+            if worker.process is not None and worker.process.poll() is None:
+                worker.process.terminate()
+
+    def wait(self):
+        deadline = time.monotonic() + STOP_TIMEOUT
+        for worker in self.workers:
+            if worker.process is None:
+                continue
+            try:
+                worker.process.wait(max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                logger.error(f"Worker {worker.info.worker} didn't stop in time, killing it.")
+                worker.process.kill()
+                worker.process.wait()
+
+    def run(self):
+        def on_signal(signum: int, frame: object):
+            logger.info("Stopping every worker.")
+            self.stop()
+        signal.signal(signal.SIGINT, on_signal)
+        signal.signal(signal.SIGTERM, on_signal)
+
+        self.start_all()
+        try:
+            while self.poll(time.monotonic()):
+                time.sleep(POLL_INTERVAL)
+        finally:
+            self.stop()
+            self.wait()
@@ -1,32 +1,47 @@
 from typing import Any
 from sizebot.lib.units import SV
 
+from collections import Counter
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import json
+import os
 
 import arrow
 
 from sizebot import __version__
-from sizebot.lib import paths
+from sizebot.lib import filelock, iopool, paths
+
+
+# How often the command count summary is brought up to date, in seconds
+COUNTS_INTERVAL = 60 * 60
 
 
 class ExistingDateException(Exception):
     pass
 
 
+def _append(filepath: Path, line: str):
+    paths.telemetrypath.mkdir(exist_ok = True)
+    with filepath.open("a") as f:
+        f.write(line + "\n")
+
+
 class TelemetryMessage:
-    def save(self):
+    def _line(self) -> str:
         data = self.toJSON()
         if "date" in data:
             raise ExistingDateException
         data["date"] = arrow.now().timestamp()
         data["version"] = __version__
-        stringified = json.dumps(data)
-        paths.telemetrypath.mkdir(exist_ok = True)
-        filepath = paths.telemetrypath / self.filename
-        with filepath.open("a") as f:
-            f.write(stringified + "\n")
+        return json.dumps(data)
+
+    def save(self):
+        _append(paths.telemetrypath / self.filename, self._line())
+
+    async def asave(self):
+        """`save()`, with the line written on the I/O pool"""
+        await iopool.run(("telemetry", self.filename), _append, paths.telemetrypath / self.filename, self._line())
 
     def toJSON(self) -> Any:
         return asdict(self)
@@ -38,6 +53,50 @@ class CommandRun(TelemetryMessage):
     filename = Path("command_run.ndjson")
 
 
+def _read_command_counts() -> tuple[int | None, int, Counter[str]]:
+    try:
+        data = json.loads(paths.commandcountspath.read_text())
+        return data.get("inode"), data["offset"], Counter(data["counts"])
+    except (FileNotFoundError, ValueError, KeyError, TypeError, AttributeError):
+        return None, 0, Counter()
+
+
+def command_counts() -> Counter[str]:
+    """How many times each command has been run, according to the CommandRun telemetry.
+
+    The totals are kept in a small summary file along with which CommandRun file they've counted and how far into it,
+    so only the lines added since then are read.
+    """
+    counted_inode, offset, counts = _read_command_counts()
+    try:
+        with (paths.telemetrypath / CommandRun.filename).open("rb") as f:
+            inode = os.fstat(f.fileno()).st_ino
+            # The file was rotated since the summary was written, so keep the totals and count the new one from the start
+            if (counted_inode is not None and inode != counted_inode) or f.seek(0, 2) < offset:
+                offset = 0
+            f.seek(offset)
+            end = offset
+            for line in f:
+                # Leave a line that's still being written for next time
+                if not line.endswith(b"\n"):
+                    break
+                end += len(line)
+                try:
+                    counts[json.loads(line)["name"]] += 1
+                except (ValueError, KeyError):
+                    continue
+    except FileNotFoundError:
+        return counts
+    if end != offset or inode != counted_inode:
+        filelock.write_atomic(paths.commandcountspath, json.dumps({"inode": inode, "offset": end, "counts": counts}))
+    return counts
+
+
+async def update_command_counts():
+    """Bring the command count summary up to date on the I/O pool, so the next start has little left to read"""
+    await iopool.run(("telemetry", CommandRun.filename), command_counts)
+
+
 @dataclass
 class ObjectUsed(TelemetryMessage):
     name: str
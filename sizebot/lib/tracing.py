@@ -0,0 +1,251 @@
+"""Trace where the time in a command goes: parsing, argument conversion, storage, stat building, or sending.
+
+Every command run while tracing is on becomes a trace, made of nested spans:
+
+    with tracing.span("userdb.load", userid = userid):
+        ...
+
+Spans find their parent through contextvars, so they nest properly across awaits, tasks, and I/O pool jobs.
+Outside a trace, a span does nothing. A finished trace is written out if it was sampled, or if it was slow.
+
+Traces are written one event per line to a rotating file, in the Chrome trace event format, on the I/O pool.
+`python -m sizebot.lib.tracing traces.ndjson > trace.json` turns that into a file Perfetto or chrome://tracing can open.
+"""
+from __future__ import annotations
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+from sizebot.lib import iopool, metrics
+
+logger = logging.getLogger("sizebot")
+
+_trace: contextvars.ContextVar[Trace | None] = contextvars.ContextVar("trace", default = None)
+_parent: contextvars.ContextVar[Span | None] = contextvars.ContextVar("span", default = None)
+_ids = itertools.count(1)
+
+
+class Span:
+    # __slots__ declares to python what attributes to expect.
+    __slots__ = ["name", "id", "parent_id", "start", "end", "thread", "attrs"]
+
+    def __init__(self, name: str, parent: Span | None, attrs: dict[str, Any]):
+        self.name = name
+        self.id = next(_ids)
+        self.parent_id = parent.id if parent is not None else None
+        self.start = time.perf_counter()
+        self.end: float | None = None
+        self.thread = threading.get_ident()
+        self.attrs = attrs
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+class Trace:
+    def __init__(self):
+        self.id = next(_ids)
+        self.spans: list[Span] = []
+        # perf_counter is precise but has no fixed start, so note the wall clock once to line traces up
+        self.wall_start = time.time()
+        self.perf_start = time.perf_counter()
+
+    def to_events(self) -> list[dict[str, Any]]:
+        """This trace as Chrome trace "complete" events"""
+        pid = os.getpid()
+        threads = {self.spans[-1].thread: self.id} if self.spans else {}
+        events = []
+        for s in sorted(self.spans, key = lambda s: s.start):
+            # Spans from I/O pool threads get their own rows, so they don't seem to overlap the event loop's spans
+            tid = threads.setdefault(s.thread, self.id * 100 + len(threads))
+            events.append({
+                "name": s.name,
+                "cat": "sizebot",
+                "ph": "X",
+                "ts": round((self.wall_start + s.start - self.perf_start) * 1_000_000),
+                "dur": round(s.duration * 1_000_000),
+                "pid": pid,
+                "tid": tid,
+                "args": {"trace": self.id, "span": s.id, "parent": s.parent_id, **{k: str(v) for k, v in s.attrs.items() if v is not None}}
+            })
+        return events
+
+
+class FileExporter:
+    """Write traces to an ndjson file, starting a new one when it gets too big and keeping a few old ones"""
+
+    def __init__(self, path: Path, *, max_bytes: int = 10_000_000, backups: int = 3):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+
+    def backup_path(self, n: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}.{n}{self.path.suffix}")
+
+    def _rotate(self):
+        for n in range(self.backups - 1, 0, -1):
+            if self.backup_path(n).exists():
+                self.backup_path(n).replace(self.backup_path(n + 1))
+        if self.backups:
+            self.path.replace(self.backup_path(1))
+        else:
+            self.path.unlink()
+
+    def export(self, trace: Trace):
+        lines = "".join(json.dumps(e) + "\n" for e in trace.to_events())
+        with self._lock:
+            self.path.parent.mkdir(parents = True, exist_ok = True)
+            if self.path.exists() and self.path.stat().st_size + len(lines) > self.max_bytes:
+                self._rotate()
+            with open(self.path, "a") as f:
+                f.write(lines)
+
+
+class Tracer:
+    def __init__(self, exporter: FileExporter, *, sample_rate: float = 0.01, slow_seconds: float | None = None):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.slow_seconds = slow_seconds
+        self._tasks: set[asyncio.Task] = set()
+
+    def _export(self, trace: Trace):
+        try:
+            self.exporter.export(trace)
+        except OSError as e:
+            logger.error(f"Failed to write a trace: {e}")
+
+    def finish(self, trace: Trace, duration: float):
+        slow = self.slow_seconds is not None and duration >= self.slow_seconds
+        if not slow and random.random() >= self.sample_rate:
+            return
+        metrics.inc("traces_exported_total", reason = "slow" if slow else "sampled")
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Traced outside the bot (like a script), so there's no event loop to keep free
+            self._export(trace)
+            return
+        task = asyncio.create_task(iopool.run(("traces", self.exporter.path), self._export, trace))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self):
+        """Wait for every trace handed to the I/O pool to be written"""
+        await asyncio.gather(*self._tasks, return_exceptions = True)
+
+
+_tracer: Tracer | None = None
+
+
+def configure(tracer: Tracer | None):
+    """Start tracing with `tracer`, or stop tracing with None"""
+    global _tracer
+    _tracer = tracer
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+async def flush():
+    if _tracer is not None:
+        await _tracer.flush()
+
+
+def current_span() -> Span | None:
+    return _parent.get()
+
+
+@contextlib.contextmanager
+def trace(name: str, **attrs: Any) -> Iterator[Span | None]:
+    """Start a new trace, unless tracing is off. Inside another trace, this is just a span."""
+    tracer = _tracer
+    if tracer is None or _trace.get() is not None:
+        with span(name, **attrs) as s:
+            yield s
+        return
+    t = Trace()
+    token = _trace.set(t)
+    try:
+        with span(name, **attrs) as root:
+            yield root
+    finally:
+        _trace.reset(token)
+        tracer.finish(t, root.duration)
+
+
+@contextlib.contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span | None]:
+    """Time the with-block as part of the current trace, if there is one"""
+    t = _trace.get()
+    if t is None:
+        yield None
+        return
+    s = Span(name, _parent.get(), attrs)
+    token = _parent.set(s)
+    try:
+        yield s
+    finally:
+        s.end = time.perf_counter()
+        _parent.reset(token)
+        t.spans.append(s)
+
+
+def traced(name: str | None = None) -> Callable:
+    """Make every call to the decorated function (or coroutine function) a span"""
+    def wrapper(fn: Callable) -> Callable:
+        spanname = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def awrapped(*args, **kwargs) -> Any:
+                if _trace.get() is None:
+                    return await fn(*args, **kwargs)
+                with span(spanname):
+                    return await fn(*args, **kwargs)
+            return awrapped
+
+        @functools.wraps(fn)
+        def wrapped(*args, **kwargs) -> Any:
+            if _trace.get() is None:
+                return fn(*args, **kwargs)
+            with span(spanname):
+                return fn(*args, **kwargs)
+        return wrapped
+    return wrapper
+
+
+def to_chrome_trace(lines: Iterable[str]) -> dict[str, Any]:
+    """Turn lines from the trace file into a Chrome trace JSON object"""
+    return {"traceEvents": [json.loads(line) for line in lines if line.strip()], "displayTimeUnit": "ms"}
+
+
+def main(argv: list[str]) -> int:
+    if not argv:
+        print("Usage: python -m sizebot.lib.tracing TRACEFILE...", file = sys.stderr)
+        return 1
+    lines = []
+    for filename in argv:
+        with open(filename) as f:
+            lines.extend(f)
+    json.dump(to_chrome_trace(lines), sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
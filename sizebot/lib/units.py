@@ -15,7 +15,8 @@ from sizebot.lib.loglevels import EGG
 import sizebot.data
 import sizebot.data.units
 from sizebot.lib import errors
-from sizebot.lib.digidecimal import BaseDecimal, DecimalSpec, RawDecimal
+from sizebot.lib.digidecimal import (BaseDecimal, DecimalSpec, Operator, RawDecimal, raw_add, raw_radd, raw_sub, raw_rsub, raw_mul,
+                                     raw_rmul, raw_truediv, raw_rtruediv, raw_floordiv, raw_rfloordiv, raw_mod, raw_rmod, raw_pow, raw_rpow)
 from sizebot.lib.types import BotContext
 
 
@@ -355,6 +356,7 @@ DimType = TypeVar("DimType", bound="Dimension")
 
 class Dimension(BaseDecimal):
     """Dimension"""
+    __slots__ = []
     _nicename: str
     _units: UnitRegistry
     _systems: dict[str, SystemRegistry]
@@ -446,29 +448,23 @@ class Dimension(BaseDecimal):
 
 
 class Decimal(BaseDecimal):
+    __slots__ = []
+
     # Decimal + Decimal = Decimal
     def __add__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__add__(other))
-        raise NotImplementedError
+        return ADD.apply(self, other)
 
     # Decimal + Decimal = Decimal
     def __radd__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__radd__(other))
-        raise NotImplementedError
+        return RADD.apply(self, other)
 
     # Decimal - Decimal = Decimal
     def __sub__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__sub__(other))
-        raise NotImplementedError
+        return SUB.apply(self, other)
 
     # Decimal - Decimal = Decimal
     def __rsub__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__rsub__(other))
-        raise NotImplementedError
+        return RSUB.apply(self, other)
 
     # Decimal * Decimal = Decimal
     @overload
@@ -506,21 +502,7 @@ class Decimal(BaseDecimal):
         ...
 
     def __mul__(self, other: SV | WV | TV | AV | VV | RV | Decimal | int) -> SV | WV | TV | AV | VV | RV | Decimal:
-        if isinstance(other, SV):
-            return SV(super().__mul__(other))
-        if isinstance(other, WV):
-            return WV(super().__mul__(other))
-        if isinstance(other, TV):
-            return TV(super().__mul__(other))
-        if isinstance(other, AV):
-            return AV(super().__mul__(other))
-        if isinstance(other, VV):
-            return VV(super().__mul__(other))
-        if isinstance(other, RV):
-            return RV(super().__mul__(other))
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__mul__(other))
-        raise NotImplementedError
+        return MUL.apply(self, other)
 
     # Decimal * Decimal = Decimal
     @overload
@@ -558,27 +540,11 @@ class Decimal(BaseDecimal):
         ...
 
     def __rmul__(self, other: SV | WV | TV | AV | VV | RV | Decimal | int) -> SV | WV | TV | AV | VV | RV | Decimal:
-        if isinstance(other, SV):
-            return SV(super().__rmul__(other))
-        if isinstance(other, WV):
-            return WV(super().__rmul__(other))
-        if isinstance(other, TV):
-            return TV(super().__rmul__(other))
-        if isinstance(other, AV):
-            return AV(super().__rmul__(other))
-        if isinstance(other, VV):
-            return VV(super().__rmul__(other))
-        if isinstance(other, RV):
-            return RV(super().__rmul__(other))
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__rmul__(other))
-        raise NotImplementedError
+        return RMUL.apply(self, other)
 
     # Decimal / Decimal = Decimal
     def __truediv__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__truediv__(other))
-        raise NotImplementedError
+        return TRUEDIV.apply(self, other)
 
     # Decimal / Decimal = Decimal
     @overload
@@ -616,71 +582,39 @@ class Decimal(BaseDecimal):
         ...
 
     def __rtruediv__(self, other: SV | WV | TV | AV | VV | RV | Decimal | int) -> SV | WV | TV | AV | VV | RV | Decimal:
-        if isinstance(other, SV):
-            return SV(super().__rtruediv__(other))
-        if isinstance(other, WV):
-            return WV(super().__rtruediv__(other))
-        if isinstance(other, TV):
-            return TV(super().__rtruediv__(other))
-        if isinstance(other, AV):
-            return AV(super().__rtruediv__(other))
-        if isinstance(other, VV):
-            return VV(super().__rtruediv__(other))
-        if isinstance(other, RV):
-            return RV(super().__rtruediv__(other))
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__rtruediv__(other))
-        raise NotImplementedError
+        return RTRUEDIV.apply(self, other)
 
     # Decimal / Decimal = Decimal
     def __floordiv__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__floordiv__(other))
-        raise NotImplementedError
+        return FLOORDIV.apply(self, other)
 
     # Decimal / Decimal = Decimal
     def __rfloordiv__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__rfloordiv__(other))
-        raise NotImplementedError
+        return RFLOORDIV.apply(self, other)
 
     # Decimal % Decimal = Decimal
     def __mod__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__mod__(other))
-        raise NotImplementedError
+        return MOD.apply(self, other)
 
     # Decimal % Decimal = Decimal
     def __rmod__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__rmod__(other))
-        raise NotImplementedError
+        return RMOD.apply(self, other)
 
     # divmod(Decimal, Decimal) = (Decimal, Decimal)
     def __divmod__(self, other: Decimal | int) -> tuple[Decimal, Decimal]:
-        if isinstance(other, Decimal | int):
-            quotient, remainder = super().__divmod__(other)
-            return Decimal(quotient), Decimal(remainder)
-        raise NotImplementedError
+        return FLOORDIV.apply(self, other), MOD.apply(self, other)
 
     # divmod(Decimal, Decimal) = (Decimal, Decimal)
     def __rdivmod__(self, other: Decimal | int) -> tuple[Decimal, Decimal]:
-        if isinstance(other, Decimal | int):
-            quotient, remainder = super().__rdivmod__(other)
-            return Decimal(quotient), Decimal(remainder)
-        raise NotImplementedError
+        return RFLOORDIV.apply(self, other), RMOD.apply(self, other)
 
     # Decimal ** Decimal = Decimal
     def __pow__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__pow__(other))
-        raise NotImplementedError
+        return POW.apply(self, other)
 
     # Decimal ** Decimal = Decimal
     def __rpow__(self, other: Decimal | int) -> Decimal:
-        if isinstance(other, Decimal | int):
-            return Decimal(super().__rpow__(other))
-        raise NotImplementedError
+        return RPOW.apply(self, other)
 
     # Decimal.log10() = Decimal
     def log10(self) -> Decimal:
@@ -693,6 +627,7 @@ class Decimal(BaseDecimal):
 
 class SV(Dimension):
     """Size Value (length in meters)"""
+    __slots__ = []
     _nicename = "size"
     _units = UnitRegistry()
     _systems = {}
@@ -746,27 +681,19 @@ class SV(Dimension):
     # Math Methods
     # SV + SV = SV
     def __add__(self, other: SV) -> SV:
-        if isinstance(other, SV):
-            return SV(super().__add__(other))
-        raise NotImplementedError
+        return ADD.apply(self, other)
 
     # SV + SV = SV
     def __radd__(self, other: SV) -> SV:
-        if isinstance(other, SV):
-            return SV(super().__radd__(other))
-        raise NotImplementedError
+        return RADD.apply(self, other)
 
     # SV - SV = SVZ
     def __sub__(self, other: SV) -> SV:
-        if isinstance(other, SV):
-            return SV(super().__sub__(other))
-        raise NotImplementedError
+        return SUB.apply(self, other)
 
     # SV - SV = SVZ
     def __rsub__(self, other: SV) -> SV:
-        if isinstance(other, SV):
-            return SV(super().__rsub__(other))
-        raise NotImplementedError
+        return RSUB.apply(self, other)
 
     # SV * Decimal = SV
     @overload
@@ -784,13 +711,7 @@ class SV(Dimension):
         ...
 
     def __mul__(self, other: SV | AV | Decimal | int) -> SV | AV | VV:
-        if isinstance(other, Decimal | int):
-            return SV(super().__mul__(other))
-        if isinstance(other, SV):
-            return AV(super().__mul__(other))
-        if isinstance(other, AV):
-            return VV(super().__mul__(other))
-        raise NotImplementedError
+        return MUL.apply(self, other)
 
     # Decimal * SV  = SV
     @overload
@@ -808,13 +729,7 @@ class SV(Dimension):
         ...
 
     def __rmul__(self, other: SV | AV | Decimal | int) -> SV | AV | VV:
-        if isinstance(other, Decimal | int):
-            return SV(super().__rmul__(other))
-        if isinstance(other, SV):
-            return AV(super().__rmul__(other))
-        if isinstance(other, AV):
-            return VV(super().__rmul__(other))
-        raise NotImplementedError
+        return RMUL.apply(self, other)
 
     # SV / Decimal = SV
     @overload
@@ -837,15 +752,7 @@ class SV(Dimension):
         ...
 
     def __truediv__(self, other: Decimal | int | SV | TV | RV) -> Decimal | SV | RV | TV:
-        if isinstance(other, Decimal | int):
-            return SV(super().__truediv__(other))
-        if isinstance(other, SV):
-            return Decimal(super().__truediv__(other))
-        if isinstance(other, TV):
-            return RV(super().__truediv__(other))
-        if isinstance(other, RV):
-            return TV(super().__truediv__(other))
-        raise NotImplementedError
+        return TRUEDIV.apply(self, other)
 
     # SV / SV = Decimal
     @overload
@@ -863,37 +770,23 @@ class SV(Dimension):
         ...
 
     def __rtruediv__(self, other: SV | AV | VV) -> Decimal | SV | AV:
-        if isinstance(other, SV):
-            return Decimal(super().__rtruediv__(other))
-        if isinstance(other, AV):
-            return SV(super().__rtruediv__(other))
-        if isinstance(other, VV):
-            return AV(super().__rtruediv__(other))
-        raise NotImplementedError
+        return RTRUEDIV.apply(self, other)
 
     # SV // SV = Decimal
     def __floordiv__(self, other: SV) -> Decimal:
-        if isinstance(other, SV):
-            return Decimal(super().__floordiv__(other))
-        raise NotImplementedError
+        return FLOORDIV.apply(self, other)
 
     # SV // SV = Decimal
     def __rfloordiv__(self, other: SV) -> Decimal:
-        if isinstance(other, SV):
-            return Decimal(super().__rfloordiv__(other))
-        raise NotImplementedError
+        return RFLOORDIV.apply(self, other)
 
     # SV % SV = SV
     def __mod__(self, other: SV) -> SV:
-        if isinstance(other, SV):
-            return SV(super().__mod__(other))
-        raise NotImplementedError
+        return MOD.apply(self, other)
 
     # SV % SV = SV
     def __rmod__(self, other: SV) -> SV:
-        if isinstance(other, SV):
-            return SV(super().__rmod__(other))
-        raise NotImplementedError
+        return RMOD.apply(self, other)
 
     # divmod(SV, SV) = (Decimal, SV)
     def __divmod__(self, other: SV) -> tuple[Decimal, SV]:
@@ -957,6 +850,7 @@ class SV(Dimension):
 
 class WV(Dimension):
     """Weight Value (mass in grams)"""
+    __slots__ = []
     _nicename = "weight"
     _units = UnitRegistry()
     _systems = {}
@@ -988,39 +882,27 @@ class WV(Dimension):
     # Math Methods
     # WV + WV = WV
     def __add__(self, other: WV) -> WV:
-        if isinstance(other, WV):
-            return WV(super().__add__(other))
-        raise NotImplementedError
+        return ADD.apply(self, other)
 
     # WV + WV = WV
     def __radd__(self, other: WV) -> WV:
-        if isinstance(other, WV):
-            return WV(super().__radd__(other))
-        raise NotImplementedError
+        return RADD.apply(self, other)
 
     # WV - WV = WV
     def __sub__(self, other: WV) -> WV:
-        if isinstance(other, WV):
-            return WV(super().__sub__(other))
-        raise NotImplementedError
+        return SUB.apply(self, other)
 
     # WV - WV = WV
     def __rsub__(self, other: WV) -> WV:
-        if isinstance(other, WV):
-            return WV(super().__rsub__(other))
-        raise NotImplementedError
+        return RSUB.apply(self, other)
 
     # WV * Decimal = WV
     def __mul__(self, other: Decimal | int) -> WV:
-        if isinstance(other, Decimal | int):
-            return WV(super().__mul__(other))
-        raise NotImplementedError
+        return MUL.apply(self, other)
 
     # Decimal * WV = WV
     def __rmul__(self, other: Decimal | int) -> WV:
-        if isinstance(other, Decimal | int):
-            return WV(super().__rmul__(other))
-        raise NotImplementedError
+        return RMUL.apply(self, other)
 
     # WV / Decimal = WV
     @overload
@@ -1033,41 +915,27 @@ class WV(Dimension):
         ...
 
     def __truediv__(self, other: Decimal | int | WV) -> Decimal | WV:
-        if isinstance(other, Decimal | int):
-            return WV(super().__truediv__(other))
-        if isinstance(other, WV):
-            return Decimal(super().__truediv__(other))
-        raise NotImplementedError
+        return TRUEDIV.apply(self, other)
 
     # WV / WV = Decimal
     def __rtruediv__(self, other: WV) -> Decimal:
-        if isinstance(other, WV):
-            return Decimal(super().__rtruediv__(other))
-        raise NotImplementedError
+        return RTRUEDIV.apply(self, other)
 
     # WV // WV = Decimal
     def __floordiv__(self, other: WV) -> Decimal:
-        if isinstance(other, WV):
-            return Decimal(super().__floordiv__(other))
-        raise NotImplementedError
+        return FLOORDIV.apply(self, other)
 
     # WV // WV = Decimal
     def __rfloordiv__(self, other: WV) -> Decimal:
-        if isinstance(other, WV):
-            return Decimal(super().__rfloordiv__(other))
-        raise NotImplementedError
+        return RFLOORDIV.apply(self, other)
 
     # WV % WV = WV
     def __mod__(self, other: WV) -> WV:
-        if isinstance(other, WV):
-            return WV(super().__mod__(other))
-        raise NotImplementedError
+        return MOD.apply(self, other)
 
     # WV % WV = WV
     def __rmod__(self, other: WV) -> WV:
-        if isinstance(other, WV):
-            return WV(super().__rmod__(other))
-        raise NotImplementedError
+        return RMOD.apply(self, other)
 
     # divmod(WV, WV) = (Decimal, WV)
     def __divmod__(self, other: WV) -> tuple[Decimal, WV]:
@@ -1117,6 +985,7 @@ class WV(Dimension):
 
 class TV(Dimension):
     """Time Value (time in seconds)"""
+    __slots__ = []
     _nicename = "time"
     _units = UnitRegistry()
     _systems = {}
@@ -1139,27 +1008,19 @@ class TV(Dimension):
     # Math Methods
     # TV + TV = TV
     def __add__(self, other: TV) -> TV:
-        if isinstance(other, TV):
-            return TV(super().__add__(other))
-        raise NotImplementedError
+        return ADD.apply(self, other)
 
     # TV + TV = TV
     def __radd__(self, other: TV) -> TV:
-        if isinstance(other, TV):
-            return TV(super().__radd__(other))
-        raise NotImplementedError
+        return RADD.apply(self, other)
 
     # TV - TV = TV
     def __sub__(self, other: TV) -> TV:
-        if isinstance(other, TV):
-            return TV(super().__sub__(other))
-        raise NotImplementedError
+        return SUB.apply(self, other)
 
     # TV - TV = TV
     def __rsub__(self, other: TV) -> TV:
-        if isinstance(other, TV):
-            return TV(super().__rsub__(other))
-        raise NotImplementedError
+        return RSUB.apply(self, other)
 
     # TV * Decimal = TV
     @overload
@@ -1172,17 +1033,11 @@ class TV(Dimension):
         ...
 
     def __mul__(self, other: Decimal | int | RV) -> SV | TV:
-        if isinstance(other, Decimal | int):
-            return TV(super().__mul__(other))
-        if isinstance(other, RV):
-            return SV(super().__mul__(other))
-        raise NotImplementedError
+        return MUL.apply(self, other)
 
     # Decimal * TV = TV
     def __rmul__(self, other: Decimal | int) -> TV:
-        if isinstance(other, Decimal | int):
-            return TV(super().__rmul__(other))
-        raise NotImplementedError
+        return RMUL.apply(self, other)
 
     # TV / Decimal = TV
     @overload
@@ -1195,41 +1050,27 @@ class TV(Dimension):
         ...
 
     def __truediv__(self, other: Decimal | int | TV) -> Decimal | TV:
-        if isinstance(other, Decimal | int):
-            return TV(super().__truediv__(other))
-        if isinstance(other, TV):
-            return Decimal(super().__truediv__(other))
-        raise NotImplementedError
+        return TRUEDIV.apply(self, other)
 
     # TV / TV = Decimal
     def __rtruediv__(self, other: TV) -> Decimal:
-        if isinstance(other, TV):
-            return Decimal(super().__rtruediv__(other))
-        raise NotImplementedError
+        return RTRUEDIV.apply(self, other)
 
     # TV // TV = Decimal
     def __floordiv__(self, other: TV) -> Decimal:
-        if isinstance(other, TV):
-            return Decimal(super().__floordiv__(other))
-        raise NotImplementedError
+        return FLOORDIV.apply(self, other)
 
     # TV // TV = Decimal
     def __rfloordiv__(self, other: TV) -> Decimal:
-        if isinstance(other, TV):
-            return Decimal(super().__rfloordiv__(other))
-        raise NotImplementedError
+        return RFLOORDIV.apply(self, other)
 
     # TV % TV = TV
     def __mod__(self, other: TV) -> TV:
-        if isinstance(other, TV):
-            return TV(super().__mod__(other))
-        raise NotImplementedError
+        return MOD.apply(self, other)
 
     # TV % TV = TV
     def __rmod__(self, other: TV) -> TV:
-        if isinstance(other, TV):
-            return TV(super().__rmod__(other))
-        raise NotImplementedError
+        return RMOD.apply(self, other)
 
     # divmod(TV, TV) = (Decimal, TV)
     def __divmod__(self, other: TV) -> tuple[Decimal, TV]:
@@ -1279,6 +1120,7 @@ class TV(Dimension):
 
 class AV(Dimension):
     """Area Value (area in meters-squared)"""
+    __slots__ = []
     _nicename = "area"
     _units = UnitRegistry()
     _systems = {}
@@ -1290,27 +1132,19 @@ class AV(Dimension):
     # Math Methods
     # AV + AV = AV
     def __add__(self, other: AV) -> AV:
-        if isinstance(other, AV):
-            return AV(super().__add__(other))
-        raise NotImplementedError
+        return ADD.apply(self, other)
 
     # AV + AV = AV
     def __radd__(self, other: AV) -> AV:
-        if isinstance(other, AV):
-            return AV(super().__radd__(other))
-        raise NotImplementedError
+        return RADD.apply(self, other)
 
     # AV - AV = AV
     def __sub__(self, other: AV) -> AV:
-        if isinstance(other, AV):
-            return AV(super().__sub__(other))
-        raise NotImplementedError
+        return SUB.apply(self, other)
 
     # AV - AV = AV
     def __rsub__(self, other: AV) -> AV:
-        if isinstance(other, AV):
-            return AV(super().__rsub__(other))
-        raise NotImplementedError
+        return RSUB.apply(self, other)
 
     # AV * Decimal = AV
     @overload
@@ -1323,11 +1157,7 @@ class AV(Dimension):
         ...
 
     def __mul__(self, other: Decimal | int | SV) -> AV | VV:
-        if isinstance(other, Decimal | int):
-            return AV(super().__mul__(other))
-        if isinstance(other, SV):
-            return VV(super().__mul__(other))
-        raise NotImplementedError
+        return MUL.apply(self, other)
 
     # Decimal * AV = AV
     @overload
@@ -1341,11 +1171,7 @@ class AV(Dimension):
 
     # Decimal * AV = AV
     def __rmul__(self, other: Decimal | int | SV) -> AV | VV:
-        if isinstance(other, Decimal | int):
-            return AV(super().__rmul__(other))
-        if isinstance(other, SV):
-            return VV(super().__rmul__(other))
-        raise NotImplementedError
+        return RMUL.apply(self, other)
 
     # AV / Decimal = AV
     @overload
@@ -1363,13 +1189,7 @@ class AV(Dimension):
         ...
 
     def __truediv__(self, other: Decimal | int | SV | AV) -> Decimal | SV | AV:
-        if isinstance(other, Decimal | int):
-            return AV(super().__truediv__(other))
-        if isinstance(other, SV):
-            return SV(super().__truediv__(other))
-        if isinstance(other, AV):
-            return Decimal(super().__truediv__(other))
-        raise NotImplementedError
+        return TRUEDIV.apply(self, other)
 
     # AV / AV = Decimal
     @overload
@@ -1382,35 +1202,23 @@ class AV(Dimension):
         ...
 
     def __rtruediv__(self, other: AV | VV) -> Decimal | SV:
-        if isinstance(other, AV):
-            return Decimal(super().__rtruediv__(other))
-        if isinstance(other, VV):
-            return SV(super().__rtruediv__(other))
-        raise NotImplementedError
+        return RTRUEDIV.apply(self, other)
 
     # AV // AV = Decimal
     def __floordiv__(self, other: AV) -> Decimal:
-        if isinstance(other, AV):
-            return Decimal(super().__floordiv__(other))
-        raise NotImplementedError
+        return FLOORDIV.apply(self, other)
 
     # AV // AV = Decimal
     def __rfloordiv__(self, other: AV) -> Decimal:
-        if isinstance(other, AV):
-            return Decimal(super().__rfloordiv__(other))
-        raise NotImplementedError
+        return RFLOORDIV.apply(self, other)
 
     # AV % AV = AV
     def __mod__(self, other: AV) -> AV:
-        if isinstance(other, AV):
-            return AV(super().__mod__(other))
-        raise NotImplementedError
+        return MOD.apply(self, other)
 
     # AV % AV = AV
     def __rmod__(self, other: AV) -> AV:
-        if isinstance(other, AV):
-            return AV(super().__rmod__(other))
-        raise NotImplementedError
+        return RMOD.apply(self, other)
 
     # divmod(AV, AV) = (Decimal, AV)
     def __divmod__(self, other: AV) -> tuple[Decimal, AV]:
@@ -1460,6 +1268,7 @@ class AV(Dimension):
 
 class VV(Dimension):
     """Area Value (area in meters-cubed)"""
+    __slots__ = []
     _nicename = "volume"
     _units = UnitRegistry()
     _systems = {}
@@ -1471,39 +1280,27 @@ class VV(Dimension):
     # Math Methods
     # VV + VV = VV
     def __add__(self, other: VV) -> VV:
-        if isinstance(other, VV):
-            return VV(super().__add__(other))
-        raise NotImplementedError
+        return ADD.apply(self, other)
 
     # VV + VV = VV
     def __radd__(self, other: VV) -> VV:
-        if isinstance(other, VV):
-            return VV(super().__radd__(other))
-        raise NotImplementedError
+        return RADD.apply(self, other)
 
     # VV - VV = VV
     def __sub__(self, other: VV) -> VV:
-        if isinstance(other, VV):
-            return VV(super().__sub__(other))
-        raise NotImplementedError
+        return SUB.apply(self, other)
 
     # VV - VV = VV
     def __rsub__(self, other: VV) -> VV:
-        if isinstance(other, VV):
-            return VV(super().__rsub__(other))
-        raise NotImplementedError
+        return RSUB.apply(self, other)
 
     # VV * Decimal = VV
     def __mul__(self, other: Decimal | int) -> VV:
-        if isinstance(other, Decimal | int):
-            return VV(super().__mul__(other))
-        raise NotImplementedError
+        return MUL.apply(self, other)
 
     # Decimal * VV = VV
     def __rmul__(self, other: Decimal | int) -> VV:
-        if isinstance(other, Decimal | int):
-            return VV(super().__rmul__(other))
-        raise NotImplementedError
+        return RMUL.apply(self, other)
 
     # VV / Decimal = VV
     @overload
@@ -1526,45 +1323,27 @@ class VV(Dimension):
         ...
 
     def __truediv__(self, other: Decimal | int | SV | AV | VV) -> Decimal | SV | AV | VV:
-        if isinstance(other, Decimal | int):
-            return VV(super().__truediv__(other))
-        if isinstance(other, SV):
-            return AV(super().__truediv__(other))
-        if isinstance(other, AV):
-            return SV(super().__truediv__(other))
-        if isinstance(other, VV):
-            return Decimal(super().__truediv__(other))
-        raise NotImplementedError
+        return TRUEDIV.apply(self, other)
 
     # VV / VV = Decimal
     def __rtruediv__(self, other: VV) -> Decimal:
-        if isinstance(other, VV):
-            return Decimal(super().__rtruediv__(other))
-        raise NotImplementedError
+        return RTRUEDIV.apply(self, other)
 
     # VV // VV = Decimal
     def __floordiv__(self, other: VV) -> Decimal:
-        if isinstance(other, VV):
-            return Decimal(super().__floordiv__(other))
-        raise NotImplementedError
+        return FLOORDIV.apply(self, other)
 
     # VV // VV = Decimal
     def __rfloordiv__(self, other: VV) -> Decimal:
-        if isinstance(other, VV):
-            return Decimal(super().__rfloordiv__(other))
-        raise NotImplementedError
+        return RFLOORDIV.apply(self, other)
 
     # VV % VV = VV
     def __mod__(self, other: VV) -> VV:
-        if isinstance(other, VV):
-            return VV(super().__mod__(other))
-        raise NotImplementedError
+        return MOD.apply(self, other)
 
     # VV % VV = VV
     def __rmod__(self, other: VV) -> VV:
-        if isinstance(other, VV):
-            return VV(super().__rmod__(other))
-        raise NotImplementedError
+        return RMOD.apply(self, other)
 
     # divmod(VV, VV) = (Decimal, VV)
     def __divmod__(self, other: VV) -> tuple[Decimal, VV]:
@@ -1614,6 +1393,7 @@ class VV(Dimension):
 
 class RV(Dimension):
     """Speed Value (meters per second)"""
+    __slots__ = []
     _nicename = "speed"
     _units = UnitRegistry()
     _systems = {}
@@ -1625,27 +1405,19 @@ class RV(Dimension):
     # Math Methods
     # RV + RV = RV
     def __add__(self, other: RV) -> RV:
-        if isinstance(other, RV):
-            return RV(super().__add__(other))
-        raise NotImplementedError
+        return ADD.apply(self, other)
 
     # RV + RV = RV
     def __radd__(self, other: RV) -> RV:
-        if isinstance(other, RV):
-            return RV(super().__radd__(other))
-        raise NotImplementedError
+        return RADD.apply(self, other)
 
     # RV - RV = RV
     def __sub__(self, other: RV) -> RV:
-        if isinstance(other, RV):
-            return RV(super().__sub__(other))
-        raise NotImplementedError
+        return SUB.apply(self, other)
 
     # RV - RV = RV
     def __rsub__(self, other: RV) -> RV:
-        if isinstance(other, RV):
-            return RV(super().__rsub__(other))
-        raise NotImplementedError
+        return RSUB.apply(self, other)
 
     # RV * TV = SV
     @overload
@@ -1659,11 +1431,7 @@ class RV(Dimension):
 
     # RV * Decimal = RV
     def __mul__(self, other: Decimal | int | TV) -> SV | RV:
-        if isinstance(other, Decimal | int):
-            return RV(super().__mul__(other))
-        if isinstance(other, TV):
-            return SV(super().__mul__(other))
-        raise NotImplementedError
+        return MUL.apply(self, other)
 
     # TV * RV = SV
     @overload
@@ -1677,11 +1445,7 @@ class RV(Dimension):
 
     # Decimal * RV = RV
     def __rmul__(self, other: Decimal | int | TV) -> SV | RV:
-        if isinstance(other, Decimal | int):
-            return RV(super().__rmul__(other))
-        if isinstance(other, TV):
-            return SV(super().__rmul__(other))
-        raise NotImplementedError
+        return RMUL.apply(self, other)
 
     # RV / Decimal = RV
     @overload
@@ -1694,41 +1458,27 @@ class RV(Dimension):
         ...
 
     def __truediv__(self, other: Decimal | int | RV) -> Decimal | RV:
-        if isinstance(other, Decimal | int):
-            return RV(super().__truediv__(other))
-        if isinstance(other, RV):
-            return Decimal(super().__truediv__(other))
-        raise NotImplementedError
+        return TRUEDIV.apply(self, other)
 
     # RV / RV = Decimal
     def __rtruediv__(self, other: RV) -> Decimal:
-        if isinstance(other, RV):
-            return Decimal(super().__rtruediv__(other))
-        raise NotImplementedError
+        return RTRUEDIV.apply(self, other)
 
     # RV // RV = Decimal
     def __floordiv__(self, other: RV) -> Decimal:
-        if isinstance(other, RV):
-            return Decimal(super().__floordiv__(other))
-        raise NotImplementedError
+        return FLOORDIV.apply(self, other)
 
     # RV // RV = Decimal
     def __rfloordiv__(self, other: RV) -> Decimal:
-        if isinstance(other, RV):
-            return Decimal(super().__rfloordiv__(other))
-        raise NotImplementedError
+        return RFLOORDIV.apply(self, other)
 
     # RV % RV = RV
     def __mod__(self, other: RV) -> RV:
-        if isinstance(other, RV):
-            return RV(super().__mod__(other))
-        raise NotImplementedError
+        return MOD.apply(self, other)
 
     # RV % RV = RV
     def __rmod__(self, other: RV) -> RV:
-        if isinstance(other, RV):
-            return RV(super().__rmod__(other))
-        raise NotImplementedError
+        return RMOD.apply(self, other)
 
     # divmod(RV, RV) = (Decimal, RV)
     def __divmod__(self, other: RV) -> tuple[Decimal, RV]:
@@ -1776,6 +1526,65 @@ class RV(Dimension):
         raise NotImplementedError
 
 
+
+# The dimension algebra: for each operator, the right-hand types each type accepts (checked in order), and the type of the result.
+# Anything else raises NotImplementedError.
+ADD = Operator(raw_add)
+RADD = Operator(raw_radd)
+SUB = Operator(raw_sub)
+RSUB = Operator(raw_rsub)
+MUL = Operator(raw_mul)
+RMUL = Operator(raw_rmul)
+TRUEDIV = Operator(raw_truediv)
+RTRUEDIV = Operator(raw_rtruediv)
+FLOORDIV = Operator(raw_floordiv)
+RFLOORDIV = Operator(raw_rfloordiv)
+MOD = Operator(raw_mod)
+RMOD = Operator(raw_rmod)
+POW = Operator(raw_pow)
+RPOW = Operator(raw_rpow)
+
+Scalar = (Decimal, int)
+DIMENSIONS: list[type[Dimension]] = [SV, WV, TV, AV, VV, RV]
+
+# Decimal (op) Decimal = Decimal
+for op in (ADD, RADD, SUB, RSUB, TRUEDIV, FLOORDIV, RFLOORDIV, MOD, RMOD, POW, RPOW):
+    op.define(Decimal, [(Scalar, Decimal)])
+# Decimal * SV = SV, SV / Decimal = SV, and so on
+for op in (MUL, RMUL, RTRUEDIV):
+    op.define(Decimal, [(dim, dim) for dim in DIMENSIONS] + [(Scalar, Decimal)])
+
+for dim in DIMENSIONS:
+    # SV + SV = SV, SV % SV = SV, and so on
+    for op in (ADD, RADD, SUB, RSUB, MOD, RMOD):
+        op.define(dim, [(dim, dim)])
+    # SV // SV = Decimal
+    for op in (FLOORDIV, RFLOORDIV):
+        op.define(dim, [(dim, Decimal)])
+    # SV / SV = Decimal
+    RTRUEDIV.define(dim, [(dim, Decimal)])
+    # SV * Decimal = SV, SV / Decimal = SV, SV / SV = Decimal
+    for op in (MUL, RMUL):
+        op.define(dim, [(Scalar, dim)])
+    TRUEDIV.define(dim, [(Scalar, dim), (dim, Decimal)])
+
+# SV * SV = AV, SV * AV = VV
+for op in (MUL, RMUL):
+    op.define(SV, [(Scalar, SV), (SV, AV), (AV, VV)])
+    op.define(AV, [(Scalar, AV), (SV, VV)])
+# TV * RV = SV
+MUL.define(TV, [(Scalar, TV), (RV, SV)])
+for op in (MUL, RMUL):
+    op.define(RV, [(Scalar, RV), (TV, SV)])
+# SV / TV = RV, SV / RV = TV
+TRUEDIV.define(SV, [(Scalar, SV), (SV, Decimal), (TV, RV), (RV, TV)])
+# AV / SV = SV, VV / SV = AV, VV / AV = SV
+TRUEDIV.define(AV, [(Scalar, AV), (SV, SV), (AV, Decimal)])
+TRUEDIV.define(VV, [(Scalar, VV), (SV, AV), (AV, SV), (VV, Decimal)])
+RTRUEDIV.define(SV, [(SV, Decimal), (AV, SV), (VV, AV)])
+RTRUEDIV.define(AV, [(AV, Decimal), (VV, SV)])
+
+
 INCH = Decimal("0.0254")
 
 def load_json_file(filename: str) -> Any | None:
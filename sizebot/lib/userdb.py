@@ -2,10 +2,11 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Literal, Any, TypeVar, cast, get_args
 
+import asyncio
 import json
+import weakref
 from copy import copy
 from functools import total_ordering
-import importlib.resources as pkg_resources
 from pathlib import Path
 
 import arrow
@@ -13,19 +14,20 @@ from arrow.arrow import Arrow
 
 import discord
 
-import sizebot.data
-from sizebot.lib import errors, paths
+from sizebot.lib import errors, iopool, metrics, paths, ranking, shards, tracing, watcher
 from sizebot.lib.diff import Diff
 from sizebot.lib.fakeplayer import FakePlayer
 from sizebot.lib.gender import Gender
+from sizebot.lib.models import get_models
 from sizebot.lib.units import SV, TV, WV, Decimal
 from sizebot.lib.unitsystem import UnitSystem
 from sizebot.lib.utils import truncate
-from sizebot.lib.stats import AVERAGE_HEIGHT, AVERAGE_WEIGHT, PlayerStats
+from sizebot.lib.stats import AVERAGE_HEIGHT, AVERAGE_WEIGHT, PlayerStats, statbox_cache
 
 BASICALLY_ZERO = Decimal("1E-27")
 
-modelJSON = json.loads(pkg_resources.read_text(sizebot.data, "models.json"))
+# Bump this, and teach migrate_json() the change, whenever the profile format changes
+SCHEMA_VERSION = 1
 
 MoveTypeStr = Literal["walk", "run", "climb", "crawl", "swim"]
 MOVETYPES = get_args(MoveTypeStr)
@@ -33,6 +35,9 @@ MOVETYPES = get_args(MoveTypeStr)
 MemberOrFake = discord.Member | FakePlayer
 MemberOrFakeOrSize = MemberOrFake | SV
 
+# A lock for each profile that's being changed, dropped once nobody holds or waits on it
+_locks: weakref.WeakValueDictionary[tuple[int, int], asyncio.Lock] = weakref.WeakValueDictionary()
+
 
 def str_or_none(v: Any) -> str | None:
     if v is None:
@@ -227,7 +232,7 @@ class User:
 
     @macrovision_model.setter
     def macrovision_model(self, value: str):
-        if value not in modelJSON.keys():
+        if value not in get_models():
             raise errors.InvalidMacrovisionModelException(value)
         self._macrovision_model = value
 
@@ -244,13 +249,14 @@ class User:
 
     @macrovision_view.setter
     def macrovision_view(self, value: str):
-        if value not in modelJSON[self.macrovision_model].keys():
+        if value not in get_models()[self.macrovision_model]:
             raise errors.InvalidMacrovisionViewException(self.macrovision_model, value)
         self._macrovision_view = value
 
     # Return an python dictionary for json exporting
     def toJSON(self) -> Any:
         return {
+            "version":          SCHEMA_VERSION,
             "guildid":          str(self.guildid),
             "id":               str(self.id),
             "nickname":         self.nickname,
@@ -292,7 +298,9 @@ class User:
     # Create a new object from a python dictionary imported using json
     @classmethod
     def fromJSON(cls, jsondata: dict[str, Any]) -> User:
-        jsondata = migrate_json(jsondata)
+        # `sizebot migrate` upgrades every saved profile at once, so old ones are rare
+        if jsondata.get("version") != SCHEMA_VERSION:
+            jsondata = migrate_json(jsondata)
         userdata = User()
         userdata.guildid = int(jsondata["guildid"])
         userdata.id = int(jsondata["id"])
@@ -378,26 +386,60 @@ def get_user_path(guildid: int, userid: int) -> Path:
     return get_guild_users_path(guildid) / f"{userid}.json"
 
 
+def encode(jsondata: Any) -> str:
+    """Profiles are saved without any whitespace. Indented JSON is bigger, and json can only encode it in pure Python."""
+    return json.dumps(jsondata, separators = (",", ":"))
+
+
+def _write(path: Path, jsondata: Any):
+    path.parent.mkdir(exist_ok = True, parents = True)
+    with metrics.timed("userdb_save_seconds"):
+        with open(path, "w") as f:
+            f.write(encode(jsondata))
+    watcher.wrote(path)
+
+
+def _saved(userdata: User):
+    """Keep the in-memory indexes up to date after a save"""
+    ranking.update(userdata)
+    statbox_cache.invalidate(userdata.id)
+
+
+@tracing.traced()
 def save(userdata: User):
     guildid = userdata.guildid
     userid = userdata.id
     if guildid is None or userid is None:
         raise errors.CannotSaveWithoutIDException
-    path = get_user_path(guildid, userid)
-    path.parent.mkdir(exist_ok = True, parents = True)
+    _write(get_user_path(guildid, userid), userdata.toJSON())
+    _saved(userdata)
+
+
+async def asave(userdata: User):
+    """`save()`, with the file written on the I/O pool"""
+    guildid = userdata.guildid
+    userid = userdata.id
+    if guildid is None or userid is None:
+        raise errors.CannotSaveWithoutIDException
+    # Take a snapshot now, so changes made while the write is queued don't end up half-saved
     jsondata = userdata.toJSON()
-    with open(path, "w") as f:
-        json.dump(jsondata, f, indent = 4)
+    # The ranked values are taken along with it, so the leaderboard matches what was written
+    values = ranking.values_for(userdata)
+    await iopool.run(("user", guildid, userid), _write, get_user_path(guildid, userid), jsondata)
+    await ranking.arecord(guildid, userid, values)
+    statbox_cache.invalidate(userid)
 
 
+@tracing.traced()
 def load(guildid: int, userid: int, *, member: discord.Member = None, allow_unreg: bool = False) -> User:
     path = get_user_path(guildid, userid)
-    try:
-        with open(path, "r") as f:
-            jsondata = json.load(f)
-    except FileNotFoundError:
-        raise errors.UserNotFoundException(guildid, userid)
-    user = User.fromJSON(jsondata)
+    with metrics.timed("userdb_load_seconds"):
+        try:
+            with open(path, "r") as f:
+                jsondata = json.load(f)
+        except FileNotFoundError:
+            raise errors.UserNotFoundException(guildid, userid)
+        user = User.fromJSON(jsondata)
     if member:
         if not user.gender:
             user.soft_gender = member.gender
@@ -409,9 +451,39 @@ def load(guildid: int, userid: int, *, member: discord.Member = None, allow_unre
     return user
 
 
-def delete(guildid: int, userid: int):
-    path = get_user_path(guildid, userid)
+def lock(guildid: int, userid: int) -> asyncio.Lock:
+    """Hold this from loading a profile to saving it, so two changes to the same profile can't overwrite each other.
+
+    Loads and saves are separate I/O pool jobs, so without it, another change can be saved in between and then lost.
+    """
+    key = (guildid, userid)
+    userlock = _locks.get(key)
+    if userlock is None:
+        userlock = _locks[key] = asyncio.Lock()
+    return userlock
+
+
+async def aload(guildid: int, userid: int, *, member: discord.Member = None, allow_unreg: bool = False) -> User:
+    """`load()`, with the file read on the I/O pool"""
+    return await iopool.run(("user", guildid, userid), load, guildid, userid, member = member, allow_unreg = allow_unreg)
+
+
+def _unlink(path: Path):
     path.unlink(missing_ok = True)
+    watcher.wrote(path)
+
+
+def delete(guildid: int, userid: int):
+    _unlink(get_user_path(guildid, userid))
+    ranking.remove(guildid, userid)
+    statbox_cache.invalidate(userid)
+
+
+async def adelete(guildid: int, userid: int):
+    """`delete()`, with the file removed on the I/O pool"""
+    await iopool.run(("user", guildid, userid), _unlink, get_user_path(guildid, userid))
+    await ranking.arecord(guildid, userid, None)
+    statbox_cache.invalidate(userid)
 
 
 def exists(guildid: int, userid: int, *, allow_unreg: bool = False) -> bool:
@@ -423,6 +495,10 @@ def exists(guildid: int, userid: int, *, allow_unreg: bool = False) -> bool:
     return exists
 
 
+async def aexists(guildid: int, userid: int, *, allow_unreg: bool = False) -> bool:
+    return await iopool.run(("user", guildid, userid), exists, guildid, userid, allow_unreg = allow_unreg)
+
+
 def count_profiles() -> int:
     users = list_users()
     usercount = len(list(users))
@@ -443,6 +519,51 @@ def list_users(*, guildid: int | None = None, userid: int | None = None) -> list
     return users
 
 
+def load_ranking(guildid: int) -> ranking.GuildRanking:
+    """A guild's leaderboards, built from every user in the guild the first time they're needed"""
+    guildranking = ranking.load(guildid)
+    if guildranking is None:
+        users = (load(guildid, userid, allow_unreg = True) for _, userid in list_users(guildid = guildid))
+        guildranking = ranking.build(guildid, users)
+    return guildranking
+
+
+async def aload_ranking(guildid: int) -> ranking.GuildRanking:
+    """`load_ranking()`, with the index read (or built from every profile) on the I/O pool"""
+    guildranking = ranking.loaded(guildid)
+    if guildranking is not None:
+        return guildranking
+    ranking.start_loading(guildid)
+    try:
+        return await iopool.run(("ranking", guildid), load_ranking, guildid)
+    finally:
+        await ranking.finish_loading(guildid)
+
+
+async def _on_file_change(event: watcher.FileEvent):
+    """Bring the caches built from profiles up to date with a profile that was changed outside this process"""
+    if event.kind == "all":
+        statbox_cache.clear()
+        # Any profile could have changed, so every leaderboard is rebuilt the next time it's asked for
+        ranking.forget()
+        guildids = await iopool.run("rankings", ranking.list_built)
+        await asyncio.gather(*(ranking.adiscard(guildid) for guildid in guildids if shards.owns(guildid)))
+        return
+    # Another worker's guild, whose leaderboards are that worker's to keep
+    if event.kind != "user" or not shards.owns(event.guildid):
+        return
+    statbox_cache.invalidate(event.userid)
+    try:
+        userdata = await aload(event.guildid, event.userid, allow_unreg = True)
+    except errors.UserNotFoundException:
+        await ranking.arecord(event.guildid, event.userid, None)
+    else:
+        await ranking.arecord(event.guildid, event.userid, ranking.values_for(userdata))
+
+
+watcher.subscribe(_on_file_change)
+
+
 def load_or_fake(arg: MemberOrFakeOrSize, *, allow_unreg: bool = False) -> User:
     if isinstance(arg, discord.Member):
         return load(arg.guild.id, arg.id, member=arg, allow_unreg=allow_unreg)
@@ -472,6 +593,26 @@ def load_or_fake_weight(arg: MemberOrFakeOrSize, *, allow_unreg: bool = False) -
         return arg
 
 
+async def aload_or_fake(arg: MemberOrFakeOrSize, *, allow_unreg: bool = False) -> User:
+    if isinstance(arg, discord.Member):
+        return await aload(arg.guild.id, arg.id, member=arg, allow_unreg=allow_unreg)
+    return load_or_fake(arg, allow_unreg=allow_unreg)
+
+
+async def aload_or_fake_height(arg: MemberOrFakeOrSize, *, allow_unreg: bool = False) -> SV:
+    if isinstance(arg, discord.Member):
+        user = await aload(arg.guild.id, arg.id, member=arg, allow_unreg=allow_unreg)
+        return user.height
+    return load_or_fake_height(arg, allow_unreg=allow_unreg)
+
+
+async def aload_or_fake_weight(arg: MemberOrFakeOrSize, *, allow_unreg: bool = False) -> WV:
+    if isinstance(arg, discord.Member):
+        user = await aload(arg.guild.id, arg.id, member=arg, allow_unreg=allow_unreg)
+        return user.weight
+    return load_or_fake_weight(arg, allow_unreg=allow_unreg)
+
+
 T = TypeVar("T")
 
 
@@ -482,6 +623,8 @@ def optional_parse(parser: Callable[[str], T], val: str | None) -> T | None:
 
 
 def migrate_json(jsondata: dict[str, Any]) -> dict[str, Any]:
+    """Bring a profile saved by an older SizeBot up to SCHEMA_VERSION"""
+    # Before version 1, profiles had no version, and fields were added whenever they were first missed
     if "allowchangefromothers" not in jsondata:
         jsondata["allowchangefromothers"] = False
     if "tra_reports" not in jsondata:
@@ -496,4 +639,5 @@ def migrate_json(jsondata: dict[str, Any]) -> dict[str, Any]:
                      "currentmovetype", "movestop", "button"]:
         if settable not in jsondata:
             jsondata[settable] = None
+    jsondata["version"] = SCHEMA_VERSION
     return jsondata
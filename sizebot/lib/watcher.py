@@ -0,0 +1,325 @@
+"""Notice when profiles and guild settings change on disk, so in-memory caches of them can be dropped.
+
+The bot isn't the only thing touching the guild store: `sizebotapi` reads it, other sharded workers write it,
+and admins sometimes edit profiles by hand. Caches subscribe to the changes here instead of trusting themselves.
+
+On Linux this uses inotify, so changes arrive straight away. Everywhere else (or when the inotify watch limit is hit),
+it polls the store every few seconds and compares each file's mtime, size and inode.
+Changes this process made itself are recognised and skipped, since its caches are already up to date.
+"""
+from __future__ import annotations
+from collections.abc import Awaitable, Callable
+from typing import Literal
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from sizebot.lib import iopool, metrics
+
+logger = logging.getLogger("sizebot")
+
+Stamp = tuple[int, int, int]
+
+
+@dataclass(frozen = True)
+class FileEvent:
+    # "all" means changes were missed, and everything should be treated as changed
+    kind: Literal["user", "guild", "all"]
+    guildid: int | None = None
+    userid: int | None = None
+
+
+Subscriber = Callable[[FileEvent], Awaitable[None] | None]
+
+_subscribers: list[Subscriber] = []
+_tasks: set[asyncio.Task] = set()
+# The stamp each file had right after this process last wrote it
+_own_stamps: dict[Path, Stamp | None] = {}
+_current: Watcher | None = None
+
+
+def subscribe(callback: Subscriber):
+    """Call `callback` with every change. It can be a coroutine function."""
+    _subscribers.append(callback)
+
+
+def unsubscribe(callback: Subscriber):
+    if callback in _subscribers:
+        _subscribers.remove(callback)
+
+
+def publish(event: FileEvent):
+    metrics.inc("watcher_events_total", kind = event.kind)
+    for callback in list(_subscribers):
+        try:
+            result = callback(event)
+        except Exception:
+            logger.exception(f"Error handling {event}.")
+            continue
+        if asyncio.iscoroutine(result):
+            task = asyncio.ensure_future(result)
+            _tasks.add(task)
+            task.add_done_callback(_done)
+
+
+def _done(task: asyncio.Task):
+    _tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Error handling a file change.", exc_info = task.exception())
+
+
+def _stamp(path: Path) -> Stamp | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def wrote(path: Path):
+    """Note that this process just wrote (or deleted) a file, so the change it causes isn't reported back to it"""
+    if _current is None:
+        return
+    _own_stamps[Path(path)] = _stamp(path)
+
+
+def classify(root: Path, path: Path) -> FileEvent | None:
+    """What a path in the guild store holds, or None if it's nothing that's cached"""
+    try:
+        parts = path.relative_to(root).parts
+    except ValueError:
+        return None
+    if len(parts) == 2 and parts[0].isdigit() and parts[1] == "guild.json":
+        return FileEvent("guild", int(parts[0]))
+    if len(parts) == 3 and parts[0].isdigit() and parts[1] == "users" and parts[2].endswith(".json") and parts[2][:-5].isdigit():
+        return FileEvent("user", int(parts[0]), int(parts[2][:-5]))
+    return None
+
+
+def scan(root: Path) -> dict[Path, Stamp]:
+    """The stamp of every cached file in the guild store"""
+    stamps = {}
+    try:
+        guilddirs = list(os.scandir(root))
+    except FileNotFoundError:
+        return stamps
+    for guilddir in guilddirs:
+        if not (guilddir.name.isdigit() and guilddir.is_dir()):
+            continue
+        guildpath = Path(guilddir.path) / "guild.json"
+        stamp = _stamp(guildpath)
+        if stamp is not None:
+            stamps[guildpath] = stamp
+        try:
+            userfiles = list(os.scandir(Path(guilddir.path) / "users"))
+        except FileNotFoundError:
+            continue
+        for userfile in userfiles:
+            if userfile.name.endswith(".json"):
+                st = userfile.stat()
+                stamps[Path(userfile.path)] = (st.st_mtime_ns, st.st_size, st.st_ino)
+    return stamps
+
+
+class Watcher:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _changed(self, path: Path, stamp: Stamp | None):
+        event = classify(self.root, path)
+        if event is None:
+            return
+        if path in _own_stamps and _own_stamps[path] == stamp:
+            return
+        publish(event)
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+
+class LocalWatcher(Watcher):
+    """A watcher that only reports the changes it's told about, for tests"""
+
+    def changed(self, path: Path):
+        self._changed(Path(path), _stamp(path))
+
+
+class PollingWatcher(Watcher):
+    def __init__(self, root: Path, interval: float):
+        super().__init__(root)
+        self.interval = interval
+        self._stamps: dict[Path, Stamp] = {}
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        self._stamps = await iopool.run("watcher", scan, self.root)
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception:
+                logger.exception(f"Error polling {self.root}.")
+
+    async def check(self):
+        """Compare the store against the last check, and report every file that changed"""
+        stamps = await iopool.run("watcher", scan, self.root)
+        old, self._stamps = self._stamps, stamps
+        for path in old.keys() | stamps.keys():
+            if old.get(path) != stamps.get(path):
+                self._changed(path, stamps.get(path))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+# From <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher(Watcher):
+    """Watches the store root, every guild folder, and every guild's users folder (inotify doesn't watch subfolders by itself)"""
+
+    def __init__(self, root: Path):
+        super().__init__(root)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno = True)
+        self._fd: int | None = None
+        self._paths: dict[int, Path] = {}
+
+    @staticmethod
+    def available() -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+        libc = ctypes.util.find_library("c")
+        return libc is not None and hasattr(ctypes.CDLL(libc), "inotify_init1")
+
+    def _check(self, result: int) -> int:
+        if result < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        return result
+
+    def _wanted(self, path: Path) -> bool:
+        parts = path.relative_to(self.root).parts
+        return (len(parts) == 0
+                or (len(parts) == 1 and parts[0].isdigit())
+                or (len(parts) == 2 and parts[0].isdigit() and parts[1] == "users"))
+
+    def _watch_tree(self, path: Path, *, report: bool = False):
+        """Watch a folder and the folders below it that matter. If `report` is set, report every file already in them."""
+        if not self._wanted(path):
+            return
+        wd = self._check(self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK))
+        self._paths[wd] = path
+        try:
+            entries = list(os.scandir(path))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if entry.is_dir():
+                self._watch_tree(Path(entry.path), report = report)
+            elif report:
+                self._changed(Path(entry.path), _stamp(entry.path))
+
+    async def start(self):
+        self.root.mkdir(exist_ok = True, parents = True)
+        self._fd = self._check(self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC))
+        try:
+            self._watch_tree(self.root)
+        except OSError:
+            await self.stop()
+            raise
+        asyncio.get_running_loop().add_reader(self._fd, self._read)
+
+    def _read(self):
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = os.fsdecode(data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0"))
+            offset += EVENT_HEADER.size + length
+            if mask & IN_Q_OVERFLOW:
+                logger.warning(f"Missed changes in {self.root}.")
+                publish(FileEvent("all"))
+                continue
+            if mask & IN_IGNORED:
+                self._paths.pop(wd, None)
+                continue
+            parent = self._paths.get(wd)
+            if parent is None:
+                continue
+            path = parent / name
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        self._watch_tree(path, report = True)
+                    except OSError as e:
+                        logger.error(f"Can't watch {path}: {e}")
+                continue
+            self._changed(path, _stamp(path))
+
+    async def stop(self):
+        if self._fd is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._fd)
+        os.close(self._fd)
+        self._fd = None
+        self._paths.clear()
+
+
+def current() -> Watcher | None:
+    return _current
+
+
+async def start(watcher: Watcher):
+    global _current
+    await watcher.start()
+    _current = watcher
+
+
+async def watch(root: Path, *, backend: Literal["auto", "inotify", "poll"] = "auto", interval: float = 5) -> Watcher:
+    """Start watching the guild store with the best watcher available"""
+    if backend != "poll" and InotifyWatcher.available():
+        try:
+            await start(InotifyWatcher(root))
+            return _current
+        except OSError as e:
+            if backend == "inotify":
+                raise
+            logger.warning(f"Can't watch {root} with inotify ({e}), polling every {interval}s instead.")
+    await start(PollingWatcher(root, interval))
+    return _current
+
+
+async def stop():
+    global _current
+    if _current is not None:
+        await _current.stop()
+        _current = None
+    _own_stamps.clear()
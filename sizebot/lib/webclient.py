@@ -0,0 +1,182 @@
+from __future__ import annotations
+from typing import Any
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+
+import aiohttp
+
+from sizebot.lib import utils
+
+logger = logging.getLogger("sizebot")
+
+DEFAULT_TIMEOUT = 10
+MAX_CONNECTIONS = 20
+MAX_CACHE_ENTRIES = 256
+
+
+class APIException(Exception):
+    def __init__(self, url: str, status: int):
+        self.url = url
+        self.status = status
+        super().__init__(f"The API at {url} returned a code {status}.")
+
+
+class Response:
+    __slots__ = ["url", "status", "body"]
+
+    def __init__(self, url: str, status: int, body: bytes):
+        self.url = url
+        self.status = status
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+
+    def text(self) -> str:
+        return self.body.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class _CacheEntry:
+    __slots__ = ["value", "fetched", "expires"]
+
+    def __init__(self, value: Any, fetched: float, expires: float):
+        self.value = value
+        self.fetched = fetched
+        self.expires = expires
+
+
+class WebClient:
+    """A shared, pooled HTTP client with a bounded TTL cache for JSON lookups.
+
+    `rewrites` maps URL prefixes to replacement prefixes, so tests can point the
+    real external APIs at a local stand-in server.
+    """
+
+    def __init__(self, *, timeout: float = DEFAULT_TIMEOUT, limit: int = MAX_CONNECTIONS, maxsize: int = MAX_CACHE_ENTRIES, rewrites: dict[str, str] | None = None):
+        self.timeout = timeout
+        self.limit = limit
+        self.maxsize = maxsize
+        self.rewrites = rewrites or {}
+        self._session: aiohttp.ClientSession | None = None
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def _session_for_loop(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit = self.limit)
+            timeout = aiohttp.ClientTimeout(total = self.timeout)
+            self._session = aiohttp.ClientSession(connector = connector, timeout = timeout)
+        return self._session
+
+    def _rewrite(self, url: str) -> str:
+        for prefix, replacement in self.rewrites.items():
+            if url.startswith(prefix):
+                return replacement + url.removeprefix(prefix)
+        return url
+
+    async def get(self, url: str) -> Response:
+        """Fetch a URL without caching"""
+        session = self._session_for_loop()
+        async with session.get(self._rewrite(url)) as r:
+            body = await r.read()
+            return Response(url, r.status, body)
+
+    def _store(self, url: str, value: Any, keep: float):
+        """Cache a response for `keep` seconds, making room by dropping expired entries, then the least recently used"""
+        now = time.monotonic()
+        self._cache[url] = _CacheEntry(value, now, now + keep)
+        self._cache.move_to_end(url)
+        if len(self._cache) > self.maxsize:
+            for key in [key for key, entry in self._cache.items() if entry.expires <= now]:
+                del self._cache[key]
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last = False)
+
+    async def _fetch_json(self, url: str, keep: float) -> Any:
+        r = await self.get(url)
+        if not r.ok:
+            raise APIException(url, r.status)
+        value = r.json()
+        if keep > 0:
+            self._store(url, value, keep)
+        return value
+
+    async def _fetch_json_once(self, url: str, keep: float) -> Any:
+        """Fetch a URL, sharing the request with any other caller already waiting on it"""
+        fut = self._inflight.get(url)
+        if fut is not None:
+            return await asyncio.shield(fut)
+        fut = asyncio.ensure_future(self._fetch_json(url, keep))
+        self._inflight[url] = fut
+        try:
+            return await asyncio.shield(fut)
+        finally:
+            if self._inflight.get(url) is fut:
+                del self._inflight[url]
+
+    async def _revalidate(self, url: str, keep: float):
+        try:
+            await self._fetch_json_once(url, keep)
+        except Exception as e:
+            logger.warning(f"Failed to refresh {url}, serving the stale copy")
+            logger.debug(utils.format_traceback(e))
+        finally:
+            self._refreshing.discard(url)
+
+    async def get_json(self, url: str, *, ttl: float = 0, stale: float = 0) -> Any:
+        """Fetch and decode a JSON URL.
+
+        Responses younger than `ttl` seconds are served from the cache. Responses younger
+        than `ttl + stale` seconds are served from the cache while a fresh copy is fetched
+        in the background.
+        """
+        keep = ttl + stale
+        entry = self._cache.get(url)
+        if entry is not None:
+            now = time.monotonic()
+            if now >= entry.expires:
+                del self._cache[url]
+                entry = None
+        if entry is not None:
+            self._cache.move_to_end(url)
+            age = now - entry.fetched
+            if age < ttl:
+                self.hits += 1
+                return entry.value
+            if age < keep:
+                self.hits += 1
+                if url not in self._refreshing:
+                    self._refreshing.add(url)
+                    task = asyncio.create_task(self._revalidate(url, keep))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                return entry.value
+        self.misses += 1
+        return await self._fetch_json_once(url, keep)
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    async def close(self):
+        """Stop any background refreshes and close the connection pool"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions = True)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+client = WebClient()
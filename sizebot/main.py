@@ -1,11 +1,14 @@
+import argparse
 import os
 import logging
 import sys
+import time
 from typing import Optional
 from datetime import datetime
+from pathlib import Path
 
 import discord
-from discord.ext.commands import Bot
+from discord.ext.commands import AutoShardedBot, Bot
 from discord.app_commands import Choice, autocomplete
 
 from digiformatter import styles, logger as digilogger
@@ -14,9 +17,11 @@ import discordplus
 
 from sizebot import __version__
 from sizebot.conf import conf
-from sizebot.lib import language, objs, paths, pokemon, status, units, nickmanager, constants
+from sizebot.lib import archive, language, lazycogs, migrate, objs, paths, shards, status, supervisor, telemetry, units, nickmanager, constants, watcher
+from sizebot.lib.cmdindex import CommandIndex
 from sizebot.lib.discordlogger import DiscordHandler
 from sizebot.lib.loglevels import BANNER, LOGIN, CMD
+from sizebot.lib.scheduler import scheduler
 from sizebot.lib.types import BotContext
 from sizebot.lib.utils import truncate
 from sizebot.plugins import active, monika
@@ -69,9 +74,13 @@ initial_cogs = [
     "winks"
 ]
 initial_extensions = [
+    "admission",
     "banned",
     "errorhandler",
-    "tupperbox"
+    "metrics",
+    "tracing",
+    "tupperbox",
+    "webclient"
 ]
 
 discordplus.patch()
@@ -92,30 +101,33 @@ def initConf():
 # Autocomplete callback for /sb
 digis_favs = ["help", "register", "stats", "compare", "stat", "setheight", "change", "setbaseheight", "distance", "lookat",
               "food", "water", "lookslike", "objectcompare", "scaled", "ruler", "stackup", "settrigger", "fall", "pushbutton", "lineup"]
-all_commands: list[str] = []
+command_index = CommandIndex()
 
 async def command_autocomplete(interaction: discord.Interaction, current: str) -> list[Choice[str]]:
     if current == "":
         return [Choice(name=cmd, value=cmd) for cmd in digis_favs]
     # If the user has already typed something...
-    # ?: How good is this "autocomplete algorithm?" Maybe use a fuzzy search or something?
-    return [Choice(name=cmd, value=cmd) for cmd in all_commands if current.lower() in cmd.lower()][:20]
+    return [Choice(name=cmd, value=cmd) for cmd in command_index.search(current, limit = 20)]
 
 
-def main():
-    try:
-        conf.load()
-    except FileNotFoundError as e:
-        logger.error(f"Configuration file not found: {e.filename}")
-        return
-
+def create_bot() -> Bot:
+    """Build the bot with every event handler, ready for `setup_hook` to load the cogs"""
     launchtime = datetime.now()  # noqa: DTZ005
 
     intents = discord.Intents.default()
     intents.members = True
     intents.messages = True
 
-    bot = Bot(command_prefix = conf.prefix, allowed_mentions = discord.AllowedMentions(everyone=False), intents=intents, case_insensitive=True)
+    options = {
+        "command_prefix": conf.prefix,
+        "allowed_mentions": discord.AllowedMentions(everyone=False),
+        "intents": intents,
+        "case_insensitive": True
+    }
+    if shards.current.sharded:
+        bot = AutoShardedBot(**options, shard_count = shards.current.shard_count, shard_ids = list(shards.current.shard_ids))
+    else:
+        bot = Bot(**options)
 
     bot.remove_command("help")
 
@@ -125,42 +137,53 @@ def main():
     # Load the units and objects.
     units.init()
     objs.init()
-    pokemon.init()
+    # Keep the object plurals, so the next start doesn't need to import inflect at all
+    language.save_cache()
+
+    async def update_command_counts(bot: Bot):
+        await telemetry.update_command_counts()
+        scheduler.schedule("command_counts", time.time() + telemetry.COUNTS_INTERVAL, update_command_counts)
 
     @bot.event
     async def setup_hook():
         logger.info("Setup hook called!")
-        global all_commands
+        if conf.watch_files:
+            w = await watcher.watch(paths.guilddbpath, backend = conf.watch_backend, interval = conf.watch_interval)
+            logger.info(f"Watching {paths.guilddbpath} with {type(w).__name__}.")
         for extension in initial_extensions:
             await bot.load_extension("sizebot.extensions." + extension)
-        for cog in initial_cogs:
-            await bot.load_extension("sizebot.cogs." + cog)
-        for cmd in bot.commands:
-            if not cmd.hidden:
-                all_commands.append(cmd.name)
-                all_commands.extend(cmd.aliases)
+        deferred = {"sizebot.cogs." + cog for cog in conf.deferred_cogs} if conf.lazy_startup else set()
+        await lazycogs.load_extensions(bot, ["sizebot.cogs." + cog for cog in initial_cogs], deferred = deferred)
+        command_index.build(bot.commands, telemetry.command_counts())
+        scheduler.schedule("command_counts", time.time() + telemetry.COUNTS_INTERVAL, update_command_counts)
+        bot.dispatch("cogs_loaded")
 
     @bot.event
     async def on_first_ready():
         # Set up logging.
         if conf.logchannelid:
             logChannel = bot.get_channel(conf.logchannelid)
-            discordhandler = DiscordHandler(logChannel)
+            if logChannel is None:
+                # The channel's guild is on another worker's shards
+                logChannel = await bot.fetch_channel(conf.logchannelid)
+            discordhandler = DiscordHandler(logChannel, flush_interval = conf.log_flush_interval, queue_size = conf.log_queue_size)
             discordhandler.setLevel(logging.INFO)
             logger.addHandler(discordhandler)
 
-        # Set the bots name to what's set in the config.
-        try:
-            await bot.user.edit(username = conf.name)
-        except discord.errors.HTTPException:
-            logger.warn("We can't change the username this much!")
-
-        try:
-            synced = await bot.tree.sync()
-            logger.info(f"Synced {len(synced)} slash command(s)")
-        except Exception as e:
-            logger.error(f"Failed to sync slash commands: {e}")
-            raise e
+        # The username and slash commands are the same for every worker, so only one of them sets them
+        if shards.current.is_primary:
+            # Set the bots name to what's set in the config.
+            try:
+                await bot.user.edit(username = conf.name)
+            except discord.errors.HTTPException:
+                logger.warn("We can't change the username this much!")
+
+            try:
+                synced = await bot.tree.sync()
+                logger.info(f"Synced {len(synced)} slash command(s)")
+            except Exception as e:
+                logger.error(f"Failed to sync slash commands: {e}")
+                raise e
 
         # Print the splash screen.
         # Obviously we need the banner printed in the terminal
@@ -185,10 +208,16 @@ def main():
         await bot.change_presence(activity = activity)
         print(styles)
         logger.info(f"Prefix: {conf.prefix}")
+        if shards.current.sharded:
+            logger.info(str(shards.current))
         launchfinishtime = datetime.now()
         elapsed = launchfinishtime - launchtime
         logger.debug(f"SizeBot launched in {round((elapsed.total_seconds() * 1000), 3)} milliseconds.\n")
+        # Don't start the scheduled tasks until the bot is properly connected
+        scheduler.start(bot)
         status.ready()
+        # Import inflect now, off the event loop, before anyone asks for the plural of their footname
+        await language.warm()
 
     @bot.event
     async def on_reconnect_ready():
@@ -208,10 +237,8 @@ def main():
         message.content = message.content.replace("‘", "'")
 
         if message.content.startswith("&"):
-            for command in all_commands:
-                if message.content.startswith(f"&{command}"):
-                    await message.channel.send("SizeBot no longer supports `&` style commands! Please use the new `/sb` command.\n-# If the /sb command isn't available in your server, ask your server owner to re-add the bot via the [invite link](<https://discord.com/oauth2/authorize?client_id=554916317258317825&permissions=563365424786496&scope=applications.commands+bot>).")
-                    break
+            if command_index.match_prefix(message.content[1:]) is not None:
+                await message.channel.send("SizeBot no longer supports `&` style commands! Please use the new `/sb` command.\n-# If the /sb command isn't available in your server, ask your server owner to re-add the bot via the [invite link](<https://discord.com/oauth2/authorize?client_id=554916317258317825&permissions=563365424786496&scope=applications.commands+bot>).")
 
         if message.content.startswith("<@554916317258317825>"):
             new_message_content = message.content.removeprefix("<@554916317258317825>")
@@ -261,19 +288,93 @@ def main():
         new_message.content = conf.prefix + full_command
         await bot.process_commands(new_message)
         first_arg = command.split()[0]
-        if first_arg not in all_commands:
+        if first_arg not in command_index:
             await interaction.channel.send(f"{constants.emojis.warning} Not a command!")
+            return
+        command_index.record(first_arg)
+        await telemetry.CommandRun(command_index.canonical[first_arg]).asave()
+
+    return bot
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog = "sizebot")
+    # Set by the supervisor when it starts a worker
+    parser.add_argument("--worker", type = int, help = argparse.SUPPRESS)
+    parser.add_argument("--shard-count", type = int, help = argparse.SUPPRESS)
+    parser.add_argument("--shards", type = lambda s: tuple(int(i) for i in s.split(",")), help = argparse.SUPPRESS)
+
+    # Admin tools, which run instead of the bot
+    actions = parser.add_subparsers(dest = "action")
+    export = actions.add_parser("export", help = "export every profile, guild, change and nap into one archive")
+    export.add_argument("archive", type = Path)
+    export.add_argument("--guild", type = int, action = "append", dest = "guilds", help = "only export this guild (can be repeated)")
+    export.add_argument("--workers", type = int, help = "worker processes (default: one per core)")
+    import_ = actions.add_parser("import", help = "restore profiles, guilds, changes and naps from an archive (stop the bot first)")
+    import_.add_argument("archive", type = Path)
+    import_.add_argument("--guild", type = int, action = "append", dest = "guilds", help = "only import this guild (can be repeated)")
+    import_.add_argument("--workers", type = int, help = "worker processes (default: one per core)")
+    import_.add_argument("--dry-run", action = "store_true", help = "check the archive without writing anything")
+    migrate_ = actions.add_parser("migrate", help = "upgrade every profile to the current format (stop the bot first)")
+    migrate_.add_argument("--workers", type = int, help = "worker processes (default: one per core)")
+    migrate_.add_argument("--dry-run", action = "store_true", help = "report what would change without writing anything")
+    return parser.parse_args(argv)
+
+
+def run_action(args: argparse.Namespace) -> int:
+    """Run an admin tool, returning the exit code"""
+    start = time.perf_counter()
+    if args.action == "migrate":
+        report = migrate.migrate(dry_run = args.dry_run, workers = args.workers)
+        logger.info(("Dry run: " if args.dry_run else "") + report.format())
+        logger.info(f"Took {time.perf_counter() - start:.1f}s.")
+        return 1 if report.error_count else 0
+    try:
+        if args.action == "export":
+            summary = archive.export(args.archive, guilds = args.guilds, workers = args.workers)
+            verb = "Exported"
+        else:
+            summary = archive.import_(args.archive, guilds = args.guilds, workers = args.workers, dry_run = args.dry_run)
+            verb = "Checked" if args.dry_run else "Imported"
+    except archive.ArchiveError as e:
+        logger.error(str(e))
+        return 1
+    logger.info(f"{verb} {summary.format()} in {time.perf_counter() - start:.1f}s.")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    try:
+        conf.load()
+    except FileNotFoundError as e:
+        logger.error(f"Configuration file not found: {e.filename}")
+        return 1
+
+    if args.action is not None:
+        return run_action(args)
+
+    if args.worker is not None:
+        shards.configure(shards.ShardInfo(args.shard_count, args.shards, args.worker))
+    elif conf.shard_workers > 1:
+        shard_count = conf.shard_count or conf.shard_workers
+        logger.info(f"Running {conf.shard_workers} workers over {shard_count} shards.")
+        supervisor.Supervisor(conf.shard_workers, shard_count).run()
+        return 0
+
+    bot = create_bot()
 
     def on_disconnect():
         logger.error("SizeBot has been disconnected from Discord!")
 
     if not conf.authtoken:
         logger.error("Authentication token not found!")
-        return
+        return 1
 
     bot.run(conf.authtoken)
     on_disconnect()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -14,9 +14,10 @@ async def on_message(m: discord.Message):
         return
     if not isinstance(m.author, discord.Member):
         return
-    try:
-        userdata = userdb.load(m.guild.id, m.author.id)
-    except errors.UserNotFoundException:
-        return
-    userdata.lastactive = arrow.now()
-    userdb.save(userdata)
+    async with userdb.lock(m.guild.id, m.author.id):
+        try:
+            userdata = await userdb.aload(m.guild.id, m.author.id)
+        except errors.UserNotFoundException:
+            return
+        userdata.lastactive = arrow.now()
+        await userdb.asave(userdata)
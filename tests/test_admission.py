@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from sizebot.lib import admission
+from sizebot.lib.admission import Admission, AdmissionDenied
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_user_burst_then_denied():
+    clock = Clock()
+    adm = Admission(user_burst = 3, user_rate = 0.1, max_wait = 1, clock = clock)
+    for _ in range(3):
+        await adm.admit(1, 10, "help")
+    with pytest.raises(AdmissionDenied) as e:
+        await adm.admit(1, 10, "help")
+    assert e.value.scope == "user"
+    assert e.value.retry_after == pytest.approx(10)
+    # Someone else isn't affected
+    await adm.admit(2, 10, "help")
+    clock.now = 10
+    await adm.admit(1, 10, "help")
+
+
+@pytest.mark.asyncio
+async def test_short_waits_are_queued():
+    adm = Admission(user_burst = 1, user_rate = 100, max_wait = 1)
+    await adm.admit(1, None, "help")
+    # Only 10ms short, so it waits instead of failing
+    await adm.admit(1, None, "help")
+    assert adm.denied == 0
+
+
+@pytest.mark.asyncio
+async def test_guild_bucket_is_shared():
+    adm = Admission(user_burst = 10, guild_burst = 4, guild_rate = 0.1, max_wait = 0, clock = Clock())
+    for userid in range(4):
+        await adm.admit(userid, 10, "help")
+    with pytest.raises(AdmissionDenied) as e:
+        await adm.admit(99, 10, "help")
+    assert e.value.scope == "guild"
+    await adm.admit(99, 11, "help")
+
+
+@pytest.mark.asyncio
+async def test_heavy_commands_are_capped():
+    adm = Admission(user_burst = 100, heavy_limit = 1, max_wait = 0.01)
+    permit = await adm.admit(1, 10, "lineup")
+    with pytest.raises(AdmissionDenied) as e:
+        await adm.admit(2, 10, "lineup")
+    assert e.value.scope == "busy"
+    # The refused command's tokens are given back
+    assert adm.users[2].tokens == 100
+    # Light commands aren't held up
+    await adm.admit(2, 10, "help")
+
+    waiter = asyncio.ensure_future(adm.admit(3, 10, "stats"))
+    await asyncio.sleep(0)
+    adm.release(permit)
+    adm.release(await waiter)
+    assert adm.running_heavy == 0
+
+
+@pytest.mark.asyncio
+async def test_prune_drops_full_buckets():
+    clock = Clock()
+    adm = Admission(user_burst = 10, user_rate = 1, clock = clock)
+    await adm.admit(1, 10, "help")
+    await adm.admit(2, 10, "lineup")
+    clock.now = 2
+    adm.prune()
+    assert list(adm.users) == [2]
+
+
+def test_costs_are_known_commands():
+    assert admission.HEAVY <= set(admission.COSTS)
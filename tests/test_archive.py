@@ -0,0 +1,138 @@
+import gzip
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from sizebot.lib import archive, paths, ranking
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch) -> Path:
+    """Point the data store at an empty folder, and return a folder to keep archives in"""
+    monkeypatch.setattr(paths, "guilddbpath", tmp_path / "guilds")
+    monkeypatch.setattr(paths, "changespath", tmp_path / "changes.json")
+    monkeypatch.setattr(paths, "naptimepath", tmp_path / "naptime.json")
+    archives = tmp_path / "archives"
+    archives.mkdir()
+    return archives
+
+
+def fill():
+    for guildid in [1, 2]:
+        guildpath = paths.guilddbpath / str(guildid)
+        (guildpath / "users").mkdir(parents = True)
+        (guildpath / "guild.json").write_text(json.dumps({"id": guildid, "small_edge": 10 + guildid}))
+        for userid in [10, 11]:
+            (guildpath / "users" / f"{userid}.json").write_text(json.dumps({"guildid": str(guildid), "id": str(userid), "height": "1.5"}))
+    paths.changespath.write_text(json.dumps([{"guildid": 1, "userid": 10}, {"guildid": 2, "userid": 11}]))
+    paths.naptimepath.write_text(json.dumps([{"guildid": 2, "userid": 10, "endtime": "0"}]))
+
+
+def snapshot() -> dict[str, object]:
+    files = {str(p.relative_to(paths.guilddbpath)): json.loads(p.read_text()) for p in paths.guilddbpath.rglob("*.json")}
+    files["changes"] = json.loads(paths.changespath.read_text())
+    files["naps"] = json.loads(paths.naptimepath.read_text())
+    return files
+
+
+def clear():
+    for p in sorted(paths.guilddbpath.rglob("*"), reverse = True):
+        p.rmdir() if p.is_dir() else p.unlink()
+    paths.changespath.unlink()
+    paths.naptimepath.unlink()
+
+
+def test_round_trip(store):
+    fill()
+    before = snapshot()
+    summary = archive.export(store / "all.gz", workers = 1)
+    assert summary.written == {"guild": 2, "user": 4, "change": 2, "nap": 1}
+    clear()
+    summary = archive.import_(store / "all.gz", workers = 1)
+    assert summary.written == {"guild": 2, "user": 4, "change": 2, "nap": 1}
+    assert snapshot() == before
+
+
+def test_import_one_guild(store):
+    fill()
+    archive.export(store / "all.gz", workers = 1)
+    (paths.guilddbpath / "2" / "users" / "10.json").write_text(json.dumps({"changed": True}))
+    paths.changespath.write_text(json.dumps([{"guildid": 1, "userid": 99}]))
+
+    summary = archive.import_(store / "all.gz", guilds = [2], workers = 1)
+    assert summary.written == {"guild": 1, "user": 2, "change": 1, "nap": 1}
+    assert json.loads((paths.guilddbpath / "2" / "users" / "10.json").read_text())["height"] == "1.5"
+    # Guild 1's changes are left alone
+    assert json.loads(paths.changespath.read_text()) == [{"guildid": 1, "userid": 99}, {"guildid": 2, "userid": 11}]
+
+
+def test_dry_run_writes_nothing(store):
+    fill()
+    archive.export(store / "all.gz", workers = 1)
+    clear()
+    summary = archive.import_(store / "all.gz", workers = 1, dry_run = True)
+    assert summary.written["user"] == 4
+    assert list(paths.guilddbpath.iterdir()) == []
+
+
+def test_tampered_record_is_caught(store):
+    fill()
+    archive.export(store / "all.gz", workers = 1)
+    text = gzip.decompress((store / "all.gz").read_bytes()).decode()
+    (store / "bad.gz").write_bytes(gzip.compress(text.replace("\"height\":\"1.5\"", "\"height\":\"15\"", 1).encode()))
+    with pytest.raises(archive.ArchiveError, match = "Checksum"):
+        archive.import_(store / "bad.gz", workers = 1, dry_run = True)
+
+
+def test_truncated_archive_is_caught(store):
+    fill()
+    archive.export(store / "all.gz", workers = 1)
+    lines = gzip.decompress((store / "all.gz").read_bytes()).decode().splitlines(keepends = True)
+    (store / "short.gz").write_bytes(gzip.compress("".join(lines[:3] + lines[-1:]).encode()))
+    with pytest.raises(archive.ArchiveError, match = "incomplete"):
+        archive.import_(store / "short.gz", workers = 1, dry_run = True)
+
+
+def test_damaged_archive_writes_nothing(store):
+    fill()
+    archive.export(store / "all.gz", workers = 1)
+    lines = gzip.decompress((store / "all.gz").read_bytes()).decode().splitlines(keepends = True)
+    # Drop the last profile, so the footer only catches it after the others were read
+    (store / "short.gz").write_bytes(gzip.compress("".join(lines[:-4] + lines[-3:]).encode()))
+    clear()
+    with pytest.raises(archive.ArchiveError, match = "incomplete"):
+        archive.import_(store / "short.gz", workers = 1)
+    assert not list(paths.guilddbpath.rglob("*.json"))
+
+
+def test_import_discards_rankings(store):
+    fill()
+    archive.export(store / "all.gz", workers = 1)
+    ranking.build(1, [])
+    ranking.build(2, [])
+    archive.import_(store / "all.gz", guilds = [1], workers = 1)
+    assert ranking.list_built() == [2]
+    ranking.forget()
+
+
+def test_worker_processes(store):
+    fill()
+    before = snapshot()
+    archive.export(store / "all.gz", workers = 2)
+    clear()
+    archive.import_(store / "all.gz", workers = 2)
+    assert snapshot() == before
+
+
+def test_failed_import_exits_non_zero(tmp_path):
+    datadir = tmp_path / "SizeBot"
+    datadir.mkdir()
+    (datadir / "sizebot.conf").write_text('[discord]\nauthtoken = "token"\n')
+    (tmp_path / "other.gz").write_bytes(gzip.compress(b'{"format": "something else"}\n'))
+    env = {**os.environ, "XDG_DATA_HOME": str(tmp_path)}
+    result = subprocess.run([sys.executable, "-m", "sizebot", "import", str(tmp_path / "other.gz"), "--workers", "1"], env = env, capture_output = True)
+    assert result.returncode == 1
@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from sizebot.lib import changes
+
+
+@pytest.mark.asyncio
+async def test_ticks_are_saved_once_per_interval(monkeypatch):
+    writes = []
+
+    async def asave_to_file():
+        writes.append(True)
+
+    monkeypatch.setattr(changes, "asave_to_file", asave_to_file)
+    monkeypatch.setattr(changes, "SAVE_INTERVAL", 0.01)
+    for _ in range(5):
+        changes._save_soon()
+    await asyncio.sleep(0.05)
+    assert len(writes) == 1
+    changes._save_soon()
+    await asyncio.sleep(0.05)
+    assert len(writes) == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_saves_straight_away(tmp_path, monkeypatch):
+    monkeypatch.setattr(changes.paths, "changespath", tmp_path / "changes.json")
+    monkeypatch.setattr(changes, "SAVE_INTERVAL", 60)
+    changes._save_soon()
+    changes.flush()
+    assert (tmp_path / "changes.json").read_text() == "[]"
+    assert changes._save_task is None
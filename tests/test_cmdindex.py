@@ -0,0 +1,92 @@
+from collections import Counter
+from types import SimpleNamespace
+
+from sizebot.lib.cmdindex import CommandIndex, edit_distance
+
+
+def cmd(name: str, *aliases: str, hidden: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(name = name, aliases = list(aliases), hidden = hidden)
+
+
+def make_index(popularity: Counter | None = None) -> CommandIndex:
+    index = CommandIndex()
+    index.build([
+        cmd("stats", "stat"),
+        cmd("statsize"),
+        cmd("statsas"),
+        cmd("setheight", "resize"),
+        cmd("setbaseheight"),
+        cmd("height"),
+        cmd("lookslike", "lookat"),
+        cmd("objectcompare", "objcompare"),
+        cmd("eval", hidden = True)
+    ], popularity)
+    return index
+
+
+def test_edit_distance():
+    assert edit_distance("stats", "stats") == 0
+    assert edit_distance("stats", "stast") == 1
+    assert edit_distance("height", "hieght") == 1
+    assert edit_distance("kitten", "sitting") == 3
+
+
+def test_exact_match_first():
+    assert make_index().search("stat")[0] == "stat"
+
+
+def test_prefix_ranked_by_popularity():
+    index = make_index(Counter({"statsize": 10, "stats": 5}))
+    assert index.search("stats")[:3] == ["stats", "statsize", "statsas"]
+    assert index.search("statsa")[0] == "statsas"
+    assert index.search("stat")[1:] == ["statsize", "stats", "statsas"]
+
+
+def test_substring_after_prefix():
+    results = make_index().search("height")
+    assert results[0] == "height"
+    assert set(results[1:]) == {"setheight", "setbaseheight"}
+
+
+def test_short_substring():
+    assert set(make_index().search("ei")) == {"height", "setheight", "setbaseheight"}
+
+
+def test_typos():
+    index = make_index()
+    assert "lookslike" in index.search("loksl")
+    assert index.search("hieght")[0] == "height"
+
+
+def test_hidden_commands_not_indexed():
+    index = make_index()
+    assert "eval" not in index
+    assert index.search("eval") == []
+
+
+def test_record_changes_ranking():
+    index = make_index()
+    assert index.search("set")[0] == "setheight"
+    for _ in range(3):
+        index.record("setbaseheight")
+    assert index.search("set")[0] == "setbaseheight"
+
+
+def test_aliases_share_popularity():
+    index = make_index()
+    index.record("resize")
+    assert index.popularity["setheight"] == 1
+
+
+def test_match_prefix():
+    index = make_index()
+    assert index.match_prefix("stats @someone") == "stats"
+    assert index.match_prefix("statsize") == "statsize"
+    assert index.match_prefix("hello") is None
+    assert index.match_prefix("") is None
+
+
+def test_no_budget_skips_typos():
+    index = make_index()
+    assert index.search("hieght", budget = 0) == []
+    assert index.search("heigh", budget = 0)[0] == "height"
@@ -0,0 +1,71 @@
+import logging
+
+import discord
+import pytest
+
+from sizebot.lib import discordlogger
+from sizebot.lib.discordlogger import DiscordHandler
+
+
+class FakeChannel:
+    def __init__(self, rate_limits: int = 0):
+        self.sent: list[str] = []
+        self.rate_limits = rate_limits
+
+    async def send(self, content: str):
+        if self.rate_limits:
+            self.rate_limits -= 1
+            raise discord.RateLimited(0.01)
+        assert len(content) <= discordlogger.MESSAGE_LENGTH
+        self.sent.append(content)
+
+
+def record(message: str, level: int = logging.ERROR) -> logging.LogRecord:
+    return logging.LogRecord("sizebot", level, __file__, 0, message, None, None)
+
+
+@pytest.mark.asyncio
+async def test_repeats_are_batched_and_counted():
+    channel = FakeChannel()
+    handler = DiscordHandler(channel, flush_interval = 0)
+    for _ in range(50):
+        handler.handle(record("Error in change"))
+    handler.handle(record("Something else"))
+    await handler.join()
+    handler.close()
+    assert channel.sent == ["```\nError in change\n```\n*(repeated 50 times)*\n```\nSomething else\n```"]
+
+
+@pytest.mark.asyncio
+async def test_long_batches_are_split():
+    channel = FakeChannel()
+    handler = DiscordHandler(channel, flush_interval = 0)
+    for i in range(10):
+        handler.handle(record(f"{i}" * 500))
+    await handler.join()
+    handler.close()
+    assert len(channel.sent) == 4
+    assert all(f"{i}" * 500 in "".join(channel.sent) for i in range(10))
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_and_reports():
+    channel = FakeChannel()
+    handler = DiscordHandler(channel, flush_interval = 0, queue_size = 2)
+    for i in range(5):
+        handler.handle(record(f"Message {i}"))
+    await handler.join()
+    handler.close()
+    assert channel.sent[0].startswith("*Dropped 3 log message(s)")
+    assert "Message 1" in channel.sent[0] and "Message 2" not in channel.sent[0]
+    assert handler.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_are_waited_out():
+    channel = FakeChannel(rate_limits = 2)
+    handler = DiscordHandler(channel, flush_interval = 0)
+    handler.handle(record("Hello"))
+    await handler.join()
+    handler.close()
+    assert channel.sent == ["```\nHello\n```"]
@@ -0,0 +1,169 @@
+import asyncio
+from copy import copy
+from types import SimpleNamespace
+
+import discord
+import pytest
+from discord.ext import commands
+
+import discordplus
+
+discordplus.patch()
+
+
+class Recorder:
+    def __init__(self):
+        self.events: list[str] = []
+        self.errors: list[tuple[str, type]] = []
+
+
+class Number(commands.Converter):
+    async def convert(self, ctx: commands.Context, argument: str) -> int:
+        ctx.cog.recorder.events.append(f"convert {argument}")
+        try:
+            return int(argument)
+        except ValueError:
+            raise commands.BadArgument(argument)
+
+
+class LinesCog(commands.Cog):
+    def __init__(self, recorder: Recorder):
+        self.recorder = recorder
+
+    @commands.command(pure = True)
+    async def pure(self, ctx: commands.Context, n: Number):
+        self.recorder.events.append(f"pure {n}")
+
+    @commands.command()
+    async def impure(self, ctx: commands.Context, n: Number):
+        self.recorder.events.append(f"impure {n}")
+
+    @commands.command()
+    async def slow(self, ctx: commands.Context):
+        self.recorder.events.append("slow start")
+        await asyncio.sleep(0.01)
+        self.recorder.events.append("slow end")
+
+    @commands.command()
+    async def redo(self, ctx: commands.Context):
+        # Like &sudo, which reruns a copy of the message with new content
+        message = copy(ctx.message)
+        message.content = "&impure 5"
+        self.recorder.events.append(f"redo {ctx.message.content} -> {message.content}")
+
+    @commands.command(multiline = True)
+    async def script(self, ctx: commands.Context, *, text: str):
+        self.recorder.events.append(f"script {len(text.splitlines())}")
+
+
+class PureCog(commands.Cog, command_attrs = {"pure": True}):
+    @commands.command()
+    async def marked(self, ctx: commands.Context):
+        pass
+
+
+async def make_bot(recorder: Recorder) -> commands.Bot:
+    bot = commands.Bot(command_prefix = "&", intents = discord.Intents.default())
+    bot._connection.user = SimpleNamespace(id = 1)
+    await bot._async_setup_hook()
+    await bot.add_cog(LinesCog(recorder))
+    await bot.add_cog(PureCog())
+
+    @bot.listen()
+    async def on_command_error(ctx: commands.Context, error: commands.CommandError):
+        recorder.errors.append((ctx.message.content, type(error)))
+
+    return bot
+
+
+def make_message(content: str) -> SimpleNamespace:
+    author = SimpleNamespace(id = 2, bot = False, display_name = "someone")
+    return SimpleNamespace(id = 3, author = author, content = content, attachments = [], guild = None, channel = None, _state = None)
+
+
+async def run(content: str) -> Recorder:
+    recorder = Recorder()
+    bot = await make_bot(recorder)
+    await bot.process_commands(make_message(content))
+    # Let the error listeners run
+    await asyncio.sleep(0)
+    return recorder
+
+
+@pytest.mark.asyncio
+async def test_lines_run_in_order():
+    recorder = await run("&impure 1\n&pure 2\n&impure 3")
+    assert [e for e in recorder.events if not e.startswith("convert")] == ["impure 1", "pure 2", "impure 3"]
+    assert recorder.errors == []
+
+
+@pytest.mark.asyncio
+async def test_pure_arguments_convert_while_previous_line_runs():
+    recorder = await run("&slow\n&pure 2")
+    assert recorder.events == ["slow start", "convert 2", "slow end", "pure 2"]
+
+
+@pytest.mark.asyncio
+async def test_impure_arguments_convert_in_place():
+    recorder = await run("&slow\n&impure 2")
+    assert recorder.events == ["slow start", "slow end", "convert 2", "impure 2"]
+
+
+@pytest.mark.asyncio
+async def test_conversion_errors_surface_in_order():
+    recorder = await run("&slow\n&pure x\n&pure 3")
+    assert [e for e in recorder.events if not e.startswith("convert")] == ["slow start", "slow end", "pure 3"]
+    assert recorder.errors == [("&pure x", commands.BadArgument)]
+
+
+@pytest.mark.asyncio
+async def test_line_messages_can_be_copied():
+    recorder = await run("&impure 1\n&redo")
+    assert recorder.events[-1] == "redo &redo -> &impure 5"
+
+
+def test_line_message_is_a_view():
+    message = make_message("&a\n&b")
+    line = discordplus.bot.LineMessage(message, "&b")
+    assert line.content == "&b" and line.author is message.author
+    copied = copy(line)
+    copied.content = "&c"
+    assert (copied.content, line.content, message.content) == ("&c", "&b", "&a\n&b")
+    # A copy made without __init__ (like pickle does) doesn't recurse
+    bare = object.__new__(discordplus.bot.LineMessage)
+    with pytest.raises(AttributeError):
+        bare.author
+
+
+@pytest.mark.asyncio
+async def test_line_without_prefix_ignores_everything():
+    recorder = await run("&pure 1\nhello")
+    assert recorder.events == []
+    assert recorder.errors == []
+
+
+@pytest.mark.asyncio
+async def test_unknown_command_stops_everything():
+    recorder = await run("&pure 1\n&nope")
+    assert recorder.events == []
+    assert recorder.errors == [("&nope", commands.CommandNotFound)]
+
+
+@pytest.mark.asyncio
+async def test_multiline_command_takes_whole_message():
+    recorder = await run("&script\na\nb")
+    assert recorder.events == ["script 2"]
+
+
+@pytest.mark.asyncio
+async def test_multiline_command_in_the_middle():
+    recorder = await run("&pure 1\n&script")
+    assert recorder.events == []
+    assert [error for _, error in recorder.errors] == [commands.BadMultilineCommand]
+
+
+@pytest.mark.asyncio
+async def test_cog_marks_commands_pure():
+    bot = await make_bot(Recorder())
+    assert bot.get_command("marked").pure
+    assert not bot.get_command("impure").pure
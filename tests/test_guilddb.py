@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+from sizebot.lib import errors, guilddb, iopool, paths
+from sizebot.lib.units import SV
+
+pool = iopool.IOPool(2)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch) -> guilddb.GuildCache:
+    monkeypatch.setattr(paths, "guilddbpath", tmp_path)
+    cache = guilddb.GuildCache()
+    monkeypatch.setattr(guilddb, "get_cache", lambda: cache)
+    monkeypatch.setattr(iopool, "get_pool", lambda: pool)
+    return cache
+
+
+def write_externally(guildid: int, **values):
+    path = guilddb.get_guild_data_path(guildid)
+    path.parent.mkdir(parents = True, exist_ok = True)
+    with open(path, "w") as f:
+        json.dump({"id": guildid, **values}, f)
+
+
+def test_missing_guild_is_remembered(cache):
+    with pytest.raises(errors.GuildNotFoundException):
+        guilddb.load(1)
+    # Written behind the cache's back, so it isn't seen
+    write_externally(1)
+    with pytest.raises(errors.GuildNotFoundException):
+        guilddb.load(1)
+    assert not guilddb.exists(1)
+
+
+def test_save_replaces_missing(cache):
+    with pytest.raises(errors.GuildNotFoundException):
+        guilddb.load(1)
+    guild = guilddb.Guild(1)
+    guild.small_edge = 5
+    guilddb.save(guild)
+    assert guilddb.load(1).small_edge == 5
+    assert guilddb.exists(1)
+
+
+def test_loaded_guild_is_a_copy(cache):
+    guilddb.save(guilddb.Guild(1))
+    guild = guilddb.load(1)
+    guild.high_limit = SV(10)
+    assert guilddb.load(1).high_limit is None
+
+
+def test_delete(cache):
+    guilddb.save(guilddb.Guild(1))
+    guilddb.delete(1)
+    assert not guilddb.get_guild_data_path(1).exists()
+    with pytest.raises(errors.GuildNotFoundException):
+        guilddb.load(1)
+
+
+def test_exists_without_cache(cache):
+    write_externally(2)
+    assert guilddb.exists(2)
+    assert not guilddb.exists(3)
+
+
+def test_check_mtime_sees_external_edits(cache):
+    cache.check_mtime = True
+    with pytest.raises(errors.GuildNotFoundException):
+        guilddb.load(1)
+    write_externally(1, large_edge = 7)
+    assert guilddb.load(1).large_edge == 7
+
+    write_externally(1, large_edge = 8)
+    path = guilddb.get_guild_data_path(1)
+    stat = path.stat()
+    os.utime(path, ns = (stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert guilddb.load(1).large_edge == 8
+
+
+@pytest.mark.asyncio
+async def test_async_round_trip(cache):
+    with pytest.raises(errors.GuildNotFoundException):
+        await guilddb.aload(1)
+    guild = await guilddb.aload_or_create(1)
+    guild.small_edge = 5
+    await guilddb.asave(guild)
+    cache.clear()
+    assert (await guilddb.aload(1)).small_edge == 5
@@ -0,0 +1,25 @@
+from sizebot.lib import importtime
+
+OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3000 |       3500 |     heavy.child
+import time:       500 |       4000 |   heavy
+import time:        50 |       4170 | toplevel
+"""
+
+
+def test_parse():
+    timings = importtime.parse(OUTPUT)
+    assert [t.name for t in timings] == ["_io", "heavy.child", "heavy", "toplevel"]
+    assert [t.depth for t in timings] == [1, 2, 1, 0]
+    assert timings[1].self_ms == 3
+    assert timings[2].cumulative_ms == 4
+
+
+def test_report_marks_over_budget():
+    report = importtime.format_report(importtime.parse(OUTPUT), budget_ms = 1, limit = 2)
+    lines = report.splitlines()
+    assert "1 over" in lines[0]
+    assert lines[1].startswith("!") and lines[1].endswith("heavy.child")
+    assert lines[2].startswith(" ") and lines[2].endswith("heavy")
+    assert len(lines) == 3
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from sizebot.lib import iopool
+
+
+@pytest.fixture
+def pool():
+    pool = iopool.IOPool(4)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_same_key_runs_in_order(pool):
+    order = []
+
+    def job(n: int, delay: float):
+        time.sleep(delay)
+        order.append(n)
+        return n
+
+    # The first job is the slowest, so anything running out of order would finish before it
+    results = await asyncio.gather(*(pool.run("key", job, n, 0.03 - n * 0.01) for n in range(3)))
+    assert results == [0, 1, 2]
+    assert order == [0, 1, 2]
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_side_by_side(pool):
+    barrier = threading.Barrier(2, timeout = 5)
+
+    def job():
+        # Only passes if both jobs are running at the same time
+        barrier.wait()
+
+    await asyncio.gather(pool.run("a", job), pool.run("b", job))
+    assert pool.completed == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_doesnt_block_the_key(pool):
+    def fail():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await pool.run("key", fail)
+    assert await pool.run("key", lambda: 1) == 1
+    assert pool.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_still_runs_job(pool):
+    started = threading.Event()
+    order = []
+
+    def slow():
+        started.set()
+        time.sleep(0.05)
+        order.append("slow")
+
+    task = asyncio.ensure_future(pool.run("key", slow))
+    await asyncio.to_thread(started.wait, 5)
+    task.cancel()
+    await pool.run("key", order.append, "next")
+    assert order == ["slow", "next"]
+
+
+@pytest.mark.asyncio
+async def test_user_lock_keeps_every_update(pool, tmp_path, monkeypatch):
+    from sizebot.lib import paths, userdb
+    from sizebot.lib.units import SV
+
+    monkeypatch.setattr(paths, "guilddbpath", tmp_path)
+    monkeypatch.setattr(iopool, "get_pool", lambda: pool)
+    userdata = userdb.User.from_height(SV(1))
+    userdata.guildid = 1
+    userdata.id = 2
+    userdata.registration_steps_remaining = []
+    userdb.save(userdata)
+
+    async def grow():
+        async with userdb.lock(1, 2):
+            userdata = await userdb.aload(1, 2)
+            await asyncio.sleep(0)
+            userdata.height += SV(1)
+            await userdb.asave(userdata)
+
+    await asyncio.gather(*(grow() for _ in range(20)))
+    assert userdb.load(1, 2).height == SV(21)
+    assert len(userdb._locks) == 0
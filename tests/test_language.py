@@ -0,0 +1,30 @@
+import threading
+
+import pytest
+
+from sizebot.lib import language, render
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = render.RenderPool(1, 10)
+    monkeypatch.setattr(render, "get_pool", lambda: pool)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_user_words_are_not_saved(pool):
+    language.get_plural_word.cache_clear()
+    assert await language.aget_plural_word("Paw") == "Paws"
+    assert pool.completed == 1
+    assert all("Paw" not in words for words in language._cache.values())
+
+
+@pytest.mark.asyncio
+async def test_warm_imports_inflect_on_the_pool(monkeypatch, pool):
+    threads = []
+    get_engine = language.get_engine
+    monkeypatch.setattr(language, "get_engine", lambda: threads.append(threading.current_thread()) or get_engine())
+    await language.warm()
+    assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,125 @@
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import discord
+import pytest
+from discord.ext import commands
+
+import discordplus
+from sizebot.lib import lazycogs, paths, render
+
+discordplus.patch()
+
+EXTENSION = "lazyext"
+SOURCE = '''
+from discord.ext import commands
+
+ran = []
+
+
+class LazyCog(commands.Cog):
+    @commands.command(aliases = ["twice"], category = "misc")
+    async def double(self, ctx, n: int):
+        """Double a number."""
+        ran.append(n * 2)
+
+
+async def setup(bot):
+    await bot.add_cog(LazyCog())
+'''
+
+
+@pytest.fixture
+def extension(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "cogmanifestpath", tmp_path / "cogs.json")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / f"{EXTENSION}.py").write_text(SOURCE)
+    yield tmp_path / f"{EXTENSION}.py"
+    sys.modules.pop(EXTENSION, None)
+
+
+async def start() -> commands.Bot:
+    bot = commands.Bot(command_prefix = "&", intents = discord.Intents.default())
+    bot._connection.user = SimpleNamespace(id = 1)
+    await bot._async_setup_hook()
+    await lazycogs.load_extensions(bot, [EXTENSION], deferred = {EXTENSION})
+    return bot
+
+
+def make_message(content: str) -> SimpleNamespace:
+    author = SimpleNamespace(id = 2, bot = False, display_name = "someone")
+    return SimpleNamespace(id = 3, author = author, content = content, attachments = [], guild = None, channel = None, _state = None)
+
+
+@pytest.mark.asyncio
+async def test_first_start_loads_and_records(extension):
+    bot = await start()
+    assert EXTENSION in bot.extensions
+    manifest = lazycogs.load_manifest()
+    assert [c["name"] for c in manifest[EXTENSION]["commands"]] == ["double"]
+
+
+@pytest.mark.asyncio
+async def test_later_start_defers(extension):
+    await start()
+    sys.modules.pop(EXTENSION, None)
+    bot = await start()
+    assert EXTENSION not in bot.extensions
+    assert EXTENSION not in sys.modules
+    proxy = bot.get_command("twice")
+    assert proxy.name == "double"
+    assert proxy.help == "Double a number."
+    assert proxy.signature == "<n>"
+    assert proxy.category == "misc"
+
+
+@pytest.mark.asyncio
+async def test_proxy_loads_and_hands_over(extension):
+    await start()
+    sys.modules.pop(EXTENSION, None)
+    bot = await start()
+    await bot.process_commands(make_message("&twice 21"))
+    await asyncio.sleep(0)
+    assert EXTENSION in bot.extensions
+    assert sys.modules[EXTENSION].ran == [42]
+    assert not isinstance(bot.get_command("double").cog, lazycogs.DeferredCog)
+
+
+@pytest.mark.asyncio
+async def test_changed_source_loads_straight_away(extension):
+    await start()
+    sys.modules.pop(EXTENSION, None)
+    extension.write_text(SOURCE + "\n# changed\n")
+    bot = await start()
+    assert EXTENSION in bot.extensions
+
+
+@pytest.mark.asyncio
+async def test_help_is_rebuilt_after_a_deferred_load(extension, monkeypatch):
+    from sizebot.cogs import help
+    from sizebot.conf import conf
+    monkeypatch.setitem(conf._values, "prefix", "&")
+    # The units list needs the object catalog
+    monkeypatch.setattr(help, "get_units_embed", discord.Embed)
+    pool = render.RenderPool(1, 10)
+    monkeypatch.setattr(render, "get_pool", lambda: pool)
+
+    # The first start records the manifest, so the second can defer the extension
+    await start()
+    bot = await start()
+    bot.remove_command("help")
+    cog = help.HelpCog(bot)
+    await bot.add_cog(cog)
+    bot.dispatch("cogs_loaded")
+    old = await cog.get_catalog()
+    assert old.is_current(bot)
+
+    await bot.get_command("double").cog.load()
+    # The old catalog is served until the new one is ready
+    assert await cog.get_catalog() is old
+    await cog._rebuild
+    new = await cog.get_catalog()
+    assert new is not old and new.is_current(bot)
+    assert "double" in new.commands
+    pool.shutdown()
@@ -0,0 +1,28 @@
+from sizebot.lib.metrics import Histogram, Registry, _bucket_index, _bucket_value
+
+
+def test_bucket_roundtrip_is_close():
+    for micros in [0, 1, 15, 16, 17, 100, 12345, 10_000_000]:
+        value = _bucket_value(_bucket_index(micros))
+        assert abs(value - micros) <= max(1, micros * 0.07)
+
+
+def test_percentiles():
+    h = Histogram()
+    for ms in range(1, 101):
+        h.observe(ms / 1000)
+    assert h.count == 100
+    assert abs(h.percentile(0.5) - 0.050) < 0.004
+    assert abs(h.percentile(0.99) - 0.099) < 0.007
+    assert h.percentile(1) == h.max
+
+
+def test_prometheus_format():
+    r = Registry()
+    r.observe("command_seconds", 0.25, command = "stats")
+    r.inc("commands_total", command = "stats", outcome = "ok")
+    text = r.to_prometheus()
+    assert "# TYPE sizebot_command_seconds summary" in text
+    assert 'sizebot_command_seconds{command="stats",quantile="0.5"} 0.250000' in text
+    assert 'sizebot_command_seconds_count{command="stats"} 1' in text
+    assert 'sizebot_commands_total{command="stats",outcome="ok"} 1' in text
@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from sizebot.lib import migrate, paths, units, userdb
+
+units.init()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "guilddbpath", tmp_path)
+
+
+def old_profile(userid: int) -> dict:
+    user = userdb.User()
+    user.guildid = 1
+    user.id = userid
+    user.nickname = f"user{userid}"
+    jsondata = user.toJSON()
+    for key in ["version", "allowchangefromothers", "triggers"]:
+        del jsondata[key]
+    path = userdb.get_user_path(1, userid)
+    path.parent.mkdir(parents = True, exist_ok = True)
+    path.write_text(json.dumps(jsondata, indent = 4))
+    return jsondata
+
+
+def test_current_profiles_skip_migration(monkeypatch):
+    user = userdb.User()
+    user.guildid, user.id = 1, 2
+    jsondata = user.toJSON()
+    monkeypatch.setattr(userdb, "migrate_json", None)
+    assert userdb.User.fromJSON(jsondata).id == 2
+
+
+def test_dry_run_reports_without_writing(store):
+    old_profile(1)
+    before = userdb.get_user_path(1, 1).read_text()
+    report = migrate.migrate(dry_run = True, workers = 1)
+    assert report.upgraded == 1
+    assert report.fields == {"allowchangefromothers": 1, "triggers": 1}
+    assert report.versions == {"none": 1}
+    assert report.bytes_after < report.bytes_before
+    assert userdb.get_user_path(1, 1).read_text() == before
+
+
+def test_migrate_upgrades_and_compacts(store):
+    old_profile(1)
+    old_profile(2)
+    # Current, but saved indented
+    userdb.get_user_path(1, 3).write_text(json.dumps(userdb.migrate_json(old_profile(3)), indent = 4))
+    userdb.get_user_path(1, 4).write_text("{not json")
+
+    report = migrate.migrate(workers = 1)
+    assert (report.profiles, report.upgraded, report.compacted, report.error_count) == (4, 2, 1, 1)
+    text = userdb.get_user_path(1, 1).read_text()
+    assert "\n" not in text
+    assert json.loads(text)["version"] == userdb.SCHEMA_VERSION
+    assert userdb.load(1, 1, allow_unreg = True).allowchangefromothers is False
+
+    report = migrate.migrate(workers = 1)
+    assert (report.upgraded, report.compacted) == (0, 0)
+
+
+def test_migrate_errors_exit_non_zero(tmp_path):
+    datadir = tmp_path / "SizeBot"
+    (datadir / "guilds" / "1" / "users").mkdir(parents = True)
+    (datadir / "sizebot.conf").write_text('[discord]\nauthtoken = "token"\n')
+    (datadir / "guilds" / "1" / "users" / "2.json").write_text("{not json")
+    env = {**os.environ, "XDG_DATA_HOME": str(tmp_path)}
+    result = subprocess.run([sys.executable, "-m", "sizebot", "migrate", "--dry-run", "--workers", "1"], env = env, capture_output = True)
+    assert result.returncode == 1
@@ -0,0 +1,213 @@
+import random
+from decimal import Decimal as RawDecimal
+from types import SimpleNamespace
+
+import pytest
+
+from sizebot.lib import iopool, paths, ranking
+from sizebot.lib.units import SV, WV, Decimal
+
+
+def test_tree_matches_sorted_list():
+    rng = random.Random(1)
+    tree = ranking.OrderStatisticTree()
+    expected = set()
+    for _ in range(2000):
+        key = (RawDecimal(rng.randint(0, 300)), rng.randint(0, 50))
+        if rng.random() < 0.3:
+            tree.discard(key)
+            expected.discard(key)
+        else:
+            tree.add(key)
+            expected.add(key)
+    expected = sorted(expected)
+    assert len(tree) == len(expected)
+    assert list(tree) == expected
+    for i in rng.sample(range(len(expected)), 50):
+        assert tree.select(i) == expected[i]
+        assert tree.rank(expected[i]) == i
+    assert tree.select(-1) == expected[-1]
+
+
+def test_tree_built_from_keys():
+    keys = [(RawDecimal(n), n) for n in range(100)]
+    random.Random(2).shuffle(keys)
+    tree = ranking.OrderStatisticTree(keys)
+    assert list(tree) == sorted(keys)
+    tree.add((RawDecimal("50.5"), 0))
+    assert tree.rank((RawDecimal("50.5"), 0)) == 51
+    with pytest.raises(IndexError):
+        tree.select(101)
+
+
+def user(userid: int, height: str, baseheight: str = "2", *, registered: bool = True) -> SimpleNamespace:
+    height = SV(height)
+    scale = height / SV(baseheight)
+    return SimpleNamespace(guildid = 1, id = userid, height = height, baseheight = SV(baseheight),
+                           weight = WV(60000 * scale ** 3), registered = registered)
+
+
+def test_top_and_rank():
+    guildranking = ranking.GuildRanking.from_users(1, {u.id: ranking.values_for(u) for u in [user(1, "1"), user(2, "10"), user(3, "3", "1")]})
+    assert guildranking.top("height", 2) == [(2, SV(10)), (3, SV(3))]
+    assert [userid for userid, _ in guildranking.top("height", 2, smallest = True)] == [1, 3]
+    assert [userid for userid, _ in guildranking.top("scale", 3)] == [2, 3, 1]
+    assert guildranking.top("height", 10, offset = 2) == [(1, SV(1))]
+    assert guildranking.rank(2, "height") == 1
+    assert guildranking.rank(1, "height") == 3
+    assert guildranking.rank(1, "height", smallest = True) == 1
+    assert guildranking.rank(4, "height") is None
+
+
+def test_unrankable_users_left_out():
+    assert ranking.values_for(user(1, "0")) is None
+    assert ranking.values_for(user(1, "infinity")) is None
+    assert ranking.values_for(user(1, "1", registered = False)) is None
+
+
+def test_set_moves_user():
+    guildranking = ranking.GuildRanking(1)
+    for u in [user(1, "1"), user(2, "2"), user(3, "3")]:
+        guildranking.set(u.id, ranking.values_for(u))
+    guildranking.set(1, ranking.values_for(user(1, "5")))
+    assert guildranking.rank(1, "height") == 1
+    assert len(guildranking.trees["height"]) == 3
+    guildranking.set(1, None)
+    assert 1 not in guildranking
+    assert len(guildranking.trees["weight"]) == 2
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = iopool.IOPool(2)
+    monkeypatch.setattr(iopool, "get_pool", lambda: pool)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def guilddbpath(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "guilddbpath", tmp_path)
+    ranking.forget()
+    yield tmp_path
+    ranking.forget()
+
+
+def test_updates_skipped_until_built(guilddbpath):
+    ranking.update(user(1, "1"))
+    assert ranking.load(1) is None
+    assert not ranking.get_journal_path(1).exists()
+
+
+def test_journal_survives_restart(guilddbpath):
+    ranking.build(1, [user(1, "1"), user(2, "2")])
+    ranking.update(user(3, "3"))
+    ranking.remove(1, 1)
+    ranking.forget()
+    guildranking = ranking.load(1)
+    assert set(guildranking.users) == {2, 3}
+    assert guildranking.rank(3, "height") == 1
+    assert guildranking.journaled == 2
+
+
+def test_journal_compacts(guilddbpath, monkeypatch):
+    monkeypatch.setattr(ranking, "MIN_COMPACT", 0)
+    ranking.build(1, [user(1, "1"), user(2, "2")])
+    ranking.update(user(1, "3"))
+    ranking.update(user(1, "4"))
+    assert ranking.get_journal_path(1).exists()
+    # The journal is now bigger than the two-user snapshot
+    ranking.remove(1, 2)
+    assert not ranking.get_journal_path(1).exists()
+    ranking.forget()
+    assert ranking.load(1).users == {1: ranking.values_for(user(1, "4"))}
+
+
+def test_unloaded_journal_compacts(guilddbpath, monkeypatch):
+    monkeypatch.setattr(ranking, "MIN_COMPACT", 0)
+    ranking.build(1, [user(1, "1"), user(2, "2")])
+    ranking.forget()
+    for n in range(3, 6):
+        ranking.update(user(1, str(n)))
+    assert ranking.loaded(1) is None
+    assert not ranking.get_journal_path(1).exists()
+    assert ranking.load(1).users[1][0] == SV(5)
+
+
+def test_broken_journal_line_skipped(guilddbpath):
+    ranking.build(1, [user(1, "1")])
+    ranking.update(user(2, "2"))
+    with open(ranking.get_journal_path(1), "a") as f:
+        f.write('{"id": "3", "val')
+    ranking.forget()
+    assert set(ranking.load(1).users) == {1, 2}
+
+
+def test_values_round_trip(guilddbpath):
+    ranking.build(1, [user(1, "1.5", "1.75")])
+    ranking.forget()
+    height, scale, weight = ranking.load(1).users[1]
+    assert height == SV("1.5")
+    assert scale == Decimal("1.5") / Decimal("1.75")
+    assert isinstance(weight, WV)
+
+
+@pytest.mark.asyncio
+async def test_saves_while_loading_are_applied_after(guilddbpath, pool):
+    ranking.start_loading(1)
+    # This save lands after the index read the user's old profile
+    await ranking.arecord(1, 1, ranking.values_for(user(1, "5")))
+    ranking.build(1, [user(1, "1"), user(2, "2")])
+    await ranking.finish_loading(1)
+    assert ranking.load(1).users[1][0] == SV(5)
+    ranking.forget()
+    assert ranking.load(1).users[1][0] == SV(5)
+
+
+@pytest.mark.asyncio
+async def test_saves_while_loading_dropped_if_never_built(guilddbpath, pool):
+    ranking.start_loading(1)
+    await ranking.arecord(1, 1, ranking.values_for(user(1, "5")))
+    await ranking.finish_loading(1)
+    assert not ranking.get_journal_path(1).exists()
+    assert ranking._built == {1: False}
+
+
+def test_discard(guilddbpath):
+    ranking.build(1, [user(1, "1")])
+    ranking.build(2, [user(2, "1")])
+    ranking.update(user(1, "2"))
+    assert sorted(ranking.list_built()) == [1, 2]
+    ranking.discard(1)
+    assert ranking.list_built() == [2]
+    assert ranking.load(1) is None
+    assert not ranking.get_journal_path(1).exists()
+
+
+@pytest.mark.asyncio
+async def test_arecord_checks_for_a_snapshot_once(guilddbpath, pool, monkeypatch):
+    await ranking.arecord(1, 1, ranking.values_for(user(1, "1")))
+    assert ranking._built == {1: False}
+    with monkeypatch.context() as m:
+        m.setattr(ranking, "_journal", None)
+        # Known to have no index, so nothing is sent to the pool at all
+        await ranking.arecord(1, 1, ranking.values_for(user(1, "2")))
+
+    ranking.build(2, [user(2, "1")])
+    await ranking.arecord(2, 3, ranking.values_for(user(3, "3")))
+    assert ranking.loaded(2).rank(3, "height") == 1
+    ranking.forget()
+    assert set(ranking.load(2).users) == {2, 3}
+
+
+@pytest.mark.asyncio
+async def test_file_changes_only_touch_owned_guilds(guilddbpath, pool, monkeypatch):
+    from sizebot.lib import shards, userdb, watcher
+    # Guild 1 is on shard 0, guild 1 << 22 on shard 1
+    monkeypatch.setattr(shards, "current", shards.ShardInfo(2, (1,), 1))
+    ranking.build(1, [user(1, "1")])
+    ranking.build(1 << 22, [user(1, "1")])
+    await userdb._on_file_change(watcher.FileEvent("user", 1, 2))
+    assert not ranking.get_journal_path(1).exists()
+    await userdb._on_file_change(watcher.FileEvent("all"))
+    assert ranking.list_built() == [1]
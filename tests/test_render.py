@@ -0,0 +1,39 @@
+import decimal
+import threading
+
+import pytest
+
+from sizebot.lib import errors, proportions
+from sizebot.lib.render import RenderPool
+from sizebot.lib.units import SV
+from sizebot.lib.userdb import User
+
+
+@pytest.mark.asyncio
+async def test_render_uses_sizebot_decimal_context():
+    pool = RenderPool(1, 10)
+    prec = await pool.run(lambda: decimal.getcontext().prec)
+    assert prec == decimal.getcontext().prec
+    assert pool.completed == 1
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_render_matches_event_loop_result():
+    pool = RenderPool(2, 10)
+    userdata = User.from_height(SV("12.5"))
+    expected = proportions.get_stats(userdata, 1)["embed"].to_dict()
+    result = await pool.run(proportions.get_stats, userdata, 1)
+    assert result["embed"].to_dict() == expected
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_render_timeout():
+    pool = RenderPool(1, 10)
+    release = threading.Event()
+    with pytest.raises(errors.RenderTimeoutException):
+        await pool.run(release.wait, timeout = 0.05)
+    assert pool.timedout == 1
+    release.set()
+    pool.shutdown()
@@ -0,0 +1,117 @@
+import pytest
+
+from sizebot.lib import objs, replycache
+from sizebot.lib.fakeplayer import FakePlayer
+from sizebot.lib.objs import DigiObject
+from sizebot.lib.replycache import ReplyCache
+from sizebot.lib.units import SV
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Context:
+    prefix = "&"
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content: str | None = None, **kwargs):
+        self.sent.append({"content": content, **kwargs} if content is not None else kwargs)
+
+
+class Cog:
+    def __init__(self):
+        self.calls = 0
+
+    @replycache.cached("what")
+    async def echo(self, ctx: Context, *, what: SV | str | FakePlayer):
+        self.calls += 1
+        if what == "random":
+            replycache.dont_cache()
+        await ctx.send(f"You said {what}")
+
+    @replycache.cached()
+    async def chatty(self, ctx: Context):
+        self.calls += 1
+        await ctx.send("one")
+        await ctx.send("two")
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> ReplyCache:
+    cache = ReplyCache(maxsize = 2, ttl = 60, clock = Clock())
+    monkeypatch.setattr(replycache, "get_cache", lambda: cache)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_same_arguments_are_answered_from_the_cache(cache: ReplyCache):
+    cog = Cog()
+    for _ in range(3):
+        ctx = Context()
+        await cog.echo(ctx, what = SV("10"))
+        assert ctx.sent == [{"content": "You said 10"}]
+    assert cog.calls == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+    await cog.echo(Context(), what = SV("11"))
+    assert cog.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_changing_arguments_are_never_cached(cache: ReplyCache):
+    cog = Cog()
+    player = FakePlayer(nickname = "Fake", height = SV("10"))
+    await cog.echo(Context(), what = player)
+    await cog.echo(Context(), what = player)
+    await cog.echo(Context(), what = "random")
+    await cog.echo(Context(), what = "random")
+    assert cog.calls == 4
+    assert cache.bypassed == 4
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_only_single_messages_are_cached(cache: ReplyCache):
+    cog = Cog()
+    await cog.chatty(Context())
+    ctx = Context()
+    await cog.chatty(ctx)
+    assert cog.calls == 2
+    assert ctx.sent == [{"content": "one"}, {"content": "two"}]
+
+
+@pytest.mark.asyncio
+async def test_catalog_reload_forgets_replies(cache: ReplyCache, monkeypatch: pytest.MonkeyPatch):
+    cog = Cog()
+    await cog.echo(Context(), what = "book")
+    monkeypatch.setattr(objs, "catalog_version", objs.catalog_version + 1)
+    await cog.echo(Context(), what = "book")
+    assert cog.calls == 2
+
+
+def test_ttl_and_lru():
+    clock = Clock()
+    cache = ReplyCache(maxsize = 2, ttl = 60, clock = clock)
+    cache.put("a", {"content": "a"})
+    cache.put("b", {"content": "b"})
+    assert cache.get("a") == {"content": "a"}
+    cache.put("c", {"content": "c"})
+    # "b" was used least recently
+    assert cache.get("b") is None
+    clock.now = 60
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+
+def test_normalize():
+    obj = DigiObject.from_json({"name": "brick", "dimension": "l", "length": "0.2"})
+    assert replycache.normalize(obj) == ("DigiObject", "brick")
+    assert replycache.normalize(SV("10")) != replycache.normalize("10")
+    with pytest.raises(replycache.Uncacheable):
+        replycache.normalize(FakePlayer(nickname = "Fake", height = SV("10")))
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from sizebot.lib import errors, roller
+
+
+def test_seeded_rolls_repeat():
+    first = roller.roll("10d20", rng = np.random.default_rng(42))
+    second = roller.roll("10d20", rng = np.random.default_rng(42))
+    assert first.total == second.total
+    assert list(first.rolls[0].used) == list(second.rolls[0].used)
+
+
+def test_dice_in_range():
+    result = roller.roll("1000d6", rng = np.random.default_rng(1))
+    used = result.rolls[0].used
+    assert len(used) == 1000
+    assert used.min() >= 1
+    assert used.max() <= 6
+    assert result.total == int(used.sum())
+
+
+def test_keep_highest():
+    result = roller.roll("100d6k10", rng = np.random.default_rng(2))
+    r = result.rolls[0]
+    assert len(r.used) == 10
+    assert len(r.dropped) == 90
+    assert r.used.min() >= r.dropped.max()
+    assert result.total == int(r.used.sum())
+
+
+def test_drop_lowest():
+    result = roller.roll("4d6d1", rng = np.random.default_rng(3))
+    r = result.rolls[0]
+    assert len(r.used) == 3
+    assert len(r.dropped) == 1
+    assert r.dropped[0] <= r.used.min()
+
+
+def test_math():
+    result = roller.roll("2d1+3*2", rng = np.random.default_rng(4))
+    assert result.total == 8
+
+
+def test_too_many_dice():
+    with pytest.raises(errors.RollTooLargeException):
+        roller.roll("600d6+600d6", max_dice = 1000)
+
+
+def test_too_many_sides():
+    with pytest.raises(errors.RollTooLargeException):
+        roller.roll("1d1001", max_sides = 1000)
+
+
+def test_zero_sides():
+    with pytest.raises(errors.InvalidRollException):
+        roller.roll("1d0")
+
+
+def test_huge_roll_is_summarized():
+    result = roller.roll("100000d6k50000", rng = np.random.default_rng(5))
+    r = result.rolls[0]
+    assert len(r.used) == 50000
+    assert sum(r.histogram().values()) == 50000
+    listing = r.format_used(limit = 100)
+    assert "×" in listing
+    assert len(listing) < 100
+
+
+def test_huge_sides_are_summarized():
+    r = roller.roll("1000d1000000", rng = np.random.default_rng(6)).rolls[0]
+    assert r.format_used(limit = 100).startswith("1000 dice from ")
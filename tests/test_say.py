@@ -22,7 +22,7 @@ def ctx() -> AsyncMock:
 
 @pytest.fixture
 def userdb_load():
-    with patch("sizebot.lib.userdb.load") as userdb_load:
+    with patch("sizebot.lib.userdb.aload", new_callable=AsyncMock) as userdb_load:
         userdb_load.defaultheight = SV("1.754")
         yield userdb_load
 
@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+import pytest
+
+from sizebot.lib.scheduler import Scheduler
+
+
+def test_pop_due_in_deadline_order():
+    s = Scheduler()
+    s.schedule("b", 20, None)
+    s.schedule("a", 10, None)
+    s.schedule("c", 30, None)
+    assert [e.key for e in s.pop_due(25)] == ["a", "b"]
+    assert len(s) == 1
+    assert s.next_deadline() == 30
+
+
+def test_cancel():
+    s = Scheduler()
+    s.schedule("a", 10, None)
+    s.schedule("b", 20, None)
+    assert s.cancel("a")
+    assert not s.cancel("a")
+    assert s.next_deadline() == 20
+    assert [e.key for e in s.pop_due(100)] == ["b"]
+
+
+def test_reschedule_replaces():
+    s = Scheduler()
+    s.schedule("a", 10, None)
+    s.schedule("a", 50, None)
+    assert s.deadline("a") == 50
+    assert s.pop_due(20) == []
+    assert [e.key for e in s.pop_due(50)] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_run_wakes_for_earlier_deadline():
+    s = Scheduler()
+    ran = []
+
+    async def callback(bot):
+        ran.append(time.time())
+
+    s.schedule("late", time.time() + 60, callback)
+    s.start(None)
+    await asyncio.sleep(0.01)
+    s.schedule("early", time.time() + 0.05, callback)
+    await asyncio.sleep(0.2)
+    s.stop()
+    assert len(ran) == 1
+    assert s.is_scheduled("late")
+    assert not s.is_scheduled("early")
@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+
+from sizebot.lib import changes, shards, supervisor
+
+
+def test_split_covers_every_shard_once():
+    split = shards.split(5, 2)
+    assert split == [(0, 2, 4), (1, 3)]
+
+
+def test_owns():
+    info = shards.ShardInfo(2, (1,), 1)
+    assert info.owns(1 << 22)
+    assert not info.owns(2 << 22)
+    # DMs go to shard 0
+    assert not info.owns(None)
+    assert shards.ShardInfo().owns(2 << 22)
+
+
+def test_per_worker():
+    assert shards.ShardInfo(2, (1,), 1).per_worker(Path("metrics.json")) == Path("metrics-1.json")
+    assert shards.ShardInfo().per_worker(Path("metrics.json")) == Path("metrics.json")
+
+
+class FakeProcess:
+    def __init__(self, command):
+        self.command = command
+        self.code = None
+        self.terminated = False
+
+    def poll(self):
+        return self.code
+
+    def terminate(self):
+        self.terminated = True
+        self.code = -15
+
+
+def test_supervisor_restarts_crashes():
+    started = []
+
+    def popen(command):
+        started.append(FakeProcess(command))
+        return started[-1]
+
+    sup = supervisor.Supervisor(2, 4, popen = popen)
+    for worker in sup.workers:
+        sup.start(worker, 0)
+    assert started[1].command[-2:] == ["--shards", "1,3"]
+
+    started[0].code = 1
+    assert sup.poll(10)
+    assert len(started) == 2
+    # Not until the restart delay is up
+    assert sup.poll(10.5)
+    assert len(started) == 2
+    assert sup.poll(11)
+    assert len(started) == 3
+    assert started[2].command == started[0].command
+    assert not started[1].terminated
+
+
+def test_supervisor_clean_exit_stops_everything():
+    started = []
+
+    def popen(command):
+        started.append(FakeProcess(command))
+        return started[-1]
+
+    sup = supervisor.Supervisor(2, 2, popen = popen)
+    for worker in sup.workers:
+        sup.start(worker, 0)
+    started[0].code = 0
+    assert not sup.poll(10)
+    assert started[1].terminated
+    assert len(started) == 2
+
+
+def test_changes_keep_other_workers_entries(tmp_path, monkeypatch):
+    path = tmp_path / "changes.json"
+    monkeypatch.setattr(changes.paths, "changespath", path)
+    ours, theirs = {"guildid": 1 << 22, "userid": 1}, {"guildid": 2 << 22, "userid": 2}
+    path.write_text(json.dumps([ours, theirs]))
+    monkeypatch.setattr(shards, "current", shards.ShardInfo(2, (1,), 1))
+
+    changes._write([])
+    assert json.loads(path.read_text()) == [theirs]
+    changes._write([ours])
+    assert json.loads(path.read_text()) == [theirs, ours]
@@ -0,0 +1,70 @@
+from sizebot.lib import units
+from sizebot.lib.stats import AVERAGE_PLAYERSTATS, PlayerStats, StatBox, StatBoxCache
+from sizebot.lib.units import SV, Decimal
+
+units.init()
+
+
+def playerstats(userid: str, height: str = "1.754") -> PlayerStats:
+    return {**AVERAGE_PLAYERSTATS, "id": userid, "nickname": f"user{userid}", "height": height}
+
+
+def test_average_is_memoized():
+    assert StatBox.load_average() is StatBox.load_average()
+
+
+def test_same_stats_and_scale_hit():
+    cache = StatBoxCache()
+    first = cache.get(playerstats("1"), Decimal(2))
+    assert cache.get(playerstats("1"), Decimal(2)) is first
+    assert cache.get(playerstats("1"), Decimal(3)) is not first
+
+
+def test_cached_matches_fresh():
+    cached = StatBoxCache().get(playerstats("1"), Decimal(2), Decimal("0.5"))
+    fresh = StatBox.load(playerstats("1")).scale(Decimal(2)).scale(Decimal("0.5"))
+    assert cached["height"].value == fresh["height"].value == SV("1.754")
+    assert cached.values.keys() == fresh.values.keys()
+
+
+def test_unscaled_box_is_shared():
+    cache = StatBoxCache()
+    base = cache.get(playerstats("1"))
+    cache.get(playerstats("1"), Decimal(2))
+    assert cache.get(playerstats("1")) is base
+    assert len(cache) == 2
+
+
+def test_changed_stats_miss():
+    cache = StatBoxCache()
+    first = cache.get(playerstats("1"), Decimal(1))
+    assert cache.get(playerstats("1", height = "2"), Decimal(1)) is not first
+
+
+def test_lru_eviction():
+    cache = StatBoxCache(maxsize = 2)
+    first = cache.get(playerstats("1"))
+    cache.get(playerstats("2"))
+    cache.get(playerstats("1"))
+    cache.get(playerstats("3"))
+    assert len(cache) == 2
+    assert cache.get(playerstats("1")) is first
+
+
+def test_invalidate():
+    cache = StatBoxCache()
+    first = cache.get(playerstats("1"), Decimal(2))
+    other = cache.get(playerstats("2"), Decimal(2))
+    cache.invalidate(1)
+    assert cache.get(playerstats("1"), Decimal(2)) is not first
+    assert cache.get(playerstats("2"), Decimal(2)) is other
+
+
+def test_stats_have_no_dict():
+    sb = StatBox.load(playerstats("1"))
+    stat = sb["height"]
+    assert not hasattr(stat, "__dict__")
+    assert not hasattr(stat.value, "__dict__")
+    # Filled in on first use, then kept
+    assert stat.title is stat.title
+    assert stat.embed["name"] == stat.title
@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from sizebot.lib import paths, telemetry
+
+
+@pytest.fixture
+def telemetrypath(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(paths, "telemetrypath", tmp_path)
+    monkeypatch.setattr(paths, "commandcountspath", tmp_path / "command_counts.json")
+    return tmp_path
+
+
+def run(*names: str):
+    for name in names:
+        telemetry.CommandRun(name).save()
+
+
+def test_command_counts_only_reads_new_lines(telemetrypath: Path):
+    assert telemetry.command_counts() == {}
+    run("stats", "stats", "height")
+    assert telemetry.command_counts() == {"stats": 2, "height": 1}
+    summary = json.loads(paths.commandcountspath.read_text())
+    assert summary["offset"] == (telemetrypath / telemetry.CommandRun.filename).stat().st_size
+
+    run("height")
+    # A line that's still being written
+    with (telemetrypath / telemetry.CommandRun.filename).open("a") as f:
+        f.write('{"name": "sta')
+    assert telemetry.command_counts() == {"stats": 2, "height": 2}
+    with (telemetrypath / telemetry.CommandRun.filename).open("a") as f:
+        f.write('ts"}\n')
+    assert telemetry.command_counts() == {"stats": 3, "height": 2}
+
+
+def test_command_counts_survive_rotation(telemetrypath: Path):
+    run("stats", "stats", "height")
+    telemetry.command_counts()
+    (telemetrypath / telemetry.CommandRun.filename).unlink()
+    run("height")
+    assert telemetry.command_counts() == {"stats": 2, "height": 2}
+
+
+def test_command_counts_notice_a_rotated_file_that_grew_past_the_offset(telemetrypath: Path):
+    run("stats", "height")
+    telemetry.command_counts()
+    # Rotated by renaming, so the new file can't reuse the old one's inode
+    (telemetrypath / telemetry.CommandRun.filename).rename(telemetrypath / "command_run.1.ndjson")
+    run("height", "height", "height", "height")
+    assert telemetry.command_counts() == {"stats": 1, "height": 5}
+    assert telemetry.command_counts() == {"stats": 1, "height": 5}
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from sizebot.lib import iopool, tracing
+
+pool = iopool.IOPool(2)
+
+
+class MemoryExporter:
+    def __init__(self):
+        self.path = None
+        self.traces: list[tracing.Trace] = []
+        self.threads: list[threading.Thread] = []
+
+    def export(self, trace: tracing.Trace):
+        self.traces.append(trace)
+        self.threads.append(threading.current_thread())
+
+
+@pytest.fixture
+def exporter(monkeypatch) -> MemoryExporter:
+    exporter = MemoryExporter()
+    monkeypatch.setattr(iopool, "get_pool", lambda: pool)
+    tracing.configure(tracing.Tracer(exporter, sample_rate = 1))
+    yield exporter
+    tracing.configure(None)
+
+
+def by_name(trace: tracing.Trace) -> dict[str, tracing.Span]:
+    return {s.name: s for s in trace.spans}
+
+
+@tracing.traced("work")
+def work() -> int:
+    return 1
+
+
+def test_spans_do_nothing_outside_a_trace(exporter):
+    with tracing.span("alone") as s:
+        assert s is None
+    assert work() == 1
+    assert exporter.traces == []
+
+
+def test_spans_nest(exporter):
+    with tracing.trace("root"):
+        with tracing.span("child"):
+            work()
+    [trace] = exporter.traces
+    spans = by_name(trace)
+    assert spans["root"].parent_id is None
+    assert spans["child"].parent_id == spans["root"].id
+    assert spans["work"].parent_id == spans["child"].id
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_keep_their_parents(exporter):
+    async def task(name: str):
+        with tracing.span(name):
+            await asyncio.sleep(0)
+            await iopool.run(name, work)
+
+    with tracing.trace("root"):
+        await asyncio.gather(task("a"), task("b"))
+    await tracing.flush()
+    [trace] = exporter.traces
+    spans = {s.name: s for s in trace.spans if s.name != "work"}
+    works = [s for s in trace.spans if s.name == "work"]
+    assert spans["a"].parent_id == spans["b"].parent_id == spans["root"].id
+    assert sorted(s.parent_id for s in works) == sorted([spans["a"].id, spans["b"].id])
+
+
+@pytest.mark.asyncio
+async def test_traces_are_exported_on_the_io_pool(exporter):
+    with tracing.trace("root"):
+        pass
+    assert exporter.traces == []
+    await tracing.flush()
+    assert len(exporter.traces) == 1
+    assert exporter.threads[0] is not threading.main_thread()
+
+
+def test_unsampled_fast_traces_are_dropped(exporter):
+    tracing.configure(tracing.Tracer(exporter, sample_rate = 0, slow_seconds = 60))
+    with tracing.trace("fast"):
+        pass
+    tracing.configure(tracing.Tracer(exporter, sample_rate = 0, slow_seconds = 0))
+    with tracing.trace("slow"):
+        pass
+    assert [t.spans[0].name for t in exporter.traces] == ["slow"]
+
+
+def test_file_exporter_rotates(tmp_path):
+    path = tmp_path / "traces.ndjson"
+    exporter = tracing.FileExporter(path, max_bytes = 1000, backups = 2)
+    tracing.configure(tracing.Tracer(exporter, sample_rate = 1))
+    try:
+        for i in range(20):
+            with tracing.trace("command", n = i):
+                pass
+    finally:
+        tracing.configure(None)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["traces.1.ndjson", "traces.2.ndjson", "traces.ndjson"]
+    events = tracing.to_chrome_trace(path.read_text().splitlines())["traceEvents"]
+    assert events[-1]["name"] == "command"
+    assert events[-1]["ph"] == "X"
+    assert events[-1]["args"]["n"] == "19"
+    json.dumps(events)
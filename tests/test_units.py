@@ -5,7 +5,7 @@ import pytest
 from contextlib import AbstractContextManager, nullcontext as does_not_raise
 
 from sizebot.lib import units
-from sizebot.lib.digidecimal import BaseDecimal
+from sizebot.lib.digidecimal import BaseDecimal, RawDecimal
 from sizebot.lib.units import Decimal, SV, WV, TV, AV, VV, RV
 
 type UnitType = Decimal | SV | WV | TV | AV | VV | RV
@@ -677,3 +677,23 @@ def test_pow(a: Any, b: Any, expected: UnitType | type[NotImplementedError]) ->
         result = a ** b
         assert type(result) is type(expected)
         assert result == expected
+
+
+def test_result_is_clamped_to_its_own_infinity():
+    # SV's infinity is far lower than Decimal's
+    result = SV("5e53") * Decimal(2)
+    assert type(result) is SV
+    assert result.is_infinite()
+    assert not (Decimal("5e53") * Decimal(2)).is_infinite()
+    assert (SV("-5e53") * 2).to_pydecimal() == RawDecimal("-infinity")
+
+
+def test_subclasses_use_their_parents_rules():
+    class Height(SV):
+        pass
+
+    result = Height(2) * Height(3)
+    assert type(result) is AV
+    assert result == AV(6)
+    with pytest.raises(NotImplementedError):
+        Height(2) + WV(3)
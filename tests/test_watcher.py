@@ -0,0 +1,92 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from sizebot.lib import errors, guilddb, iopool, paths, watcher
+
+pool = iopool.IOPool(2)
+
+
+@pytest.fixture
+def events(tmp_path, monkeypatch) -> list[watcher.FileEvent]:
+    monkeypatch.setattr(paths, "guilddbpath", tmp_path)
+    cache = guilddb.GuildCache()
+    monkeypatch.setattr(guilddb, "get_cache", lambda: cache)
+    monkeypatch.setattr(iopool, "get_pool", lambda: pool)
+    events = []
+    watcher.subscribe(events.append)
+    yield events
+    watcher.unsubscribe(events.append)
+    asyncio.run(watcher.stop())
+
+
+def write_externally(path: Path, jsondata: dict):
+    path.parent.mkdir(parents = True, exist_ok = True)
+    with open(path, "w") as f:
+        json.dump(jsondata, f)
+    # Make sure the stamp changes, even on filesystems with coarse timestamps
+    os.utime(path, ns = (0, path.stat().st_mtime_ns + 1_000_000_000))
+
+
+def test_classify(tmp_path):
+    assert watcher.classify(tmp_path, tmp_path / "1" / "guild.json") == watcher.FileEvent("guild", 1)
+    assert watcher.classify(tmp_path, tmp_path / "1" / "users" / "2.json") == watcher.FileEvent("user", 1, 2)
+    assert watcher.classify(tmp_path, tmp_path / "1" / "ranking.json") is None
+    assert watcher.classify(tmp_path, tmp_path / "1" / "users" / "2.json.tmp") is None
+
+
+@pytest.mark.asyncio
+async def test_external_edit_invalidates_guild(events, tmp_path):
+    local = watcher.LocalWatcher(tmp_path)
+    await watcher.start(local)
+    with pytest.raises(errors.GuildNotFoundException):
+        guilddb.load(1)
+    path = guilddb.get_guild_data_path(1)
+    write_externally(path, {"id": 1, "small_edge": 5})
+    local.changed(path)
+    assert events == [watcher.FileEvent("guild", 1)]
+    assert guilddb.load(1).small_edge == 5
+
+
+@pytest.mark.asyncio
+async def test_own_writes_are_skipped(events, tmp_path):
+    local = watcher.LocalWatcher(tmp_path)
+    await watcher.start(local)
+    guilddb.save(guilddb.Guild(1))
+    local.changed(guilddb.get_guild_data_path(1))
+    guilddb.delete(1)
+    local.changed(guilddb.get_guild_data_path(1))
+    assert events == []
+
+
+@pytest.mark.asyncio
+async def test_polling_sees_changes(events, tmp_path):
+    userpath = tmp_path / "1" / "users" / "2.json"
+    write_externally(userpath, {})
+    poller = watcher.PollingWatcher(tmp_path, 60)
+    await watcher.start(poller)
+    await poller.check()
+    assert events == []
+    write_externally(userpath, {"changed": True})
+    write_externally(tmp_path / "3" / "guild.json", {})
+    await poller.check()
+    assert sorted(events, key = lambda e: e.kind) == [watcher.FileEvent("guild", 3), watcher.FileEvent("user", 1, 2)]
+    events.clear()
+    userpath.unlink()
+    await poller.check()
+    assert events == [watcher.FileEvent("user", 1, 2)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not watcher.InotifyWatcher.available(), reason = "inotify is Linux only")
+async def test_inotify_sees_new_guilds(events, tmp_path):
+    await watcher.start(watcher.InotifyWatcher(tmp_path))
+    write_externally(tmp_path / "1" / "users" / "2.json", {})
+    for _ in range(100):
+        if events:
+            break
+        await asyncio.sleep(0.01)
+    assert watcher.FileEvent("user", 1, 2) in events
@@ -0,0 +1,113 @@
+import asyncio
+
+import discord
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from discord.ext import commands
+
+from sizebot.lib import metal, webclient
+from sizebot.lib.units import WV, Decimal
+
+
+@pytest_asyncio.fixture
+async def standin():
+    calls = []
+
+    async def quote(request: web.Request) -> web.Response:
+        calls.append(request.path)
+        return web.json_response([{"spreadProfilePrices": [{"ask": "2834.95"}]}])
+
+    async def broken(request: web.Request) -> web.Response:
+        calls.append(request.path)
+        return web.Response(status = 500, text = "{}")
+
+    app = web.Application()
+    app.router.add_get("/public-quotes/bboquotes/instrument/{metal}/USD", quote)
+    app.router.add_get("/broken", broken)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    client = webclient.WebClient(rewrites = {"https://forex-data-feed.swissquote.com": f"http://127.0.0.1:{port}"})
+    oldclient = webclient.client
+    webclient.client = client
+    yield client, calls, f"http://127.0.0.1:{port}"
+    webclient.client = oldclient
+    await client.close()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_metal_value_is_cached(standin):
+    client, calls, _ = standin
+    value = await metal.metal_value("gold", WV(1000))
+    assert value == Decimal(1000) * Decimal("2834.95") / metal.G_PER_OZ
+    await metal.metal_value("gold", WV(1))
+    assert len(calls) == 1
+    assert client.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_a_fetch(standin):
+    client, calls, _ = standin
+    await asyncio.gather(*(metal.metal_value("silver", WV(1)) for _ in range(5)))
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate(standin):
+    client, calls, base = standin
+    url = base + "/public-quotes/bboquotes/instrument/XPT/USD"
+    await client.get_json(url, ttl = 0, stale = 60)
+    await client.get_json(url, ttl = 0, stale = 60)
+    assert client.hits == 1
+    await asyncio.sleep(0.1)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_error_status_raises(standin):
+    client, calls, base = standin
+    with pytest.raises(webclient.APIException):
+        await client.get_json(base + "/broken", ttl = 60)
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(standin):
+    client, calls, base = standin
+    client.maxsize = 2
+    urls = [base + f"/public-quotes/bboquotes/instrument/{m}/USD" for m in ("XAU", "XAG", "XPT")]
+    await client.get_json(urls[0], ttl = 60)
+    await client.get_json(urls[1], ttl = 60)
+    await client.get_json(urls[0], ttl = 60)
+    await client.get_json(urls[2], ttl = 60)
+    # The second URL was used least recently
+    assert list(client._cache) == [urls[0], urls[2]]
+    # Uncached lookups aren't kept at all
+    await client.get_json(base + "/public-quotes/bboquotes/instrument/XPD/USD")
+    assert len(client._cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_close_stops_refreshes(standin):
+    client, calls, base = standin
+    url = base + "/public-quotes/bboquotes/instrument/XPT/USD"
+    await client.get_json(url, ttl = 0, stale = 60)
+    await client.get_json(url, ttl = 0, stale = 60)
+    assert len(client._tasks) == 1
+    await client.close()
+    assert not client._tasks
+
+
+@pytest.mark.asyncio
+async def test_closing_the_bot_closes_the_client(standin):
+    client, _, base = standin
+    await client.get(base + "/broken")
+    assert client._session is not None
+    bot = commands.Bot(command_prefix = "&", intents = discord.Intents.default())
+    await bot.load_extension("sizebot.extensions.webclient")
+    await bot.close()
+    assert client._session is None